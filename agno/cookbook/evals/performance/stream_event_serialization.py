@@ -0,0 +1,34 @@
+"""Measures the cost of serializing the events of a long streamed run, as the playground and FastAPI routers do.
+
+Each iteration serializes 1000 content chunks, so the per-chunk cost is the reported time / 1000.
+Run `pip install agno orjson` to install dependencies, orjson is optional.
+"""
+
+from agno.eval.performance import PerformanceEval
+from agno.run.response import RunResponseContentEvent
+
+NUM_CHUNKS = 1000
+
+chunks = [
+    RunResponseContentEvent(
+        content=f"token {i} ",
+        agent_id="agent-id",
+        agent_name="Streaming Agent",
+        run_id="run-id",
+        session_id="session-id",
+    )
+    for i in range(NUM_CHUNKS)
+]
+
+
+def serialize_stream():
+    for chunk in chunks:
+        chunk.to_json()
+
+
+serialization_perf = PerformanceEval(
+    name="Stream Event Serialization Performance", func=serialize_stream, num_iterations=100
+)
+
+if __name__ == "__main__":
+    serialization_perf.run(print_results=True, print_summary=True)
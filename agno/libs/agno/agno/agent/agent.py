@@ -47,9 +47,11 @@ from agno.run.response import (
 )
 from agno.run.team import TeamRunResponse, TeamRunResponseEvent
 from agno.storage.base import Storage
+from agno.storage.media.base import MediaStore, use_media_store
+from agno.storage.session import Session
 from agno.storage.session.agent import AgentSession
 from agno.tools.function import Function
-from agno.tools.toolkit import Toolkit
+from agno.tools.toolkit import Toolkit, copy_tool_for_run
 from agno.utils.events import (
     create_memory_update_completed_event,
     create_memory_update_started_event,
@@ -164,6 +166,8 @@ class Agent:
 
     # --- Agent Storage ---
     storage: Optional[Storage] = None
+    # Store for the content of media in the session, so storage only keeps its hash and URI
+    media_store: Optional[MediaStore] = None
     # Extra data stored with this agent
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -175,6 +179,9 @@ class Agent:
     show_tool_calls: bool = True
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of parallel-safe tool calls from one model response that run at the same time.
+    # None runs tool calls one after another. Only applies to sync runs, async runs already run tool calls concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -360,10 +367,12 @@ class Agent:
         retriever: Optional[Callable[..., Optional[List[Union[Dict, str]]]]] = None,
         references_format: Literal["json", "yaml"] = "json",
         storage: Optional[Storage] = None,
+        media_store: Optional[MediaStore] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         reasoning: bool = False,
@@ -453,11 +462,13 @@ class Agent:
         self.references_format = references_format
 
         self.storage = storage
+        self.media_store = media_store
         self.extra_data = extra_data
 
         self.tools = tools
         self.show_tool_calls = show_tool_calls
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_choice = tool_choice
         self.tool_hooks = tool_hooks
 
@@ -636,8 +647,21 @@ class Agent:
 
         log_debug(f"Agent ID: {self.agent_id}", center=True)
 
+        self._initialize_memory()
+
+        # Default to the agent's model if no model is provided
+        if isinstance(self.memory, Memory):
+            if self.memory.model is None and self.model is not None:
+                self.memory.set_model(self.model)
+
+        if self._formatter is None:
+            self._formatter = SafeFormatter()
+
+    def _initialize_memory(self) -> None:
         if self.memory is None:
             self.memory = Memory()
+            # A new memory is already unique to this instance
+            self._memory_deepcopy_done = True
         elif not self._memory_deepcopy_done:
             from copy import deepcopy
 
@@ -646,14 +670,6 @@ class Agent:
                 self.memory = deepcopy(self.memory)
             self._memory_deepcopy_done = True
 
-        # Default to the agent's model if no model is provided
-        if isinstance(self.memory, Memory):
-            if self.memory.model is None and self.model is not None:
-                self.memory.set_model(self.model)
-
-        if self._formatter is None:
-            self._formatter = SafeFormatter()
-
     @property
     def has_team(self) -> bool:
         return self.team is not None and len(self.team) > 0
@@ -714,6 +730,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
             response_format=response_format,
         )
 
@@ -1197,7 +1214,7 @@ class Agent:
 
         # We should break out of the run function
         if any(tool_call.is_paused for tool_call in run_response.tools or []):
-            return self._handle_agent_run_paused(
+            return await self._ahandle_agent_run_paused(
                 run_response=run_response, run_messages=run_messages, session_id=session_id, user_id=user_id
             )
 
@@ -1216,7 +1233,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -1280,7 +1297,7 @@ class Agent:
 
         # We should break out of the run function
         if any(tool_call.is_paused for tool_call in run_response.tools or []):
-            for item in self._handle_agent_run_paused_stream(
+            async for item in self._ahandle_agent_run_paused_stream(
                 run_response=run_response, run_messages=run_messages, session_id=session_id, user_id=user_id
             ):
                 yield item
@@ -1308,7 +1325,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(from_run_response=run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -1398,7 +1415,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1821,6 +1838,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
         )
 
         self._update_run_response(model_response=model_response, run_response=run_response, run_messages=run_messages)
@@ -2043,7 +2061,7 @@ class Agent:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Run can be continued from previous run response or from passed run_response context
         if run_response is not None:
@@ -2233,7 +2251,7 @@ class Agent:
 
         # We should break out of the run function
         if any(tool_call.is_paused for tool_call in run_response.tools or []):
-            return self._handle_agent_run_paused(
+            return await self._ahandle_agent_run_paused(
                 run_response=run_response, run_messages=run_messages, session_id=session_id, user_id=user_id
             )
 
@@ -2252,7 +2270,7 @@ class Agent:
         self._convert_response_to_structured_format(run_response)
 
         # 6. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # 7. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
@@ -2317,7 +2335,7 @@ class Agent:
 
         # We should break out of the run function
         if any(tool_call.is_paused for tool_call in run_response.tools or []):
-            for item in self._handle_agent_run_paused_stream(
+            async for item in self._ahandle_agent_run_paused_stream(
                 run_response=run_response, run_messages=run_messages, session_id=session_id, user_id=user_id
             ):
                 yield item
@@ -2345,7 +2363,7 @@ class Agent:
             yield self._handle_event(create_run_response_completed_event(run_response), run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(user_id=user_id, session_id=session_id)
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
 
         # Log Agent Run
         await self._alog_agent_run(user_id=user_id, session_id=session_id)
@@ -2411,6 +2429,65 @@ class Agent:
 
         log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
 
+    async def _ahandle_agent_run_paused(
+        self,
+        run_response: RunResponse,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> RunResponse:
+        # Set the run response to paused
+
+        run_response.status = RunStatus.paused
+        if not run_response.content:
+            run_response.content = get_paused_content(run_response)
+
+        # Save session to storage
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
+
+        # Log Agent Run
+        await self._alog_agent_run(user_id=user_id, session_id=session_id)
+
+        log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
+
+        # Save output to file if save_response_to_file is set
+        self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
+
+        # We return and await confirmation/completion for the tools that require it
+        return run_response
+
+    async def _ahandle_agent_run_paused_stream(
+        self,
+        run_response: RunResponse,
+        run_messages: RunMessages,
+        session_id: str,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[RunResponseEvent]:
+        # Set the run response to paused
+
+        run_response.status = RunStatus.paused
+        if not run_response.content:
+            run_response.content = get_paused_content(run_response)
+
+        # Save output to file if save_response_to_file is set
+        self.save_run_response_to_file(message=run_messages.user_message, session_id=session_id)
+
+        # We return and await confirmation/completion for the tools that require it
+        yield self._handle_event(
+            create_run_response_paused_event(
+                from_run_response=run_response,
+                tools=run_response.tools,
+            ),
+            run_response,
+        )
+
+        # Save session to storage
+        await self.awrite_to_storage(user_id=user_id, session_id=session_id)
+        # Log Agent Run
+        await self._alog_agent_run(user_id=user_id, session_id=session_id)
+
+        log_debug(f"Agent Run Paused: {run_response.run_id}", center=True, symbol="*")
+
     def _convert_response_to_structured_format(self, run_response: Union[RunResponse, ModelResponse]):
         # Convert the response to the structured format if needed
         if self.response_model is not None and not isinstance(run_response.content, self.response_model):
@@ -2843,7 +2920,8 @@ class Agent:
 
         if isinstance(self.memory, AgentMemory):
             # Calculate session metrics
-            self.session_metrics = self.calculate_metrics(self.memory.messages)
+            assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
+            self.session_metrics = self.memory.get_session_metrics(assistant_message_role=assistant_message_role)
         elif isinstance(self.memory, Memory):
             # Calculate session metrics
             if self.session_metrics is None:
@@ -2998,6 +3076,7 @@ class Agent:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
             stream_model_response=stream_model_response,
         ):
             yield from self._handle_model_response_chunk(
@@ -3623,7 +3702,7 @@ class Agent:
         if self.search_previous_sessions_history:
             agent_tools.append(
                 self.get_previous_sessions_messages_function(
-                    num_history_sessions=self.num_history_sessions, user_id=user_id
+                    num_history_sessions=self.num_history_sessions, user_id=user_id, async_mode=async_mode
                 )
             )
             self._rebuild_tools = True
@@ -4140,10 +4219,36 @@ class Agent:
             Optional[AgentSession]: The saved AgentSession or None if not saved.
         """
         if self.storage is not None:
-            self.agent_session = cast(
-                AgentSession,
-                self.storage.upsert(session=self.get_agent_session(session_id=session_id, user_id=user_id)),
-            )
+            with use_media_store(self.media_store):
+                agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            self.agent_session = cast(AgentSession, self.storage.upsert(session=agent_session))
+        return self.agent_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[AgentSession]:
+        """Load the AgentSession from storage, without blocking the event loop
+
+        Args:
+            session_id: The session_id to load from storage.
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None:
+            self.agent_session = cast(AgentSession, await self.storage.aread(session_id=session_id))
+            if self.agent_session is not None:
+                self.load_agent_session(session=self.agent_session)
+        return self.agent_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """Save the AgentSession to storage, without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            with use_media_store(self.media_store):
+                agent_session = self.get_agent_session(session_id=session_id, user_id=user_id)
+            self.agent_session = cast(AgentSession, await self.storage.aupsert(session=agent_session))
         return self.agent_session
 
     def add_introduction(self, introduction: str) -> None:
@@ -4964,6 +5069,51 @@ class Agent:
         log_debug(f"Created new {self.__class__.__name__}")
         return new_agent
 
+    def copy_for_run(self) -> Agent:
+        """Create a copy of this Agent for one run, so runs can happen concurrently, e.g. one per server request.
+
+        Unlike deep_copy, the copy shares the configuration and resources of this Agent: the model clients, storage,
+        knowledge, the toolkits behind its tools and its Memory, which keeps runs by session. Run and session state,
+        the tools prepared for the model and AgentMemory, which holds a single session, are its own.
+
+        Returns:
+            Agent: The copy.
+        """
+        from copy import copy, deepcopy
+
+        self.set_agent_id()
+        self._initialize_memory()
+
+        new_agent = copy(self)
+        if self.model is not None:
+            new_agent.model = deepcopy(self.model)
+        if self.reasoning_model is not None:
+            new_agent.reasoning_model = deepcopy(self.reasoning_model)
+        if self.reasoning_agent is not None:
+            new_agent.reasoning_agent = self.reasoning_agent.copy_for_run()
+        if self.team is not None:
+            new_agent.team = [member.copy_for_run() for member in self.team]
+        if isinstance(self.memory, AgentMemory):
+            new_agent.memory = self.memory.deep_copy()
+        if self.tools is not None:
+            new_agent.tools = [copy_tool_for_run(tool) for tool in self.tools]
+        for field_name in ("session_state", "team_session_state", "context", "extra_data"):
+            field_value = getattr(self, field_name)
+            if field_value is not None:
+                setattr(new_agent, field_name, self._deep_copy_field(field_name, field_value))
+
+        new_agent.reset_run_state()
+        new_agent.session_metrics = None
+        new_agent.images = None
+        new_agent.audio = None
+        new_agent.videos = None
+        new_agent.agent_session = None
+        new_agent._tool_instructions = None
+        new_agent._tools_for_model = None
+        new_agent._functions_for_model = None
+        new_agent._rebuild_tools = True
+        return new_agent
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -6551,7 +6701,7 @@ class Agent:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
@@ -6578,7 +6728,7 @@ class Agent:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=agent_session.session_id,
-                    agent_data=agent_session.to_dict() if self.monitoring else agent_session.telemetry_data(),
+                    agent_data=agent_session.monitoring_data() if self.monitoring else agent_session.telemetry_data(),
                     team_session_id=agent_session.team_session_id,
                 ),
                 monitor=self.monitoring,
@@ -7615,32 +7765,21 @@ class Agent:
         return effective_filters
 
     def get_previous_sessions_messages_function(
-        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None
-    ) -> Callable:
+        self, num_history_sessions: Optional[int] = 2, user_id: Optional[str] = None, async_mode: bool = False
+    ) -> Union[Callable, Function]:
         """Factory function to create a get_previous_session_messages function.
 
         Args:
             user_id: The user ID to get sessions for
             num_history_sessions: The last n sessions to be taken from db
+            async_mode: Read the sessions with the async storage methods
 
         Returns:
-            Callable: A function that retrieves messages from previous sessions
+            Union[Callable, Function]: A function that retrieves messages from previous sessions
         """
+        import json
 
-        def get_previous_session_messages() -> str:
-            """Use this function to retrieve messages from previous chat sessions.
-            USE THIS TOOL ONLY WHEN THE QUESTION IS EITHER "What was my last conversation?" or "What was my last question?" and similar to it.
-
-            Returns:
-                str: JSON formatted list of message pairs from previous sessions
-            """
-            import json
-
-            if self.storage is None:
-                return "Storage not available"
-
-            selected_sessions = self.storage.get_recent_sessions(limit=num_history_sessions, user_id=user_id)
-
+        def get_messages_json(selected_sessions: List[Session]) -> str:
             all_messages = []
             seen_message_pairs = set()
 
@@ -7672,6 +7811,34 @@ class Agent:
 
             return json.dumps([msg.to_dict() for msg in all_messages]) if all_messages else "No history found"
 
+        def get_previous_session_messages() -> str:
+            """Use this function to retrieve messages from previous chat sessions.
+            USE THIS TOOL ONLY WHEN THE QUESTION IS EITHER "What was my last conversation?" or "What was my last question?" and similar to it.
+
+            Returns:
+                str: JSON formatted list of message pairs from previous sessions
+            """
+            if self.storage is None:
+                return "Storage not available"
+
+            selected_sessions = self.storage.get_recent_sessions(limit=num_history_sessions, user_id=user_id)
+            return get_messages_json(selected_sessions)
+
+        async def aget_previous_session_messages() -> str:
+            """Use this function to retrieve messages from previous chat sessions.
+            USE THIS TOOL ONLY WHEN THE QUESTION IS EITHER "What was my last conversation?" or "What was my last question?" and similar to it.
+
+            Returns:
+                str: JSON formatted list of message pairs from previous sessions
+            """
+            if self.storage is None:
+                return "Storage not available"
+
+            selected_sessions = await self.storage.aget_recent_sessions(limit=num_history_sessions, user_id=user_id)
+            return get_messages_json(selected_sessions)
+
+        if async_mode:
+            return Function.from_callable(aget_previous_session_messages, name="get_previous_session_messages")
         return get_previous_session_messages
 
     def cli_app(
@@ -0,0 +1,148 @@
+import atexit
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from httpx import Client as HttpxClient
+
+from agno.api.api import api
+from agno.cli.settings import agno_cli_settings
+from agno.utils.log import log_debug
+
+
+class ApiExporter:
+    """Sends events to the Agno API from a background thread, so runs never wait on the network.
+
+    Events are kept in a bounded in-memory queue and dropped when it is full. The worker thread sends the queued
+    events over a persistent HTTP client, when `batch_size` events are queued or every `flush_interval` seconds.
+    The API has no batch route, so every event is still its own POST request: the queue takes the requests off the
+    run and reuses the pooled connection, it does not reduce the number of requests.
+
+    Args:
+        max_queue_size: Maximum number of events waiting to be sent. New events are dropped when the queue is full.
+        batch_size: Number of queued events that wakes the worker before the flush interval.
+        flush_interval: Maximum number of seconds an event waits before it is sent.
+        shutdown_timeout: Number of seconds to wait for queued events to be sent when the process exits.
+        base_url: URL of the API, defaults to the api_url setting.
+        headers: Headers sent with each event, defaults to the authenticated API headers.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 5.0,
+        shutdown_timeout: float = 2.0,
+        base_url: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.base_url = base_url
+        self.headers = headers
+        # Number of events dropped because the queue was full
+        self.dropped_events: int = 0
+
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._client: Optional[HttpxClient] = None
+        self._pid: Optional[int] = None
+        self._atexit_registered = False
+
+    def enqueue(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event to be sent to `route`. Returns False if the event was dropped."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait((route, payload))
+        except queue.Full:
+            self.dropped_events += 1
+            log_debug(f"Dropped API event for {route}, the export queue is full")
+            return False
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events are sent. Returns False if the timeout expired first."""
+        if self._worker is None or not self._worker.is_alive():
+            return self._queue.unfinished_tasks == 0
+        self._wakeup.set()
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: self._queue.unfinished_tasks == 0, timeout=timeout)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Send the queued events and stop the worker thread."""
+        self.flush(timeout=self.shutdown_timeout if timeout is None else timeout)
+        self._stopped.set()
+        self._wakeup.set()
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+            self._worker = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker is not None and self._pid == os.getpid():
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Threads and connections do not survive a fork, start over in the child process
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._client = None
+            self._pid = os.getpid()
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name="agno-api-exporter", daemon=True)
+            self._worker.start()
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+
+    def _get_client(self) -> HttpxClient:
+        if self._client is None:
+            self._client = HttpxClient(
+                base_url=self.base_url or agno_cli_settings.api_url,
+                headers=self.headers if self.headers is not None else api.authenticated_headers,
+                timeout=60,
+            )
+        return self._client
+
+    def _next_events(self) -> List[Tuple[str, Dict[str, Any]]]:
+        events: List[Tuple[str, Dict[str, Any]]] = []
+        while len(events) < self.batch_size:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=self.flush_interval)
+            self._wakeup.clear()
+            while True:
+                events = self._next_events()
+                if not events:
+                    break
+                self._send(events)
+
+    def _send(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        # One request per event, the API has no route that accepts several events
+        for route, payload in events:
+            try:
+                response = self._get_client().post(route, json=payload)
+                response.raise_for_status()
+            except Exception as e:
+                log_debug(f"Could not send API event to {route}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+api_exporter = ApiExporter()
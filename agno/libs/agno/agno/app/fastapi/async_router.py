@@ -283,12 +283,16 @@ def get_async_router(
             agent = next((agent for agent in agents if agent.agent_id == agent_id), None)
             if agent is None:
                 raise HTTPException(status_code=404, detail="Agent not found")
+            # Each request runs its own copy, so concurrent requests don't share run and session state
+            agent = agent.copy_for_run()
             if not message:
                 raise HTTPException(status_code=400, detail="Message is required")
         if team_id and teams:
             team = next((team for team in teams if team.team_id == team_id), None)
             if team is None:
                 raise HTTPException(status_code=404, detail="Team not found")
+            # Each request runs its own copy, so concurrent requests don't share run and session state
+            team = team.copy_for_run()
             if not message:
                 raise HTTPException(status_code=400, detail="Message is required")
         if workflow_id and workflows:
@@ -11,10 +11,10 @@ from agno.agent.agent import Agent, RunResponse
 from agno.app.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_team_session,
-    get_session_title_from_workflow_session,
+    get_agent_for_run,
+    get_session_title_from_summary,
     get_team_by_id,
+    get_team_for_run,
     get_workflow_by_id,
 )
 from agno.app.playground.schemas import (
@@ -254,7 +254,7 @@ def get_async_playground_router(
         files: Optional[List[UploadFile]] = File(None),
     ):
         logger.debug(f"AgentRunRequest: {message} {session_id} {user_id} {agent_id}")
-        agent = get_agent_by_id(agent_id, agents)
+        agent = get_agent_for_run(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -437,7 +437,7 @@ def get_async_playground_router(
         logger.debug(
             f"AgentContinueRunRequest: run_id={run_id} session_id={session_id} user_id={user_id} agent_id={agent_id}"
         )
-        agent = get_agent_by_id(agent_id, agents)
+        agent = get_agent_for_run(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
 
@@ -483,7 +483,12 @@ def get_async_playground_router(
             return run_response_obj.to_dict()
 
     @playground_router.get("/agents/{agent_id}/sessions")
-    async def get_all_agent_sessions(agent_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_agent_sessions(
+        agent_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         logger.debug(f"AgentSessionsRequest: {agent_id} {user_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
@@ -493,15 +498,16 @@ def get_async_playground_router(
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
         agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=user_id, entity_id=agent_id)  # type: ignore
-        for session in all_agent_sessions:
-            title = get_session_title(session)
+        summaries = agent.storage.list_session_summaries(
+            user_id=user_id, entity_id=agent_id, limit=limit, offset=offset
+        )
+        for summary in summaries:
             agent_sessions.append(
                 AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_summary(summary, "agent"),
+                    session_id=summary.session_id,
+                    session_name=summary.session_name,
+                    created_at=summary.created_at,
                 )
             )
         return agent_sessions
@@ -547,7 +553,7 @@ def get_async_playground_router(
 
     @playground_router.post("/agents/{agent_id}/sessions/{session_id}/rename")
     async def rename_agent_session(agent_id: str, session_id: str, body: AgentRenameRequest):
-        agent = get_agent_by_id(agent_id, agents)
+        agent = get_agent_for_run(agent_id, agents)
         if agent is None:
             return JSONResponse(status_code=404, content=f"couldn't find agent with {agent_id}")
 
@@ -658,7 +664,12 @@ def get_async_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.get("/workflows/{workflow_id}/sessions")
-    async def get_all_workflow_sessions(workflow_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_workflow_sessions(
+        workflow_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -670,22 +681,21 @@ def get_async_playground_router(
 
         # Retrieve all sessions for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=user_id, entity_id=workflow_id
-            )  # type: ignore
+            summaries = workflow.storage.list_session_summaries(
+                user_id=user_id, entity_id=workflow_id, limit=limit, offset=offset
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         # Return the sessions
         workflow_sessions: List[WorkflowSessionResponse] = []
-        for session in all_workflow_sessions:
-            title = get_session_title_from_workflow_session(session)
+        for summary in summaries:
             workflow_sessions.append(
                 {
-                    "title": title,
-                    "session_id": session.session_id,
-                    "session_name": session.session_data.get("session_name") if session.session_data else None,
-                    "created_at": session.created_at,
+                    "title": get_session_title_from_summary(summary, "workflow"),
+                    "session_id": summary.session_id,
+                    "session_name": summary.session_name,
+                    "created_at": summary.created_at,
                 }  # type: ignore
             )
         return workflow_sessions
@@ -759,7 +769,7 @@ def get_async_playground_router(
         files: Optional[List[UploadFile]] = File(None),
     ):
         logger.debug(f"Creating team run: {message} {session_id} {monitor} {user_id} {team_id} {files}")
-        team = get_team_by_id(team_id, teams)
+        team = get_team_for_run(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
@@ -855,7 +865,12 @@ def get_async_playground_router(
             return run_response.to_dict()
 
     @playground_router.get("/teams/{team_id}/sessions", response_model=List[TeamSessionResponse])
-    async def get_all_team_sessions(team_id: str, user_id: Optional[str] = Query(None, min_length=1)):
+    async def get_all_team_sessions(
+        team_id: str,
+        user_id: Optional[str] = Query(None, min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        offset: int = Query(0, ge=0),
+    ):
         team = get_team_by_id(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
@@ -864,19 +879,20 @@ def get_async_playground_router(
             raise HTTPException(status_code=404, detail="Team does not have storage enabled")
 
         try:
-            all_team_sessions: List[TeamSession] = team.storage.get_all_sessions(user_id=user_id, entity_id=team_id)  # type: ignore
+            summaries = team.storage.list_session_summaries(
+                user_id=user_id, entity_id=team_id, limit=limit, offset=offset
+            )
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
 
         team_sessions: List[TeamSessionResponse] = []
-        for session in all_team_sessions:
-            title = get_session_title_from_team_session(session)
+        for summary in summaries:
             team_sessions.append(
                 TeamSessionResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
+                    title=get_session_title_from_summary(summary, "team"),
+                    session_id=summary.session_id,
+                    session_name=summary.session_name,
+                    created_at=summary.created_at,
                 )
             )
         return team_sessions
@@ -929,7 +945,7 @@ def get_async_playground_router(
 
     @playground_router.post("/teams/{team_id}/sessions/{session_id}/rename")
     async def rename_team_session(team_id: str, session_id: str, body: TeamRenameRequest):
-        team = get_team_by_id(team_id, teams)
+        team = get_team_for_run(team_id, teams)
         if team is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
@@ -1,8 +1,9 @@
-from typing import Any, List, Optional, Union, cast
+from typing import Any, List, Literal, Optional, Union, cast
 
 from agno.agent.agent import Agent, AgentRun, Function, Toolkit
 from agno.run.response import RunResponse
 from agno.run.team import TeamRunResponse
+from agno.storage.session import StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -40,6 +41,12 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
     return None
 
 
+def get_agent_for_run(agent_id: str, agents: Optional[List[Agent]] = None) -> Optional[Agent]:
+    """Get a copy of an agent for one request, so concurrent requests don't share its run and session state"""
+    agent = get_agent_by_id(agent_id, agents)
+    return agent.copy_for_run() if agent is not None else None
+
+
 def get_session_title(session: Union[AgentSession, TeamSession]) -> str:
     if session is None:
         return "Unnamed session"
@@ -139,6 +146,12 @@ def get_team_by_id(team_id: str, teams: Optional[List[Team]] = None) -> Optional
     return None
 
 
+def get_team_for_run(team_id: str, teams: Optional[List[Team]] = None) -> Optional[Team]:
+    """Get a copy of a team for one request, so concurrent requests don't share its run and session state"""
+    team = get_team_by_id(team_id, teams)
+    return team.copy_for_run() if team is not None else None
+
+
 def get_session_title_from_team_session(team_session: TeamSession) -> str:
     if team_session is None:
         return "Unnamed session"
@@ -175,3 +188,20 @@ def get_session_title_from_team_session(team_session: TeamSession) -> str:
             except Exception as e:
                 logger.error(f"Error parsing chat: {e}")
     return "Unnamed session"
+
+
+def get_session_title_from_summary(
+    summary: StoredSessionSummary, mode: Literal["agent", "team", "workflow"] = "agent"
+) -> str:
+    """Get the title of a session from its stored summary, without loading the whole session."""
+    session_data = {"session_name": summary.session_name} if summary.session_name is not None else None
+    memory = {"runs": [summary.first_run] if summary.first_run is not None else []}
+    if mode == "workflow":
+        return get_session_title_from_workflow_session(
+            WorkflowSession(session_id=summary.session_id, session_data=session_data, memory=memory)
+        )
+    if mode == "team":
+        return get_session_title_from_team_session(
+            TeamSession(session_id=summary.session_id, session_data=session_data, memory=memory)
+        )
+    return get_session_title(AgentSession(session_id=summary.session_id, session_data=session_data, memory=memory))
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from hashlib import md5
 from typing import Any, Dict, List, Optional
 
 from agno.embedder import Embedder
+from agno.utils.log import log_error, log_warning
 
 
 @dataclass
@@ -17,6 +19,12 @@ class Document:
     usage: Optional[Dict[str, Any]] = None
     reranking_score: Optional[float] = None
 
+    @property
+    def content_hash(self) -> str:
+        """md5 hash of the content, as used by the vector dbs to identify documents"""
+        cleaned_content = self.content.replace("\x00", "\ufffd")
+        return md5(cleaned_content.encode()).hexdigest()
+
     def embed(self, embedder: Optional[Embedder] = None) -> None:
         """Embed the document using the provided embedder"""
 
@@ -26,6 +34,97 @@ class Document:
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @classmethod
+    def _embed_individually(cls, documents: List["Document"], embedder: Embedder) -> List["Document"]:
+        failed: List[Document] = []
+        for doc in documents:
+            try:
+                doc.embed(embedder=embedder)
+                doc.embedder = embedder
+            except Exception as e:
+                log_error(f"Error embedding document '{doc.name}': {e}")
+            if not doc.embedding:
+                failed.append(doc)
+        return failed
+
+    @classmethod
+    async def _async_embed_individually(cls, documents: List["Document"], embedder: Embedder) -> List["Document"]:
+        failed: List[Document] = []
+        for doc in documents:
+            try:
+                # Embedders without an async API embed in a thread, so the event loop is not blocked
+                embeddings, usages = await embedder.async_get_embeddings_batch_and_usage([doc.content])
+                cls._set_embeddings([doc], embedder, embeddings, usages)
+            except Exception as e:
+                log_error(f"Error embedding document '{doc.name}': {e}")
+            if not doc.embedding:
+                failed.append(doc)
+        return failed
+
+    @classmethod
+    def _pending_embedding(cls, documents: List["Document"], embedder: Embedder) -> List["Document"]:
+        # Documents that were already embedded by this embedder, e.g. by an ingestion pipeline, are skipped
+        return [doc for doc in documents if not (doc.embedding and doc.embedder is embedder)]
+
+    @classmethod
+    def _set_embeddings(
+        cls,
+        documents: List["Document"],
+        embedder: Embedder,
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict[str, Any]]],
+    ) -> None:
+        for doc, embedding, usage in zip(documents, embeddings, usages):
+            doc.embedding, doc.usage, doc.embedder = embedding, usage, embedder
+
+    @classmethod
+    def embed_documents(cls, documents: List["Document"], embedder: Embedder) -> List["Document"]:
+        """Embed a list of documents using batched requests to the embedder.
+        Falls back to embedding each document individually if the batch request fails,
+        in which case documents that cannot be embedded are left without an embedding.
+
+        Returns:
+            List[Document]: The documents that could not be embedded, which should not be written.
+        """
+        pending = cls._pending_embedding(documents, embedder)
+        if not pending:
+            return []
+
+        try:
+            embeddings, usages = embedder.get_embeddings_batch_and_usage([doc.content for doc in pending])
+            if len(embeddings) != len(pending):
+                raise ValueError(f"Expected {len(pending)} embeddings, but got {len(embeddings)}")
+        except Exception as e:
+            log_warning(f"Batch embedding failed, embedding documents one at a time: {e}")
+            return cls._embed_individually(pending, embedder=embedder)
+
+        cls._set_embeddings(pending, embedder, embeddings, usages)
+        return [doc for doc in pending if not doc.embedding]
+
+    @classmethod
+    async def async_embed_documents(cls, documents: List["Document"], embedder: Embedder) -> List["Document"]:
+        """Embed a list of documents asynchronously using batched requests to the embedder.
+        Falls back to embedding each document individually if the batch request fails,
+        in which case documents that cannot be embedded are left without an embedding.
+
+        Returns:
+            List[Document]: The documents that could not be embedded, which should not be written.
+        """
+        pending = cls._pending_embedding(documents, embedder)
+        if not pending:
+            return []
+
+        try:
+            embeddings, usages = await embedder.async_get_embeddings_batch_and_usage([doc.content for doc in pending])
+            if len(embeddings) != len(pending):
+                raise ValueError(f"Expected {len(pending)} embeddings, but got {len(embeddings)}")
+        except Exception as e:
+            log_warning(f"Batch embedding failed, embedding documents one at a time: {e}")
+            return await cls._async_embed_individually(pending, embedder=embedder)
+
+        cls._set_embeddings(pending, embedder, embeddings, usages)
+        return [doc for doc in pending if not doc.embedding]
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
         fields = {"name", "meta_data", "content"}
@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
@@ -7,9 +9,92 @@ class Embedder:
     """Base class for managing embedders"""
 
     dimensions: Optional[int] = 1536
+    # Maximum number of texts sent to the provider in a single request
+    batch_size: int = 100
+    # Maximum number of batch requests in flight at the same time
+    max_concurrency: int = 4
 
     def get_embedding(self, text: str) -> List[float]:
         raise NotImplementedError
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts in one provider request.
+
+        The default implementation falls back to one request per text.
+        Embedders with a native multi-input API should override this method.
+        When a single request embeds several texts, the request usage is reported on the first
+        text of the batch and None on the rest, so that summing usage across documents stays correct.
+        """
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for text in texts:
+            embedding, usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            usages.append(usage)
+        return embeddings, usages
+
+    async def _async_embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a single batch of texts asynchronously. Runs the sync batch in a thread by default."""
+        return await asyncio.to_thread(self._embed_batch_and_usage, texts)
+
+    def _split_batches(self, texts: List[str]) -> List[List[str]]:
+        batch_size = max(self.batch_size, 1)
+        return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts, returning the embeddings and usage in the same order as the input.
+
+        Texts are split into requests of at most `batch_size` texts, and up to `max_concurrency`
+        requests are run at the same time.
+        """
+        if not texts:
+            return [], []
+
+        batches = self._split_batches(texts)
+        if len(batches) == 1 or self.max_concurrency <= 1:
+            results = [self._embed_batch_and_usage(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(batches))) as executor:
+                # executor.map preserves the order of the batches
+                results = list(executor.map(self._embed_batch_and_usage, batches))
+
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch_embeddings, batch_usages in results:
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    def get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts, returning the embeddings in the same order as the input."""
+        return self.get_embeddings_batch_and_usage(texts)[0]
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        """Embed a list of texts asynchronously, with at most `max_concurrency` requests in flight."""
+        if not texts:
+            return [], []
+
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def _embed(batch: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+            async with semaphore:
+                return await self._async_embed_batch_and_usage(batch)
+
+        # asyncio.gather preserves the order of the batches
+        results = await asyncio.gather(*[_embed(batch) for batch in self._split_batches(texts)])
+
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        for batch_embeddings, batch_usages in results:
+            embeddings.extend(batch_embeddings)
+            usages.extend(batch_usages)
+        return embeddings, usages
+
+    async def async_get_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of texts asynchronously, returning the embeddings in the same order as the input."""
+        return (await self.async_get_embeddings_batch_and_usage(texts))[0]
@@ -0,0 +1,320 @@
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, field
+from hashlib import md5
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agno.embedder.base import Embedder
+from agno.utils.log import log_debug, log_warning
+from agno.utils.lru_cache import LRUCache
+from agno.utils.shared import SharedOnCopy
+
+
+class EmbeddingCacheStore(ABC):
+    """Base class for stores that persist embeddings keyed on a content-addressed cache key"""
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings for the keys that are present in the store"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryEmbeddingCacheStore(EmbeddingCacheStore):
+    """Process-local embedding cache with LRU eviction"""
+
+    def __init__(self, max_entries: int = 100_000):
+        self._cache: LRUCache[List[float]] = LRUCache(max_size=max_entries)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        for key in keys:
+            embedding = self._cache.get(key)
+            if embedding is not None:
+                found[key] = embedding
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        for key, embedding in items.items():
+            self._cache.set(key, embedding)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class SqliteEmbeddingCacheStore(SharedOnCopy, EmbeddingCacheStore):
+    """Embedding cache persisted to a local sqlite file, shared by every vector db and process using the file.
+
+    Embeddings are stored as packed float32 blobs. When the number of entries exceeds `max_entries`,
+    the least recently used entries are evicted. The number of entries is tracked from the keys each write adds,
+    and counted again every `RECOUNT_INTERVAL` writes to include the entries written by other processes.
+    """
+
+    RECOUNT_INTERVAL = 100
+
+    def __init__(
+        self,
+        db_file: str = "tmp/embedding_cache.db",
+        table_name: str = "embedding_cache",
+        max_entries: Optional[int] = 1_000_000,
+    ):
+        db_path = Path(db_file).resolve()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_file: str = str(db_path)
+        self.table_name: str = table_name
+        self.max_entries: Optional[int] = max_entries
+
+        self._lock = threading.Lock()
+        # Number of entries in the table, None until counted
+        self._row_count: Optional[int] = None
+        self._writes_since_count = 0
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_last_used ON {self.table_name} (last_used)"
+            )
+
+    @staticmethod
+    def _pack(embedding: List[float]) -> bytes:
+        return array("f", embedding).tobytes()
+
+    @staticmethod
+    def _unpack(blob: bytes) -> List[float]:
+        values = array("f")
+        values.frombytes(blob)
+        return values.tolist()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        if not keys:
+            return found
+
+        now = time.time()
+        # Stay well below the sqlite limit on the number of bound parameters
+        for i in range(0, len(keys), 500):
+            chunk = list(keys[i : i + 500])
+            placeholders = ",".join("?" * len(chunk))
+            with self._lock, self._connection:
+                rows = self._connection.execute(
+                    f"SELECT key, embedding FROM {self.table_name} WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                if rows:
+                    self._connection.execute(
+                        f"UPDATE {self.table_name} SET last_used = ? WHERE key IN ({placeholders})", [now, *chunk]
+                    )
+            for key, blob in rows:
+                found[key] = self._unpack(blob)
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        if not items:
+            return
+
+        now = time.time()
+        rows = [(key, self._pack(embedding), now) for key, embedding in items.items()]
+        with self._lock, self._connection:
+            count = 0
+            if self.max_entries is not None:
+                count = self._get_row_count() + len(rows) - self._count_stored(list(items))
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, embedding, last_used) VALUES (?, ?, ?)", rows
+            )
+            if self.max_entries is not None:
+                if count > self.max_entries:
+                    log_debug(f"Evicting {count - self.max_entries} entries from the embedding cache")
+                    self._connection.execute(
+                        f"DELETE FROM {self.table_name} WHERE key IN ("
+                        f"SELECT key FROM {self.table_name} ORDER BY last_used ASC LIMIT ?)",
+                        (count - self.max_entries,),
+                    )
+                    count = self.max_entries
+                self._row_count = count
+
+    def _get_row_count(self) -> int:
+        # Called with the lock held
+        if self._row_count is None or self._writes_since_count >= self.RECOUNT_INTERVAL:
+            self._row_count = self._connection.execute(f"SELECT COUNT(*) FROM {self.table_name}").fetchone()[0]
+            self._writes_since_count = 0
+        self._writes_since_count += 1
+        return self._row_count
+
+    def _count_stored(self, keys: List[str]) -> int:
+        # Called with the lock held, counts the keys that are already in the table
+        stored = 0
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            stored += self._connection.execute(
+                f"SELECT COUNT(*) FROM {self.table_name} WHERE key IN ({placeholders})", chunk
+            ).fetchone()[0]
+        return stored
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
+            self._row_count = 0
+
+
+@dataclass
+class CachedEmbedder(Embedder):
+    """Wraps any Embedder with a content-addressed embedding cache.
+
+    Cache keys combine the wrapped embedder's id, its dimensions and the md5 hash of the text, so the same
+    cache can be shared across vector dbs and knowledge base reloads without mixing up embedding spaces.
+    Recently used embeddings are also kept in an in-memory LRU in front of the store, which makes repeated
+    search queries free.
+    """
+
+    embedder: Optional[Embedder] = None
+    # Store for embeddings. Defaults to an in-memory store.
+    cache: Optional[EmbeddingCacheStore] = None
+    # Number of embeddings kept in memory in front of the store
+    memory_cache_size: int = 1024
+    _memory_cache: LRUCache = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if self.embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        if self.cache is None:
+            self.cache = InMemoryEmbeddingCacheStore()
+        self.dimensions = self.embedder.dimensions
+        self.batch_size = self.embedder.batch_size
+        self.max_concurrency = self.embedder.max_concurrency
+        self._memory_cache = LRUCache(max_size=self.memory_cache_size)
+
+    @property
+    def embedder_id(self) -> str:
+        return f"{self.embedder.__class__.__name__}:{getattr(self.embedder, 'id', '')}"
+
+    def cache_key(self, text: str) -> str:
+        # Hash the content the same way the vector dbs compute their content_hash
+        content_hash = md5(text.replace("\x00", "\ufffd").encode()).hexdigest()
+        return f"{self.embedder_id}:{self.dimensions}:{content_hash}"
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found: Dict[str, List[float]] = {}
+        missing: List[str] = []
+        for key in keys:
+            embedding = self._memory_cache.get(key)
+            if embedding is not None:
+                found[key] = embedding
+            else:
+                missing.append(key)
+
+        if missing:
+            try:
+                from_store = self.cache.get_many(missing)  # type: ignore
+            except Exception as e:
+                log_warning(f"Error reading from embedding cache: {e}")
+                from_store = {}
+            for key, embedding in from_store.items():
+                self._memory_cache.set(key, embedding)
+            found.update(from_store)
+        return found
+
+    def _store(self, items: Dict[str, List[float]]) -> None:
+        # Do not cache failed embeddings
+        items = {key: embedding for key, embedding in items.items() if embedding}
+        if not items:
+            return
+        for key, embedding in items.items():
+            self._memory_cache.set(key, embedding)
+        try:
+            self.cache.set_many(items)  # type: ignore
+        except Exception as e:
+            log_warning(f"Error writing to embedding cache: {e}")
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        key = self.cache_key(text)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key], None
+
+        embedding, usage = self.embedder.get_embedding_and_usage(text)  # type: ignore
+        self._store({key: embedding})
+        return embedding, usage
+
+    def _split_hits_and_misses(
+        self, texts: List[str]
+    ) -> Tuple[List[str], Dict[str, List[float]], Dict[str, Tuple[int, str]]]:
+        keys = [self.cache_key(text) for text in texts]
+        cached = self._lookup(keys)
+        # Deduplicate misses so that repeated texts are only embedded once
+        misses: Dict[str, Tuple[int, str]] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in misses:
+                misses[key] = (len(misses), text)
+        return keys, cached, misses
+
+    def _merge(
+        self,
+        keys: List[str],
+        cached: Dict[str, List[float]],
+        misses: Dict[str, Tuple[int, str]],
+        embeddings: List[List[float]],
+        usages: List[Optional[Dict]],
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if len(embeddings) != len(misses):
+            raise ValueError(f"Expected {len(misses)} embeddings, but got {len(embeddings)}")
+        self._store({key: embeddings[index] for key, (index, _) in misses.items()})
+        log_debug(f"Embedding cache: {len(keys) - len(misses)} hits, {len(misses)} misses")
+
+        result_embeddings: List[List[float]] = []
+        result_usages: List[Optional[Dict]] = []
+        reported = set()
+        for key in keys:
+            if key in cached:
+                result_embeddings.append(cached[key])
+                result_usages.append(None)
+            else:
+                index = misses[key][0]
+                result_embeddings.append(embeddings[index])
+                # Only report the usage once for duplicated texts
+                result_usages.append(usages[index] if index not in reported else None)
+                reported.add(index)
+        return result_embeddings, result_usages
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if not texts:
+            return [], []
+        keys, cached, misses = self._split_hits_and_misses(texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if misses:
+            embeddings, usages = self.embedder.get_embeddings_batch_and_usage([text for _, text in misses.values()])  # type: ignore
+        return self._merge(keys, cached, misses, embeddings, usages)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if not texts:
+            return [], []
+        keys, cached, misses = self._split_hits_and_misses(texts)
+        embeddings: List[List[float]] = []
+        usages: List[Optional[Dict]] = []
+        if misses:
+            embeddings, usages = await self.embedder.async_get_embeddings_batch_and_usage(  # type: ignore
+                [text for _, text in misses.values()]
+            )
+        return self._merge(keys, cached, misses, embeddings, usages)
@@ -15,6 +15,8 @@ except ImportError:
 class CohereEmbedder(Embedder):
     id: str = "embed-english-v3.0"
     input_type: str = "search_query"
+    # The Cohere embed endpoint accepts at most 96 texts per request
+    batch_size: int = 96
     embedding_types: Optional[List[str]] = None
     api_key: Optional[str] = None
     request_params: Optional[Dict[str, Any]] = None
@@ -31,7 +33,9 @@ class CohereEmbedder(Embedder):
         self.cohere_client = CohereClient(**client_params)
         return self.cohere_client
 
-    def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+    def response(
+        self, text: Union[str, List[str]]
+    ) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.id:
@@ -42,7 +46,8 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        texts = text if isinstance(text, list) else [text]
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -71,3 +76,20 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=texts)
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = list(response.embeddings)
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = list(response.embeddings.float_) if response.embeddings.float_ else []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+
+        usages: List[Optional[Dict]] = [None] * len(texts)
+        usage = response.meta.billed_units if response.meta else None
+        if usage:
+            usages[0] = usage.model_dump()
+        return embeddings, usages
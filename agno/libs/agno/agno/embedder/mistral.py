@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import getenv
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -47,7 +47,7 @@ class MistralEmbedder(Embedder):
 
         return self.mistral_client
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.id,
@@ -80,3 +80,14 @@ class MistralEmbedder(Embedder):
         except Exception as e:
             logger.warning(f"Error getting embedding and usage: {e}")
             return [], {}
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingResponse = self._response(text=texts)
+
+        embeddings: List[List[float]] = [data.embedding or [] for data in response.data] if response.data else []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        usages: List[Optional[Dict]] = [None] * len(texts)
+        if response.usage:
+            usages[0] = response.usage.model_dump()
+        return embeddings, usages
@@ -88,3 +88,21 @@ class OllamaEmbedder(Embedder):
         embedding = self.get_embedding(text=text)
         usage = None
         return embedding, usage
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+
+        response = self.client.embed(input=texts, model=self.id, **kwargs)
+        embeddings = list(response["embeddings"]) if response and "embeddings" in response else []
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+
+        checked_embeddings: List[List[float]] = []
+        for embedding in embeddings:
+            if len(embedding) != self.dimensions:
+                logger.warning(f"Expected embedding dimension {self.dimensions}, but got {len(embedding)}")
+                embedding = []
+            checked_embeddings.append(embedding)
+        return checked_embeddings, [None] * len(texts)
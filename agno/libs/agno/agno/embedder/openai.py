@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -7,6 +7,7 @@ from agno.embedder.base import Embedder
 from agno.utils.log import logger
 
 try:
+    from openai import AsyncOpenAI as AsyncOpenAIClient
     from openai import OpenAI as OpenAIClient
     from openai.types.create_embedding_response import CreateEmbeddingResponse
 except ImportError:
@@ -25,12 +26,9 @@ class OpenAIEmbedder(Embedder):
     request_params: Optional[Dict[str, Any]] = None
     client_params: Optional[Dict[str, Any]] = None
     openai_client: Optional[OpenAIClient] = None
+    async_openai_client: Optional[AsyncOpenAIClient] = None
 
-    @property
-    def client(self) -> OpenAIClient:
-        if self.openai_client:
-            return self.openai_client
-
+    def _get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {
             "api_key": self.api_key,
             "organization": self.organization,
@@ -39,12 +37,27 @@ class OpenAIEmbedder(Embedder):
         _client_params = {k: v for k, v in _client_params.items() if v is not None}
         if self.client_params:
             _client_params.update(self.client_params)
-        self.openai_client = OpenAIClient(**_client_params)
+        return _client_params
+
+    @property
+    def client(self) -> OpenAIClient:
+        if self.openai_client:
+            return self.openai_client
+
+        self.openai_client = OpenAIClient(**self._get_client_params())
         return self.openai_client
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    @property
+    def async_client(self) -> AsyncOpenAIClient:
+        if self.async_openai_client:
+            return self.async_openai_client
+
+        self.async_openai_client = AsyncOpenAIClient(**self._get_client_params())
+        return self.async_openai_client
+
+    def _get_request_params(self, input: Union[str, List[str]]) -> Dict[str, Any]:
         _request_params: Dict[str, Any] = {
-            "input": text,
+            "input": input,
             "model": self.id,
             "encoding_format": self.encoding_format,
         }
@@ -54,7 +67,13 @@ class OpenAIEmbedder(Embedder):
             _request_params["dimensions"] = self.dimensions
         if self.request_params:
             _request_params.update(self.request_params)
-        return self.client.embeddings.create(**_request_params)
+        return _request_params
+
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return self.client.embeddings.create(**self._get_request_params(text))
+
+    async def async_response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
+        return await self.async_client.embeddings.create(**self._get_request_params(text))
 
     def get_embedding(self, text: str) -> List[float]:
         response: CreateEmbeddingResponse = self.response(text=text)
@@ -72,3 +91,21 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def _parse_batch_response(
+        self, response: CreateEmbeddingResponse, num_texts: int
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        # The API may return the embeddings out of order, so sort them by their input index
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+        if len(embeddings) != num_texts:
+            raise ValueError(f"Expected {num_texts} embeddings, but got {len(embeddings)}")
+        usages: List[Optional[Dict]] = [None] * num_texts
+        if response.usage:
+            usages[0] = response.usage.model_dump()
+        return embeddings, usages
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_response(self.response(text=texts), len(texts))
+
+    async def _async_embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return self._parse_batch_response(await self.async_response(text=texts), len(texts))
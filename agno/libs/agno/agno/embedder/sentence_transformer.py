@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -19,11 +20,13 @@ class SentenceTransformerEmbedder(Embedder):
     prompt: Optional[str] = None
     normalize_embeddings: bool = False
 
-    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+    def _get_model(self) -> SentenceTransformer:
         if not self.sentence_transformer_client:
-            model = SentenceTransformer(model_name_or_path=self.id)
-        else:
-            model = self.sentence_transformer_client
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.id)
+        return self.sentence_transformer_client
+
+    def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
+        model = self._get_model()
         embedding = model.encode(text, prompt=self.prompt, normalize_embeddings=self.normalize_embeddings)
         try:
             return embedding  # type: ignore
@@ -33,3 +36,20 @@ class SentenceTransformerEmbedder(Embedder):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        # The model batches locally, so encode all texts in a single call instead of splitting into requests
+        if not texts:
+            return [], []
+        embeddings = self._get_model().encode(
+            texts,
+            prompt=self.prompt,
+            normalize_embeddings=self.normalize_embeddings,
+            batch_size=self.batch_size,
+        )
+        return [embedding.tolist() for embedding in embeddings], [None] * len(texts)
+
+    async def async_get_embeddings_batch_and_usage(
+        self, texts: List[str]
+    ) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        return await asyncio.to_thread(self.get_embeddings_batch_and_usage, texts)
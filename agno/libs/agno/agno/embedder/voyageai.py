@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agno.embedder.base import Embedder
 from agno.utils.log import logger
@@ -39,9 +39,9 @@ class VoyageAIEmbedder(Embedder):
         self.voyage_client = VoyageClient(**_client_params)
         return self.voyage_client
 
-    def _response(self, text: str) -> EmbeddingsObject:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": text if isinstance(text, list) else [text],
             "model": self.id,
         }
         if self.request_params:
@@ -62,3 +62,13 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        response: EmbeddingsObject = self._response(text=texts)
+
+        embeddings = list(response.embeddings)
+        if len(embeddings) != len(texts):
+            raise ValueError(f"Expected {len(texts)} embeddings, but got {len(embeddings)}")
+        usages: List[Optional[Dict]] = [None] * len(texts)
+        usages[0] = {"total_tokens": response.total_tokens}
+        return embeddings, usages
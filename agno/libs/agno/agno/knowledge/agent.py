@@ -1,6 +1,12 @@
 import asyncio
+import pickle
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, AsyncIterator, ClassVar, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -8,9 +14,18 @@ from agno.document import Document
 from agno.document.chunking.fixed import FixedSizeChunking
 from agno.document.chunking.strategy import ChunkingStrategy
 from agno.document.reader.base import Reader
-from agno.utils.log import log_debug, log_info, logger
+from agno.knowledge.manifest import SourceManifest
+from agno.knowledge.pipeline import IngestionPipeline
+from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb import VectorDb
 
+# Files read from disk by a knowledge base, with the metadata to add to their documents
+SourceFiles = List[Tuple[Path, Dict[str, Any]]]
+# Manifest and pending entries of the load running in the current thread or task, see AgentKnowledge._track_sources
+_manifest_load: ContextVar[Optional[Tuple[SourceManifest, Dict[str, Dict[str, Any]]]]] = ContextVar(
+    "agno_manifest_load", default=None
+)
+
 
 class AgentKnowledge(BaseModel):
     """Base class for Agent knowledge"""
@@ -26,6 +41,17 @@ class AgentKnowledge(BaseModel):
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
+    # Pipeline used by load/aload to overlap reading, chunking, embedding and writing
+    ingestion_pipeline: Optional[IngestionPipeline] = None
+    # Manifest of loaded files, used by load/aload to only reload files that changed
+    manifest: Optional[SourceManifest] = None
+    # Number of processes reading files in parallel, for knowledge bases that read files from disk.
+    # None reads one file at a time in this process.
+    num_parse_workers: Optional[int] = Field(default=None, ge=1)
+
+    # Name of the reader argument that takes the file path, for knowledge bases that read files from disk
+    _reader_path_arg: ClassVar[str] = "file"
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     valid_metadata_filters: Set[str] = None  # type: ignore
@@ -50,6 +76,90 @@ class AgentKnowledge(BaseModel):
         """
         raise NotImplementedError
 
+    def _add_file_metadata(self, documents: List[Document], metadata: Dict[str, Any]) -> List[Document]:
+        if metadata:
+            for doc in documents:
+                log_info(f"Adding metadata {metadata} to document: {doc.name}")
+                doc.meta_data.update(metadata)  # type: ignore
+        return documents
+
+    def _parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Get a process pool for reading files, or None if files should be read in this process"""
+        if self.num_parse_workers is None or self.reader is None:
+            return None
+        try:
+            # The reader is sent to the worker processes with every file
+            pickle.dumps(self.reader)
+        except Exception as e:
+            log_warning(f"Reader can not be sent to worker processes, reading files in this process: {e}")
+            return None
+        return ProcessPoolExecutor(max_workers=self.num_parse_workers)
+
+    def _read_files(self, files: SourceFiles) -> Iterator[List[Document]]:
+        """Read files and yield the documents of each file, in the order of the files.
+
+        With `num_parse_workers` set, files are read in a process pool, so CPU-bound parsing runs on several
+        cores. At most two files per worker are read ahead of the file being yielded.
+        """
+        if self.reader is None:
+            raise ValueError("Reader is not set")
+        executor = self._parse_pool() if len(files) > 1 else None
+        if executor is None:
+            for path, metadata in files:
+                documents = self.reader.read(**{self._reader_path_arg: path})
+                yield self._add_file_metadata(documents, metadata)
+            return
+
+        read_ahead = 2 * self.num_parse_workers  # type: ignore
+        pending: Deque[Tuple[Future, Dict[str, Any]]] = deque()
+        try:
+            for path, metadata in files:
+                pending.append((executor.submit(self.reader.read, **{self._reader_path_arg: path}), metadata))
+                if len(pending) >= read_ahead:
+                    future, file_metadata = pending.popleft()
+                    yield self._add_file_metadata(future.result(), file_metadata)
+            while pending:
+                future, file_metadata = pending.popleft()
+                yield self._add_file_metadata(future.result(), file_metadata)
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    async def _async_read_files(self, files: SourceFiles) -> AsyncIterator[List[Document]]:
+        """Read files asynchronously and yield the documents of each file, in the order of the files.
+
+        With `num_parse_workers` set, files are read in a process pool, as the parsing is CPU-bound and does not
+        benefit from the reader's async methods.
+        """
+        if self.reader is None:
+            raise ValueError("Reader is not set")
+        executor = self._parse_pool() if len(files) > 1 else None
+        if executor is None:
+            for path, metadata in files:
+                documents = await self.reader.async_read(**{self._reader_path_arg: path})
+                yield self._add_file_metadata(documents, metadata)
+            return
+
+        loop = asyncio.get_running_loop()
+        read_ahead = 2 * self.num_parse_workers  # type: ignore
+        pending: Deque[Tuple[asyncio.Future, Dict[str, Any]]] = deque()
+        try:
+            for path, metadata in files:
+                read = partial(self.reader.read, **{self._reader_path_arg: path})
+                pending.append((loop.run_in_executor(executor, read), metadata))
+                if len(pending) >= read_ahead:
+                    future, file_metadata = pending.popleft()
+                    yield self._add_file_metadata(await future, file_metadata)
+            while pending:
+                future, file_metadata = pending.popleft()
+                yield self._add_file_metadata(await future, file_metadata)
+        finally:
+            for future, _ in pending:
+                future.cancel()
+            # Wait for the files being read without blocking the event loop
+            await asyncio.to_thread(executor.shutdown, wait=True)
+
     def search(
         self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
@@ -86,6 +196,42 @@ class AgentKnowledge(BaseModel):
             logger.error(f"Error searching for documents: {e}")
             return []
 
+    def search_many(
+        self, queries: List[str], num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Returns relevant documents for each of the queries, in the order of the queries"""
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return [[] for _ in queries]
+
+            _num_documents = num_documents or self.num_documents
+            log_debug(f"Getting {_num_documents} relevant documents for {len(queries)} queries: {queries}")
+            return self.vector_db.search_many(queries=queries, limit=_num_documents, filters=filters)
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return [[] for _ in queries]
+
+    async def async_search_many(
+        self, queries: List[str], num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Returns relevant documents for each of the queries, in the order of the queries"""
+        try:
+            if self.vector_db is None:
+                logger.warning("No vector db provided")
+                return [[] for _ in queries]
+
+            _num_documents = num_documents or self.num_documents
+            log_debug(f"Getting {_num_documents} relevant documents for {len(queries)} queries: {queries}")
+            try:
+                return await self.vector_db.async_search_many(queries=queries, limit=_num_documents, filters=filters)
+            except NotImplementedError:
+                logger.info("Vector db does not support async search")
+                return self.search_many(queries=queries, num_documents=_num_documents, filters=filters)
+        except Exception as e:
+            logger.error(f"Error searching for documents: {e}")
+            return [[] for _ in queries]
+
     def load(
         self,
         recreate: bool = False,
@@ -103,6 +249,10 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db provided")
             return
 
+        if self.ingestion_pipeline is not None:
+            self.ingestion_pipeline.run(self, recreate=recreate, upsert=upsert, skip_existing=skip_existing)
+            return
+
         if recreate:
             log_info("Dropping collection")
             self.vector_db.drop()
@@ -112,32 +262,33 @@ class AgentKnowledge(BaseModel):
             self.vector_db.create()
 
         log_info("Loading knowledge base")
-        num_documents = 0
-        for document_list in self.document_lists:
-            documents_to_load = document_list
-
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
+        with self._track_sources(recreate=recreate):
+            num_documents = 0
+            for document_list in self.document_lists:
+                documents_to_load = document_list
 
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
+                # Track metadata for filtering capabilities
                 for doc in document_list:
-                    self.vector_db.upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
+
+                # Upsert documents if upsert is True and vector db supports upsert
+                if upsert and self.vector_db.upsert_available():
+                    for meta_data, documents in self._group_documents_by_meta_data(document_list):
+                        self.vector_db.upsert(documents=documents, filters=meta_data)
+                # Insert documents
+                else:
+                    # Filter out documents which already exist in the vector db
+                    if skip_existing:
+                        log_debug("Filtering out existing documents before insertion.")
+                        documents_to_load = self.filter_existing_documents(document_list)
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        self.vector_db.insert(documents=[doc], filters=doc.meta_data)
+                    if documents_to_load:
+                        for meta_data, documents in self._group_documents_by_meta_data(documents_to_load):
+                            self.vector_db.insert(documents=documents, filters=meta_data)
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+                num_documents += len(documents_to_load)
+                log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
     async def aload(
         self,
@@ -157,6 +308,10 @@ class AgentKnowledge(BaseModel):
             logger.warning("No vector db provided")
             return
 
+        if self.ingestion_pipeline is not None:
+            await self.ingestion_pipeline.arun(self, recreate=recreate, upsert=upsert, skip_existing=skip_existing)
+            return
+
         if recreate:
             log_info("Dropping collection")
             await self.vector_db.async_drop()
@@ -166,32 +321,33 @@ class AgentKnowledge(BaseModel):
             await self.vector_db.async_create()
 
         log_info("Loading knowledge base")
-        num_documents = 0
-        document_iterator = self.async_document_lists
-        async for document_list in document_iterator:  # type: ignore
-            documents_to_load = document_list
-            # Track metadata for filtering capabilities
-            for doc in document_list:
-                if doc.meta_data:
-                    self._track_metadata_structure(doc.meta_data)
-
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
+        with self._track_sources(recreate=recreate):
+            num_documents = 0
+            document_iterator = self.async_document_lists
+            async for document_list in document_iterator:  # type: ignore
+                documents_to_load = document_list
+                # Track metadata for filtering capabilities
                 for doc in document_list:
-                    await self.vector_db.async_upsert(documents=[doc], filters=doc.meta_data)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    log_debug("Filtering out existing documents before insertion.")
-                    documents_to_load = self.filter_existing_documents(document_list)
+                    if doc.meta_data:
+                        self._track_metadata_structure(doc.meta_data)
+
+                # Upsert documents if upsert is True and vector db supports upsert
+                if upsert and self.vector_db.upsert_available():
+                    for meta_data, documents in self._group_documents_by_meta_data(document_list):
+                        await self.vector_db.async_upsert(documents=documents, filters=meta_data)
+                # Insert documents
+                else:
+                    # Filter out documents which already exist in the vector db
+                    if skip_existing:
+                        log_debug("Filtering out existing documents before insertion.")
+                        documents_to_load = await self.async_filter_existing_documents(document_list)
 
-                if documents_to_load:
-                    for doc in documents_to_load:
-                        await self.vector_db.async_insert(documents=[doc], filters=doc.meta_data)
+                    if documents_to_load:
+                        for meta_data, documents in self._group_documents_by_meta_data(documents_to_load):
+                            await self.vector_db.async_insert(documents=documents, filters=meta_data)
 
-            num_documents += len(documents_to_load)
-            log_info(f"Added {len(documents_to_load)} documents to knowledge base")
+                num_documents += len(documents_to_load)
+                log_info(f"Added {len(documents_to_load)} documents to knowledge base")
 
     def load_documents(
         self,
@@ -223,11 +379,7 @@ class AgentKnowledge(BaseModel):
             log_info(f"Loaded {len(documents)} documents to knowledge base")
         else:
             # Filter out documents which already exist in the vector db
-            documents_to_load = (
-                [document for document in documents if not self.vector_db.doc_exists(document)]
-                if skip_existing
-                else documents
-            )
+            documents_to_load = self.filter_existing_documents(documents) if skip_existing else documents
 
             # Insert documents
             if len(documents_to_load) > 0:
@@ -274,20 +426,7 @@ class AgentKnowledge(BaseModel):
         else:
             # Filter out documents which already exist in the vector db
             if skip_existing:
-                try:
-                    # Parallelize existence checks using asyncio.gather
-                    existence_checks = await asyncio.gather(
-                        *[self.vector_db.async_doc_exists(document) for document in documents], return_exceptions=True
-                    )
-
-                    documents_to_load = [
-                        doc
-                        for doc, exists in zip(documents, existence_checks)
-                        if not (isinstance(exists, bool) and exists)
-                    ]
-                except NotImplementedError:
-                    logger.warning("Vector db does not support async doc_exists")
-                    documents_to_load = [document for document in documents if not self.vector_db.doc_exists(document)]
+                documents_to_load = await self.async_filter_existing_documents(documents)
             else:
                 documents_to_load = documents
 
@@ -406,7 +545,8 @@ class AgentKnowledge(BaseModel):
         """Filter out documents that already exist in the vector database.
 
         This helper method is used across various knowledge base implementations
-        to avoid inserting duplicate documents.
+        to avoid inserting duplicate documents. Documents are compared on their content hash,
+        and vector dbs that support it are checked with a single bulk query.
 
         Args:
             documents (List[Document]): List of documents to filter
@@ -414,31 +554,102 @@ class AgentKnowledge(BaseModel):
         Returns:
             List[Document]: Filtered list of documents that don't exist in the database
         """
-        from agno.utils.log import log_debug, log_info
-
         if not self.vector_db:
             log_debug("No vector database configured, skipping document filtering")
             return documents
 
-        # Use set for O(1) lookups
-        seen_content = set()
-        original_count = len(documents)
-        filtered_documents = []
+        unique_documents = self._deduplicate_documents(documents)
+        try:
+            existing = self.vector_db.existing_hashes(list(unique_documents.keys()))
+        except NotImplementedError:
+            existing = {
+                content_hash for content_hash, doc in unique_documents.items() if self.vector_db.doc_exists(doc)
+            }
+        return self._remove_existing_documents(documents, unique_documents, existing)
 
-        for doc in documents:
-            # Check hash and existence in DB
-            content_hash = doc.content  # Assuming doc.content is reliable hash key
-            if content_hash not in seen_content and not self.vector_db.doc_exists(doc):
-                seen_content.add(content_hash)
-                filtered_documents.append(doc)
-            else:
-                log_debug(f"Skipping existing document: {doc.name} (or duplicate content)")
+    async def async_filter_existing_documents(self, documents: List[Document]) -> List[Document]:
+        """Filter out documents that already exist in the vector database asynchronously."""
+        if not self.vector_db:
+            log_debug("No vector database configured, skipping document filtering")
+            return documents
 
-        if len(filtered_documents) < original_count:
-            log_info(f"Skipped {original_count - len(filtered_documents)} existing/duplicate documents.")
+        unique_documents = self._deduplicate_documents(documents)
+        try:
+            existing = await self.vector_db.async_existing_hashes(list(unique_documents.keys()))
+        except NotImplementedError:
+            existence_checks = await asyncio.gather(
+                *[self.vector_db.async_doc_exists(doc) for doc in unique_documents.values()], return_exceptions=True
+            )
+            existing = {
+                content_hash
+                for content_hash, exists in zip(unique_documents.keys(), existence_checks)
+                if isinstance(exists, bool) and exists
+            }
+        return self._remove_existing_documents(documents, unique_documents, existing)
+
+    def _deduplicate_documents(self, documents: List[Document]) -> Dict[str, Document]:
+        """Map each content hash to the first document with that content"""
+        unique_documents: Dict[str, Document] = {}
+        for doc in documents:
+            unique_documents.setdefault(doc.content_hash, doc)
+        return unique_documents
 
+    def _remove_existing_documents(
+        self, documents: List[Document], unique_documents: Dict[str, Document], existing: Set[str]
+    ) -> List[Document]:
+        filtered_documents = [doc for content_hash, doc in unique_documents.items() if content_hash not in existing]
+        if len(filtered_documents) < len(documents):
+            log_info(f"Skipped {len(documents) - len(filtered_documents)} existing/duplicate documents.")
         return filtered_documents
 
+    @contextmanager
+    def _track_sources(self, recreate: bool = False) -> Iterator[Optional[Dict[str, Dict[str, Any]]]]:
+        """Track the files read during a load in the manifest, and record them only if the load succeeds.
+
+        Yields the pending manifest entries of the load, or None without a manifest.
+        """
+        if self.manifest is None:
+            yield None
+            return
+
+        if recreate:
+            self.manifest.clear(target=self._manifest_target())
+        pending = self.manifest.start()
+        token = _manifest_load.set((self.manifest, pending))
+        try:
+            yield pending
+        finally:
+            _manifest_load.reset(token)
+        self.manifest.commit(pending)
+
+    def _source_changed(self, path: Path) -> bool:
+        """Returns False if the file is unchanged since it was last loaded, according to the manifest"""
+        if self.manifest is None:
+            return True
+        load = _manifest_load.get()
+        pending = load[1] if load is not None and load[0] is self.manifest else None
+        return self.manifest.has_changed(path, target=self._manifest_target(), pending=pending)
+
+    def _manifest_target(self) -> str:
+        """Identify the vector db table or collection in the manifest, so its entries are kept per vector db"""
+        return SourceManifest.target_of(self.vector_db) if self.vector_db is not None else ""
+
+    def _group_documents_by_meta_data(
+        self, documents: List[Document]
+    ) -> List[Tuple[Optional[Dict[str, Any]], List[Document]]]:
+        """Group consecutive documents that share the same metadata, preserving order.
+
+        Each group can be written to the vector db in a single call, so its documents are embedded in
+        batched requests instead of one request per document.
+        """
+        groups: List[Tuple[Optional[Dict[str, Any]], List[Document]]] = []
+        for doc in documents:
+            if groups and groups[-1][0] == doc.meta_data:
+                groups[-1][1].append(doc)
+            else:
+                groups.append((doc.meta_data, [doc]))
+        return groups
+
     def _track_metadata_structure(self, metadata: Optional[Dict[str, Any]]) -> None:
         """Track metadata structure to enable filter extraction from queries
 
@@ -5,8 +5,8 @@ from pydantic import Field
 
 from agno.document import Document
 from agno.document.reader.csv_reader import CSVReader
-from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_info, logger
+from agno.knowledge.agent import AgentKnowledge, SourceFiles
+from agno.utils.log import logger
 
 
 class CSVKnowledgeBase(AgentKnowledge):
@@ -15,35 +15,34 @@ class CSVKnowledgeBase(AgentKnowledge):
     exclude_files: List[str] = Field(default_factory=list)
     reader: CSVReader = CSVReader()
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over CSV files and yield lists of documents."""
+    def _source_files(self) -> SourceFiles:
+        """Get the CSV files to read, with the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        files: SourceFiles = []
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _csv_path = Path(file_path)  # type: ignore
-                    if self._is_valid_csv(_csv_path):
-                        documents = self.reader.read(file=_csv_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                    _csv_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_csv(_csv_path) and self._source_changed(_csv_path):
+                        files.append((_csv_path, item.get("metadata", {})))  # type: ignore
         else:
             # Handle single path
             _csv_path = Path(self.path)
             if _csv_path.is_dir():
                 for _csv in _csv_path.glob("**/*.csv"):
-                    if _csv.name not in self.exclude_files:
-                        yield self.reader.read(file=_csv)
-            elif self._is_valid_csv(_csv_path):
-                yield self.reader.read(file=_csv_path)
+                    if _csv.name not in self.exclude_files and self._source_changed(_csv):
+                        files.append((_csv, {}))
+            elif self._is_valid_csv(_csv_path) and self._source_changed(_csv_path):
+                files.append((_csv_path, {}))
+        return files
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over CSV files and yield lists of documents."""
+        yield from self._read_files(self._source_files())
 
     def _is_valid_csv(self, path: Path) -> bool:
         """Helper to check if path is a valid CSV file."""
@@ -52,32 +51,8 @@ class CSVKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over CSV files and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _csv_path = Path(file_path)  # type: ignore
-                    if self._is_valid_csv(_csv_path):
-                        documents = await self.reader.async_read(file=_csv_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _csv_path = Path(self.path)
-            if _csv_path.is_dir():
-                for _csv in _csv_path.glob("**/*.csv"):
-                    if _csv.name not in self.exclude_files:
-                        yield await self.reader.async_read(file=_csv)
-            elif self._is_valid_csv(_csv_path):
-                yield await self.reader.async_read(file=_csv_path)
+        async for documents in self._async_read_files(self._source_files()):
+            yield documents
 
     def load_document(
         self,
@@ -3,8 +3,8 @@ from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 
 from agno.document import Document
 from agno.document.reader.docx_reader import DocxReader
-from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_info, logger
+from agno.knowledge.agent import AgentKnowledge, SourceFiles
+from agno.utils.log import logger
 
 
 class DocxKnowledgeBase(AgentKnowledge):
@@ -12,35 +12,34 @@ class DocxKnowledgeBase(AgentKnowledge):
     formats: List[str] = [".doc", ".docx"]
     reader: DocxReader = DocxReader()
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over doc/docx files and yield lists of documents."""
+    def _source_files(self) -> SourceFiles:
+        """Get the doc/docx files to read, with the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        files: SourceFiles = []
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_docx(_file_path):
-                        documents = self.reader.read(file=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                    _file_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_docx(_file_path) and self._source_changed(_file_path):
+                        files.append((_file_path, item.get("metadata", {})))  # type: ignore
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
-                    if self._is_valid_docx(_file):
-                        yield self.reader.read(file=_file)
-            elif self._is_valid_docx(_file_path):
-                yield self.reader.read(file=_file_path)
+                    if self._is_valid_docx(_file) and self._source_changed(_file):
+                        files.append((_file, {}))
+            elif self._is_valid_docx(_file_path) and self._source_changed(_file_path):
+                files.append((_file_path, {}))
+        return files
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over doc/docx files and yield lists of documents."""
+        yield from self._read_files(self._source_files())
 
     def _is_valid_docx(self, path: Path) -> bool:
         """Helper to check if path is a valid doc/docx file."""
@@ -49,32 +48,8 @@ class DocxKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over doc/docx files and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_docx(_file_path):
-                        documents = await self.reader.async_read(file=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _file_path = Path(self.path)
-            if _file_path.is_dir():
-                for _file in _file_path.glob("**/*"):
-                    if self._is_valid_docx(_file):
-                        yield await self.reader.async_read(file=_file)
-            elif self._is_valid_docx(_file_path):
-                yield await self.reader.async_read(file=_file_path)
+        async for documents in self._async_read_files(self._source_files()):
+            yield documents
 
     def load_document(
         self,
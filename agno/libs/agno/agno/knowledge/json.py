@@ -1,46 +1,46 @@
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, List, Optional, Union
 
 from agno.document import Document
 from agno.document.reader.json_reader import JSONReader
-from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_info, logger
+from agno.knowledge.agent import AgentKnowledge, SourceFiles
+from agno.utils.log import logger
 
 
 class JSONKnowledgeBase(AgentKnowledge):
     path: Optional[Union[str, Path, List[Dict[str, Union[str, Dict[str, Any]]]]]] = None
     reader: JSONReader = JSONReader()
     formats: List[str] = [".json"]
+    _reader_path_arg: ClassVar[str] = "path"
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over JSON files and yield lists of documents."""
+    def _source_files(self) -> SourceFiles:
+        """Get the JSON files to read, with the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        files: SourceFiles = []
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_json(_file_path):
-                        documents = self.reader.read(path=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                    _file_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_json(_file_path) and self._source_changed(_file_path):
+                        files.append((_file_path, item.get("metadata", {})))  # type: ignore
         else:
             # Handle single path
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
-                    if self._is_valid_json(_file):
-                        yield self.reader.read(path=_file)
-            elif self._is_valid_json(_file_path):
-                yield self.reader.read(path=_file_path)
+                    if self._is_valid_json(_file) and self._source_changed(_file):
+                        files.append((_file, {}))
+            elif self._is_valid_json(_file_path) and self._source_changed(_file_path):
+                files.append((_file_path, {}))
+        return files
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over JSON files and yield lists of documents."""
+        yield from self._read_files(self._source_files())
 
     def _is_valid_json(self, path: Path) -> bool:
         """Helper to check if path is a valid JSON file."""
@@ -49,32 +49,8 @@ class JSONKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over JSON files and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_json(_file_path):
-                        documents = await self.reader.async_read(path=_file_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _file_path = Path(self.path)
-            if _file_path.is_dir():
-                for _file in _file_path.glob("**/*"):
-                    if self._is_valid_json(_file):
-                        yield await self.reader.async_read(path=_file)
-            elif self._is_valid_json(_file_path):
-                yield await self.reader.async_read(path=_file_path)
+        async for documents in self._async_read_files(self._source_files()):
+            yield documents
 
     def load_document(
         self,
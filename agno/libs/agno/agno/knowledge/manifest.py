@@ -0,0 +1,136 @@
+import json
+import threading
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from agno.utils.log import log_debug, log_warning
+from agno.utils.shared import SharedOnCopy
+
+
+class SourceManifest(SharedOnCopy):
+    """Records the path, modification time, size and content hash of every file loaded into a knowledge base.
+
+    When set on a knowledge base, `load` and `aload` only read, chunk and embed files that are new or whose
+    content changed since the last successful load. The modification time and size are checked first, so a
+    file is only hashed when it was touched. The manifest is written to `path` once a load completes, and the
+    entries of a vector db are cleared when the knowledge base is loaded into it with `recreate=True`.
+
+    Entries are kept per vector db table or collection (see `target_of`), so one manifest can be shared by
+    knowledge bases loading the same files into different vector dbs. The entries of the files read by a load are
+    kept by the load itself (see `start`), so concurrent loads sharing the manifest do not record each other's files.
+    """
+
+    # Attributes of a vector db that identify the table or collection documents are written to
+    _TARGET_ATTRIBUTES = ("uri", "path", "schema", "table_name", "collection", "collection_name", "index_name")
+
+    def __init__(self, path: Union[str, Path] = "tmp/knowledge_manifest.json"):
+        self.path: Path = Path(path)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            return json.loads(self.path.read_text("utf-8"))
+        except Exception as e:
+            log_warning(f"Could not read knowledge manifest {self.path}, reloading all sources: {e}")
+            return {}
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so an interrupted write does not corrupt the manifest
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(self.entries, indent=2), "utf-8")
+        tmp_path.replace(self.path)
+
+    @classmethod
+    def target_of(cls, vector_db: Any) -> str:
+        """Identify the table or collection of a vector db, without credentials"""
+        parts = [type(vector_db).__name__]
+        for attribute in cls._TARGET_ATTRIBUTES:
+            value = getattr(vector_db, attribute, None)
+            if isinstance(value, (str, Path)) and str(value):
+                parts.append(f"{attribute}={value}")
+        return ",".join(parts)
+
+    @staticmethod
+    def _key(path: Path, target: str) -> str:
+        resolved = str(path.resolve())
+        return f"{target}|{resolved}" if target else resolved
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        file_hash = md5()
+        with path.open("rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
+    def start(self) -> Dict[str, Dict[str, Any]]:
+        """Start a load, returns the pending entries to pass to `has_changed` and `commit`.
+
+        A failed load discards its pending entries instead of committing them.
+        """
+        return {}
+
+    def commit(self, pending: Dict[str, Dict[str, Any]]) -> None:
+        """Record the files read by a load and persist the manifest"""
+        if not pending:
+            return
+        with self._lock:
+            self.entries.update(pending)
+            self._write()
+
+    def clear(self, target: Optional[str] = None) -> None:
+        """Remove the entries of a vector db, or all entries if `target` is None"""
+        with self._lock:
+            if target is None:
+                self._entries = {}
+            else:
+                self._entries = {key: entry for key, entry in self.entries.items() if entry.get("target", "") != target}
+            self._write()
+
+    def has_changed(self, path: Path, target: str = "", pending: Optional[Dict[str, Dict[str, Any]]] = None) -> bool:
+        """Returns True if the file should be (re)loaded into the vector db identified by `target`, and adds its
+        entry to the `pending` entries of the load.
+
+        Outside of a load (`pending` is None) every file is reported as changed, so iterating over the knowledge base
+        for other purposes, e.g. to collect metadata filters, still sees every file.
+        """
+        if pending is None:
+            return True
+
+        key = self._key(path, target)
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+
+        entry = self.entries.get(key)
+        if entry is not None and entry.get("mtime") == stat.st_mtime and entry.get("size") == stat.st_size:
+            log_debug(f"Skipping unchanged source: {path}")
+            return False
+
+        content_hash = self.hash_file(path)
+        new_entry = {
+            "path": str(path.resolve()),
+            "target": target,
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "content_hash": content_hash,
+        }
+        pending[key] = new_entry
+
+        if entry is not None and entry.get("content_hash") == content_hash:
+            # Only the modification time changed
+            log_debug(f"Skipping source with unchanged content: {path}")
+            return False
+        return True
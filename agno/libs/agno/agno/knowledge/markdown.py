@@ -25,7 +25,7 @@ class MarkdownKnowledgeBase(AgentKnowledge):
                     file_path = item["path"]
                     config = item.get("metadata", {})
                     _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_text(_file_path):
+                    if self._is_valid_text(_file_path) and self._source_changed(_file_path):
                         documents = self.reader.read(file=_file_path)
                         if config:
                             for doc in documents:
@@ -37,9 +37,9 @@ class MarkdownKnowledgeBase(AgentKnowledge):
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
-                    if self._is_valid_text(_file):
+                    if self._is_valid_text(_file) and self._source_changed(_file):
                         yield self.reader.read(file=_file)
-            elif self._is_valid_text(_file_path):
+            elif self._is_valid_text(_file_path) and self._source_changed(_file_path):
                 yield self.reader.read(file=_file_path)
 
     def _is_valid_text(self, path: Path) -> bool:
@@ -59,7 +59,7 @@ class MarkdownKnowledgeBase(AgentKnowledge):
                     file_path = item["path"]
                     config = item.get("metadata", {})
                     _file_path = Path(file_path)  # type: ignore
-                    if self._is_valid_text(_file_path):
+                    if self._is_valid_text(_file_path) and self._source_changed(_file_path):
                         documents = await self.reader.async_read(file=_file_path)
                         if config:
                             for doc in documents:
@@ -71,9 +71,9 @@ class MarkdownKnowledgeBase(AgentKnowledge):
             _file_path = Path(self.path)
             if _file_path.is_dir():
                 for _file in _file_path.glob("**/*"):
-                    if self._is_valid_text(_file):
+                    if self._is_valid_text(_file) and self._source_changed(_file):
                         yield await self.reader.async_read(file=_file)
-            elif self._is_valid_text(_file_path):
+            elif self._is_valid_text(_file_path) and self._source_changed(_file_path):
                 yield await self.reader.async_read(file=_file_path)
 
     def load_document(
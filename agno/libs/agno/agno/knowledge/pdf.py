@@ -1,12 +1,12 @@
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, List, Optional, Union
 
 from pydantic import Field
 
 from agno.document import Document
 from agno.document.reader.pdf_reader import PDFImageReader, PDFReader
-from agno.knowledge.agent import AgentKnowledge
-from agno.utils.log import log_info, logger
+from agno.knowledge.agent import AgentKnowledge, SourceFiles
+from agno.utils.log import logger
 
 
 class PDFKnowledgeBase(AgentKnowledge):
@@ -14,36 +14,36 @@ class PDFKnowledgeBase(AgentKnowledge):
     formats: List[str] = [".pdf"]
     exclude_files: List[str] = Field(default_factory=list)
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
+    _reader_path_arg: ClassVar[str] = "pdf"
 
-    @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDFs and yield lists of documents."""
+    def _source_files(self) -> SourceFiles:
+        """Get the PDFs to read, with the metadata to add to their documents."""
         if self.path is None:
             raise ValueError("Path is not set")
 
+        files: SourceFiles = []
         if isinstance(self.path, list):
             for item in self.path:
                 if isinstance(item, dict) and "path" in item:
                     # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _pdf_path = Path(file_path)  # type: ignore
-                    if self._is_valid_pdf(_pdf_path):
-                        documents = self.reader.read(pdf=_pdf_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
+                    _pdf_path = Path(item["path"])  # type: ignore
+                    if self._is_valid_pdf(_pdf_path) and self._source_changed(_pdf_path):
+                        files.append((_pdf_path, item.get("metadata", {})))  # type: ignore
         else:
             # Handle single path
             _pdf_path = Path(self.path)
             if _pdf_path.is_dir():
                 for _pdf in _pdf_path.glob("**/*.pdf"):
-                    if _pdf.name not in self.exclude_files:
-                        yield self.reader.read(pdf=_pdf)
-            elif self._is_valid_pdf(_pdf_path):
-                yield self.reader.read(pdf=_pdf_path)
+                    if _pdf.name not in self.exclude_files and self._source_changed(_pdf):
+                        files.append((_pdf, {}))
+            elif self._is_valid_pdf(_pdf_path) and self._source_changed(_pdf_path):
+                files.append((_pdf_path, {}))
+        return files
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over PDFs and yield lists of documents."""
+        yield from self._read_files(self._source_files())
 
     def _is_valid_pdf(self, path: Path) -> bool:
         """Helper to check if path is a valid PDF file."""
@@ -52,32 +52,8 @@ class PDFKnowledgeBase(AgentKnowledge):
     @property
     async def async_document_lists(self) -> AsyncIterator[List[Document]]:
         """Iterate over PDFs and yield lists of documents asynchronously."""
-        if self.path is None:
-            raise ValueError("Path is not set")
-
-        if isinstance(self.path, list):
-            for item in self.path:
-                if isinstance(item, dict) and "path" in item:
-                    # Handle path with metadata
-                    file_path = item["path"]
-                    config = item.get("metadata", {})
-                    _pdf_path = Path(file_path)  # type: ignore
-                    if self._is_valid_pdf(_pdf_path):
-                        documents = await self.reader.async_read(pdf=_pdf_path)
-                        if config:
-                            for doc in documents:
-                                log_info(f"Adding metadata {config} to document: {doc.name}")
-                                doc.meta_data.update(config)  # type: ignore
-                        yield documents
-        else:
-            # Handle single path
-            _pdf_path = Path(self.path)
-            if _pdf_path.is_dir():
-                for _pdf in _pdf_path.glob("**/*.pdf"):
-                    if _pdf.name not in self.exclude_files:
-                        yield await self.reader.async_read(pdf=_pdf)
-            elif self._is_valid_pdf(_pdf_path):
-                yield await self.reader.async_read(pdf=_pdf_path)
+        async for documents in self._async_read_files(self._source_files()):
+            yield documents
 
     def load_document(
         self,
@@ -0,0 +1,307 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from agno.document import Document
+from agno.exceptions import AgnoError
+from agno.utils.log import log_debug, log_info, logger
+
+if TYPE_CHECKING:
+    from agno.knowledge.agent import AgentKnowledge
+
+# Marks the end of a stream on a pipeline queue
+_END = object()
+
+
+@dataclass
+class StageMetrics:
+    """Throughput counters for one stage of the ingestion pipeline"""
+
+    name: str
+    workers: int = 1
+    # Number of document lists / batches handled by the stage
+    batches: int = 0
+    # Number of documents emitted by the stage
+    documents: int = 0
+    errors: int = 0
+    # Total time spent doing work, summed across workers
+    busy_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    @property
+    def documents_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.documents / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "batches": self.batches,
+            "documents": self.documents,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 4),
+            "elapsed_seconds": round(self.elapsed_seconds, 4),
+            "documents_per_second": round(self.documents_per_second, 2),
+        }
+
+
+@dataclass
+class FailedBatch:
+    """A batch of documents that a stage of the ingestion pipeline failed to process"""
+
+    stage: str
+    documents: List[Document]
+    error: Exception
+
+
+class IngestionError(AgnoError):
+    """Exception raised when batches failed during an ingestion pipeline run, after the other batches were loaded"""
+
+    def __init__(self, failed_batches: List[FailedBatch], metrics: Dict[str, StageMetrics]):
+        num_documents = sum(len(batch.documents) for batch in failed_batches)
+        super().__init__(f"Ingestion failed for {len(failed_batches)} batches with {num_documents} documents")
+        self.failed_batches = failed_batches
+        self.metrics = metrics
+
+
+@dataclass
+class IngestionPipeline:
+    """Streams a knowledge base into its vector db through separate read, chunk, embed and write stages.
+
+    Stages are connected by bounded queues, so a slow stage applies backpressure to the stages before it
+    and only `queue_size` batches per stage are held in memory. Each stage runs its own pool of workers,
+    which lets the embedder and the vector db be saturated at the same time.
+
+    Set it on a knowledge base with `knowledge.ingestion_pipeline = IngestionPipeline(...)` to use it for
+    `load` and `aload`. Batches that fail are logged and the other batches are still loaded, then an
+    `IngestionError` with the failed batches is raised.
+    """
+
+    # Number of workers chunking documents
+    chunk_workers: int = 2
+    # Number of workers embedding batches of documents
+    embed_workers: int = 4
+    # Number of workers writing batches to the vector db
+    write_workers: int = 2
+    # Maximum number of items waiting between two stages
+    queue_size: int = 8
+    # Number of chunks embedded and written together
+    batch_size: int = 100
+
+    metrics: Dict[str, StageMetrics] = field(default_factory=dict, init=False)
+    failed_batches: List[FailedBatch] = field(default_factory=list, init=False)
+
+    def __post_init__(self):
+        self.chunk_workers = max(self.chunk_workers, 1)
+        self.embed_workers = max(self.embed_workers, 1)
+        self.write_workers = max(self.write_workers, 1)
+        self.queue_size = max(self.queue_size, 1)
+        self.batch_size = max(self.batch_size, 1)
+
+    def run(
+        self, knowledge: "AgentKnowledge", recreate: bool = False, upsert: bool = False, skip_existing: bool = True
+    ) -> Dict[str, StageMetrics]:
+        """Run the pipeline from synchronous code.
+
+        When called while an event loop is running, the pipeline runs on a new event loop in another thread.
+        """
+        coroutine = self.arun(knowledge=knowledge, recreate=recreate, upsert=upsert, skip_existing=skip_existing)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def arun(
+        self, knowledge: "AgentKnowledge", recreate: bool = False, upsert: bool = False, skip_existing: bool = True
+    ) -> Dict[str, StageMetrics]:
+        """Load the knowledge base into its vector db and return the metrics of each stage."""
+        vector_db = knowledge.vector_db
+        if vector_db is None:
+            logger.warning("No vector db provided")
+            return {}
+
+        if recreate:
+            log_info("Dropping collection")
+            await vector_db.async_drop()
+
+        if not await vector_db.async_exists():
+            log_info("Creating collection")
+            await vector_db.async_create()
+
+        self.failed_batches = []
+        self.metrics = {
+            "read": StageMetrics(name="read"),
+            "chunk": StageMetrics(name="chunk", workers=self.chunk_workers),
+            "embed": StageMetrics(name="embed", workers=self.embed_workers),
+            "write": StageMetrics(name="write", workers=self.write_workers),
+        }
+        chunk_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        embed_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # The chunk stage takes over chunking from the reader, so reading and chunking can overlap.
+        # Files are read by a copy of the knowledge base with a non-chunking copy of the reader, so the
+        # reader shared with other loads is left unchanged.
+        reader = knowledge.reader
+        chunk_in_pipeline = reader is not None and reader.chunk
+        reading_knowledge = knowledge
+        if chunk_in_pipeline:
+            reading_reader = copy(reader)
+            reading_reader.chunk = False  # type: ignore
+            reading_knowledge = knowledge.model_copy(update={"reader": reading_reader})
+
+        embedder = getattr(vector_db, "embedder", None)
+        use_upsert = upsert and vector_db.upsert_available()
+
+        async def _chunk(document_list: List[Document]) -> List[List[Document]]:
+            if chunk_in_pipeline:
+                chunked = await asyncio.to_thread(
+                    lambda: [chunk for doc in document_list for chunk in reader.chunk_document(doc)]  # type: ignore
+                )
+            else:
+                chunked = document_list
+            for doc in chunked:
+                if doc.meta_data:
+                    knowledge._track_metadata_structure(doc.meta_data)
+            # Re-batch so the downstream stages work on batches of a predictable size
+            return [chunked[i : i + self.batch_size] for i in range(0, len(chunked), self.batch_size)]
+
+        async def _embed(documents: List[Document]) -> List[List[Document]]:
+            if not use_upsert and skip_existing:
+                documents = await knowledge.async_filter_existing_documents(documents)
+            if documents and embedder is not None:
+                failed = await Document.async_embed_documents(documents, embedder=embedder)
+                if failed:
+                    # The documents that could not be embedded are reported instead of written
+                    self._record_failure("embed", failed, ValueError(f"Could not embed {len(failed)} documents"))
+                    documents = [doc for doc in documents if doc.embedding]
+            return [documents] if documents else []
+
+        async def _write(documents: List[Document]) -> List[List[Document]]:
+            for meta_data, group in knowledge._group_documents_by_meta_data(documents):
+                if use_upsert:
+                    await vector_db.async_upsert(documents=group, filters=meta_data)
+                else:
+                    await vector_db.async_insert(documents=group, filters=meta_data)
+            return [documents]
+
+        log_info("Loading knowledge base")
+        with knowledge._track_sources(recreate=recreate) as pending_sources:
+            await asyncio.gather(
+                self._read_stage(reading_knowledge, chunk_queue, consumers=self.chunk_workers),
+                self._run_stage("chunk", _chunk, chunk_queue, embed_queue, self.chunk_workers, self.embed_workers),
+                self._run_stage("embed", _embed, embed_queue, write_queue, self.embed_workers, self.write_workers),
+                self._run_stage("write", _write, write_queue, None, self.write_workers, 0),
+            )
+            if pending_sources is not None and self.failed_batches:
+                # Files with failed batches must be read again on the next load
+                logger.warning("Ingestion finished with errors, not updating the knowledge manifest")
+                pending_sources.clear()
+
+        for metrics in self.metrics.values():
+            log_debug(f"Ingestion stage metrics: {metrics.to_dict()}")
+        log_info(f"Added {self.metrics['write'].documents} documents to knowledge base")
+        if self.failed_batches:
+            raise IngestionError(failed_batches=self.failed_batches, metrics=self.metrics)
+        return self.metrics
+
+    async def _iterate_document_lists(self, knowledge: "AgentKnowledge") -> AsyncIterator[List[Document]]:
+        document_lists = knowledge.async_document_lists
+        if hasattr(document_lists, "__aiter__"):
+            yielded = False
+            try:
+                async for document_list in document_lists:  # type: ignore
+                    yielded = True
+                    yield document_list
+                return
+            except NotImplementedError:
+                if yielded:
+                    raise
+        elif asyncio.iscoroutine(document_lists):
+            # The base class property is a coroutine that raises NotImplementedError
+            document_lists.close()
+        log_debug("Knowledge base does not support async reading, reading in a thread")
+
+        # Fall back to the sync iterator, advancing it in a thread so the event loop is not blocked
+        iterator = iter(knowledge.document_lists)
+        while True:
+            document_list = await asyncio.to_thread(next, iterator, None)
+            if document_list is None:
+                return
+            yield document_list
+
+    def _record_failure(self, stage: str, documents: List[Document], error: Exception) -> None:
+        names = sorted({doc.name for doc in documents if doc.name})
+        logger.error(f"Error in ingestion stage '{stage}' for {len(documents)} documents {names}: {error}")
+        self.metrics[stage].errors += 1
+        self.failed_batches.append(FailedBatch(stage=stage, documents=documents, error=error))
+
+    async def _read_stage(self, knowledge: "AgentKnowledge", out_queue: asyncio.Queue, consumers: int) -> None:
+        metrics = self.metrics["read"]
+        metrics.started_at = time.perf_counter()
+        try:
+            started = time.perf_counter()
+            async for document_list in self._iterate_document_lists(knowledge):
+                metrics.busy_seconds += time.perf_counter() - started
+                metrics.batches += 1
+                metrics.documents += len(document_list)
+                # Blocks while the chunk stage is behind, which applies backpressure to reading
+                await out_queue.put(document_list)
+                started = time.perf_counter()
+        finally:
+            metrics.finished_at = time.perf_counter()
+            for _ in range(consumers):
+                await out_queue.put(_END)
+
+    async def _run_stage(
+        self,
+        name: str,
+        process: Callable[[List[Document]], Awaitable[List[List[Document]]]],
+        in_queue: asyncio.Queue,
+        out_queue: Optional[asyncio.Queue],
+        workers: int,
+        consumers: int,
+    ) -> None:
+        metrics = self.metrics[name]
+
+        async def _worker() -> None:
+            while True:
+                item = await in_queue.get()
+                if item is _END:
+                    return
+                if metrics.started_at is None:
+                    metrics.started_at = time.perf_counter()
+                started = time.perf_counter()
+                try:
+                    outputs = await process(item)
+                except Exception as e:
+                    self._record_failure(name, item, e)
+                    continue
+                finally:
+                    metrics.busy_seconds += time.perf_counter() - started
+                    metrics.batches += 1
+                metrics.documents += sum(len(output) for output in outputs)
+                if out_queue is not None:
+                    for output in outputs:
+                        await out_queue.put(output)
+
+        try:
+            await asyncio.gather(*[_worker() for _ in range(workers)])
+        finally:
+            metrics.finished_at = time.perf_counter()
+            if out_queue is not None:
+                for _ in range(consumers):
+                    await out_queue.put(_END)
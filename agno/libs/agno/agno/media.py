@@ -4,10 +4,40 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from pydantic import BaseModel, field_validator, model_validator
 
 
+def _offload_content(media: BaseModel, content: Optional[Union[str, bytes]]) -> Optional[Dict[str, Any]]:
+    """Store the content of a media object in the active media store, see agno.storage.media.use_media_store.
+
+    Returns:
+        Optional[Dict[str, Any]]: The content_hash and content_uri to serialize instead of the content,
+            or None to serialize the content inline.
+    """
+    from agno.storage.media.base import get_active_media_store
+
+    media_store = get_active_media_store()
+    content_uri = getattr(media, "content_uri", None)
+    if media_store is not None and content and not (content_uri and media_store.contains_uri(content_uri)):
+        content_hash, content_uri = media_store.put(content if isinstance(content, bytes) else content.encode("utf-8"))
+        # Keep the reference, so later saves don't hash the content again
+        setattr(media, "content_hash", content_hash)
+        setattr(media, "content_uri", content_uri)
+    if content_uri is not None and (media_store is not None or not content):
+        return {"content_hash": getattr(media, "content_hash", None), "content_uri": content_uri}
+    return None
+
+
+def _read_content(content_uri: str) -> bytes:
+    from agno.storage.media.base import read_media_uri
+
+    return read_media_uri(content_uri)
+
+
 class Media(BaseModel):
     id: str
     original_prompt: Optional[str] = None
     revised_prompt: Optional[str] = None
+    # SHA-256 hash and location of the content, when it was offloaded to a media store
+    content_hash: Optional[str] = None
+    content_uri: Optional[str] = None
 
 
 class VideoArtifact(Media):
@@ -17,17 +47,27 @@ class VideoArtifact(Media):
     eta: Optional[str] = None
     length: Optional[str] = None
 
+    def load_content(self) -> Optional[Union[str, bytes]]:
+        """Read the content from the media store it was offloaded to"""
+        if self.content is None and self.content_uri is not None:
+            self.content = _read_content(self.content_uri)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = _offload_content(self, self.content)
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.content
+            "content": None
+            if content_ref is not None
+            else self.content
             if isinstance(self.content, str)
             else self.content.decode("utf-8")
             if self.content
             else None,
             "mime_type": self.mime_type,
             "eta": self.eta,
+            **(content_ref or {}),
         }
         return {k: v for k, v in response_dict.items() if v is not None}
 
@@ -38,15 +78,25 @@ class ImageArtifact(Media):
     mime_type: Optional[str] = None
     alt_text: Optional[str] = None
 
+    def load_content(self) -> Optional[bytes]:
+        """Read the content from the media store it was offloaded to"""
+        if self.content is None and self.content_uri is not None:
+            self.content = _read_content(self.content_uri)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = _offload_content(self, self.content)
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.content.decode("utf-8")
+            "content": None
+            if content_ref is not None
+            else self.content.decode("utf-8")
             if self.content and isinstance(self.content, bytes)
             else self.content,
             "mime_type": self.mime_type,
             "alt_text": self.alt_text,
+            **(content_ref or {}),
         }
         return {k: v for k, v in response_dict.items() if v is not None}
 
@@ -64,17 +114,25 @@ class AudioArtifact(Media):
         """
         if data.get("url") and data.get("base64_audio"):
             raise ValueError("Provide either `url` or `base64_audio`, not both.")
-        if not data.get("url") and not data.get("base64_audio"):
+        if not data.get("url") and not data.get("base64_audio") and not data.get("content_uri"):
             raise ValueError("Either `url` or `base64_audio` must be provided.")
         return data
 
+    def load_content(self) -> Optional[str]:
+        """Read the content from the media store it was offloaded to"""
+        if self.base64_audio is None and self.content_uri is not None:
+            self.base64_audio = _read_content(self.content_uri).decode("utf-8")
+        return self.base64_audio
+
     def to_dict(self) -> Dict[str, Any]:
+        content_ref = _offload_content(self, self.base64_audio)
         response_dict = {
             "id": self.id,
             "url": self.url,
-            "content": self.base64_audio,
+            "content": self.base64_audio if content_ref is None else None,
             "mime_type": self.mime_type,
             "length": self.length,
+            **(content_ref or {}),
         }
         return {k: v for k, v in response_dict.items() if v is not None}
 
@@ -84,6 +142,9 @@ class Video(BaseModel):
     content: Optional[Any] = None  # Actual video bytes content
     url: Optional[str] = None  # Remote location for video
     format: Optional[str] = None  # E.g. `mp4`, `mov`, `avi`, `mkv`, `webm`, `flv`, `mpeg`, `mpg`, `wmv`, `three_gp`
+    # SHA-256 hash and location of the content, when it was offloaded to a media store
+    content_hash: Optional[str] = None
+    content_uri: Optional[str] = None
 
     @model_validator(mode="before")
     def validate_data(cls, data: Any):
@@ -112,25 +173,33 @@ class Video(BaseModel):
         # Count how many fields are set (not None)
         count = len([field for field in [filepath, content, url] if field is not None])
 
-        if count == 0:
+        if count == 0 and data.get("content_uri") is None:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
         elif count > 1:
             raise ValueError("Only one of `filepath` or `content` or `url` should be provided.")
 
         return data
 
+    def load_content(self) -> Optional[Any]:
+        """Read the content from the media store it was offloaded to"""
+        if self.content is None and self.content_uri is not None:
+            self.content = _read_content(self.content_uri)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
         import base64
         import zlib
 
+        content_ref = _offload_content(self, self.content)
         response_dict = {
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "format": self.format,
+            **(content_ref or {}),
         }
         return {k: v for k, v in response_dict.items() if v is not None}
 
@@ -144,6 +213,9 @@ class Audio(BaseModel):
     filepath: Optional[Union[Path, str]] = None  # Absolute local location for audio
     url: Optional[str] = None  # Remote location for audio
     format: Optional[str] = None
+    # SHA-256 hash and location of the content, when it was offloaded to a media store
+    content_hash: Optional[str] = None
+    content_uri: Optional[str] = None
 
     @model_validator(mode="before")
     def validate_data(cls, data: Any):
@@ -172,7 +244,7 @@ class Audio(BaseModel):
         # Count how many fields are set (not None)
         count = len([field for field in [filepath, content, url] if field is not None])
 
-        if count == 0:
+        if count == 0 and data.get("content_uri") is None:
             raise ValueError("One of `filepath` or `content` or `url` must be provided.")
         elif count > 1:
             raise ValueError("Only one of `filepath` or `content` or `url` should be provided.")
@@ -188,18 +260,26 @@ class Audio(BaseModel):
         else:
             return None
 
+    def load_content(self) -> Optional[Any]:
+        """Read the content from the media store it was offloaded to"""
+        if self.content is None and self.content_uri is not None:
+            self.content = _read_content(self.content_uri)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
         import base64
         import zlib
 
+        content_ref = _offload_content(self, self.content)
         response_dict = {
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "format": self.format,
+            **(content_ref or {}),
         }
 
         return {k: v for k, v in response_dict.items() if v is not None}
@@ -245,6 +325,9 @@ class Image(BaseModel):
         None  # low, medium, high or auto (per OpenAI spec https://platform.openai.com/docs/guides/vision?lang=node#low-or-high-fidelity-image-understanding)
     )
     id: Optional[str] = None
+    # SHA-256 hash and location of the content, when it was offloaded to a media store
+    content_hash: Optional[str] = None
+    content_uri: Optional[str] = None
 
     @property
     def image_url_content(self) -> Optional[bytes]:
@@ -282,26 +365,34 @@ class Image(BaseModel):
         # Count how many fields are set (not None)
         count = len([field for field in [url, filepath, content] if field is not None])
 
-        if count == 0:
+        if count == 0 and data.get("content_uri") is None:
             raise ValueError("One of `url`, `filepath`, or `content` must be provided.")
         elif count > 1:
             raise ValueError("Only one of `url`, `filepath`, or `content` should be provided.")
 
         return data
 
+    def load_content(self) -> Optional[Any]:
+        """Read the content from the media store it was offloaded to"""
+        if self.content is None and self.content_uri is not None:
+            self.content = _read_content(self.content_uri)
+        return self.content
+
     def to_dict(self) -> Dict[str, Any]:
         import base64
         import zlib
 
+        content_ref = _offload_content(self, self.content)
         response_dict = {
             "content": base64.b64encode(
                 zlib.compress(self.content) if isinstance(self.content, bytes) else self.content.encode("utf-8")
             ).decode("utf-8")
-            if self.content
+            if self.content and content_ref is None
             else None,
             "filepath": self.filepath,
             "url": self.url,
             "detail": self.detail,
+            **(content_ref or {}),
         }
 
         return {k: v for k, v in response_dict.items() if v is not None}
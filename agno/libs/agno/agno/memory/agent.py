@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+from agno.memory.bookkeeping import RunIndex, RunningMetrics
 from agno.memory.classifier import MemoryClassifier
 from agno.memory.db import MemoryDb
 from agno.memory.manager import MemoryManager
@@ -14,6 +15,9 @@ from agno.models.message import Message
 from agno.run.response import RunResponse
 from agno.utils.log import log_debug, log_info, logger
 
+if TYPE_CHECKING:
+    from agno.agent.metrics import SessionMetrics
+
 
 class AgentRun(BaseModel):
     message: Optional[Message] = None
@@ -67,6 +71,15 @@ class AgentMemory(BaseModel):
 
     version: int = 1
 
+    # Positions of the runs by run_id
+    _run_index: RunIndex = PrivateAttr(
+        default_factory=lambda: RunIndex(get_run_id=lambda run: run.response.run_id if run.response else None)
+    )
+    # Running total of the metrics of the messages
+    _session_metrics: RunningMetrics = PrivateAttr(
+        default_factory=lambda: RunningMetrics(get_messages=lambda message: [message])
+    )
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -107,12 +120,12 @@ class AgentMemory(BaseModel):
             run_id = agent_run.response.run_id
 
             # Check for existing run with same ID
-            for i, run in enumerate(self.runs):
-                if run.response and run.response.run_id == run_id:
-                    # Replace existing run
-                    self.runs[i] = agent_run
-                    log_debug(f"Replaced existing AgentRun with run_id {run_id} in memory")
-                    return
+            position = self._run_index.find(self.runs, run_id)
+            if position is not None:
+                # Replace existing run
+                self.runs[position] = agent_run
+                log_debug(f"Replaced existing AgentRun with run_id {run_id} in memory")
+                return
 
             # Add new run if not found
             self.runs.append(agent_run)
@@ -146,6 +159,10 @@ class AgentMemory(BaseModel):
         self.messages.extend(messages)
         log_debug(f"Added {len(messages)} Messages to AgentMemory")
 
+    def get_session_metrics(self, assistant_message_role: str = "assistant") -> "SessionMetrics":
+        """Returns the SessionMetrics of the assistant messages, reading only the messages added since the last call."""
+        return self._session_metrics.total(self.messages, assistant_message_role=assistant_message_role)
+
     def get_messages(self) -> List[Dict[str, Any]]:
         """Returns the messages list as a list of dictionaries."""
         return [message.model_dump() for message in self.messages]
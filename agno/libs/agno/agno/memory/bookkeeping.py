@@ -0,0 +1,113 @@
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from agno.models.message import Message
+
+if TYPE_CHECKING:
+    from agno.agent.metrics import SessionMetrics
+
+
+class RunIndex:
+    """Positions of the runs in a list by run_id, kept in step with the list as runs are appended.
+
+    Runs appended to the list are indexed on the next lookup. Each hit is checked against the list, and the list is
+    indexed again if it was replaced or edited elsewhere.
+
+    Args:
+        get_run_id: Returns the run_id of a run, or None if it has none.
+    """
+
+    def __init__(self, get_run_id: Callable[[Any], Optional[str]]):
+        self.get_run_id = get_run_id
+        self._runs: Optional[List[Any]] = None
+        self._positions: Dict[str, int] = {}
+        self._indexed: int = 0
+
+    def find(self, runs: List[Any], run_id: str) -> Optional[int]:
+        """Get the position of the first run with this run_id, or None if there is none"""
+        self._sync(runs)
+        position = self._positions.get(run_id)
+        if position is not None and self.get_run_id(runs[position]) != run_id:
+            self._runs = None
+            self._sync(runs)
+            position = self._positions.get(run_id)
+        return position
+
+    def _sync(self, runs: List[Any]) -> None:
+        if self._runs is not runs or self._indexed > len(runs):
+            self._runs = runs
+            self._positions = {}
+            self._indexed = 0
+        for position in range(self._indexed, len(runs)):
+            run_id = self.get_run_id(runs[position])
+            if run_id is not None:
+                self._positions.setdefault(run_id, position)
+        self._indexed = len(runs)
+
+    def __deepcopy__(self, memo):
+        # A copy indexes the copied runs on first use
+        return self.__class__(self.get_run_id)
+
+
+class RunningMetrics:
+    """Running total of the metrics of the assistant messages in a list of items, e.g. runs or messages.
+
+    Items are counted once, as they are added to the list. The last `open_items` items may still change, so they are
+    read again on every call. The total is read again in full if the list was replaced or edited elsewhere.
+
+    Args:
+        get_messages: Returns the messages of an item.
+        open_items: Number of items at the end of the list that are not added to the running total.
+    """
+
+    def __init__(self, get_messages: Callable[[Any], Optional[List[Message]]], open_items: int = 0):
+        self.get_messages = get_messages
+        self.open_items = open_items
+        self._items: Optional[List[Any]] = None
+        self._role: Optional[str] = None
+        self._counted: int = 0
+        self._last_counted: Any = None
+        self._metrics: Optional["SessionMetrics"] = None
+
+    def total(self, items: List[Any], assistant_message_role: str = "assistant") -> "SessionMetrics":
+        """Get the metrics of the assistant messages in all items"""
+        from agno.agent.metrics import SessionMetrics
+
+        closed = max(len(items) - self.open_items, 0)
+        if (
+            self._metrics is None
+            or self._items is not items
+            or self._role != assistant_message_role
+            or self._counted > closed
+            or (self._counted > 0 and items[self._counted - 1] is not self._last_counted)
+        ):
+            self._items = items
+            self._role = assistant_message_role
+            self._counted = 0
+            self._last_counted = None
+            self._metrics = SessionMetrics()
+
+        for item in items[self._counted : closed]:
+            self._metrics = self._add(self._metrics, item)
+        if closed > self._counted:
+            self._counted = closed
+            self._last_counted = items[closed - 1]
+
+        metrics = replace(self._metrics)
+        for item in items[closed:]:
+            metrics = self._add(metrics, item)
+        return metrics
+
+    def reset(self) -> None:
+        """Read the total again in full on the next call, e.g. after an item was replaced"""
+        self._metrics = None
+
+    def _add(self, metrics: "SessionMetrics", item: Any) -> "SessionMetrics":
+        for message in self.get_messages(item) or []:
+            if message.role == self._role and message.metrics is not None:
+                metrics += message.metrics
+        return metrics
+
+    def __deepcopy__(self, memo):
+        # A copy reads the copied items on first use
+        return self.__class__(self.get_messages, self.open_items)
@@ -0,0 +1,107 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from agno.memory.v2.db.base import MemoryDb
+from agno.memory.v2.db.schema import MemoryRow
+from agno.memory.v2.schema import UserMemory
+from agno.utils.log import log_debug
+from agno.utils.lru_cache import LRUCache
+from agno.utils.shared import SharedOnCopy
+
+
+@dataclass
+class CachedUserMemories:
+    """The memories of a user, with the db version they were read at"""
+
+    memories: Dict[str, UserMemory]
+    # (row count, latest update) of the user's memories, see MemoryDb.get_memories_version
+    version: Tuple[int, Any]
+    # Monotonic time of the last full read, used to bound staleness
+    loaded_at: float
+
+
+class UserMemoryCache(SharedOnCopy):
+    """Write-through cache of user memories, keyed by user id.
+
+    Each read pays for a cheap version check against the db. When the version changed, only the memories updated
+    since the cached version are fetched; a full read happens when the row count does not add up (e.g. a memory was
+    deleted by another process), when the entry is older than `ttl` or when the db does not report versions.
+
+    Args:
+        max_users: Maximum number of users to keep memories for. The least recently used user is evicted first.
+        ttl: Number of seconds after which the memories of a user are fully read again.
+            Bounds the staleness from updates that land within the resolution of the db timestamps.
+    """
+
+    def __init__(self, max_users: int = 1024, ttl: Optional[float] = 300):
+        self.ttl: Optional[float] = ttl
+        self._entries: LRUCache[CachedUserMemories] = LRUCache(max_size=max_users)
+
+    def get_user_memories(self, db: MemoryDb, user_id: str) -> Dict[str, UserMemory]:
+        """Get the memories of a user, keyed by memory id, reading only what changed since the last call"""
+        version = db.get_memories_version(user_id=user_id)
+        if not isinstance(version, tuple):
+            # The db can't tell if memories changed, always read them
+            return self._to_memories(db.read_memories(user_id=user_id))
+
+        entry: Optional[CachedUserMemories] = self._entries.get(user_id)
+        if entry is not None and self.ttl is not None and time.monotonic() - entry.loaded_at > self.ttl:
+            entry = None
+
+        if entry is not None and entry.version != version:
+            entry = self._read_updated(db, user_id, entry, version)
+
+        if entry is None:
+            memories = self._to_memories(db.read_memories(user_id=user_id))
+            entry = CachedUserMemories(memories=memories, version=version, loaded_at=time.monotonic())
+        self._entries.set(user_id, entry)
+        return dict(entry.memories)
+
+    def _read_updated(
+        self, db: MemoryDb, user_id: str, entry: CachedUserMemories, version: Tuple[int, Any]
+    ) -> Optional[CachedUserMemories]:
+        """Merge the memories updated since the cached version, None when they must be read in full"""
+        if entry.version[1] is None:
+            return None
+        memories = dict(entry.memories)
+        memories.update(self._to_memories(db.read_memories_updated_since(user_id=user_id, since=entry.version[1])))
+        # A memory deleted elsewhere leaves the count off
+        if len(memories) != version[0]:
+            return None
+        log_debug(f"Read {len(memories) - len(entry.memories)} new memories for user {user_id}")
+        return CachedUserMemories(memories=memories, version=version, loaded_at=entry.loaded_at)
+
+    def upsert(self, user_id: str, memory_id: str, memory: UserMemory) -> None:
+        """Write a memory through to the cached memories of a user"""
+        entry: Optional[CachedUserMemories] = self._entries.get(user_id)
+        if entry is not None:
+            self._entries.set(
+                user_id,
+                CachedUserMemories(
+                    memories={**entry.memories, memory_id: memory}, version=entry.version, loaded_at=entry.loaded_at
+                ),
+            )
+
+    def delete(self, user_id: str, memory_id: str) -> None:
+        """Remove a memory from the cached memories of a user"""
+        entry: Optional[CachedUserMemories] = self._entries.get(user_id)
+        if entry is not None:
+            memories = {key: value for key, value in entry.memories.items() if key != memory_id}
+            self._entries.set(
+                user_id, CachedUserMemories(memories=memories, version=entry.version, loaded_at=entry.loaded_at)
+            )
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop the cached memories of a user, or of all users"""
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _to_memories(rows: Iterable[MemoryRow]) -> Dict[str, UserMemory]:
+        return {row.id: UserMemory.from_dict(row.memory) for row in rows if row.id is not None}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
 from agno.memory.v2.db.schema import MemoryRow
 
@@ -21,6 +21,16 @@ class MemoryDb(ABC):
     ) -> List[MemoryRow]:
         raise NotImplementedError
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        """Get the (row count, latest update) of the memories of a user, used to cheaply detect changes.
+        Returns None when the db can't compute it, in which case memories are always read in full.
+        """
+        return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        """Read the memories of a user updated at or after `since`, the latest update of a version."""
+        return self.read_memories(user_id=user_id)
+
     @abstractmethod
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         raise NotImplementedError
@@ -1,6 +1,6 @@
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
@@ -16,6 +16,7 @@ try:
         Transaction,
         transactional,
     )
+    from google.cloud.firestore_v1.base_query import FieldFilter
 except ImportError:
     raise ImportError(
         "`google-cloud-firestore` not installed. Please install it using `pip install google-cloud-firestore`"
@@ -188,30 +189,80 @@ class FirestoreMemoryDb(MemoryDb):
                 data = doc.to_dict()
                 if data is None:
                     continue
-
-                # Get timestamps for last_updated
-                updated_at = data.get("updated_at")
-                created_at = data.get("created_at")
-                last_updated = None
-                if updated_at:
-                    last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc)
-                elif created_at:
-                    last_updated = datetime.fromtimestamp(created_at, tz=timezone.utc)
-
-                memories.append(
-                    MemoryRow(
-                        id=data.get("id"),
-                        user_id=data.get("user_id", user_id),
-                        memory=data.get("memory", {}),
-                        last_updated=last_updated,
-                    )
-                )
+                memories.append(self._to_memory_row(data, user_id))
 
             return memories
         except Exception as e:
             logger.error(f"Error reading memories: {e}")
             return []
 
+    def _to_memory_row(self, data: Dict[str, Any], user_id: str) -> MemoryRow:
+        # Get timestamps for last_updated
+        updated_at = data.get("updated_at")
+        created_at = data.get("created_at")
+        last_updated = None
+        if updated_at:
+            last_updated = datetime.fromtimestamp(updated_at, tz=timezone.utc)
+        elif created_at:
+            last_updated = datetime.fromtimestamp(created_at, tz=timezone.utc)
+
+        return MemoryRow(
+            id=data.get("id"),
+            user_id=data.get("user_id", user_id),
+            memory=data.get("memory", {}),
+            last_updated=last_updated,
+        )
+
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        """
+        Get the number of memories of a user and their latest updated_at.
+
+        Args:
+            user_id: ID of the user to read
+
+        Returns:
+            Optional[Tuple[int, Any]]: The (count, latest updated_at) of the memories
+        """
+        if user_id is None:
+            return None
+
+        try:
+            user_collection = self.get_user_collection(user_id)
+            count = user_collection.count().get()[0][0].value
+            latest = None
+            for doc in user_collection.order_by("updated_at", direction=Query.DESCENDING).limit(1).stream():
+                data = doc.to_dict()
+                latest = data.get("updated_at") if data is not None else None
+            return count, latest
+        except Exception as e:
+            logger.error(f"Error reading memories version: {e}")
+            return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        """
+        Read the memories of a user updated at or after a timestamp.
+
+        Args:
+            user_id: ID of the user to read
+            since: The updated_at timestamp to read from
+
+        Returns:
+            List[MemoryRow]: List of memories
+        """
+        if user_id is None:
+            return []
+
+        memories: List[MemoryRow] = []
+        try:
+            query = self.get_user_collection(user_id).where(filter=FieldFilter("updated_at", ">=", since))
+            for doc in query.stream():
+                data = doc.to_dict()
+                if data is not None:
+                    memories.append(self._to_memory_row(data, user_id))
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
     def upsert_memory(self, memory: MemoryRow) -> None:
         """
         Upsert a memory into the user-specific collection.
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from pymongo import MongoClient
@@ -9,7 +9,7 @@ try:
 except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
-from agno.memory.v2.db import MemoryDb
+from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.utils.log import log_debug, logger
 
@@ -103,7 +103,46 @@ class MongoMemoryDb(MemoryDb):
             for doc in cursor:
                 # Remove MongoDB _id before converting to MemoryRow
                 doc.pop("_id", None)
-                memories.append(MemoryRow(user_id=doc["user_id"], memory=doc["memory"]))
+                memories.append(MemoryRow(id=doc.get("id"), user_id=doc["user_id"], memory=doc["memory"]))
+        except PyMongoError as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        """Get the number of memories of a user and their latest updated_at
+        Args:
+            user_id: ID of the user to read
+        Returns:
+            Optional[Tuple[int, Any]]: The (count, latest updated_at) of the memories
+        """
+        try:
+            query = {} if user_id is None else {"user_id": user_id}
+            pipeline: List[Dict[str, Any]] = [
+                {"$match": query},
+                {"$group": {"_id": None, "count": {"$sum": 1}, "latest": {"$max": "$updated_at"}}},
+            ]
+            for result in self.collection.aggregate(pipeline):
+                return result["count"], result["latest"]
+            return 0, None
+        except PyMongoError as e:
+            logger.error(f"Error reading memories version: {e}")
+            return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        """Read the memories of a user updated at or after a timestamp
+        Args:
+            user_id: ID of the user to read
+            since: The updated_at timestamp to read from
+        Returns:
+            List[MemoryRow]: List of memories
+        """
+        memories: List[MemoryRow] = []
+        try:
+            query: Dict[str, Any] = {"updated_at": {"$gte": since}}
+            if user_id is not None:
+                query["user_id"] = user_id
+            for doc in self.collection.find(query, {"_id": 0}):
+                memories.append(MemoryRow(id=doc.get("id"), user_id=doc["user_id"], memory=doc["memory"]))
         except PyMongoError as e:
             logger.error(f"Error reading memories: {e}")
         return memories
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -6,7 +6,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import scoped_session, sessionmaker
     from sqlalchemy.schema import Column, MetaData, Table
-    from sqlalchemy.sql.expression import delete, select, text
+    from sqlalchemy.sql.expression import delete, func, select, text
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed.  Please install using `pip install sqlalchemy 'psycopg[binary]'`")
@@ -120,6 +120,33 @@ class PostgresMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        updated_at = func.coalesce(self.table.c.updated_at, self.table.c.created_at)
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(func.count(), func.max(updated_at)).select_from(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                count, latest = sess.execute(stmt).one()
+                return count, latest
+        except Exception as e:
+            log_debug(f"Exception reading memories version: {e}")
+            return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        updated_at = func.coalesce(self.table.c.updated_at, self.table.c.created_at)
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table).where(updated_at >= since)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                for row in sess.execute(stmt).fetchall():
+                    memories.append(MemoryRow.model_validate(row))
+        except Exception as e:
+            log_debug(f"Exception reading from table: {e}")
+        return memories
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
 
@@ -139,6 +166,7 @@ class PostgresMemoryDb(MemoryDb):
                     set_=dict(
                         user_id=stmt.excluded.user_id,
                         memory=stmt.excluded.memory,
+                        updated_at=text("now()"),
                     ),
                 )
 
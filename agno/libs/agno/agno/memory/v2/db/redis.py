@@ -1,6 +1,6 @@
 import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from redis import ConnectionError, Redis
@@ -13,6 +13,9 @@ from agno.utils.log import log_debug, log_info, logger
 
 
 class RedisMemoryDb(MemoryDb):
+    # Field of a user's memory index holding the revision of the user's memories
+    _REVISION = "__revision__"
+
     def __init__(
         self,
         prefix: str = "agno_memory",
@@ -55,6 +58,24 @@ class RedisMemoryDb(MemoryDb):
         """Generate Redis key for a memory."""
         return f"{self.prefix}:{memory_id}"
 
+    def _get_index_key(self, user_id: str) -> str:
+        """Generate Redis key for the index of a user's memories, kept out of the `prefix:*` pattern."""
+        return f"{self.prefix}-index:{user_id}"
+
+    def _rebuild_index(self, user_id: str) -> None:
+        """Index the memories of a user written before the index existed."""
+        index_key = self._get_index_key(user_id)
+        memory_ids = []
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            data_str = self.redis_client.get(key)
+            if data_str:
+                data = json.loads(data_str)  # type: ignore
+                if data.get("user_id") == user_id:
+                    memory_ids.append(data["id"])
+        self.redis_client.hsetnx(index_key, self._REVISION, 0)
+        if memory_ids:
+            self.redis_client.hset(index_key, mapping={memory_id: 0 for memory_id in memory_ids})
+
     def create(self) -> None:
         """
         Test connection to Redis.
@@ -115,6 +136,43 @@ class RedisMemoryDb(MemoryDb):
 
         return memories
 
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        """Get the number of memories of a user and their revision from the user's memory index.
+        Not available with `expire`, as expired memories are not removed from the index.
+        """
+        if user_id is None or self.expire is not None:
+            return None
+        try:
+            index_key = self._get_index_key(user_id)
+            revision = self.redis_client.hget(index_key, self._REVISION)
+            if revision is None:
+                self._rebuild_index(user_id)
+                return None
+            return self.redis_client.hlen(index_key) - 1, int(revision)  # type: ignore
+        except Exception as e:
+            logger.error(f"Error reading memories version: {e}")
+            return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        """Read the memories of a user written at or after a revision of the user's memory index"""
+        if user_id is None:
+            return self.read_memories(user_id=user_id)
+        memories: List[MemoryRow] = []
+        try:
+            index = self.redis_client.hgetall(self._get_index_key(user_id))
+            memory_ids = [
+                memory_id
+                for memory_id, revision in index.items()  # type: ignore
+                if memory_id != self._REVISION and int(revision) >= since
+            ]
+            if memory_ids:
+                for data_str in self.redis_client.mget([self._get_key(memory_id) for memory_id in memory_ids]):  # type: ignore
+                    if data_str:
+                        memories.append(MemoryRow.model_validate(json.loads(data_str)))
+        except Exception as e:
+            logger.error(f"Error reading memories: {e}")
+        return memories
+
     def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
         """Upsert a memory in Redis"""
         try:
@@ -136,6 +194,10 @@ class RedisMemoryDb(MemoryDb):
                 self.redis_client.set(key, json.dumps(memory_data), ex=self.expire)
             else:
                 self.redis_client.set(key, json.dumps(memory_data))
+                if memory.user_id is not None:
+                    index_key = self._get_index_key(memory.user_id)
+                    revision = self.redis_client.hincrby(index_key, self._REVISION, 1)
+                    self.redis_client.hset(index_key, memory.id, revision)  # type: ignore
 
             return memory
 
@@ -147,7 +209,13 @@ class RedisMemoryDb(MemoryDb):
         """Delete a memory from Redis"""
         try:
             key = self._get_key(memory_id)
+            data_str = self.redis_client.get(key)
             self.redis_client.delete(key)
+            user_id = json.loads(data_str).get("user_id") if data_str else None  # type: ignore
+            if user_id is not None and self.expire is None:
+                index_key = self._get_index_key(user_id)
+                self.redis_client.hdel(index_key, memory_id)
+                self.redis_client.hincrby(index_key, self._REVISION, 1)
             log_debug(f"Deleted memory: {memory_id}")
         except Exception as e:
             logger.error(f"Error deleting memory: {e}")
@@ -173,6 +241,9 @@ class RedisMemoryDb(MemoryDb):
         try:
             pattern = f"{self.prefix}:*"
             keys_to_delete = list(self.redis_client.scan_iter(match=pattern))
+            index_keys = list(self.redis_client.scan_iter(match=f"{self.prefix}-index:*"))
+            if index_keys:
+                self.redis_client.delete(*index_keys)
 
             if keys_to_delete:
                 self.redis_client.delete(*keys_to_delete)
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
     from sqlalchemy import (
@@ -9,8 +9,10 @@ try:
         MetaData,
         String,
         Table,
+        cast,
         create_engine,
         delete,
+        func,
         inspect,
         select,
         text,
@@ -132,14 +134,7 @@ class SqliteMemoryDb(MemoryDb):
 
                 result = session.execute(stmt)
                 for row in result:
-                    memories.append(
-                        MemoryRow(
-                            id=row.id,
-                            user_id=row.user_id,
-                            memory=eval(row.memory),
-                            last_updated=row.updated_at or row.created_at,
-                        )
-                    )
+                    memories.append(self._to_memory_row(row))
         except SQLAlchemyError as e:
             log_debug(f"Exception reading from table: {e}")
             log_debug(f"Table does not exist: {self.table_name}")
@@ -147,6 +142,43 @@ class SqliteMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def _to_memory_row(self, row: Any) -> MemoryRow:
+        return MemoryRow(
+            id=row.id,
+            user_id=row.user_id,
+            memory=eval(row.memory),
+            last_updated=row.updated_at or row.created_at,
+        )
+
+    def _updated_at(self):
+        # Compare the stored timestamp text, binding a datetime would change its format
+        return cast(func.coalesce(self.table.c.updated_at, self.table.c.created_at), String)
+
+    def get_memories_version(self, user_id: Optional[str] = None) -> Optional[Tuple[int, Any]]:
+        try:
+            with self.Session() as session:
+                stmt = select(func.count(), func.max(self._updated_at())).select_from(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                count, latest = session.execute(stmt).one()
+                return count, latest
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading memories version: {e}")
+            return None
+
+    def read_memories_updated_since(self, user_id: Optional[str], since: Any) -> List[MemoryRow]:
+        memories: List[MemoryRow] = []
+        try:
+            with self.Session() as session:
+                stmt = select(self.table).where(self._updated_at() >= since)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                for row in session.execute(stmt):
+                    memories.append(self._to_memory_row(row))
+        except SQLAlchemyError as e:
+            log_debug(f"Exception reading from table: {e}")
+        return memories
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         try:
             with self.Session() as session:
@@ -3,11 +3,13 @@ from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from os import getenv
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Type, Union
 
 from pydantic import BaseModel, Field
 
 from agno.media import AudioArtifact, ImageArtifact, VideoArtifact
+from agno.memory.bookkeeping import RunIndex, RunningMetrics
+from agno.memory.v2.cache import UserMemoryCache
 from agno.memory.v2.db.base import MemoryDb
 from agno.memory.v2.db.schema import MemoryRow
 from agno.memory.v2.manager import MemoryManager
@@ -22,6 +24,9 @@ from agno.utils.log import log_debug, log_warning, logger, set_log_level_to_debu
 from agno.utils.prompts import get_json_output_prompt
 from agno.utils.string import parse_response_model_str
 
+if TYPE_CHECKING:
+    from agno.agent.metrics import SessionMetrics
+
 
 class MemorySearchResponse(BaseModel):
     """Model for Memory Search Response."""
@@ -94,6 +99,8 @@ class Memory:
     summary_manager: Optional[SessionSummarizer] = None
 
     db: Optional[MemoryDb] = None
+    # Cache of the user memories read from the db, shared by copies of this memory
+    user_memory_cache: Optional[UserMemoryCache] = None
 
     # runs per session
     runs: Optional[Dict[str, List[Union[RunResponse, TeamRunResponse]]]] = None
@@ -121,10 +128,16 @@ class Memory:
         debug_mode: bool = False,
         delete_memories: bool = False,
         clear_memories: bool = False,
+        cache_user_memories: bool = True,
+        user_memory_cache: Optional[UserMemoryCache] = None,
     ):
         self.memories = memories or {}
         self.summaries = summaries or {}
         self.runs = runs or {}
+        # session_id -> positions of the runs of the session by run_id
+        self._run_indexes: Dict[str, RunIndex] = {}
+        # session_id -> running total of the metrics of the runs of the session
+        self._session_metrics: Dict[str, RunningMetrics] = {}
 
         self.debug_mode = debug_mode
 
@@ -142,6 +155,10 @@ class Memory:
 
         self.db = db
 
+        if user_memory_cache is None and cache_user_memories:
+            user_memory_cache = UserMemoryCache()
+        self.user_memory_cache = user_memory_cache
+
         # We are making memories
         if self.model is not None:
             if self.memory_manager is None:
@@ -185,16 +202,30 @@ class Memory:
 
     def refresh_from_db(self, user_id: Optional[str] = None):
         if self.db:
-            # If no user_id is provided, read all memories
+            # If no user_id is provided, read and reset all memories
             if user_id is None:
-                all_memories = self.db.read_memories()
+                self.memories = {}
+                for memory in self.db.read_memories():
+                    if memory.user_id is not None and memory.id is not None:
+                        self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                return
+
+            # Only replace the memories of this user, runs for other users can share this Memory
+            if self.user_memory_cache is not None:
+                # Only read the memories of the user that changed since the last refresh
+                user_memories = self.user_memory_cache.get_user_memories(self.db, user_id)
+            else:
+                user_memories = {
+                    memory.id: UserMemory.from_dict(memory.memory)
+                    for memory in self.db.read_memories(user_id=user_id)
+                    if memory.id is not None
+                }
+            if self.memories is None:
+                self.memories = {}
+            if user_memories:
+                self.memories[user_id] = user_memories
             else:
-                all_memories = self.db.read_memories(user_id=user_id)
-            # Reset the memories
-            self.memories = {}
-            for memory in all_memories:
-                if memory.user_id is not None and memory.id is not None:
-                    self.memories.setdefault(memory.user_id, {})[memory.id] = UserMemory.from_dict(memory.memory)
+                self.memories.pop(user_id, None)
 
     def set_log_level(self):
         if self.debug_mode or getenv("AGNO_DEBUG", "false").lower() == "true":
@@ -387,7 +418,7 @@ class Memory:
 
         del self.memories[user_id][memory_id]  # type: ignore
         if self.db:
-            self._delete_db_memory(memory_id=memory_id)
+            self._delete_db_memory(memory_id=memory_id, user_id=user_id)
 
     def delete_session_summary(self, user_id: str, session_id: str) -> None:
         """Delete a session summary for a given user id
@@ -540,7 +571,7 @@ class Memory:
         )
 
         # We refresh from the DB
-        self.refresh_from_db()
+        self.refresh_from_db(user_id=user_id)
 
         return response
 
@@ -618,19 +649,27 @@ class Memory:
             if not self.db:
                 raise ValueError("Memory db not initialized")
             self.db.upsert_memory(memory)
+            if self.user_memory_cache is not None and memory.user_id is not None:
+                self.user_memory_cache.upsert(memory.user_id, memory.id, UserMemory.from_dict(memory.memory))  # type: ignore
             return "Memory added successfully"
         except Exception as e:
+            if self.user_memory_cache is not None and memory.user_id is not None:
+                self.user_memory_cache.invalidate(memory.user_id)
             logger.warning(f"Error storing memory in db: {e}")
             return f"Error adding memory: {e}"
 
-    def _delete_db_memory(self, memory_id: str) -> str:
+    def _delete_db_memory(self, memory_id: str, user_id: Optional[str] = None) -> str:
         """Use this function to delete a memory from the database."""
         try:
             if not self.db:
                 raise ValueError("Memory db not initialized")
             self.db.delete_memory(memory_id=memory_id)
+            if self.user_memory_cache is not None and user_id is not None:
+                self.user_memory_cache.delete(user_id, memory_id)
             return "Memory deleted successfully"
         except Exception as e:
+            if self.user_memory_cache is not None:
+                self.user_memory_cache.invalidate(user_id)
             logger.warning(f"Error deleting memory in db: {e}")
             return f"Error deleting memory: {e}"
 
@@ -686,17 +725,32 @@ class Memory:
         # Check if run already exists with the same run_id
         if hasattr(run, "run_id") and run.run_id:
             run_id = run.run_id
+            if session_id not in self._run_indexes:
+                self._run_indexes[session_id] = RunIndex(get_run_id=lambda r: getattr(r, "run_id", None))
             # Look for existing run with same ID
-            for i, existing_run in enumerate(self.runs[session_id]):
-                if hasattr(existing_run, "run_id") and existing_run.run_id == run_id:
-                    # Replace existing run
-                    self.runs[session_id][i] = run
-                    log_debug(f"Replaced existing run with run_id {run_id} in memory")
-                    return
+            position = self._run_indexes[session_id].find(self.runs[session_id], run_id)
+            if position is not None:
+                # Replace existing run
+                self.runs[session_id][position] = run
+                if session_id in self._session_metrics:
+                    self._session_metrics[session_id].reset()
+                log_debug(f"Replaced existing run with run_id {run_id} in memory")
+                return
 
         self.runs[session_id].append(run)
         log_debug("Added RunResponse to Memory")
 
+    def get_session_metrics(self, session_id: str, assistant_message_role: str = "assistant") -> "SessionMetrics":
+        """Returns the SessionMetrics of the assistant messages in the runs of a session.
+
+        Runs are counted once as they are added, so the cost does not grow with the number of runs in the session.
+        The last run may still change and is read on every call.
+        """
+        if session_id not in self._session_metrics:
+            self._session_metrics[session_id] = RunningMetrics(get_messages=lambda run: run.messages, open_items=1)
+        session_runs = self.runs.get(session_id, []) if self.runs else []
+        return self._session_metrics[session_id].total(session_runs, assistant_message_role=assistant_message_role)
+
     def get_messages_from_last_n_runs(
         self,
         session_id: str,
@@ -726,17 +780,26 @@ class Memory:
             skip_status = [RunStatus.paused, RunStatus.cancelled, RunStatus.error]
 
         session_runs = self.runs.get(session_id, [])
-        # Filter by agent_id and team_id
-        if agent_id:
-            session_runs = [run for run in session_runs if hasattr(run, "agent_id") and run.agent_id == agent_id]  # type: ignore
-        if team_id:
-            session_runs = [run for run in session_runs if hasattr(run, "team_id") and run.team_id == team_id]  # type: ignore
 
-        # Filter by status
-        session_runs = [run for run in session_runs if hasattr(run, "status") and run.status not in skip_status]  # type: ignore
-
-        # Filter by last_n
-        runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
+        def include_run(run: Union[RunResponse, TeamRunResponse]) -> bool:
+            if agent_id and not (hasattr(run, "agent_id") and run.agent_id == agent_id):  # type: ignore
+                return False
+            if team_id and not (hasattr(run, "team_id") and run.team_id == team_id):  # type: ignore
+                return False
+            return hasattr(run, "status") and run.status not in skip_status  # type: ignore
+
+        if last_n is not None and last_n > 0:
+            # Only read the runs from the end of the session that are needed
+            runs_to_process: List[Union[RunResponse, TeamRunResponse]] = []
+            for run in reversed(session_runs):
+                if len(runs_to_process) == last_n:
+                    break
+                if include_run(run):
+                    runs_to_process.append(run)
+            runs_to_process.reverse()
+        else:
+            session_runs = [run for run in session_runs if include_run(run)]
+            runs_to_process = session_runs[-last_n:] if last_n is not None else session_runs
         messages_from_history = []
         system_message = None
         for run_response in runs_to_process:
@@ -982,9 +1045,13 @@ class Memory:
         """Clears the memory."""
         if self.db:
             self.db.clear()
+        if self.user_memory_cache is not None:
+            self.user_memory_cache.invalidate()
         self.memories = {}
         self.summaries = {}
         self.runs = {}
+        self._run_indexes = {}
+        self._session_metrics = {}
 
     def deep_copy(self) -> "Memory":
         from copy import deepcopy
@@ -994,7 +1061,7 @@ class Memory:
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "memory_manager", "summary_manager"]:
+            if field_name not in ["db", "memory_manager", "summary_manager", "user_memory_cache"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -1004,6 +1071,7 @@ class Memory:
         copied_obj.db = self.db
         copied_obj.memory_manager = self.memory_manager
         copied_obj.summary_manager = self.summary_manager
+        copied_obj.user_memory_cache = self.user_memory_cache
 
         return copied_obj
 
@@ -1117,7 +1185,7 @@ class Memory:
         # Deep copy attributes
         for k, v in self.__dict__.items():
             # Reuse db
-            if k in {"db", "memory_manager", "summary_manager", "team_context"}:
+            if k in {"db", "memory_manager", "summary_manager", "team_context", "user_memory_cache"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
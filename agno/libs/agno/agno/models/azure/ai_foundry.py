@@ -172,10 +172,13 @@ class AzureAIFoundry(Model):
         Returns:
             AsyncChatCompletionsClient: An instance of the asynchronous Azure AI client.
         """
+        async_client = self._get_cached_async_client()
+        if async_client is not None:
+            return async_client
+
         client_params = self._get_client_params()
 
-        self.async_client = AsyncChatCompletionsClient(**client_params)
-        return self.async_client
+        return self._set_async_client(AsyncChatCompletionsClient(**client_params))
 
     def invoke(
         self,
@@ -216,11 +219,10 @@ class AzureAIFoundry(Model):
         """
 
         try:
-            async with self.get_async_client() as client:
-                return await client.complete(
-                    messages=[format_message(m) for m in messages],
-                    **self.get_request_params(tools=tools, response_format=response_format, tool_choice=tool_choice),
-                )
+            return await self.get_async_client().complete(
+                messages=[format_message(m) for m in messages],
+                **self.get_request_params(tools=tools, response_format=response_format, tool_choice=tool_choice),
+            )
         except HttpResponseError as e:
             log_error(f"Azure AI API error: {e}")
             raise ModelProviderError(
@@ -272,14 +274,13 @@ class AzureAIFoundry(Model):
         Sends an asynchronous streaming chat completion request to the Azure AI API.
         """
         try:
-            async with self.get_async_client() as client:
-                stream = await client.complete(
-                    messages=[format_message(m) for m in messages],
-                    stream=True,
-                    **self.get_request_params(tools=tools, response_format=response_format, tool_choice=tool_choice),
-                )
-                async for chunk in stream:  # type: ignore
-                    yield chunk
+            stream = await self.get_async_client().complete(
+                messages=[format_message(m) for m in messages],
+                stream=True,
+                **self.get_request_params(tools=tools, response_format=response_format, tool_choice=tool_choice),
+            )
+            async for chunk in stream:  # type: ignore
+                yield chunk
 
         except HttpResponseError as e:
             log_error(f"Azure AI API error: {e}")
@@ -5,6 +5,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 
 try:
     from openai import AsyncAzureOpenAI as AsyncAzureOpenAIClient
@@ -116,7 +117,7 @@ class AzureOpenAI(OpenAILike):
         else:
             # Create a new async HTTP client with custom limits
             _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
 
         self.async_client = AsyncAzureOpenAIClient(**_client_params)
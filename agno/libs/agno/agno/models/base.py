@@ -1,6 +1,8 @@
 import asyncio
 import collections.abc
+import contextvars
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from types import AsyncGeneratorType, GeneratorType
 from typing import (
@@ -22,7 +24,7 @@ from uuid import uuid4
 from pydantic import BaseModel
 
 from agno.exceptions import AgentRunException
-from agno.media import AudioResponse, ImageArtifact
+from agno.media import Audio, AudioResponse, Image, ImageArtifact, Video
 from agno.models.message import Citations, Message, MessageMetrics
 from agno.models.response import ModelResponse, ModelResponseEvent, ToolExecution
 from agno.run.response import RunResponseContentEvent, RunResponseEvent
@@ -61,6 +63,28 @@ def _log_messages(messages: List[Message]) -> None:
         m.log(metrics=False)
 
 
+def _get_offloaded_media(messages: List[Message]) -> List[Union[Image, Audio, Video]]:
+    """Get the media of the messages whose content is still in a media store"""
+    offloaded_media: List[Union[Image, Audio, Video]] = []
+    for m in messages:
+        media_list: List[Union[Image, Audio, Video]] = [*(m.images or []), *(m.audio or []), *(m.videos or [])]
+        offloaded_media.extend(media for media in media_list if media.content is None and media.content_uri is not None)
+    return offloaded_media
+
+
+def _load_media_content(messages: List[Message]) -> None:
+    """Read the content of offloaded media before it is sent to the model"""
+    for media in _get_offloaded_media(messages):
+        media.load_content()
+
+
+async def _aload_media_content(messages: List[Message]) -> None:
+    """Read the content of offloaded media before it is sent to the model, downloading in parallel"""
+    offloaded_media = _get_offloaded_media(messages)
+    if offloaded_media:
+        await asyncio.gather(*(asyncio.to_thread(media.load_content) for media in offloaded_media))
+
+
 def _add_usage_metrics_to_assistant_message(assistant_message: Message, response_usage: Any) -> None:
     """
     Add usage metrics from the model provider to the assistant message.
@@ -222,6 +246,17 @@ def _handle_agent_exception(a_exc: AgentRunException, additional_messages: Optio
             m.stop_after_tool_call = True
 
 
+# Attributes that hold the provider SDK clients of a model
+_CLIENT_FIELDS = ("client", "async_client")
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 @dataclass
 class Model(ABC):
     # ID of the model to use.
@@ -257,6 +292,11 @@ class Model(ABC):
     # The role of the assistant message.
     assistant_message_role: str = "assistant"
 
+    # Event loop the async client was created on, None if the client was passed to the model
+    _async_client_loop: Optional[Any] = field(default=None, init=False, repr=False)
+    # Async clients created on other event loops that are not closed yet, with their event loop
+    _previous_async_clients: List[Tuple[Any, Any]] = field(default_factory=list, init=False, repr=False)
+
     def __post_init__(self):
         if self.provider is None and self.name is not None:
             self.provider = f"{self.name} ({self.id})"
@@ -319,6 +359,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> ModelResponse:
         """
         Generate a response from the model.
@@ -328,6 +369,7 @@ class Model(ABC):
         log_debug(f"Model: {self.id}", center=True, symbol="-")
 
         _log_messages(messages)
+        _load_media_content(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -367,6 +409,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tool_calls=max_parallel_tool_calls,
                 ):
                     if isinstance(function_call_response, ModelResponse):
                         if (
@@ -439,6 +482,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await _aload_media_content(messages)
         model_response = ModelResponse()
 
         function_call_count = 0
@@ -741,6 +785,7 @@ class Model(ABC):
         functions: Optional[Dict[str, Function]] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         stream_model_response: bool = True,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         """
@@ -750,6 +795,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        _load_media_content(messages)
 
         function_call_count = 0
 
@@ -814,6 +860,7 @@ class Model(ABC):
                     function_call_results=function_call_results,
                     current_function_call_count=function_call_count,
                     function_call_limit=tool_call_limit,
+                    max_parallel_tool_calls=max_parallel_tool_calls,
                 ):
                     yield function_call_response
 
@@ -898,6 +945,7 @@ class Model(ABC):
         log_debug(f"{self.get_provider()} Async Response Stream Start", center=True, symbol="-")
         log_debug(f"Model: {self.id}", center=True, symbol="-")
         _log_messages(messages)
+        await _aload_media_content(messages)
 
         function_call_count = 0
 
@@ -1203,6 +1251,21 @@ class Model(ABC):
         # Stop function call timer
         function_call_timer.stop()
 
+        yield from self._process_function_call_output(
+            function_call=function_call,
+            function_call_success=function_call_success,
+            function_call_timer=function_call_timer,
+            function_call_results=function_call_results,
+        )
+
+    def _process_function_call_output(
+        self,
+        function_call: FunctionCall,
+        function_call_success: bool,
+        function_call_timer: Timer,
+        function_call_results: List[Message],
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Yield the output of an executed function call and add its result to the function call results."""
         # Process function call output
         function_call_output: str = ""
 
@@ -1258,6 +1321,66 @@ class Model(ABC):
         # Add function call to function call results
         function_call_results.append(function_call_result)
 
+    def _execute_function_call(self, function_call: FunctionCall) -> Tuple[Union[bool, AgentRunException], Timer]:
+        """Execute a function call, returning its success status and timer. Used by the tool call thread pool."""
+        function_call_timer = Timer()
+        function_call_timer.start()
+        success: Union[bool, AgentRunException] = False
+        try:
+            success = function_call.execute().status == "success"
+        except AgentRunException as e:
+            success = e
+        finally:
+            function_call_timer.stop()
+        return success, function_call_timer
+
+    def _run_function_calls_in_parallel(
+        self,
+        function_calls: List[FunctionCall],
+        function_call_results: List[Message],
+        additional_messages: List[Message],
+        max_parallel_tool_calls: int,
+    ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+        """Execute function calls in a thread pool, yielding their events and results in call order."""
+        for fc in function_calls:
+            yield ModelResponse(
+                content=fc.get_call_str(),
+                tool_executions=[
+                    ToolExecution(
+                        tool_call_id=fc.call_id,
+                        tool_name=fc.function.name,
+                        tool_args=fc.arguments,
+                    )
+                ],
+                event=ModelResponseEvent.tool_call_started.value,
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_parallel_tool_calls, len(function_calls)), thread_name_prefix="agno-tool-call"
+        ) as executor:
+            futures: List[Future] = [
+                executor.submit(contextvars.copy_context().run, self._execute_function_call, fc)
+                for fc in function_calls
+            ]
+            for fc, future in zip(function_calls, futures):
+                try:
+                    function_call_success, function_call_timer = future.result()
+                except Exception as e:
+                    log_error(f"Error executing function {fc.function.name}: {e}")
+                    raise e
+
+                if isinstance(function_call_success, AgentRunException):
+                    # Update additional messages from function call
+                    _handle_agent_exception(function_call_success, additional_messages)
+                    function_call_success = False
+
+                yield from self._process_function_call_output(
+                    function_call=fc,
+                    function_call_success=function_call_success,
+                    function_call_timer=function_call_timer,
+                    function_call_results=function_call_results,
+                )
+
     def run_function_calls(
         self,
         function_calls: List[FunctionCall],
@@ -1265,16 +1388,37 @@ class Model(ABC):
         additional_messages: Optional[List[Message]] = None,
         current_function_call_count: int = 0,
         function_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
     ) -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
         # Additional messages from function calls that will be added to the function call results
         if additional_messages is None:
             additional_messages = []
 
+        # Consecutive parallel-safe function calls, executed together when the next call can't join them
+        parallel_batch: List[FunctionCall] = []
+
+        def run_parallel_batch() -> Iterator[Union[ModelResponse, RunResponseEvent, TeamRunResponseEvent]]:
+            if len(parallel_batch) == 1:
+                yield from self.run_function_call(
+                    function_call=parallel_batch[0],
+                    function_call_results=function_call_results,
+                    additional_messages=additional_messages,
+                )
+            elif parallel_batch:
+                yield from self._run_function_calls_in_parallel(
+                    function_calls=parallel_batch,
+                    function_call_results=function_call_results,
+                    additional_messages=additional_messages,  # type: ignore
+                    max_parallel_tool_calls=max_parallel_tool_calls,  # type: ignore
+                )
+            parallel_batch.clear()
+
         for fc in function_calls:
             if function_call_limit is not None:
                 current_function_call_count += 1
                 # We have reached the function call limit, so we add an error result to the function call results
                 if current_function_call_count > function_call_limit:
+                    yield from run_parallel_batch()
                     function_call_results.append(self.create_tool_call_limit_error_result(fc))
                     continue
 
@@ -1346,6 +1490,7 @@ class Model(ABC):
                 )
 
             if paused_tool_executions:
+                yield from run_parallel_batch()
                 yield ModelResponse(
                     tool_executions=paused_tool_executions,
                     event=ModelResponseEvent.tool_call_paused.value,
@@ -1353,10 +1498,17 @@ class Model(ABC):
                 # We don't execute the function calls here
                 continue
 
+            if max_parallel_tool_calls is not None and max_parallel_tool_calls > 1 and fc.function.parallel_safe:
+                parallel_batch.append(fc)
+                continue
+
+            yield from run_parallel_batch()
             yield from self.run_function_call(
                 function_call=fc, function_call_results=function_call_results, additional_messages=additional_messages
             )
 
+        yield from run_parallel_batch()
+
         # Add any additional messages at the end
         if additional_messages:
             function_call_results.extend(additional_messages)
@@ -1671,6 +1823,100 @@ class Model(ABC):
     def get_instructions_for_model(self, tools: Optional[List[Any]] = None) -> Optional[List[str]]:
         return self.instructions
 
+    def _get_cached_async_client(self) -> Optional[Any]:
+        """Get the async client of this model, unless the model created it on another event loop.
+
+        The connection pool of an async client can only be used on the event loop it was created on, so a client
+        created during an earlier `asyncio.run` is replaced rather than reused. The replaced client is kept until
+        `aclose` while its event loop is open, and used again when the model runs on that event loop.
+        """
+        async_client = getattr(self, "async_client", None)
+        if async_client is None or self._async_client_loop is None:
+            return async_client
+        loop = _get_running_loop()
+        if self._async_client_loop is loop:
+            return async_client
+
+        # Connections can't be closed once their event loop is closed, they are released with the client
+        clients = [
+            (client, client_loop)
+            for client, client_loop in [*self._previous_async_clients, (async_client, self._async_client_loop)]
+            if not client_loop.is_closed()
+        ]
+        self.async_client, self._async_client_loop = None, None
+        for i, (client, client_loop) in enumerate(clients):
+            if client_loop is loop:
+                self.async_client, self._async_client_loop = clients.pop(i)
+                break
+        self._previous_async_clients = clients
+        return self.async_client
+
+    def _set_async_client(self, async_client: Any) -> Any:
+        """Keep an async client created by this model, with the event loop it was created on"""
+        self.async_client = async_client
+        self._async_client_loop = _get_running_loop()
+        return async_client
+
+    def close(self) -> None:
+        """Close the sync provider clients of this model and their connection pools.
+
+        New clients are created on the next request. An `http_client` passed to the model is left open.
+        """
+        for field_name in _CLIENT_FIELDS:
+            client = getattr(self, field_name, None)
+            if client is None:
+                continue
+            close = getattr(client, "close", None)
+            if close is None or asyncio.iscoroutinefunction(close):
+                # Async clients can only be closed from an event loop, see aclose
+                continue
+            setattr(self, field_name, None)
+            if getattr(self, "http_client", None) is not None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                log_debug(f"Could not close {field_name} of {self.get_provider()}: {e}")
+
+    async def aclose(self) -> None:
+        """Close the sync and async provider clients of this model and their connection pools.
+
+        Async clients created on another event loop are closed on that event loop while it is running.
+        """
+        clients = [
+            (
+                field_name,
+                getattr(self, field_name, None),
+                self._async_client_loop if field_name == "async_client" else None,
+            )
+            for field_name in _CLIENT_FIELDS
+        ]
+        clients.extend(("async_client", client, client_loop) for client, client_loop in self._previous_async_clients)
+        self._previous_async_clients = []
+        for field_name, client, client_loop in clients:
+            if client is None:
+                continue
+            setattr(self, field_name, None)
+            if getattr(self, "http_client", None) is not None:
+                continue
+            close = getattr(client, "close", None) or getattr(client, "aclose", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if not asyncio.iscoroutine(result):
+                    continue
+                if client_loop is None or client_loop is _get_running_loop():
+                    await result
+                elif client_loop.is_running():
+                    # Close the connections on the event loop they belong to
+                    await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(result, client_loop))
+                else:
+                    result.close()
+                    log_debug(f"Could not close {field_name} of {self.get_provider()}, its event loop is not running")
+            except Exception as e:
+                log_debug(f"Could not close {field_name} of {self.get_provider()}: {e}")
+
     def __deepcopy__(self, memo):
         """Create a deep copy of the Model instance.
 
@@ -1691,6 +1937,10 @@ class Model(ABC):
         for k, v in self.__dict__.items():
             if k in {"response_format", "_tools", "_functions"}:
                 continue
+            # Copies share the provider clients, and with them the connection pools
+            if k in _CLIENT_FIELDS or k in {"http_client", "_async_client_loop", "_previous_async_clients"}:
+                setattr(new_model, k, v)
+                continue
             try:
                 setattr(new_model, k, deepcopy(v, memo))
             except Exception:
@@ -10,6 +10,7 @@ from pydantic import BaseModel
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.log import log_debug, log_error, log_warning
 
 try:
@@ -61,6 +62,8 @@ class Cerebras(Model):
     default_headers: Optional[Any] = None
     default_query: Optional[Any] = None
     http_client: Optional[httpx.Client] = None
+    # Connection pool limits of the async HTTP client created for this model
+    http_client_limits: Optional[httpx.Limits] = None
     client_params: Optional[Dict[str, Any]] = None
 
     # Cerebras clients
@@ -124,7 +127,7 @@ class Cerebras(Model):
         else:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
         self.async_client = AsyncCerebrasClient(**client_params)
         return self.async_client
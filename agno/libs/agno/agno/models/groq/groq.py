@@ -9,6 +9,7 @@ from agno.exceptions import ModelProviderError
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.openai import images_to_message
 
@@ -58,6 +59,8 @@ class Groq(Model):
     default_headers: Optional[Any] = None
     default_query: Optional[Any] = None
     http_client: Optional[httpx.Client] = None
+    # Connection pool limits of the async HTTP client created for this model
+    http_client_limits: Optional[httpx.Limits] = None
     client_params: Optional[Dict[str, Any]] = None
 
     # Groq clients
@@ -111,8 +114,9 @@ class Groq(Model):
         Returns:
             AsyncGroqClient: An instance of the asynchronous Groq client.
         """
-        if self.async_client:
-            return self.async_client
+        async_client = self._get_cached_async_client()
+        if async_client is not None:
+            return async_client
 
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
@@ -120,9 +124,9 @@ class Groq(Model):
         else:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
-        return AsyncGroqClient(**client_params)
+        return self._set_async_client(AsyncGroqClient(**client_params))
 
     def get_request_params(
         self,
@@ -10,6 +10,7 @@ from agno.exceptions import ModelProviderError
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.models.llama import format_message
 
@@ -59,6 +60,8 @@ class Llama(Model):
     default_headers: Optional[Any] = None
     default_query: Optional[Any] = None
     http_client: Optional[httpx.Client] = None
+    # Connection pool limits of the async HTTP client created for this model
+    http_client_limits: Optional[httpx.Limits] = None
     client_params: Optional[Dict[str, Any]] = None
 
     # OpenAI clients
@@ -113,8 +116,9 @@ class Llama(Model):
         Returns:
             AsyncLlamaAPIClient: An instance of the asynchronous Llama client.
         """
-        if self.async_client:
-            return self.async_client
+        async_client = self._get_cached_async_client()
+        if async_client is not None:
+            return async_client
 
         client_params: Dict[str, Any] = self._get_client_params()
         if self.http_client:
@@ -122,9 +126,9 @@ class Llama(Model):
         else:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
-        return AsyncLlamaAPIClient(**client_params)
+        return self._set_async_client(AsyncLlamaAPIClient(**client_params))
 
     def get_request_params(
         self,
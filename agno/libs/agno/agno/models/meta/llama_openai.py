@@ -11,6 +11,7 @@ except ImportError:
 
 from agno.models.meta.llama import Message
 from agno.models.openai.like import OpenAILike
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.models.llama import format_message
 
 
@@ -62,13 +63,17 @@ class LlamaOpenAI(OpenAILike):
 
     def get_async_client(self):
         """Override to provide custom httpx client that properly handles redirects"""
+        async_client = self._get_cached_async_client()
+        if async_client is not None and not async_client.is_closed():
+            return async_client
+
         client_params = self._get_client_params()
 
         # Llama gives a 307 redirect error, so we need to set up a custom client to allow redirects
         client_params["http_client"] = httpx.AsyncClient(
-            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS,
             follow_redirects=True,
             timeout=httpx.Timeout(30.0),
         )
 
-        return AsyncOpenAIClient(**client_params)
+        return self._set_async_client(AsyncOpenAIClient(**client_params))
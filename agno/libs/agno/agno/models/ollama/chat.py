@@ -79,10 +79,11 @@ class Ollama(Model):
         Returns:
             AsyncOllamaClient: An instance of the Ollama client.
         """
-        if self.async_client is not None:
-            return self.async_client
+        async_client = self._get_cached_async_client()
+        if async_client is not None:
+            return async_client
 
-        return AsyncOllamaClient(**self._get_client_params())
+        return self._set_async_client(AsyncOllamaClient(**self._get_client_params()))
 
     def get_request_params(
         self,
@@ -11,6 +11,7 @@ from agno.media import AudioResponse
 from agno.models.base import Model
 from agno.models.message import Message
 from agno.models.response import ModelResponse
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.openai import _format_file_for_message, audio_to_message, images_to_message
 
@@ -75,9 +76,15 @@ class OpenAIChat(Model):
     max_retries: Optional[int] = None
     default_headers: Optional[Any] = None
     default_query: Optional[Any] = None
-    http_client: Optional[httpx.Client] = None
+    http_client: Optional[Union[httpx.Client, httpx.AsyncClient]] = None
+    # Connection pool limits of the HTTP clients created for this model
+    http_client_limits: Optional[httpx.Limits] = None
     client_params: Optional[Dict[str, Any]] = None
 
+    # OpenAI clients, reused across requests
+    client: Optional[OpenAIClient] = None
+    async_client: Optional[AsyncOpenAIClient] = None
+
     # The role to map the message role to.
     default_role_map = {
         "system": "developer",
@@ -120,10 +127,16 @@ class OpenAIChat(Model):
         Returns:
             OpenAIClient: An instance of the OpenAI client.
         """
+        if self.client and not self.client.is_closed():
+            return self.client
+
         client_params: Dict[str, Any] = self._get_client_params()
-        if self.http_client is not None:
+        if isinstance(self.http_client, httpx.Client):
             client_params["http_client"] = self.http_client
-        return OpenAIClient(**client_params)
+        elif self.http_client_limits is not None:
+            client_params["http_client"] = httpx.Client(limits=self.http_client_limits)
+        self.client = OpenAIClient(**client_params)
+        return self.client
 
     def get_async_client(self) -> AsyncOpenAIClient:
         """
@@ -132,15 +145,19 @@ class OpenAIChat(Model):
         Returns:
             AsyncOpenAIClient: An instance of the asynchronous OpenAI client.
         """
+        async_client = self._get_cached_async_client()
+        if async_client is not None and not async_client.is_closed():
+            return async_client
+
         client_params: Dict[str, Any] = self._get_client_params()
-        if self.http_client:
+        if isinstance(self.http_client, httpx.AsyncClient):
             client_params["http_client"] = self.http_client
         else:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
-        return AsyncOpenAIClient(**client_params)
+        return self._set_async_client(AsyncOpenAIClient(**client_params))
 
     def get_request_params(
         self,
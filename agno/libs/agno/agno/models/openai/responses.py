@@ -10,6 +10,7 @@ from agno.media import File
 from agno.models.base import MessageData, Model, _add_usage_metrics_to_assistant_message
 from agno.models.message import Citations, Message, UrlCitation
 from agno.models.response import ModelResponse
+from agno.utils.http import DEFAULT_CONNECTION_LIMITS
 from agno.utils.log import log_debug, log_error, log_warning
 from agno.utils.models.openai_responses import images_to_message
 from agno.utils.models.schema_utils import get_response_schema_for_provider
@@ -57,6 +58,8 @@ class OpenAIResponses(Model):
     default_headers: Optional[Dict[str, str]] = None
     default_query: Optional[Dict[str, str]] = None
     http_client: Optional[httpx.Client] = None
+    # Connection pool limits of the async HTTP client created for this model
+    http_client_limits: Optional[httpx.Limits] = None
     client_params: Optional[Dict[str, Any]] = None
 
     # Parameters affecting built-in tools
@@ -142,7 +145,7 @@ class OpenAIResponses(Model):
         else:
             # Create a new async HTTP client with custom limits
             client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
+                limits=self.http_client_limits or DEFAULT_CONNECTION_LIMITS
             )
 
         self.async_client = AsyncOpenAI(**client_params)
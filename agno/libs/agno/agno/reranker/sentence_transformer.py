@@ -1,36 +1,124 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
 
 from agno.document import Document
 from agno.reranker.base import Reranker
-from agno.utils.log import logger
+from agno.utils.log import log_debug, logger
 
 try:
     from sentence_transformers import CrossEncoder
 except ImportError:
     raise ImportError("`sentence-transformers` not installed, please run `pip install sentence-transformers`")
 
+# CrossEncoders loaded in this process, keyed by model and model kwargs
+_cross_encoders: Dict[str, CrossEncoder] = {}
+# Batchers scoring pairs for each model, batch size and max wait
+_batchers: Dict[Tuple[str, int, float], "_CrossEncoderBatcher"] = {}
+_cross_encoders_lock = threading.Lock()
+_batchers_lock = threading.Lock()
+
+
+def _model_key(model: str, model_kwargs: Optional[Dict[str, Any]] = None) -> str:
+    return f"{model}:{json.dumps(model_kwargs or {}, sort_keys=True, default=str)}"
+
+
+def get_cross_encoder(model: str, model_kwargs: Optional[Dict[str, Any]] = None) -> CrossEncoder:
+    """Get the CrossEncoder for a model, loading its weights once per process"""
+    key = _model_key(model, model_kwargs)
+    with _cross_encoders_lock:
+        cross_encoder = _cross_encoders.get(key)
+        if cross_encoder is None:
+            log_debug(f"Loading CrossEncoder: {model}")
+            cross_encoder = CrossEncoder(model_name_or_path=model, model_kwargs=model_kwargs)
+            _cross_encoders[key] = cross_encoder
+        return cross_encoder
+
+
+class _CrossEncoderBatcher:
+    """Scores (query, document) pairs on a dedicated worker thread.
+    Pairs submitted while the worker waits, up to `max_wait` seconds, are scored in one `predict` call of at most
+    about `batch_size` pairs.
+    """
+
+    def __init__(self, model: str, model_kwargs: Optional[Dict[str, Any]], batch_size: int, max_wait: float):
+        self.model = model
+        self.model_kwargs = model_kwargs
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.SimpleQueue[Tuple[List[List[str]], Future]]" = queue.SimpleQueue()
+        self._worker = threading.Thread(target=self._run, name=f"agno-reranker-{model}", daemon=True)
+        self._worker.start()
+
+    def submit(self, pairs: List[List[str]]) -> "Future[List[Any]]":
+        future: "Future[List[Any]]" = Future()
+        self._queue.put((pairs, future))
+        return future
+
+    def _next_batch(self) -> List[Tuple[List[List[str]], Future]]:
+        requests = [self._queue.get()]
+        num_pairs = len(requests[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while num_pairs < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            requests.append(request)
+            num_pairs += len(request[0])
+        return requests
+
+    def _run(self) -> None:
+        while True:
+            requests = self._next_batch()
+            pairs = [pair for request_pairs, _ in requests for pair in request_pairs]
+            try:
+                # The model is loaded on the worker thread, so the first request does not block an event loop
+                cross_encoder = get_cross_encoder(self.model, self.model_kwargs)
+                scores = cross_encoder.predict(pairs, batch_size=self.batch_size).tolist()
+            except Exception as e:
+                for _, future in requests:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_pairs, future in requests:
+                future.set_result(scores[offset : offset + len(request_pairs)])
+                offset += len(request_pairs)
+
 
 class SentenceTransformerReranker(Reranker):
     model: str = "BAAI/bge-reranker-v2-m3"
     model_kwargs: Optional[Dict[str, Any]] = None
     top_n: Optional[int] = None
+    # Maximum number of (query, document) pairs scored together, across concurrent requests
+    batch_size: int = 32
+    # Maximum number of seconds to wait for concurrent requests to fill a batch
+    max_wait: float = 0.005
 
-    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
-        if not documents:
-            return []
-
-        sentence_transformer_client = CrossEncoder(model_name_or_path=self.model, model_kwargs=self.model_kwargs)
+    def _get_batcher(self) -> _CrossEncoderBatcher:
+        key = (_model_key(self.model, self.model_kwargs), self.batch_size, self.max_wait)
+        with _batchers_lock:
+            batcher = _batchers.get(key)
+            if batcher is None:
+                batcher = _CrossEncoderBatcher(self.model, self.model_kwargs, self.batch_size, self.max_wait)
+                _batchers[key] = batcher
+            return batcher
 
+    def _rank(self, documents: List[Document], scores: List[Any]) -> List[Document]:
         top_n = self.top_n
         if top_n and not (0 < top_n):
             logger.warning(f"top_n should be a positive integer, got {self.top_n}, setting top_n to None")
             top_n = None
 
         compressed_docs: list[Document] = []
-
-        sentence_pairs = [[query, doc.content] for doc in documents]
-
-        scores = sentence_transformer_client.predict(sentence_pairs).tolist()
         for index, score in enumerate(scores):
             doc = documents[index]
             doc.reranking_score = score
@@ -46,9 +134,32 @@ class SentenceTransformerReranker(Reranker):
 
         return compressed_docs
 
+    def _rerank(self, query: str, documents: List[Document]) -> List[Document]:
+        if not documents:
+            return []
+
+        sentence_pairs = [[query, doc.content] for doc in documents]
+        scores = self._get_batcher().submit(sentence_pairs).result()
+        return self._rank(documents, scores)
+
+    async def _arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        if not documents:
+            return []
+
+        sentence_pairs = [[query, doc.content] for doc in documents]
+        scores = await asyncio.wrap_future(self._get_batcher().submit(sentence_pairs))
+        return self._rank(documents, scores)
+
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         try:
             return self._rerank(query=query, documents=documents)
         except Exception as e:
             logger.error(f"Error reranking documents: {e}. Returning original documents")
             return documents
+
+    async def arerank(self, query: str, documents: List[Document]) -> List[Document]:
+        try:
+            return await self._arerank(query=query, documents=documents)
+        except Exception as e:
+            logger.error(f"Error reranking documents: {e}. Returning original documents")
+            return documents
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -9,29 +9,29 @@ from agno.models.message import Citations, Message, MessageReferences
 from agno.models.response import ToolExecution
 from agno.reasoning.step import ReasoningStep
 from agno.utils.log import log_error
+from agno.utils.serialize import dataclass_to_dict, json_dumps
+
+# Fields of the run response events that to_dict serializes itself
+EVENT_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    [
+        "tools",
+        "tool",
+        "extra_data",
+        "image",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "member_responses",
+    ]
+)
 
 
 @dataclass
 class BaseRunResponseEvent:
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "tools",
-                "tool",
-                "extra_data",
-                "image",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "member_responses",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=EVENT_FIELDS_SERIALIZED_SEPARATELY)
 
         if hasattr(self, "extra_data") and self.extra_data is not None:
             _dict["extra_data"] = (
@@ -102,16 +102,15 @@ class BaseRunResponseEvent:
 
         return _dict
 
-    def to_json(self) -> str:
-        import json
-
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize the event to JSON, compact by default as events are sent for every streamed chunk"""
         try:
             _dict = self.to_dict()
         except Exception:
             log_error("Failed to convert response event to json", exc_info=True)
             raise
 
-        return json.dumps(_dict, indent=2)
+        return json_dumps(_dict, indent=indent)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]):
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Union
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message
 from agno.models.response import ToolExecution
 from agno.run.base import BaseRunResponseEvent, RunResponseExtraData, RunStatus
 from agno.utils.log import logger
+from agno.utils.serialize import dataclass_to_dict, json_dumps
 
 
 class RunEvent(str, Enum):
@@ -209,6 +210,12 @@ def run_response_event_from_dict(data: dict) -> BaseRunResponseEvent:
     return cls.from_dict(data)  # type: ignore
 
 
+# Fields of RunResponse that to_dict serializes itself
+RUN_RESPONSE_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    ["messages", "tools", "extra_data", "images", "videos", "audio", "response_audio", "citations", "events"]
+)
+
+
 @dataclass
 class RunResponse:
     """Response returned by Agent.run() or Workflow.run() functions"""
@@ -262,23 +269,7 @@ class RunResponse:
         return [t for t in self.tools if t.external_execution_required] if self.tools else []
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "messages",
-                "tools",
-                "extra_data",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "events",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=RUN_RESPONSE_FIELDS_SERIALIZED_SEPARATELY)
 
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
@@ -343,16 +334,14 @@ class RunResponse:
 
         return _dict
 
-    def to_json(self) -> str:
-        import json
-
+    def to_json(self, indent: Optional[int] = 2) -> str:
         try:
             _dict = self.to_dict()
         except Exception:
             logger.error("Failed to convert response to json", exc_info=True)
             raise
 
-        return json.dumps(_dict, indent=2)
+        return json_dumps(_dict, indent=indent)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "RunResponse":
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, List, Optional, Union
@@ -10,6 +10,7 @@ from agno.models.message import Citations, Message
 from agno.models.response import ToolExecution
 from agno.run.base import BaseRunResponseEvent, RunResponseExtraData, RunStatus
 from agno.run.response import RunEvent, RunResponse, RunResponseEvent, run_response_event_from_dict
+from agno.utils.serialize import dataclass_to_dict, json_dumps
 
 
 class TeamRunEvent(str, Enum):
@@ -205,6 +206,24 @@ def team_run_response_event_from_dict(data: dict) -> BaseTeamRunResponseEvent:
     return event_class.from_dict(data)  # type: ignore
 
 
+# Fields of TeamRunResponse that to_dict serializes itself
+TEAM_RUN_RESPONSE_FIELDS_SERIALIZED_SEPARATELY = frozenset(
+    [
+        "messages",
+        "status",
+        "tools",
+        "extra_data",
+        "images",
+        "videos",
+        "audio",
+        "response_audio",
+        "citations",
+        "events",
+        "member_responses",
+    ]
+)
+
+
 @dataclass
 class TeamRunResponse:
     """Response returned by Team.run() functions"""
@@ -255,24 +274,7 @@ class TeamRunResponse:
         return self.status == RunStatus.cancelled
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {
-            k: v
-            for k, v in asdict(self).items()
-            if v is not None
-            and k
-            not in [
-                "messages",
-                "status",
-                "tools",
-                "extra_data",
-                "images",
-                "videos",
-                "audio",
-                "response_audio",
-                "citations",
-                "events",
-            ]
-        }
+        _dict = dataclass_to_dict(self, exclude=TEAM_RUN_RESPONSE_FIELDS_SERIALIZED_SEPARATELY)
         if self.events is not None:
             _dict["events"] = [e.to_dict() for e in self.events]
 
@@ -297,7 +299,7 @@ class TeamRunResponse:
         if self.response_audio is not None:
             _dict["response_audio"] = self.response_audio.to_dict()
 
-        if self.member_responses:
+        if self.member_responses is not None:
             _dict["member_responses"] = [response.to_dict() for response in self.member_responses]
 
         if self.citations is not None:
@@ -319,12 +321,10 @@ class TeamRunResponse:
 
         return _dict
 
-    def to_json(self) -> str:
-        import json
-
+    def to_json(self, indent: Optional[int] = 2) -> str:
         _dict = self.to_dict()
 
-        return json.dumps(_dict, indent=2)
+        return json_dumps(_dict, indent=indent)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TeamRunResponse":
@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from enum import Enum
 from time import time
 from typing import Any, Dict, Optional, Union
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional, Union
 from pydantic import BaseModel
 
 from agno.utils.log import log_error
+from agno.utils.serialize import dataclass_to_dict, json_dumps
 
 
 class RunEvent(str, Enum):
@@ -25,23 +26,21 @@ class BaseWorkflowRunResponseEvent:
     content: Optional[Any] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        _dict = {k: v for k, v in asdict(self).items() if v is not None}
+        _dict = dataclass_to_dict(self)
 
         if hasattr(self, "content") and self.content and isinstance(self.content, BaseModel):
             _dict["content"] = self.content.model_dump(exclude_none=True)
 
         return _dict
 
-    def to_json(self) -> str:
-        import json
-
+    def to_json(self, indent: Optional[int] = None) -> str:
         try:
             _dict = self.to_dict()
         except Exception:
             log_error("Failed to convert response to json", exc_info=True)
             raise
 
-        return json.dumps(_dict, indent=2)
+        return json_dumps(_dict, indent=indent)
 
 
 @dataclass
@@ -1,7 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Literal, Optional
 
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 
 
 class Storage(ABC):
@@ -43,10 +44,48 @@ class Storage(ABC):
     ) -> List[Session]:
         raise NotImplementedError
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """Get a page of session summaries, ordered by created_at descending.
+        Storages that can read the summary fields without loading whole sessions should override this.
+        """
+        sessions = self.get_all_sessions(user_id=user_id, entity_id=entity_id)
+        sessions.sort(key=lambda session: session.created_at or 0, reverse=True)
+        end = offset + limit if limit is not None else None
+        return [StoredSessionSummary.from_session_dict(session.to_dict()) for session in sessions[offset:end]]
+
     @abstractmethod
     def upsert(self, session: Session) -> Optional[Session]:
         raise NotImplementedError
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Async version of `read`.
+        Runs `read` in a worker thread, storages with an async driver should override this.
+        """
+        return await asyncio.to_thread(self.read, session_id, user_id)
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Async version of `get_recent_sessions`.
+        Runs `get_recent_sessions` in a worker thread, storages with an async driver should override this.
+        """
+        return await asyncio.to_thread(self.get_recent_sessions, user_id, entity_id, limit)
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Async version of `upsert`.
+        Runs `upsert` in a worker thread, storages with an async driver should override this.
+        """
+        return await asyncio.to_thread(self.upsert, session)
+
     @abstractmethod
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Literal, Optional
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -394,6 +394,59 @@ class DynamoDbStorage(Storage):
             logger.error(f"Error retrieving sessions: {e}")
         return sessions
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """
+        Retrieve a page of session summaries, ordered by created_at descending.
+        Only the summary attributes and the first run are projected, the rest of the session memory is not read.
+
+        Args:
+            user_id (Optional[str], optional): User ID to filter by. Defaults to None.
+            entity_id (Optional[str], optional): Entity ID to filter by. Defaults to None.
+            limit (Optional[int], optional): Maximum number of summaries to return. Defaults to None.
+            offset (int, optional): Number of summaries to skip. Defaults to 0.
+
+        Returns:
+            List[StoredSessionSummary]: List of session summaries matching the criteria.
+        """
+        entity_field = "agent_id" if self.mode == "agent" else "team_id" if self.mode == "team" else "workflow_id"
+        kwargs: Dict[str, Any] = {
+            "ProjectionExpression": f"session_id, user_id, {entity_field}, #sd.session_name, #mem.runs[0], created_at, updated_at",
+            "ExpressionAttributeNames": {"#sd": "session_data", "#mem": "memory"},
+        }
+        try:
+            if user_id is not None:
+                kwargs.update(IndexName="user_id-index", KeyConditionExpression=Key("user_id").eq(user_id))
+                fetch = self.table.query
+            elif entity_id is not None:
+                kwargs.update(IndexName=f"{entity_field}-index", KeyConditionExpression=Key(entity_field).eq(entity_id))
+                fetch = self.table.query
+            else:
+                fetch = self.table.scan
+
+            items: List[Dict[str, Any]] = []
+            while True:
+                response = fetch(**kwargs)
+                items.extend(response.get("Items", []))
+                if "LastEvaluatedKey" not in response:
+                    break
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.error(f"Error retrieving session summaries: {e}")
+            return []
+
+        summaries = [StoredSessionSummary.from_session_dict(self._deserialize_item(item)) for item in items]
+        if user_id is not None and entity_id is not None:
+            summaries = [summary for summary in summaries if summary.entity_id == entity_id]
+        summaries.sort(key=lambda summary: (-(summary.created_at or 0), summary.session_id))
+        end = offset + limit if limit is not None else None
+        return summaries[offset:end]
+
     def get_recent_sessions(
         self,
         user_id: Optional[str] = None,
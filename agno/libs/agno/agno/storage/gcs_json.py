@@ -3,7 +3,7 @@ import time
 from typing import Any, List, Literal, Optional
 
 from agno.storage.json import JsonStorage, Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -208,6 +208,18 @@ class GCSJsonStorage(JsonStorage):
 
         return sessions
 
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """
+        Lists session summaries from the session blobs, JsonStorage's local index does not apply to the bucket.
+        """
+        return Storage.list_session_summaries(self, user_id=user_id, entity_id=entity_id, limit=limit, offset=offset)
+
     def upsert(self, session: Session) -> Optional[Session]:
         """
         Inserts or updates a session JSON blob in the GCS bucket.
@@ -1,22 +1,37 @@
 import json
+import os
+import threading
 import time
 from dataclasses import asdict
 from pathlib import Path
-from typing import List, Literal, Optional, Union
+from tempfile import NamedTemporaryFile
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import logger
 
+# Locks serializing the updates of each session index in this process, shared by the storages of a directory
+_index_locks: Dict[Path, threading.RLock] = {}
+_index_locks_lock = threading.Lock()
+
 
 class JsonStorage(Storage):
     def __init__(self, dir_path: Union[str, Path], mode: Optional[Literal["agent", "team", "workflow"]] = "agent"):
         super().__init__(mode)
         self.dir_path = Path(dir_path)
         self.dir_path.mkdir(parents=True, exist_ok=True)
+        # Secondary index of session summaries, kept out of the *.json glob
+        self.index_path = self.dir_path / ".session_index"
+
+    @property
+    def _index_lock(self) -> threading.RLock:
+        index_path = self.index_path.resolve()
+        with _index_locks_lock:
+            return _index_locks.setdefault(index_path, threading.RLock())
 
     def serialize(self, data: dict) -> str:
         return json.dumps(data, ensure_ascii=False, indent=4)
@@ -187,6 +202,65 @@ class JsonStorage(Storage):
 
         return sessions
 
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the session summary index, rebuilding it from the session files if it is missing."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return self.deserialize(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Error reading session index, rebuilding: {e}")
+
+        with self._index_lock:
+            index: Dict[str, Dict[str, Any]] = {}
+            for file in self.dir_path.glob("*.json"):
+                try:
+                    with open(file, "r", encoding="utf-8") as f:
+                        summary = StoredSessionSummary.from_session_dict(self.deserialize(f.read()))
+                    index[summary.session_id] = summary.to_dict()
+                except Exception as e:
+                    logger.error(f"Error reading session file {file}: {e}")
+            self._write_index(index)
+            return index
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the session summary index."""
+        # A unique temporary file per write, so concurrent writers never write to the same file
+        with NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.dir_path, prefix=f"{self.index_path.name}.", suffix=".tmp", delete=False
+        ) as f:
+            f.write(json.dumps(index, ensure_ascii=False))
+        os.replace(f.name, self.index_path)
+
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """Get a page of session summaries from the index, ordered by created_at descending.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of summaries to return
+            offset: Number of summaries to skip
+
+        Returns:
+            List[StoredSessionSummary]: List of session summaries
+        """
+        summaries = [
+            StoredSessionSummary.from_dict(data)
+            for data in self._read_index().values()
+            if (user_id is None or data.get("user_id") == user_id)
+            and (entity_id is None or data.get("entity_id") == entity_id)
+        ]
+        summaries.sort(key=lambda summary: (-(summary.created_at or 0), summary.session_id))
+        end = offset + limit if limit is not None else None
+        return summaries[offset:end]
+
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in storage."""
         try:
@@ -197,6 +271,12 @@ class JsonStorage(Storage):
 
             with open(self.dir_path / f"{session.session_id}.json", "w", encoding="utf-8") as f:
                 f.write(self.serialize(data))
+
+            # Read, update and write the index under the lock, so concurrent upserts don't lose entries
+            with self._index_lock:
+                index = self._read_index()
+                index[session.session_id] = StoredSessionSummary.from_session_dict(data).to_dict()
+                self._write_index(index)
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -208,6 +288,10 @@ class JsonStorage(Storage):
             return
         try:
             (self.dir_path / f"{session_id}.json").unlink(missing_ok=True)
+            with self._index_lock:
+                index = self._read_index()
+                if index.pop(session_id, None) is not None:
+                    self._write_index(index)
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
@@ -215,6 +299,7 @@ class JsonStorage(Storage):
         """Drop all sessions from storage."""
         for file in self.dir_path.glob("*.json"):
             file.unlink()
+        self.index_path.unlink(missing_ok=True)
 
     def upgrade_schema(self) -> None:
         """Upgrade the schema of the storage."""
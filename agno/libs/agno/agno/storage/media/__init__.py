@@ -0,0 +1,9 @@
+from agno.storage.media.base import MediaStore, read_media_uri, use_media_store
+from agno.storage.media.local import LocalMediaStore
+
+__all__ = [
+    "MediaStore",
+    "LocalMediaStore",
+    "read_media_uri",
+    "use_media_store",
+]
@@ -0,0 +1,115 @@
+import hashlib
+import re
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from io import BytesIO
+from typing import IO, Dict, Iterator, Optional, Tuple
+
+from agno.utils.log import log_debug
+from agno.utils.shared import SharedOnCopy
+
+# Size of the chunks copied when media content is written to a store
+CHUNK_SIZE = 1024 * 1024
+
+# Hex SHA-256 digest, the last part of the URI of stored content
+_CONTENT_HASH_PATTERN = re.compile(r"[0-9a-f]{64}")
+# Registered media stores by base URI, used to read content back from its URI
+_media_stores: Dict[str, "MediaStore"] = {}
+# Media store used when media is serialized, see use_media_store
+_active_media_store: ContextVar[Optional["MediaStore"]] = ContextVar("agno_media_store", default=None)
+
+
+class MediaStore(SharedOnCopy, ABC):
+    """Base class for the stores that keep media content by its SHA-256 hash, so the same content is stored once.
+
+    Sessions saved while a media store is in use (see `use_media_store`) keep the hash and URI of media content
+    instead of the content itself. The content is read back from its URI when a model request needs it.
+    """
+
+    @property
+    @abstractmethod
+    def base_uri(self) -> str:
+        """URI that the URIs of the stored content start with"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, content_hash: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, content_hash: str, stream: IO[bytes]) -> None:
+        """Store the content read from `stream` under its hash"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(self, content_hash: str) -> IO[bytes]:
+        """Open the stored content for reading"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, content_hash: str) -> None:
+        raise NotImplementedError
+
+    def register(self) -> None:
+        """Register the store so content can be read back from its URIs"""
+        _media_stores[self.base_uri] = self
+
+    def key(self, content_hash: str) -> str:
+        return f"{content_hash[:2]}/{content_hash}"
+
+    def uri(self, content_hash: str) -> str:
+        return f"{self.base_uri}/{self.key(content_hash)}"
+
+    def contains_uri(self, uri: str) -> bool:
+        return uri.startswith(self.base_uri + "/")
+
+    def put(self, content: bytes) -> Tuple[str, str]:
+        """Store the content, unless it is already stored.
+
+        Returns:
+            Tuple[str, str]: The hash and URI of the content.
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        if not self.exists(content_hash):
+            self.write(content_hash, BytesIO(content))
+            log_debug(f"Stored {len(content)} bytes of media at {self.uri(content_hash)}")
+        return content_hash, self.uri(content_hash)
+
+    def get(self, content_hash: str) -> bytes:
+        with self.open(content_hash) as stream:
+            return stream.read()
+
+
+@contextmanager
+def use_media_store(media_store: Optional["MediaStore"]) -> Iterator[None]:
+    """Store media content in `media_store` when media is serialized within this block"""
+    token = _active_media_store.set(media_store)
+    try:
+        yield
+    finally:
+        _active_media_store.reset(token)
+
+
+def get_active_media_store() -> Optional["MediaStore"]:
+    return _active_media_store.get()
+
+
+def open_media_uri(uri: str) -> IO[bytes]:
+    """Open the media content at `uri` for reading, from the registered media store the URI belongs to.
+
+    Only URIs of content in a registered media store are opened, so a content_uri read from a session
+    cannot point at other files.
+    """
+    content_hash = uri.rsplit("/", 1)[-1]
+    if _CONTENT_HASH_PATTERN.fullmatch(content_hash):
+        for media_store in list(_media_stores.values()):
+            if media_store.uri(content_hash) == uri:
+                return media_store.open(content_hash)
+    raise ValueError(f"No media store registered for {uri}")
+
+
+def read_media_uri(uri: str) -> bytes:
+    """Read the media content at `uri`"""
+    with open_media_uri(uri) as stream:
+        return stream.read()
@@ -0,0 +1,50 @@
+import os
+import shutil
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO, Union
+
+from agno.storage.media.base import CHUNK_SIZE, MediaStore
+
+
+class LocalMediaStore(MediaStore):
+    """Keeps media content as files under `base_dir`, one file per content hash.
+
+    Files are written to a temporary file first and moved into place, so readers never see partial content.
+
+    Args:
+        base_dir: Directory to store the media files in.
+    """
+
+    def __init__(self, base_dir: Union[str, Path]):
+        self.base_dir: Path = Path(base_dir).resolve()
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.register()
+
+    @property
+    def base_uri(self) -> str:
+        return self.base_dir.as_uri()
+
+    def _path(self, content_hash: str) -> Path:
+        return self.base_dir / self.key(content_hash)
+
+    def exists(self, content_hash: str) -> bool:
+        return self._path(content_hash).exists()
+
+    def write(self, content_hash: str, stream: IO[bytes]) -> None:
+        path = self._path(content_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("wb", dir=path.parent, prefix=f".{content_hash}.", delete=False) as f:
+            try:
+                shutil.copyfileobj(stream, f, CHUNK_SIZE)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    def open(self, content_hash: str) -> IO[bytes]:
+        return open(self._path(content_hash), "rb")
+
+    def delete(self, content_hash: str) -> None:
+        self._path(content_hash).unlink(missing_ok=True)
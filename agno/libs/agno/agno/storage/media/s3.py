@@ -0,0 +1,72 @@
+from typing import IO, Any, Optional
+
+from agno.storage.media.base import MediaStore
+
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+except ImportError:
+    raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
+
+
+class S3MediaStore(MediaStore):
+    """Keeps media content as objects in an S3 bucket, or any S3 compatible store such as MinIO.
+
+    Uploads use multipart transfers for large content and downloads are streamed from the response body.
+
+    Args:
+        bucket_name: Name of the bucket to store the media in.
+        prefix: Prefix of the object keys.
+        region_name: AWS region of the bucket.
+        endpoint_url: URL of an S3 compatible store.
+        aws_access_key_id: AWS access key id, defaults to the standard AWS credential chain.
+        aws_secret_access_key: AWS secret access key, defaults to the standard AWS credential chain.
+        client: A boto3 S3 client to use instead of creating one.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        prefix: str = "agno/media",
+        region_name: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        aws_access_key_id: Optional[str] = None,
+        aws_secret_access_key: Optional[str] = None,
+        client: Optional[Any] = None,
+    ):
+        self.bucket_name: str = bucket_name
+        self.prefix: str = prefix.strip("/")
+        self.client = client or boto3.client(
+            "s3",
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+        )
+        self.register()
+
+    @property
+    def base_uri(self) -> str:
+        return f"s3://{self.bucket_name}/{self.prefix}" if self.prefix else f"s3://{self.bucket_name}"
+
+    def _object_key(self, content_hash: str) -> str:
+        return f"{self.prefix}/{self.key(content_hash)}" if self.prefix else self.key(content_hash)
+
+    def exists(self, content_hash: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket_name, Key=self._object_key(content_hash))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def write(self, content_hash: str, stream: IO[bytes]) -> None:
+        self.client.upload_fileobj(stream, self.bucket_name, self._object_key(content_hash))
+
+    def open(self, content_hash: str) -> IO[bytes]:
+        response = self.client.get_object(Bucket=self.bucket_name, Key=self._object_key(content_hash))
+        return response["Body"]
+
+    def delete(self, content_hash: str) -> None:
+        self.client.delete_object(Bucket=self.bucket_name, Key=self._object_key(content_hash))
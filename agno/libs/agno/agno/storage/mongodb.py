@@ -1,16 +1,18 @@
+import asyncio
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.utils.log import log_debug, logger
 
 try:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, MongoClient
+    from pymongo.asynchronous.collection import AsyncCollection
     from pymongo.collection import Collection
     from pymongo.database import Database
     from pymongo.errors import PyMongoError
@@ -26,6 +28,7 @@ class MongoDbStorage(Storage):
         db_name: str = "agno",
         client: Optional[MongoClient] = None,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        async_client: Optional[AsyncMongoClient] = None,
     ):
         """
         This class provides agent storage using MongoDB.
@@ -35,6 +38,8 @@ class MongoDbStorage(Storage):
             db_url: MongoDB connection URL
             db_name: Name of the database
             client: Optional existing MongoDB client
+            async_client: Optional existing async MongoDB client, used by `aread`, `aupsert` and
+                `aget_recent_sessions`. Defaults to a client for the db_url, unless only `client` is provided.
         """
         super().__init__(mode)
         self._client: Optional[MongoClient] = client
@@ -51,6 +56,38 @@ class MongoDbStorage(Storage):
         self.db: Database = self._client[self.db_name]
         self.collection: Collection = self.db[self.collection_name]
 
+        # Async client for aread, aupsert and aget_recent_sessions, created for the running event loop on first use
+        self.db_url: Optional[str] = db_url
+        self._async_client: Optional[AsyncMongoClient] = async_client
+        self._owns_async_client: bool = async_client is None and (db_url is not None or client is None)
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_async_collection(self) -> Optional[AsyncCollection]:
+        """
+        Get the collection from the async client, or None if the async methods should run the sync methods in a thread.
+        Connections can not be shared between event loops, so a client created by the storage is recreated when the
+        running event loop changes.
+        """
+        if self._owns_async_client:
+            loop = asyncio.get_running_loop()
+            if self._async_client is None or self._async_client_loop is not loop:
+                self._async_client = AsyncMongoClient(self.db_url)
+                self._async_client_loop = loop
+        if self._async_client is None:
+            return None
+        return self._async_client[self.db_name][self.collection_name]
+
+    def _to_session(self, doc: Dict[str, Any]) -> Optional[Session]:
+        # Remove MongoDB _id before converting to Session object
+        doc.pop("_id", None)
+        if self.mode == "agent":
+            return AgentSession.from_dict(doc)
+        elif self.mode == "team":
+            return TeamSession.from_dict(doc)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(doc)
+        return None
+
     def create(self) -> None:
         """Create necessary indexes for the collection"""
         try:
@@ -96,6 +133,28 @@ class MongoDbStorage(Storage):
             logger.error(f"Error reading session: {e}")
             return None
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from MongoDB, without blocking the event loop
+        Args:
+            session_id: ID of the session to read
+            user_id: ID of the user to read
+        Returns:
+            Optional[Session]: The session if found, otherwise None
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+        try:
+            query = {"session_id": session_id}
+            if user_id:
+                query["user_id"] = user_id
+
+            doc = await collection.find_one(query)
+            return self._to_session(doc) if doc else None
+        except PyMongoError as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs matching the criteria
         Args:
@@ -222,6 +281,93 @@ class MongoDbStorage(Storage):
             logger.error(f"Error getting last {limit} sessions: {e}")
             return []
 
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Get the last N sessions, ordered by created_at descending, without blocking the event loop.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Number of most recent sessions to return
+
+        Returns:
+            List[Session]: List of most recent sessions
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=limit)
+        try:
+            query = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if entity_id is not None:
+                query[f"{self.mode}_id"] = entity_id
+
+            cursor = collection.find(query).sort("created_at", -1)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+
+            sessions: List[Session] = []
+            async for doc in cursor:
+                session = self._to_session(doc)
+                if session is not None:
+                    sessions.append(session)
+            return sessions
+        except PyMongoError as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
+            return []
+
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """Get a page of session summaries, ordered by created_at descending.
+        Only the summary fields and the first run are projected, the rest of the session memory is not loaded.
+        Args:
+            user_id: ID of the user to read
+            entity_id: ID of the agent / team / workflow to read
+            limit: Maximum number of summaries to return
+            offset: Number of summaries to skip
+        Returns:
+            List[StoredSessionSummary]: List of session summaries
+        """
+        try:
+            entity_field = "agent_id" if self.mode == "agent" else "team_id" if self.mode == "team" else "workflow_id"
+            query = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if entity_id is not None:
+                query[entity_field] = entity_id
+
+            projection = {
+                "_id": 0,
+                "session_id": 1,
+                "user_id": 1,
+                entity_field: 1,
+                "session_data.session_name": 1,
+                "memory.runs": {"$slice": 1},
+                "created_at": 1,
+                "updated_at": 1,
+            }
+            cursor = self.collection.find(query, projection).sort([("created_at", -1), ("session_id", 1)]).skip(offset)
+            if limit is not None:
+                cursor = cursor.limit(limit)
+
+            summaries: List[StoredSessionSummary] = []
+            for doc in cursor:
+                summaries.append(StoredSessionSummary.from_session_dict(doc))
+            return summaries
+        except PyMongoError as e:
+            logger.error(f"Error getting session summaries: {e}")
+            return []
+
     def upsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
         """Upsert a session
         Args:
@@ -231,40 +377,74 @@ class MongoDbStorage(Storage):
             Optional[Session]: The upserted session, otherwise None
         """
         try:
-            # Convert session to dict and add timestamps
-            session_dict = session.to_dict()
-            now = datetime.now(timezone.utc)
-            timestamp = int(now.timestamp())
-
-            # Handle UUID serialization
-            if isinstance(session.session_id, UUID):
-                session_dict["session_id"] = str(session.session_id)
-
-            # Add version field for optimistic locking
-            if "_version" not in session_dict:
-                session_dict["_version"] = 1
-            else:
-                session_dict["_version"] += 1
-
-            update_data = {**session_dict, "updated_at": timestamp}
+            update_data = self._get_update_data(session)
 
             # For new documents, set created_at
-            query = {"session_id": session_dict["session_id"]}
+            query = {"session_id": update_data["session_id"]}
 
             doc = self.collection.find_one(query)
             if not doc:
-                update_data["created_at"] = timestamp
+                update_data["created_at"] = update_data["updated_at"]
 
             result = self.collection.update_one(query, {"$set": update_data}, upsert=True)
 
             if result.acknowledged:
-                return self.read(session_id=session_dict["session_id"])
+                return self.read(session_id=update_data["session_id"])
             return None
 
         except PyMongoError as e:
             logger.warning(f"Error upserting session: {e}")
             return None
 
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Upsert a session, without blocking the event loop
+        Args:
+            session (Session): The session to upsert
+        Returns:
+            Optional[Session]: The upserted session, otherwise None
+        """
+        collection = self._get_async_collection()
+        if collection is None:
+            return await super().aupsert(session)
+        try:
+            update_data = self._get_update_data(session)
+
+            # For new documents, set created_at
+            query = {"session_id": update_data["session_id"]}
+
+            doc = await collection.find_one(query)
+            if not doc:
+                update_data["created_at"] = update_data["updated_at"]
+
+            result = await collection.update_one(query, {"$set": update_data}, upsert=True)
+
+            if result.acknowledged:
+                return await self.aread(session_id=update_data["session_id"])
+            return None
+
+        except PyMongoError as e:
+            logger.warning(f"Error upserting session: {e}")
+            return None
+
+    def _get_update_data(self, session: Session) -> Dict[str, Any]:
+        """Convert a session to the fields to set on its document"""
+        # Convert session to dict and add timestamps
+        session_dict = session.to_dict()
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp())
+
+        # Handle UUID serialization
+        if isinstance(session.session_id, UUID):
+            session_dict["session_id"] = str(session.session_id)
+
+        # Add version field for optimistic locking
+        if "_version" not in session_dict:
+            session_dict["_version"] = 1
+        else:
+            session_dict["_version"] += 1
+
+        return {**session_dict, "updated_at": timestamp}
+
     def delete_session(self, session_id: Optional[str] = None) -> None:
         """Delete an agent session
         Args:
@@ -310,7 +490,7 @@ class MongoDbStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"_client", "db", "collection"}:
+            if k in {"_client", "db", "collection", "_async_client", "_async_client_loop"}:
                 # Reuse MongoDB connections without copying
                 setattr(copied_obj, k, v)
             else:
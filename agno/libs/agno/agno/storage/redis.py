@@ -1,11 +1,12 @@
+import asyncio
 import json
 import time
 from dataclasses import asdict
-from typing import List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, cast
 from uuid import UUID
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
@@ -13,6 +14,8 @@ from agno.utils.log import log_debug, log_info, logger
 
 try:
     from redis import ConnectionError, Redis
+    from redis.asyncio import Redis as AsyncRedis
+    from redis.typing import EncodableT, FieldT
 except ImportError:
     raise ImportError("`redis` not installed. Please install it using `pip install redis`")
 
@@ -25,6 +28,9 @@ class UUIDEncoder(json.JSONEncoder):
 
 
 class RedisStorage(Storage):
+    # Field of the session index marking that it covers every session key
+    _INDEX_COMPLETE = "__complete__"
+
     def __init__(
         self,
         prefix: str,
@@ -52,7 +58,9 @@ class RedisStorage(Storage):
         super().__init__(mode)
         self.prefix = prefix
         self.expire = expire
-        self.redis_client = Redis(
+        # Hash of session_id -> session summary, kept out of the `prefix:*` key pattern
+        self.index_key = f"{self.prefix}-session-index"
+        self._connection_kwargs: Dict[str, Any] = dict(
             host=host,
             port=port,
             db=db,
@@ -60,8 +68,32 @@ class RedisStorage(Storage):
             decode_responses=True,  # Automatically decode responses to str
             ssl=ssl,
         )
+        self.redis_client = Redis(**self._connection_kwargs)
+        # Async client for aread, aupsert and aget_recent_sessions, created for the running event loop on first use
+        self._async_redis_client: Optional[AsyncRedis] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
         log_debug(f"Created RedisStorage with prefix: '{self.prefix}'")
 
+    def _get_async_redis_client(self) -> AsyncRedis:
+        """
+        Get the async Redis client.
+        Connections can not be shared between event loops, so the client is recreated when the running event loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_redis_client is None or self._async_client_loop is not loop:
+            self._async_redis_client = AsyncRedis(**self._connection_kwargs)
+            self._async_client_loop = loop
+        return self._async_redis_client
+
+    def _to_session(self, data: dict) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
     def _get_key(self, session_id: str) -> str:
         """Generate Redis key for a session."""
         return f"{self.prefix}:{session_id}"
@@ -109,6 +141,21 @@ class RedisStorage(Storage):
             logger.error(f"Error reading session: {e}")
             return None
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """Read a Session from Redis, without blocking the event loop."""
+        try:
+            data = await self._get_async_redis_client().get(self._get_key(session_id))
+            if data is None:
+                return None
+
+            session_data = self.deserialize(data)  # type: ignore
+            if user_id and session_data.get("user_id") != user_id:
+                return None
+            return self._to_session(session_data)
+        except Exception as e:
+            logger.error(f"Error reading session: {e}")
+            return None
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """Get all session IDs, optionally filtered by user_id and/or entity_id."""
         session_ids = []
@@ -269,6 +316,133 @@ class RedisStorage(Storage):
 
         return sessions
 
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """Get the last N sessions, ordered by created_at descending, without blocking the event loop.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Number of most recent sessions to return
+
+        Returns:
+            List[Session]: List of most recent sessions
+        """
+        sessions: List[Session] = []
+        # List of (created_at, data) tuples for sorting
+        session_data: List[tuple[int, dict]] = []
+
+        try:
+            redis_client = self._get_async_redis_client()
+            async for key in redis_client.scan_iter(match=f"{self.prefix}:*"):
+                try:
+                    raw = await redis_client.get(key)
+                    if raw is None:
+                        continue
+                    data = self.deserialize(raw)  # type: ignore
+
+                    # Apply filters
+                    if user_id and data["user_id"] != user_id:
+                        continue
+                    if entity_id and data[f"{self.mode}_id"] != entity_id:
+                        continue
+
+                    session_data.append((data.get("created_at") or 0, data))
+                except Exception as e:
+                    logger.error(f"Error processing session data: {e}")
+                    continue
+
+            # Sort by created_at descending and take only the last N sessions
+            session_data.sort(key=lambda x: x[0], reverse=True)
+            if limit is not None:
+                session_data = session_data[:limit]
+
+            for _, data in session_data:
+                session = self._to_session(data)
+                if session is not None:
+                    sessions.append(session)
+
+        except Exception as e:
+            logger.error(f"Error getting last {limit} sessions: {e}")
+
+        return sessions
+
+    def _index_entry(self, data: dict, ttl: Optional[int] = None) -> str:
+        """Serialize the summary of a session for the index, with the time its session key expires."""
+        entry: Dict[str, Any] = StoredSessionSummary.from_session_dict(data).to_dict()
+        if ttl is not None and ttl > 0:
+            entry["expires_at"] = int(time.time()) + ttl
+        return self.serialize(entry)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the session summary index by scanning the session keys."""
+        entries: Dict[FieldT, EncodableT] = {}
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            try:
+                raw = self.redis_client.get(key)
+                if raw is None:
+                    continue
+                data = self.deserialize(raw)  # type: ignore
+                ttl = self.redis_client.ttl(key) if self.expire is not None else None
+                entries[data["session_id"]] = self._index_entry(data, ttl)  # type: ignore
+            except Exception as e:
+                logger.error(f"Error indexing session {key}: {e}")
+        entries[self._INDEX_COMPLETE] = "1"
+        self.redis_client.hset(self.index_key, mapping=entries)
+
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """Get a page of session summaries from the index, ordered by created_at descending.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Maximum number of summaries to return
+            offset: Number of summaries to skip
+
+        Returns:
+            List[StoredSessionSummary]: List of session summaries
+        """
+        summaries: List[StoredSessionSummary] = []
+        try:
+            if not self.redis_client.hexists(self.index_key, self._INDEX_COMPLETE):
+                self._rebuild_index()
+
+            now = int(time.time())
+            expired: List[str] = []
+            # The client decodes responses, so the index holds strings
+            index = cast(Dict[str, str], self.redis_client.hgetall(self.index_key))
+            for session_id, raw in index.items():
+                if session_id == self._INDEX_COMPLETE:
+                    continue
+                data = self.deserialize(raw)
+                if data.get("expires_at") is not None and data["expires_at"] <= now:
+                    expired.append(session_id)
+                    continue
+                if user_id is not None and data.get("user_id") != user_id:
+                    continue
+                if entity_id is not None and data.get("entity_id") != entity_id:
+                    continue
+                summaries.append(StoredSessionSummary.from_dict(data))
+            if expired:
+                self.redis_client.hdel(self.index_key, *expired)
+        except Exception as e:
+            logger.error(f"Error getting session summaries: {e}")
+            return []
+
+        summaries.sort(key=lambda summary: (-(summary.created_at or 0), summary.session_id))
+        end = offset + limit if limit is not None else None
+        return summaries[offset:end]
+
     def upsert(self, session: Session) -> Optional[Session]:
         """Insert or update a Session in Redis."""
         try:
@@ -282,6 +456,25 @@ class RedisStorage(Storage):
                 self.redis_client.set(key, self.serialize(data), ex=self.expire)
             else:
                 self.redis_client.set(key, self.serialize(data))
+            self.redis_client.hset(self.index_key, session.session_id, self._index_entry(data, self.expire))
+            return session
+        except Exception as e:
+            logger.error(f"Error upserting session: {e}")
+            return None
+
+    async def aupsert(self, session: Session) -> Optional[Session]:
+        """Insert or update a Session in Redis, without blocking the event loop."""
+        try:
+            data = asdict(session)
+            data["updated_at"] = int(time.time())
+            if "created_at" not in data:
+                data["created_at"] = data["updated_at"]
+
+            # Write the session and its index entry in one round trip
+            async with self._get_async_redis_client().pipeline(transaction=False) as pipe:
+                pipe.set(self._get_key(session.session_id), self.serialize(data), ex=self.expire)
+                pipe.hset(self.index_key, session.session_id, self._index_entry(data, self.expire))
+                await pipe.execute()
             return session
         except Exception as e:
             logger.error(f"Error upserting session: {e}")
@@ -294,6 +487,7 @@ class RedisStorage(Storage):
         try:
             key = self._get_key(session_id)
             self.redis_client.delete(key)
+            self.redis_client.hdel(self.index_key, session_id)
             log_debug(f"Deleted session: {session_id}")
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
@@ -304,6 +498,7 @@ class RedisStorage(Storage):
             pattern = f"{self.prefix}:*"
             for key in self.redis_client.scan_iter(match=pattern):
                 self.redis_client.delete(key)
+            self.redis_client.delete(self.index_key)
             log_info(f"Dropped all sessions with prefix: {self.prefix}")
         except Exception as e:
             logger.error(f"Error dropping sessions: {e}")
@@ -0,0 +1,77 @@
+import json
+from hashlib import md5
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def split_runs(memory: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split the runs out of a session memory, returning the memory without runs and the runs"""
+    if memory is None or "runs" not in memory:
+        return memory, []
+    memory = dict(memory)
+    runs = memory.pop("runs") or []
+    return memory, runs
+
+
+def hash_run(run: Dict[str, Any]) -> str:
+    return md5(json.dumps(run, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _run_field(run: Dict[str, Any], field: str) -> Optional[Any]:
+    # RunResponse dicts carry their fields, AgentRun and WorkflowRun dicts nest them in the response
+    value = run.get(field)
+    if value is None and isinstance(run.get("response"), dict):
+        value = run["response"].get(field)
+    return value
+
+
+def get_run_status(run: Dict[str, Any]) -> Optional[str]:
+    """Get the status of a run, see `agno.run.base.RunStatus`"""
+    status = _run_field(run, "status")
+    return str(status) if status is not None else None
+
+
+def identify_runs(
+    runs: List[Dict[str, Any]], stored: Optional[Dict[str, Tuple[str, Optional[str]]]] = None
+) -> Dict[str, Tuple[str, Optional[str], Dict[str, Any]]]:
+    """Map the id of each run to its content hash, status and the run, keeping the order of the runs.
+
+    Hashing a run serializes it, so the runs that are settled keep the hash they were stored with instead: the runs in
+    `stored` (run id -> (hash, status)) that are followed by a run that was stored too, are not paused and have the
+    same status. Runs without an id are keyed by their content hash.
+    """
+    stored = stored or {}
+    run_ids = [_run_field(run, "run_id") for run in runs]
+    identified: Dict[str, Tuple[str, Optional[str], Dict[str, Any]]] = {}
+    for i, (run_id, run) in enumerate(zip(run_ids, runs)):
+        status = get_run_status(run)
+        stored_run = stored.get(str(run_id)) if run_id is not None else None
+        next_run_id = run_ids[i + 1] if i + 1 < len(runs) else None
+        if (
+            stored_run is not None
+            and stored_run[1] == status
+            and status != "PAUSED"
+            and next_run_id is not None
+            and str(next_run_id) in stored
+        ):
+            run_hash = stored_run[0]
+        else:
+            run_hash = hash_run(run)
+        identified[str(run_id) if run_id is not None else run_hash] = (run_hash, status, run)
+    return identified
+
+
+def merge_runs(
+    memory: Optional[Dict[str, Any]], runs: List[Dict[str, Any]], limit: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the session memory with its runs read from the runs table.
+    Sessions written before runs were stored separately keep their runs in the memory column.
+    """
+    if memory is None:
+        return None
+    memory = dict(memory)
+    if not runs:
+        runs = memory.get("runs") or []
+        if limit is not None:
+            runs = runs[-limit:] if limit > 0 else []
+    memory["runs"] = runs
+    return memory
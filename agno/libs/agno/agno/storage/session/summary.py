@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Mapping, Optional
+
+# Keys of a run kept in a session summary, enough to derive a title for the session
+_RUN_KEYS = ("run_id", "session_id", "agent_id", "team_id", "workflow_id", "event", "is_paused")
+# Maximum number of characters of run content kept in a session summary
+_CONTENT_LENGTH = 200
+
+
+def compact_run(run: Optional[Mapping[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reduce a stored run to its ids, the start of its content and its first user message"""
+    if not isinstance(run, Mapping):
+        return None
+
+    compacted: Dict[str, Any] = {key: run[key] for key in _RUN_KEYS if key in run}
+    content = run.get("content")
+    if isinstance(content, str):
+        compacted["content"] = content[:_CONTENT_LENGTH]
+    messages = run.get("messages")
+    if isinstance(messages, list):
+        compacted["messages"] = [
+            message
+            for message in messages
+            if isinstance(message, Mapping)
+            and message.get("role") == "user"
+            and message.get("from_history", False) is False
+        ][:1]
+    # AgentRun and WorkflowRun dicts nest the response
+    if "message" in run:
+        compacted["message"] = run["message"]
+    if "input" in run:
+        compacted["input"] = run["input"]
+    if "response" in run:
+        compacted["response"] = compact_run(run["response"])
+    return compacted
+
+
+@dataclass
+class StoredSessionSummary:
+    """Lightweight view of a stored session, used to list sessions without loading their memory"""
+
+    # Session UUID
+    session_id: str
+    # ID of the user interacting with the agent, team or workflow
+    user_id: Optional[str] = None
+    # ID of the agent, team or workflow the session is associated with
+    entity_id: Optional[str] = None
+    # Name of the session, if it was named
+    session_name: Optional[str] = None
+    # The first run of the session, reduced with compact_run, used to derive a title
+    first_run: Optional[Dict[str, Any]] = None
+    # The unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> StoredSessionSummary:
+        return cls(
+            session_id=data["session_id"],
+            user_id=data.get("user_id"),
+            entity_id=data.get("entity_id"),
+            session_name=data.get("session_name"),
+            first_run=compact_run(data.get("first_run")),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
+
+    @classmethod
+    def from_session_dict(cls, data: Mapping[str, Any]) -> StoredSessionSummary:
+        """Build the summary of a full session dict, as stored by the agent, team or workflow"""
+        session_data = data.get("session_data") or {}
+        runs = (data.get("memory") or {}).get("runs") or []
+        return cls(
+            session_id=data["session_id"],
+            user_id=data.get("user_id"),
+            entity_id=data.get("agent_id") or data.get("team_id") or data.get("workflow_id"),
+            session_name=session_data.get("session_name") if isinstance(session_data, Mapping) else None,
+            first_run=compact_run(runs[0]) if isinstance(runs, list) and len(runs) > 0 else None,
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+        )
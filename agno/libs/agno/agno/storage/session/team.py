@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from typing import Any, Dict, Mapping, Optional
 
 from agno.utils.log import logger
@@ -34,6 +34,10 @@ class TeamSession:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def monitoring_data(self) -> Dict[str, Any]:
+        # The session without its memory, which already holds every run and is sent with each run event otherwise
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "memory"}
+
     def telemetry_data(self) -> Dict[str, Any]:
         return {
             "model": self.team_data.get("model") if self.team_data else None,
@@ -1,13 +1,17 @@
+import asyncio
 import time
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple
 
 from agno.storage.base import Storage
-from agno.storage.session import Session
+from agno.storage.runs import get_run_status, identify_runs, merge_runs, split_runs
+from agno.storage.session import Session, StoredSessionSummary
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.team import TeamSession
 from agno.storage.session.workflow import WorkflowSession
+from agno.utils.async_engine import LoopAsyncEngine
 from agno.utils.log import log_debug, log_info, log_warning, logger
+from agno.utils.lru_cache import LRUCache
 
 try:
     from sqlalchemy.dialects import sqlite
@@ -15,13 +19,16 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session as SqlSession
     from sqlalchemy.orm import sessionmaker
-    from sqlalchemy.schema import Column, MetaData, Table
+    from sqlalchemy.schema import Column, Index, MetaData, Table
     from sqlalchemy.sql import text
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import func, select, type_coerce
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
 
 class SqliteStorage(Storage):
     def __init__(
@@ -33,6 +40,10 @@ class SqliteStorage(Storage):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         mode: Optional[Literal["agent", "team", "workflow"]] = "agent",
+        runs_table_name: Optional[str] = None,
+        num_history_runs: Optional[int] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         This class provides agent storage using a sqlite database.
@@ -48,6 +59,13 @@ class SqliteStorage(Storage):
             db_url: The database URL to connect to.
             db_file: The database file to connect to.
             db_engine: The SQLAlchemy database engine to use.
+            runs_table_name: If set, runs are appended to this table, one row per run, instead of being
+                rewritten with the whole session memory on every upsert.
+            num_history_runs: When runs are stored in a runs table, only load the last N runs of a session on read.
+                Older runs stay in the runs table and can be loaded with `read_runs`.
+            async_db_url: The aiosqlite database URL used by `aread`, `aupsert` and `aget_recent_sessions`.
+                Defaults to the database file of the sync engine, if `aiosqlite` is installed.
+            async_db_engine: The SQLAlchemy async database engine to use for the async methods.
         """
         super().__init__(mode)
         _engine: Optional[Engine] = db_engine
@@ -80,9 +98,32 @@ class SqliteStorage(Storage):
 
         # Database session
         self.SqlSession: sessionmaker[SqlSession] = sessionmaker(bind=self.db_engine)
+        # Async engine for aread, aupsert and aget_recent_sessions, created for the running event loop on first use
+        self.async_engine: LoopAsyncEngine = LoopAsyncEngine(
+            url=async_db_url or self._async_db_url(), engine=async_db_engine
+        )
         # Database table for storage
         self.table: Table = self.get_table()
 
+        # Table for session runs, keyed by (session_id, run_id)
+        self.runs_table_name: Optional[str] = runs_table_name
+        self.num_history_runs: Optional[int] = num_history_runs
+        self.runs_table: Optional[Table] = self.get_runs_table()
+        # Run id -> (content hash, status) of the stored runs of recently used sessions, used to only hash and write
+        # the runs that changed
+        self._run_hashes: LRUCache[Dict[str, Tuple[str, Optional[str]]]] = LRUCache(max_size=1024)
+
+    def _in_memory(self) -> bool:
+        """Whether the sync engine uses an in-memory database, which is only visible to its own connections"""
+        return self.db_engine.url.database in (None, "", ":memory:")
+
+    def _async_db_url(self) -> Optional[str]:
+        """Get the aiosqlite url for the database file of the sync engine"""
+        url = self.db_engine.url
+        if url.get_backend_name() != "sqlite" or self._in_memory():
+            return None
+        return url.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
     @property
     def mode(self) -> Optional[Literal["agent", "team", "workflow"]]:
         """Get the mode of the storage."""
@@ -159,6 +200,30 @@ class SqliteStorage(Storage):
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_runs_table(self) -> Optional[Table]:
+        """
+        Define the table schema for session runs.
+
+        Returns:
+            Optional[Table]: SQLAlchemy Table object for the runs, or None if runs are stored with the session memory.
+        """
+        if self.runs_table_name is None:
+            return None
+        return Table(
+            self.runs_table_name,
+            self.metadata,
+            Column("session_id", String, primary_key=True),
+            Column("run_id", String, primary_key=True),
+            # Position of the run in the session, used to load the last N runs
+            Column("run_index", sqlite.INTEGER, nullable=False),
+            Column("run_hash", String),
+            Column("run_data", sqlite.JSON),
+            Column("created_at", sqlite.INTEGER, default=lambda: int(time.time())),
+            Column("updated_at", sqlite.INTEGER, onupdate=lambda: int(time.time())),
+            Index(f"idx_{self.runs_table_name}_session_run_index", "session_id", "run_index"),
+            extend_existing=True,
+        )
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -218,6 +283,162 @@ class SqliteStorage(Storage):
                 logger.error(f"Error creating table: {e}")
                 raise
 
+        if self.runs_table is not None:
+            log_debug(f"Creating table: {self.runs_table.name}")
+            self.runs_table.create(self.db_engine, checkfirst=True)
+
+    def _to_session(self, data: Mapping[str, Any]) -> Optional[Session]:
+        if self.mode == "agent":
+            return AgentSession.from_dict(data)
+        elif self.mode == "team":
+            return TeamSession.from_dict(data)
+        elif self.mode == "workflow":
+            return WorkflowSession.from_dict(data)
+        return None
+
+    def _with_runs(self, sess: SqlSession, rows: Sequence[Any], limit: Optional[int] = None) -> List[Mapping[str, Any]]:
+        """Add the runs from the runs table to the memory of each session row"""
+        if self.runs_table is None or not rows:
+            return [row._mapping for row in rows]
+
+        runs_by_session: Dict[str, List[Dict[str, Any]]] = {row.session_id: [] for row in rows}
+        if limit is None:
+            stmt = (
+                select(
+                    self.runs_table.c.session_id,
+                    self.runs_table.c.run_id,
+                    self.runs_table.c.run_hash,
+                    self.runs_table.c.run_data,
+                )
+                .where(self.runs_table.c.session_id.in_(list(runs_by_session)))
+                .order_by(self.runs_table.c.session_id, self.runs_table.c.run_index)
+            )
+            run_rows = list(sess.execute(stmt).fetchall())
+        else:
+            run_rows = []
+            for session_id in runs_by_session:
+                stmt = (
+                    select(
+                        self.runs_table.c.session_id,
+                        self.runs_table.c.run_id,
+                        self.runs_table.c.run_hash,
+                        self.runs_table.c.run_data,
+                    )
+                    .where(self.runs_table.c.session_id == session_id)
+                    .order_by(self.runs_table.c.run_index.desc())
+                    .limit(max(limit, 0))
+                )
+                run_rows.extend(reversed(sess.execute(stmt).fetchall()))
+
+        run_hashes: Dict[str, Dict[str, Tuple[str, Optional[str]]]] = {}
+        for run_row in run_rows:
+            runs_by_session[run_row.session_id].append(run_row.run_data)
+            run_hashes.setdefault(run_row.session_id, {})[run_row.run_id] = (
+                run_row.run_hash,
+                get_run_status(run_row.run_data),
+            )
+        for session_id, hashes in run_hashes.items():
+            known_hashes = self._run_hashes.get(session_id) or {}
+            self._run_hashes.set(session_id, {**known_hashes, **hashes})
+
+        sessions: List[Mapping[str, Any]] = []
+        for row in rows:
+            data = dict(row._mapping)
+            data["memory"] = merge_runs(data.get("memory"), runs_by_session[row.session_id], limit=limit)
+            sessions.append(data)
+        return sessions
+
+    def _write_runs(self, sess: SqlSession, session_id: str, runs: List[Dict[str, Any]]) -> None:
+        """Append new runs to the runs table and update the runs that changed since they were stored"""
+        if self.runs_table is None or not runs:
+            return
+
+        stored_runs = self._run_hashes.get(session_id) or {}
+        identified = identify_runs(runs, stored_runs)
+        unknown_run_ids = [run_id for run_id in identified if run_id not in stored_runs]
+        if unknown_run_ids:
+            # Look up the stored hashes of the runs we have not seen yet, their status is read on the next write
+            stmt = select(self.runs_table.c.run_id, self.runs_table.c.run_hash).where(
+                self.runs_table.c.session_id == session_id,
+                self.runs_table.c.run_id.in_(unknown_run_ids),
+            )
+            stored_runs = {**stored_runs, **{row.run_id: (row.run_hash, None) for row in sess.execute(stmt)}}
+
+        changed = [
+            (run_id, run_hash, run)
+            for run_id, (run_hash, _, run) in identified.items()
+            if run_id not in stored_runs or stored_runs[run_id][0] != run_hash
+        ]
+        if changed:
+            next_index = (
+                sess.execute(
+                    select(func.coalesce(func.max(self.runs_table.c.run_index), -1)).where(
+                        self.runs_table.c.session_id == session_id
+                    )
+                ).scalar()
+                or 0
+            )
+            now = int(time.time())
+            values = [
+                dict(
+                    session_id=session_id,
+                    run_id=run_id,
+                    run_index=next_index + i + 1,
+                    run_hash=run_hash,
+                    run_data=run,
+                    created_at=now,
+                    updated_at=now,
+                )
+                for i, (run_id, run_hash, run) in enumerate(changed)
+            ]
+            insert_stmt = sqlite.insert(self.runs_table).values(values)
+            # Runs that are already stored keep their position in the session
+            upsert_stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["session_id", "run_id"],
+                set_=dict(
+                    run_hash=insert_stmt.excluded.run_hash,
+                    run_data=insert_stmt.excluded.run_data,
+                    updated_at=insert_stmt.excluded.updated_at,
+                ),
+            )
+            sess.execute(upsert_stmt)
+            log_debug(f"Stored {len(changed)} of {len(identified)} runs for session: {session_id}")
+
+        self._run_hashes.set(
+            session_id,
+            {**stored_runs, **{run_id: (run_hash, status) for run_id, (run_hash, status, _) in identified.items()}},
+        )
+
+    def read_runs(self, session_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read the runs of a session from the runs table, oldest first.
+
+        Args:
+            session_id (str): ID of the session to read the runs of.
+            limit (Optional[int]): Only read the last N runs. Defaults to all runs.
+
+        Returns:
+            List[Dict[str, Any]]: The stored runs.
+        """
+        if self.runs_table is None:
+            # Runs are stored with the session memory
+            session = self.read(session_id=session_id)
+            memory = session.memory if session is not None and session.memory is not None else {}
+            return merge_runs(memory, [], limit=limit)["runs"]  # type: ignore
+        try:
+            with self.SqlSession() as sess:
+                stmt = (
+                    select(self.runs_table.c.run_data)
+                    .where(self.runs_table.c.session_id == session_id)
+                    .order_by(self.runs_table.c.run_index.desc())
+                )
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                return [row.run_data for row in reversed(sess.execute(stmt).fetchall())]
+        except Exception as e:
+            log_debug(f"Exception reading runs from table: {e}")
+        return []
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
         """
         Read a Session from the database.
@@ -231,16 +452,7 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess:
-                stmt = select(self.table).where(self.table.c.session_id == session_id)
-                if user_id:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                result = sess.execute(stmt).fetchone()
-                if self.mode == "agent":
-                    return AgentSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "team":
-                    return TeamSession.from_dict(result._mapping) if result is not None else None  # type: ignore
-                elif self.mode == "workflow":
-                    return WorkflowSession.from_dict(result._mapping) if result is not None else None  # type: ignore
+                return self._read(sess, session_id=session_id, user_id=user_id)
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -249,6 +461,43 @@ class SqliteStorage(Storage):
                 log_debug(f"Exception reading from table: {e}")
         return None
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        """
+        Read a Session from the database, without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[Session]: Session object if found, None otherwise.
+        """
+        sess = await self.async_engine.open_session()
+        if sess is None:
+            if self._in_memory():
+                # Each thread gets its own in-memory database, so it is read on the event loop thread
+                return self.read(session_id=session_id, user_id=user_id)
+            return await super().aread(session_id=session_id, user_id=user_id)
+        try:
+            async with sess:
+                return await sess.run_sync(self._read, session_id=session_id, user_id=user_id)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return None
+
+    def _read(self, sess: SqlSession, session_id: str, user_id: Optional[str] = None) -> Optional[Session]:
+        stmt = select(self.table).where(self.table.c.session_id == session_id)
+        if user_id:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        result = sess.execute(stmt).fetchone()
+        if result is None:
+            return None
+        return self._to_session(self._with_runs(sess, [result], limit=self.num_history_runs)[0])
+
     def get_all_session_ids(self, user_id: Optional[str] = None, entity_id: Optional[str] = None) -> List[str]:
         """
         Get all session IDs, optionally filtered by user_id and/or entity_id.
@@ -315,12 +564,7 @@ class SqliteStorage(Storage):
                 # execute query
                 rows = sess.execute(stmt).fetchall()
                 if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
+                    return [self._to_session(data) for data in self._with_runs(sess, rows)]  # type: ignore
                 else:
                     return []
         except Exception as e:
@@ -350,33 +594,137 @@ class SqliteStorage(Storage):
         """
         try:
             with self.SqlSession() as sess, sess.begin():
-                # Build the query
-                stmt = select(self.table)
+                return self._get_recent_sessions(sess, user_id=user_id, entity_id=entity_id, limit=limit)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                self.create()
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    async def aget_recent_sessions(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        """
+        Get the last N sessions, ordered by created_at descending, without blocking the event loop.
+
+        Args:
+            user_id: Filter by user ID
+            entity_id: Filter by entity ID (agent_id, team_id, or workflow_id)
+            limit: Number of most recent sessions to return
+
+        Returns:
+            List[Session]: List of most recent sessions
+        """
+        sess = await self.async_engine.open_session()
+        if sess is None:
+            if self._in_memory():
+                return self.get_recent_sessions(user_id=user_id, entity_id=entity_id, limit=limit)
+            return await super().aget_recent_sessions(user_id=user_id, entity_id=entity_id, limit=limit)
+        try:
+            async with sess:
+                return await sess.run_sync(self._get_recent_sessions, user_id=user_id, entity_id=entity_id, limit=limit)
+        except Exception as e:
+            if "no such table" in str(e):
+                log_debug(f"Table does not exist: {self.table.name}")
+                await asyncio.to_thread(self.create)
+            else:
+                log_debug(f"Exception reading from table: {e}")
+        return []
+
+    def _get_recent_sessions(
+        self,
+        sess: SqlSession,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = 2,
+    ) -> List[Session]:
+        # Build the query
+        stmt = select(self.table)
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if entity_id is not None:
+            if self.mode == "agent":
+                stmt = stmt.where(self.table.c.agent_id == entity_id)
+            elif self.mode == "team":
+                stmt = stmt.where(self.table.c.team_id == entity_id)
+            elif self.mode == "workflow":
+                stmt = stmt.where(self.table.c.workflow_id == entity_id)
+
+        # Order by created_at desc and limit to num_history_sessions
+        stmt = stmt.order_by(self.table.c.created_at.desc())
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        # Execute query
+        rows = sess.execute(stmt).fetchall()
+        if rows is not None:
+            return [self._to_session(data) for data in self._with_runs(sess, rows)]  # type: ignore
+        return []
+
+    def list_session_summaries(
+        self,
+        user_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredSessionSummary]:
+        """
+        Get a page of session summaries, ordered by created_at descending.
+        Only the summary fields and the first run are selected, the rest of the session memory is not loaded.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            entity_id (Optional[str]): The ID of the agent / team / workflow to filter by.
+            limit (Optional[int]): Maximum number of summaries to return. Defaults to all.
+            offset (int): Number of summaries to skip.
+
+        Returns:
+            List[StoredSessionSummary]: The session summaries.
+        """
+        if self.mode == "agent":
+            entity_column = self.table.c.agent_id
+        elif self.mode == "team":
+            entity_column = self.table.c.team_id
+        else:
+            entity_column = self.table.c.workflow_id
+
+        first_run = func.json_extract(self.table.c.memory, "$.runs[0]")
+        if self.runs_table is not None:
+            stored_first_run = (
+                select(self.runs_table.c.run_data)
+                .where(self.runs_table.c.session_id == self.table.c.session_id)
+                .order_by(self.runs_table.c.run_index)
+                .limit(1)
+                .scalar_subquery()
+            )
+            first_run = func.coalesce(stored_first_run, first_run)
+
+        try:
+            with self.SqlSession() as sess:
+                stmt = select(
+                    self.table.c.session_id,
+                    self.table.c.user_id,
+                    entity_column.label("entity_id"),
+                    func.json_extract(self.table.c.session_data, "$.session_name").label("session_name"),
+                    type_coerce(first_run, sqlite.JSON).label("first_run"),
+                    self.table.c.created_at,
+                    self.table.c.updated_at,
+                )
                 if user_id is not None:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 if entity_id is not None:
-                    if self.mode == "agent":
-                        stmt = stmt.where(self.table.c.agent_id == entity_id)
-                    elif self.mode == "team":
-                        stmt = stmt.where(self.table.c.team_id == entity_id)
-                    elif self.mode == "workflow":
-                        stmt = stmt.where(self.table.c.workflow_id == entity_id)
-
-                # Order by created_at desc and limit to num_history_sessions
-                stmt = stmt.order_by(self.table.c.created_at.desc())
+                    stmt = stmt.where(entity_column == entity_id)
+                # Order by session_id as well, so pages are stable for sessions created in the same second
+                stmt = stmt.order_by(self.table.c.created_at.desc(), self.table.c.session_id).offset(offset)
                 if limit is not None:
                     stmt = stmt.limit(limit)
-
-                # Execute query
                 rows = sess.execute(stmt).fetchall()
-                if rows is not None:
-                    if self.mode == "agent":
-                        return [AgentSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "team":
-                        return [TeamSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                    elif self.mode == "workflow":
-                        return [WorkflowSession.from_dict(row._mapping) for row in rows]  # type: ignore
-                return []
+                return [StoredSessionSummary.from_dict(dict(row._mapping)) for row in rows]
         except Exception as e:
             if "no such table" in str(e):
                 log_debug(f"Table does not exist: {self.table.name}")
@@ -428,93 +776,15 @@ class SqliteStorage(Storage):
         if self.auto_upgrade_schema and not self._schema_up_to_date:
             self.upgrade_schema()
 
+        # With a runs table, the runs are written separately from the rest of the session memory
+        memory, runs = split_runs(session.memory) if self.runs_table is not None else (session.memory, [])
+
         try:
             with self.SqlSession() as sess, sess.begin():
-                if self.mode == "agent":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        agent_id=session.agent_id,  # type: ignore
-                        team_session_id=session.team_session_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            agent_id=session.agent_id,  # type: ignore
-                            team_session_id=session.team_session_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            agent_data=session.agent_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "team":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        team_id=session.team_id,  # type: ignore
-                        user_id=session.user_id,
-                        team_session_id=session.team_session_id,  # type: ignore
-                        memory=session.memory,
-                        team_data=session.team_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            team_id=session.team_id,  # type: ignore
-                            user_id=session.user_id,
-                            team_session_id=session.team_session_id,  # type: ignore
-                            memory=session.memory,
-                            team_data=session.team_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-                elif self.mode == "workflow":
-                    # Create an insert statement
-                    stmt = sqlite.insert(self.table).values(
-                        session_id=session.session_id,
-                        workflow_id=session.workflow_id,  # type: ignore
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,  # type: ignore
-                        session_data=session.session_data,
-                        extra_data=session.extra_data,
-                    )
-
-                    # Define the upsert if the session_id already exists
-                    # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
-                    stmt = stmt.on_conflict_do_update(
-                        index_elements=["session_id"],
-                        set_=dict(
-                            workflow_id=session.workflow_id,  # type: ignore
-                            user_id=session.user_id,
-                            memory=session.memory,
-                            workflow_data=session.workflow_data,  # type: ignore
-                            session_data=session.session_data,
-                            extra_data=session.extra_data,
-                            updated_at=int(time.time()),
-                        ),  # The updated value for each column
-                    )
-
-                sess.execute(stmt)
+                self._upsert(sess, session=session, memory=memory, runs=runs)
         except Exception as e:
+            # The stored runs are unknown after a failed write
+            self._run_hashes.pop(session.session_id)
             if create_and_retry and not self.table_exists():
                 log_debug(f"Table does not exist: {self.table.name}")
                 log_debug("Creating table and retrying upsert")
@@ -528,6 +798,139 @@ class SqliteStorage(Storage):
                 return None
         return self.read(session_id=session.session_id)
 
+    async def aupsert(self, session: Session, create_and_retry: bool = True) -> Optional[Session]:
+        """
+        Insert or update a Session in the database, without blocking the event loop.
+
+        Args:
+            session (Session): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[Session]: The upserted Session, or None if operation failed.
+        """
+        sess = await self.async_engine.open_session()
+        if sess is None:
+            if self._in_memory():
+                return self.upsert(session, create_and_retry=create_and_retry)
+            return await super().aupsert(session)
+
+        # Perform schema upgrade if auto_upgrade_schema is enabled
+        if self.auto_upgrade_schema and not self._schema_up_to_date:
+            await asyncio.to_thread(self.upgrade_schema)
+
+        # With a runs table, the runs are written separately from the rest of the session memory
+        memory, runs = split_runs(session.memory) if self.runs_table is not None else (session.memory, [])
+
+        try:
+            async with sess:
+                await sess.run_sync(self._upsert, session=session, memory=memory, runs=runs)
+                await sess.commit()
+        except Exception as e:
+            # The stored runs are unknown after a failed write
+            self._run_hashes.pop(session.session_id)
+            if create_and_retry and not await asyncio.to_thread(self.table_exists):
+                log_debug(f"Table does not exist: {self.table.name}")
+                log_debug("Creating table and retrying upsert")
+                await asyncio.to_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            else:
+                log_warning(f"Exception upserting into table: {e}")
+                log_warning(
+                    "A table upgrade might be required, please review these docs for more information: https://agno.link/upgrade-schema"
+                )
+                return None
+        return await self.aread(session_id=session.session_id)
+
+    def _upsert(
+        self, sess: SqlSession, session: Session, memory: Optional[Dict[str, Any]], runs: List[Dict[str, Any]]
+    ) -> None:
+        if self.mode == "agent":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                agent_id=session.agent_id,  # type: ignore
+                team_session_id=session.team_session_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                agent_data=session.agent_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    agent_id=session.agent_id,  # type: ignore
+                    team_session_id=session.team_session_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    agent_data=session.agent_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "team":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                team_id=session.team_id,  # type: ignore
+                user_id=session.user_id,
+                team_session_id=session.team_session_id,  # type: ignore
+                memory=memory,
+                team_data=session.team_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    team_id=session.team_id,  # type: ignore
+                    user_id=session.user_id,
+                    team_session_id=session.team_session_id,  # type: ignore
+                    memory=memory,
+                    team_data=session.team_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+        elif self.mode == "workflow":
+            # Create an insert statement
+            stmt = sqlite.insert(self.table).values(
+                session_id=session.session_id,
+                workflow_id=session.workflow_id,  # type: ignore
+                user_id=session.user_id,
+                memory=memory,
+                workflow_data=session.workflow_data,  # type: ignore
+                session_data=session.session_data,
+                extra_data=session.extra_data,
+            )
+
+            # Define the upsert if the session_id already exists
+            # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id"],
+                set_=dict(
+                    workflow_id=session.workflow_id,  # type: ignore
+                    user_id=session.user_id,
+                    memory=memory,
+                    workflow_data=session.workflow_data,  # type: ignore
+                    session_data=session.session_data,
+                    extra_data=session.extra_data,
+                    updated_at=int(time.time()),
+                ),  # The updated value for each column
+            )
+
+        sess.execute(stmt)
+        self._write_runs(sess, session.session_id, runs)
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a workflow session from the database.
@@ -547,6 +950,9 @@ class SqliteStorage(Storage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.runs_table is not None:
+                    sess.execute(self.runs_table.delete().where(self.runs_table.c.session_id == session_id))
+                    self._run_hashes.pop(session_id)
                 if result.rowcount == 0:
                     log_debug(f"No session found with session_id: {session_id}")
                 else:
@@ -562,9 +968,13 @@ class SqliteStorage(Storage):
             log_debug(f"Deleting table: {self.table_name}")
             # Drop with checkfirst=True to avoid errors if the table doesn't exist
             self.table.drop(self.db_engine, checkfirst=True)
+            if self.runs_table is not None:
+                self.runs_table.drop(self.db_engine, checkfirst=True)
+                self._run_hashes.clear()
             # Clear metadata to ensure indexes are recreated properly
             self.metadata = MetaData()
             self.table = self.get_table()
+            self.runs_table = self.get_runs_table()
 
     def __deepcopy__(self, memo):
         """
@@ -585,9 +995,9 @@ class SqliteStorage(Storage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "runs_table", "inspector"}:
                 continue
-            # Reuse db_engine and Session without copying
+            # Reuse the engines and sessions without copying
             elif k in {"db_engine", "SqlSession"}:
                 setattr(copied_obj, k, v)
             else:
@@ -597,5 +1007,6 @@ class SqliteStorage(Storage):
         copied_obj.metadata = MetaData()
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.runs_table = copied_obj.get_runs_table()
 
         return copied_obj
@@ -1,7 +1,7 @@
 import asyncio
 import json
 from collections import ChainMap, defaultdict, deque
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import asdict, dataclass, replace
 from os import getenv
 from textwrap import dedent
@@ -44,9 +44,10 @@ from agno.run.messages import RunMessages
 from agno.run.response import RunEvent, RunResponse, RunResponseEvent
 from agno.run.team import TeamRunEvent, TeamRunResponse, TeamRunResponseEvent, ToolCallCompletedEvent
 from agno.storage.base import Storage
+from agno.storage.media.base import MediaStore, use_media_store
 from agno.storage.session.team import TeamSession
 from agno.tools.function import Function
-from agno.tools.toolkit import Toolkit
+from agno.tools.toolkit import Toolkit, copy_tool_for_run
 from agno.utils.events import (
     create_team_memory_update_completed_event,
     create_team_memory_update_started_event,
@@ -211,6 +212,9 @@ class Team:
     tool_choice: Optional[Union[str, Dict[str, Any]]] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # Maximum number of parallel-safe tool calls from one model response that run at the same time.
+    # None runs tool calls one after another. Only applies to sync runs, async runs already run tool calls concurrently.
+    max_parallel_tool_calls: Optional[int] = None
     # A list of hooks to be called before and after the tool call
     tool_hooks: Optional[List[Callable]] = None
 
@@ -248,6 +252,8 @@ class Team:
 
     # --- Team Storage ---
     storage: Optional[Storage] = None
+    # Store for the content of media in the session, so storage only keeps its hash and URI
+    media_store: Optional[MediaStore] = None
     # Extra data stored with this team
     extra_data: Optional[Dict[str, Any]] = None
 
@@ -324,6 +330,7 @@ class Team:
         tools: Optional[List[Union[Toolkit, Callable, Function, Dict]]] = None,
         show_tool_calls: bool = True,
         tool_call_limit: Optional[int] = None,
+        max_parallel_tool_calls: Optional[int] = None,
         tool_choice: Optional[Union[str, Dict[str, Any]]] = None,
         tool_hooks: Optional[List[Callable]] = None,
         response_model: Optional[Type[BaseModel]] = None,
@@ -340,6 +347,7 @@ class Team:
         num_of_interactions_from_history: Optional[int] = None,
         num_history_runs: int = 3,
         storage: Optional[Storage] = None,
+        media_store: Optional[MediaStore] = None,
         extra_data: Optional[Dict[str, Any]] = None,
         reasoning: bool = False,
         reasoning_model: Optional[Model] = None,
@@ -404,6 +412,7 @@ class Team:
         self.show_tool_calls = show_tool_calls
         self.tool_choice = tool_choice
         self.tool_call_limit = tool_call_limit
+        self.max_parallel_tool_calls = max_parallel_tool_calls
         self.tool_hooks = tool_hooks
 
         self.response_model = response_model
@@ -424,6 +433,7 @@ class Team:
         self.num_history_runs = num_history_runs
 
         self.storage = storage
+        self.media_store = media_store
         self.extra_data = extra_data
 
         self.reasoning = reasoning
@@ -586,6 +596,61 @@ class Team:
         self.run_messages = None
         self.run_response = None
 
+    def _initialize_memory(self) -> None:
+        if self.memory is None:
+            self.memory = Memory()
+            # A new memory is already unique to this instance
+            self._memory_deepcopy_done = True
+        elif not self._memory_deepcopy_done:
+            # We store a copy of memory to ensure different team instances reference unique memory copy
+            if isinstance(self.memory, Memory):
+                self.memory = deepcopy(self.memory)
+            self._memory_deepcopy_done = True
+
+    def copy_for_run(self) -> "Team":
+        """Create a copy of this Team for one run, so runs can happen concurrently, e.g. one per server request.
+
+        The copy shares the configuration and resources of this Team, see Agent.copy_for_run. Its members are copies
+        too, and run and session state, the tools prepared for the model and TeamMemory are its own.
+
+        Returns:
+            Team: The copy.
+        """
+        self._set_team_id()
+        self._initialize_memory()
+
+        new_team = copy(self)
+        new_team.members = [member.copy_for_run() for member in self.members]
+        if self.model is not None:
+            new_team.model = deepcopy(self.model)
+        if self.reasoning_model is not None:
+            new_team.reasoning_model = deepcopy(self.reasoning_model)
+        if self.reasoning_agent is not None:
+            new_team.reasoning_agent = self.reasoning_agent.copy_for_run()
+        if isinstance(self.memory, TeamMemory):
+            new_team.memory = self.memory.deep_copy()
+        if self.tools is not None:
+            new_team.tools = [copy_tool_for_run(tool) for tool in self.tools]
+        for field_name in ("session_state", "team_session_state", "context", "extra_data"):
+            field_value = getattr(self, field_name)
+            if field_value is not None:
+                try:
+                    setattr(new_team, field_name, deepcopy(field_value))
+                except Exception as e:
+                    log_warning(f"Failed to copy field: {field_name} - {e}")
+
+        new_team._reset_run_state()
+        new_team.session_metrics = None
+        new_team.full_team_session_metrics = None
+        new_team.images = None
+        new_team.audio = None
+        new_team.videos = None
+        new_team.team_session = None
+        new_team._tool_instructions = None
+        new_team._tools_for_model = None
+        new_team._functions_for_model = None
+        return new_team
+
     def initialize_team(self, session_id: Optional[str] = None) -> None:
         self._set_defaults()
         self._set_default_model()
@@ -603,13 +668,7 @@ class Team:
         log_debug(f"Team ID: {self.team_id}", center=True)
 
         # Initialize memory if not yet set
-        if self.memory is None:
-            self.memory = Memory()
-        elif not self._memory_deepcopy_done:
-            # We store a copy of memory to ensure different team instances reference unique memory copy
-            if isinstance(self.memory, Memory):
-                self.memory = deepcopy(self.memory)
-            self._memory_deepcopy_done = True
+        self._initialize_memory()
 
         # Default to the team's model if no model is provided
         if isinstance(self.memory, Memory):
@@ -938,6 +997,7 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
         )
 
         #  Update TeamRunResponse
@@ -1160,7 +1220,7 @@ class Team:
         self.stream_intermediate_steps = self.stream_intermediate_steps or (stream_intermediate_steps and self.stream)
 
         # Read existing session from storage
-        self.read_from_storage(session_id=session_id)
+        await self.aread_from_storage(session_id=session_id)
 
         # Read existing session from storage
         if self.context is not None:
@@ -1366,7 +1426,7 @@ class Team:
         self._convert_response_to_structured_format(run_response=run_response)
 
         # 7. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 8. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1442,7 +1502,7 @@ class Team:
             )
 
         # 6. Save session to storage
-        self.write_to_storage(session_id=session_id, user_id=user_id)
+        await self.awrite_to_storage(session_id=session_id, user_id=user_id)
 
         # 7. Log Team Run
         await self._alog_team_run(session_id=session_id, user_id=user_id)
@@ -1588,14 +1648,11 @@ class Team:
         elif isinstance(self.memory, Memory):
             yield from self._make_memories_and_summaries(run_messages, session_id, user_id)
 
-            session_messages: List[Message] = []
-            for run in self.memory.runs.get(session_id, []):  # type: ignore
-                if run.messages is not None:
-                    for m in run.messages:
-                        session_messages.append(m)
-
             # 10. Calculate session metrics
-            self.session_metrics = self._calculate_session_metrics(session_messages)
+            assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
+            self.session_metrics = self.memory.get_session_metrics(
+                session_id=session_id, assistant_message_role=assistant_message_role
+            )
 
     async def _aupdate_memory(
         self,
@@ -1632,15 +1689,11 @@ class Team:
             async for event in self._amake_memories_and_summaries(run_messages, session_id, user_id):
                 yield event
 
-            session_messages: List[Message] = []
-            if self.memory.runs:
-                for run in self.memory.runs.get(session_id, []):
-                    if run.messages is not None:
-                        for m in run.messages:
-                            session_messages.append(m)
-
             # 10. Calculate session metrics
-            self.session_metrics = self._calculate_session_metrics(session_messages)
+            assistant_message_role = self.model.assistant_message_role if self.model is not None else "assistant"
+            self.session_metrics = self.memory.get_session_metrics(
+                session_id=session_id, assistant_message_role=assistant_message_role
+            )
 
     def _handle_model_response_stream(
         self,
@@ -1669,6 +1722,7 @@ class Team:
             functions=self._functions_for_model,
             tool_choice=self.tool_choice,
             tool_call_limit=self.tool_call_limit,
+            max_parallel_tool_calls=self.max_parallel_tool_calls,
             stream_model_response=stream_model_response,
         ):
             yield from self._handle_model_response_chunk(
@@ -6486,9 +6540,36 @@ class Team:
             Optional[TeamSession]: The saved TeamSession or None if not saved.
         """
         if self.storage is not None:
-            self.team_session = cast(
-                TeamSession, self.storage.upsert(session=self._get_team_session(session_id=session_id, user_id=user_id))
-            )
+            with use_media_store(self.media_store):
+                team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            self.team_session = cast(TeamSession, self.storage.upsert(session=team_session))
+        return self.team_session
+
+    async def aread_from_storage(self, session_id: str) -> Optional[TeamSession]:
+        """Load the TeamSession from storage, without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The loaded TeamSession or None if not found.
+        """
+        if self.storage is not None and session_id is not None:
+            self.team_session = cast(TeamSession, await self.storage.aread(session_id=session_id))
+            if self.team_session is not None:
+                self.load_team_session(session=self.team_session)
+            else:
+                # New session, just reset the state
+                self.session_name = None
+        return self.team_session
+
+    async def awrite_to_storage(self, session_id: str, user_id: Optional[str] = None) -> Optional[TeamSession]:
+        """Save the TeamSession to storage, without blocking the event loop
+
+        Returns:
+            Optional[TeamSession]: The saved TeamSession or None if not saved.
+        """
+        if self.storage is not None:
+            with use_media_store(self.media_store):
+                team_session = self._get_team_session(session_id=session_id, user_id=user_id)
+            self.team_session = cast(TeamSession, await self.storage.aupsert(session=team_session))
         return self.team_session
 
     def rename_session(self, session_name: str, session_id: Optional[str] = None) -> None:
@@ -7395,7 +7476,7 @@ class Team:
                     run_data=run_data,
                     team_session_id=team_session.team_session_id,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.monitoring_data() if self.monitoring else team_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -7419,7 +7500,7 @@ class Team:
                     run_id=self.run_id,
                     run_data=run_data,
                     session_id=team_session.session_id,
-                    team_data=team_session.to_dict() if self.monitoring else team_session.telemetry_data(),
+                    team_data=team_session.monitoring_data() if self.monitoring else team_session.telemetry_data(),
                 ),
                 monitor=self.monitoring,
             )
@@ -0,0 +1,12 @@
+from agno.tools.cache.base import ToolCacheStats, ToolResultCache
+from agno.tools.cache.file import FileToolResultCache
+from agno.tools.cache.in_memory import InMemoryToolResultCache
+from agno.tools.cache.sqlite import SqliteToolResultCache
+
+__all__ = [
+    "ToolCacheStats",
+    "ToolResultCache",
+    "FileToolResultCache",
+    "InMemoryToolResultCache",
+    "SqliteToolResultCache",
+]
@@ -0,0 +1,88 @@
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from agno.utils.shared import SharedOnCopy
+
+
+@dataclass
+class ToolCacheStats:
+    """Cache hits and misses of a function"""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ToolResultCache(SharedOnCopy, ABC):
+    """Base class for the stores that cache tool call results.
+
+    Keys are built by the Function and already include the function name, so one store can be shared by many
+    functions. The store also deduplicates concurrent identical calls: the first caller runs the function and the
+    others wait for its result (see `begin_call`).
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, ToolCacheStats] = {}
+        self._lock = threading.Lock()
+        # Cache key -> event set when the call running for that key finishes
+        self._in_flight: Dict[str, threading.Event] = {}
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached result, None if it is missing or expired"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache a result for `ttl` seconds, or until evicted if ttl is None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def record(self, function_name: str, hit: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(function_name, ToolCacheStats())
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def get_stats(self, function_name: Optional[str] = None) -> Dict[str, ToolCacheStats]:
+        """Get the cache hits and misses in this process, per function name"""
+        with self._lock:
+            if function_name is not None:
+                stats = self._stats.get(function_name, ToolCacheStats())
+                return {function_name: ToolCacheStats(hits=stats.hits, misses=stats.misses)}
+            return {name: ToolCacheStats(hits=s.hits, misses=s.misses) for name, s in self._stats.items()}
+
+    def begin_call(self, key: str) -> Optional[threading.Event]:
+        """Register a call for `key`.
+
+        Returns:
+            None if the caller should run the function, and must call `end_call` once the result is cached.
+            Otherwise the event of the identical call already running, to wait on before reading the cache again.
+        """
+        with self._lock:
+            event = self._in_flight.get(key)
+            if event is not None:
+                return event
+            self._in_flight[key] = threading.Event()
+            return None
+
+    def end_call(self, key: str) -> None:
+        with self._lock:
+            event = self._in_flight.pop(key, None)
+        if event is not None:
+            event.set()
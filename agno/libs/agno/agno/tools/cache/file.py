@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+from tempfile import gettempdir
+from time import time
+from typing import Any, Optional, Union
+
+from agno.tools.cache.base import ToolResultCache
+from agno.utils.log import log_error, log_warning
+
+
+class FileToolResultCache(ToolResultCache):
+    """Caches tool results as JSON files, one per call, under `cache_dir`.
+
+    Kept for caches that must survive restarts without a database. Expired files are removed when read.
+
+    Files are stored as `functions/<key>.json` with an `expires_at` time. Results cached by earlier versions, as
+    `functions/<function name>/<key>.json` with a `timestamp`, are not read: those calls run again once, and
+    `clear` removes the old files.
+
+    Args:
+        cache_dir: Directory to store the cache files. Defaults to the system temp dir.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        super().__init__()
+        self.cache_dir: Path = Path(cache_dir or Path(gettempdir()) / "agno_cache") / "functions"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        if any(path.is_dir() for path in self.cache_dir.iterdir()):
+            log_warning(
+                f"Ignoring tool results cached in the previous layout under {self.cache_dir}, "
+                "use clear() to remove them"
+            )
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with path.open("r") as f:
+                cache_data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
+
+        expires_at = cache_data.get("expires_at")
+        if expires_at is None or time() <= expires_at:
+            return cache_data.get("result")
+        path.unlink(missing_ok=True)
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            with self._path(key).open("w") as f:
+                json.dump({"expires_at": time() + ttl if ttl is not None else None, "result": value}, f)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        # Also removes results cached in the previous `<function name>/<key>.json` layout
+        for path in self.cache_dir.glob("**/*.json"):
+            path.unlink(missing_ok=True)
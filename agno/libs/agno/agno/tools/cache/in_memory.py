@@ -0,0 +1,41 @@
+import time
+from typing import Any, Optional, Tuple
+
+from agno.tools.cache.base import ToolResultCache
+from agno.utils.lru_cache import LRUCache
+
+
+class InMemoryToolResultCache(ToolResultCache):
+    """Caches tool results in this process, evicting the least recently used result beyond `max_size`.
+
+    Args:
+        max_size: Maximum number of cached results.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        super().__init__()
+        # Cache key -> (expiry as monotonic time or None, result)
+        self._entries: LRUCache[Tuple[Optional[float], Any]] = LRUCache(max_size=max_size)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() > expires_at:
+            self._entries.pop(key)
+            return None
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries.set(key, (expires_at, value))
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,72 @@
+import json
+from typing import Any, Optional
+
+from agno.tools.cache.base import ToolResultCache
+from agno.utils.log import log_error
+
+try:
+    from redis import Redis
+except ImportError:
+    raise ImportError("`redis` not installed. Please install it using `pip install redis`")
+
+
+class RedisToolResultCache(ToolResultCache):
+    """Caches tool results in Redis, or any server speaking its protocol, so workers on many hosts can share them.
+
+    Results must be JSON serializable and expire through Redis key expiry. Concurrent identical calls are only
+    deduplicated within a process.
+
+    Args:
+        prefix: Prefix for the Redis keys.
+        host: Redis host address.
+        port: Redis port number.
+        db: Redis database number.
+        password: Redis password if authentication is required.
+        ssl: Whether to use SSL for the Redis connection.
+        redis_client: An existing Redis client, used instead of connecting with the arguments above.
+    """
+
+    def __init__(
+        self,
+        prefix: str = "agno:tool_cache",
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        ssl: bool = False,
+        redis_client: Optional[Redis] = None,
+    ):
+        super().__init__()
+        self.prefix = prefix
+        self.redis_client = redis_client or Redis(
+            host=host,
+            port=port,
+            db=db,
+            password=password,
+            decode_responses=True,
+            ssl=ssl,
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            value = self.redis_client.get(self._key(key))
+        except Exception as e:
+            log_error(f"Error reading cache: {e}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            self.redis_client.set(self._key(key), json.dumps(value), px=int(ttl * 1000) if ttl is not None else None)
+        except Exception as e:
+            log_error(f"Error writing cache: {e}")
+
+    def delete(self, key: str) -> None:
+        self.redis_client.delete(self._key(key))
+
+    def clear(self) -> None:
+        for key in self.redis_client.scan_iter(match=f"{self.prefix}:*"):
+            self.redis_client.delete(key)
@@ -0,0 +1,98 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from time import time
+from typing import Any, Optional, Union
+
+from agno.tools.cache.base import ToolResultCache
+from agno.utils.log import log_debug, log_error
+
+
+class SqliteToolResultCache(ToolResultCache):
+    """Caches tool results in a SQLite table, which processes on the same host can share.
+
+    Results must be JSON serializable. Expired rows are purged every `purge_interval` writes, and the oldest rows
+    are removed once the table holds more than `max_entries`.
+
+    Args:
+        db_file: Path of the SQLite database file.
+        table_name: Name of the cache table.
+        max_entries: Maximum number of cached results, None for no bound.
+        purge_interval: Number of writes between purges.
+    """
+
+    def __init__(
+        self,
+        db_file: Union[str, Path],
+        table_name: str = "agno_tool_cache",
+        max_entries: Optional[int] = 10_000,
+        purge_interval: int = 100,
+    ):
+        super().__init__()
+        self.db_file: str = str(db_file)
+        self.table_name: str = table_name
+        self.max_entries: Optional[int] = max_entries
+        self.purge_interval: int = purge_interval
+        self._writes = 0
+        self._db_lock = threading.Lock()
+
+        Path(self.db_file).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_file, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, created_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_created_at ON {self.table_name} (created_at)"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._db_lock:
+            row = self._connection.execute(
+                f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and time() > expires_at:
+            self.delete(key)
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        try:
+            serialized = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            log_error(f"Error writing cache: {e}")
+            return
+
+        now = time()
+        with self._db_lock:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
+                (key, serialized, now + ttl if ttl is not None else None, now),
+            )
+            self._writes += 1
+            if self._writes % self.purge_interval == 0:
+                self._purge(now)
+
+    def _purge(self, now: float) -> None:
+        deleted = self._connection.execute(f"DELETE FROM {self.table_name} WHERE expires_at < ?", (now,)).rowcount
+        if self.max_entries is not None:
+            deleted += self._connection.execute(
+                f"DELETE FROM {self.table_name} WHERE key IN "
+                f"(SELECT key FROM {self.table_name} ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        if deleted:
+            log_debug(f"Purged {deleted} cached tool results")
+
+    def delete(self, key: str) -> None:
+        with self._db_lock:
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._db_lock:
+            self._connection.execute(f"DELETE FROM {self.table_name}")
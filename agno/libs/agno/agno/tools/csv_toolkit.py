@@ -1,5 +1,6 @@
 import csv
 import json
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
@@ -18,8 +19,16 @@ class CsvTools(Toolkit):
         read_column_names: bool = True,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        cache_tables: bool = True,
         **kwargs,
     ):
+        """Initialize CsvTools.
+
+        Args:
+            cache_tables (bool): Load each csv into a DuckDB table once and serve reads, columns and queries from it.
+                The table is reloaded when the size or modification time of the csv changes. Pass a database file
+                in `duckdb_kwargs` (e.g. `{"database": "csvs.duckdb"}`) to keep the tables across processes.
+        """
         self.csvs: List[Path] = []
         if csvs:
             for _csv in csvs:
@@ -32,6 +41,9 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        self.cache_tables: bool = cache_tables
+        # DuckDB connections are not safe to share between threads
+        self._duckdb_lock = threading.RLock()
 
         tools: List[Any] = []
         if read_csvs:
@@ -75,9 +87,21 @@ class CsvTools(Toolkit):
             log_info(f"Reading file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
+            _row_limit = row_limit or self.row_limit
+            if self._use_table_cache():
+                with self._duckdb_lock:
+                    # Values as the strings in the file, the way the csv module reads them
+                    table = self._load_table(file_path, as_text=True)
+                    query_result = self._get_connection().sql(
+                        f"SELECT COALESCE(COLUMNS(*), '') FROM {table}"
+                        + (f" LIMIT {int(_row_limit)}" if _row_limit is not None else "")
+                    )
+                    columns = self._get_connection().table(table).columns
+                    csv_data = [dict(zip(columns, row)) for row in query_result.fetchall()]
+                return json.dumps(csv_data)
+
             # Read the csv file
             csv_data = []
-            _row_limit = row_limit or self.row_limit
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
                 if _row_limit is not None:
@@ -105,6 +129,10 @@ class CsvTools(Toolkit):
             log_info(f"Reading columns from file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
+            if self._use_table_cache():
+                with self._duckdb_lock:
+                    return json.dumps(self._get_connection().table(self._load_table(file_path)).columns)
+
             # Get the columns of the csv file
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
@@ -131,52 +159,99 @@ class CsvTools(Toolkit):
             str: The query results if successful, otherwise returns an error message.
         """
         try:
-            import duckdb
-
             if csv_name not in [_csv.stem for _csv in self.csvs]:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            log_info(f"Loading csv file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Create duckdb connection
-            con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
-            if con is None:
-                logger.error("Error connecting to DuckDB")
-                return "Error connecting to DuckDB, please check the connection."
-
-            # Create a table from the csv file
-            con.execute(f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv_auto('{file_path}')")
-
-            # -*- Format the SQL Query
-            # Remove backticks
-            formatted_sql = sql_query.replace("`", "")
-            # If there are multiple statements, only run the first one
-            formatted_sql = formatted_sql.split(";")[0]
-            # -*- Run the SQL Query
-            log_info(f"Running query: {formatted_sql}")
-            query_result = con.sql(formatted_sql)
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            with self._duckdb_lock:
+                con = self._get_connection()
+
+                # Create a table from the csv file
+                self._load_table(file_path)
+
+                # -*- Format the SQL Query
+                # Remove backticks
+                formatted_sql = sql_query.replace("`", "")
+                # If there are multiple statements, only run the first one
+                formatted_sql = formatted_sql.split(";")[0]
+                # -*- Run the SQL Query
+                log_info(f"Running query: {formatted_sql}")
+                query_result = con.sql(formatted_sql)
+                result_output = "No output"
+                if query_result is not None:
+                    try:
+                        results_as_python_objects = query_result.fetchall()
+                        result_rows = []
+                        for row in results_as_python_objects:
+                            if len(row) == 1:
+                                result_rows.append(str(row[0]))
+                            else:
+                                result_rows.append(",".join(str(x) for x in row))
+
+                        result_data = "\n".join(result_rows)
+                        result_output = ",".join(query_result.columns) + "\n" + result_data
+                    except AttributeError:
+                        result_output = str(query_result)
 
             log_debug(f"Query result: {result_output}")
             return result_output
         except Exception as e:
             logger.error(f"Error querying csv: {e}")
             return f"Error querying csv: {e}"
+
+    def _use_table_cache(self) -> bool:
+        if not self.cache_tables:
+            return False
+        try:
+            import duckdb  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _get_connection(self) -> Any:
+        """Returns the DuckDB connection, created once and reused across tool calls"""
+        if self.duckdb_connection is None:
+            import duckdb
+
+            self.duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
+        return self.duckdb_connection
+
+    def _load_table(self, file_path: Path, as_text: bool = False) -> str:
+        """Loads the csv into a table named after the file, unless it is already loaded and the file did not change.
+
+        Args:
+            as_text (bool): Load every column as VARCHAR, keeping the values exactly as written in the file,
+                into a separate table so queries still see the detected column types.
+
+        Returns:
+            str: The quoted table name.
+        """
+        con = self._get_connection()
+        table_name = f"_agno_csv_text_{file_path.stem}" if as_text else file_path.stem
+        table = '"' + table_name.replace('"', '""') + '"'
+        stat = file_path.stat()
+        source = str(file_path.resolve())
+
+        if self.cache_tables:
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS _agno_csv_tables "
+                "(table_name VARCHAR PRIMARY KEY, source VARCHAR, size BIGINT, mtime_ns BIGINT)"
+            )
+            cached = con.execute(
+                "SELECT source, size, mtime_ns FROM _agno_csv_tables WHERE table_name = ?", [table_name]
+            ).fetchone()
+            if cached == (source, stat.st_size, stat.st_mtime_ns):
+                return table
+
+        log_info(f"Loading csv file: {file_path.stem}" + (" as text" if as_text else ""))
+        con.execute(
+            f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM read_csv_auto(?, all_varchar = ?)",
+            [str(file_path), as_text],
+        )
+        if self.cache_tables:
+            con.execute(
+                "INSERT OR REPLACE INTO _agno_csv_tables VALUES (?, ?, ?, ?)",
+                [table_name, source, stat.st_size, stat.st_mtime_ns],
+            )
+        return table
@@ -1,6 +1,7 @@
 from functools import update_wrapper, wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, overload
 
+from agno.tools.cache import ToolResultCache
 from agno.tools.function import Function, get_entrypoint_docstring
 from agno.utils.log import logger
 
@@ -24,6 +25,7 @@ def tool(
     sanitize_arguments: Optional[bool] = None,
     show_result: Optional[bool] = None,
     stop_after_tool_call: Optional[bool] = None,
+    parallel_safe: Optional[bool] = None,
     requires_confirmation: Optional[bool] = None,
     requires_user_input: Optional[bool] = None,
     user_input_fields: Optional[List[str]] = None,
@@ -34,6 +36,7 @@ def tool(
     cache_results: bool = False,
     cache_dir: Optional[str] = None,
     cache_ttl: int = 3600,
+    cache_backend: Optional[ToolResultCache] = None,
 ) -> Callable[[F], Function]: ...
 
 
@@ -53,6 +56,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         add_instructions: bool - If True, add instructions to the system message
         show_result: Optional[bool] - If True, shows the result after function call
         stop_after_tool_call: Optional[bool] - If True, the agent will stop after the function call.
+        parallel_safe: Optional[bool] - If True, the function can run in parallel with other parallel-safe calls.
         requires_confirmation: Optional[bool] - If True, the function will require user confirmation before execution
         requires_user_input: Optional[bool] - If True, the function will require user input before execution
         user_input_fields: Optional[List[str]] - List of fields that will be provided to the function as user input
@@ -63,6 +67,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
         cache_results: bool - If True, enable caching of function results
         cache_dir: Optional[str] - Directory to store cache files
         cache_ttl: int - Time-to-live for cached results in seconds
+        cache_backend: Optional[ToolResultCache] - Store for cached results, defaults to an in-memory cache
 
     Returns:
         Union[Function, Callable[[F], Function]]: Decorated function or decorator
@@ -91,6 +96,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "sanitize_arguments",
             "show_result",
             "stop_after_tool_call",
+            "parallel_safe",
             "requires_confirmation",
             "requires_user_input",
             "user_input_fields",
@@ -101,6 +107,7 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
             "cache_results",
             "cache_dir",
             "cache_ttl",
+            "cache_backend",
         }
     )
 
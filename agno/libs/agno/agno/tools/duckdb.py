@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.query_result import QueryResultPager, iter_batches
 
 try:
     import duckdb
@@ -22,6 +23,7 @@ class DuckDbTools(Toolkit):
         create_tables: bool = True,
         summarize_tables: bool = True,
         export_tables: bool = False,
+        result_pager: Optional[QueryResultPager] = None,
         **kwargs,
     ):
         self.db_path: Optional[str] = db_path
@@ -29,6 +31,8 @@ class DuckDbTools(Toolkit):
         self.config: Optional[dict] = config
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
+        # Bounds the size of query results and keeps truncated results open for paging
+        self.result_pager: QueryResultPager = result_pager or QueryResultPager()
 
         tools: List[Any] = []
         tools.append(self.show_tables)
@@ -38,6 +42,7 @@ class DuckDbTools(Toolkit):
             tools.append(self.inspect_query)
         if run_queries:
             tools.append(self.run_query)
+            tools.append(self.get_next_result_page)
         if create_tables:
             tools.append(self.create_table_from_path)
         if summarize_tables:
@@ -129,19 +134,10 @@ class DuckDbTools(Toolkit):
             query_result = self.connection.sql(formatted_sql)
             result_output = "No output"
             if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+                # Relations keep their position when other queries run on the connection, unlike Arrow readers
+                result_output = self.result_pager.render(
+                    query_result.columns, iter_batches(lambda: query_result.fetchmany(1000))
+                )
 
             log_debug(f"Query result: {result_output}")
             return result_output
@@ -152,6 +148,14 @@ class DuckDbTools(Toolkit):
         except Exception as e:
             return str(e)
 
+    def get_next_result_page(self, handle: str) -> str:
+        """Function to get the next rows of a query result that was too large to return at once.
+
+        :param handle: Handle of the truncated result
+        :return: Next rows of the result
+        """
+        return self.result_pager.next_page(handle)
+
     def summarize_table(self, table: str) -> str:
         """Function to compute a number of aggregates over a table.
         The function launches a query that computes a number of aggregates over all columns,
@@ -1,16 +1,67 @@
+from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Type, TypeVar, get_type_hints
+from typing import Any, Callable, Dict, Hashable, List, Literal, Optional, Tuple, Type, TypeVar, get_type_hints
 
 from docstring_parser import parse
 from pydantic import BaseModel, Field, validate_call
 from pydantic._internal._validate_call import ValidateCallWrapper
 
 from agno.exceptions import AgentRunException
-from agno.utils.log import log_debug, log_error, log_exception, log_warning
+from agno.tools.cache import FileToolResultCache, InMemoryToolResultCache, ToolResultCache
+from agno.utils.log import log_debug, log_exception, log_warning
+from agno.utils.lru_cache import LRUCache
 
 T = TypeVar("T")
 
+# Cache for function results when no cache_backend or cache_dir is set
+default_tool_result_cache: ToolResultCache = InMemoryToolResultCache()
+# cache_dir -> the file cache for that directory
+_file_tool_result_caches: Dict[str, FileToolResultCache] = {}
+# Seconds a call waits for an identical call already running before running itself
+SINGLE_FLIGHT_TIMEOUT = 300
+
+
+@dataclass
+class ProcessedSchema:
+    """The parameters and description read from a callable, shared by all Functions built on it"""
+
+    parameters: Dict[str, Any]
+    description: str
+    # (name, description, type) of each parameter, used to build the user input schema
+    user_input_fields: List[Tuple[str, Optional[str], Any]]
+
+
+# Schemas of the callables processed so far, see get_schema_cache_key
+processed_schema_cache: LRUCache[ProcessedSchema] = LRUCache(max_size=4096)
+# Plain functions -> the same function wrapped with validate_call
+wrapped_callable_cache: LRUCache[Callable] = LRUCache(max_size=4096)
+
+
+def get_schema_cache_key(c: Callable, *options: Any) -> Optional[Hashable]:
+    """Get the key of the schema of a callable, or None if it can't be cached.
+
+    Bound methods of the same function share a key, as do callables already wrapped with validate_call and
+    decorated functions. Closures are not cached: they are often built for each run, e.g. the tools capturing the
+    agent, so they would never be hit and the cache would keep them alive with everything they capture.
+    """
+    from inspect import ismethod, unwrap
+
+    raw_function = getattr(c, "raw_function", None)
+    if callable(raw_function):
+        c = raw_function
+    bound = ismethod(c)
+    # Decorated functions have the signature and docstring of the function they wrap
+    target = unwrap(c.__func__ if bound else c)  # type: ignore
+    if getattr(target, "__closure__", None) is not None:
+        return None
+    key = (target, bound, *options)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 def get_entrypoint_docstring(entrypoint: Callable) -> str:
     from inspect import getdoc
@@ -89,6 +140,9 @@ class Function(BaseModel):
     show_result: bool = False
     # If True, the agent will stop after the function call.
     stop_after_tool_call: bool = False
+    # If True, the function can run at the same time as other parallel-safe calls from the same model response.
+    # Only used when the agent or team sets max_parallel_tool_calls.
+    parallel_safe: bool = False
     # Hook that runs before the function is executed.
     # If defined, can accept the FunctionCall instance as a parameter.
     pre_hook: Optional[Callable] = None
@@ -116,6 +170,8 @@ class Function(BaseModel):
     cache_results: bool = False
     cache_dir: Optional[str] = None
     cache_ttl: int = 3600
+    # The ToolResultCache to use. Defaults to JSON files if cache_dir is set, otherwise to a shared in-memory cache.
+    cache_backend: Optional[Any] = None
 
     # --*-- FOR INTERNAL USE ONLY --*--
     # The agent that the function is associated with
@@ -137,6 +193,18 @@ class Function(BaseModel):
 
         function_name = name or c.__name__
         parameters = {"type": "object", "properties": {}, "required": []}
+        description: Optional[str] = None
+
+        cache_key = get_schema_cache_key(c, "callable", strict)
+        cached_schema = processed_schema_cache.get(cache_key) if cache_key is not None else None
+        if cached_schema is not None:
+            return cls(
+                name=function_name,
+                description=cached_schema.description,
+                parameters=deepcopy(cached_schema.parameters),
+                entrypoint=cls._wrap_callable(c),
+            )
+
         try:
             sig = signature(c)
             type_hints = get_type_hints(c)
@@ -187,6 +255,12 @@ class Function(BaseModel):
                     if param.default == param.empty and name != "self" and name not in ["agent", "team"]
                 ]
 
+            description = get_entrypoint_docstring(entrypoint=c)
+            if cache_key is not None:
+                processed_schema_cache.set(
+                    cache_key,
+                    ProcessedSchema(parameters=deepcopy(parameters), description=description, user_input_fields=[]),
+                )
             # log_debug(f"JSON schema for {function_name}: {parameters}")
         except Exception as e:
             log_warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
@@ -195,17 +269,13 @@ class Function(BaseModel):
 
         return cls(
             name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
+            description=description if description is not None else get_entrypoint_docstring(entrypoint=c),
             parameters=parameters,
             entrypoint=entrypoint,
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-
-        from agno.utils.json_schema import get_json_schema
-
         if self.skip_entrypoint_processing:
             if strict:
                 self.process_schema_for_strict()
@@ -224,71 +294,27 @@ class Function(BaseModel):
         if self.requires_user_input:
             self.user_input_schema = self.user_input_schema or []
 
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            if "team" in sig.parameters:
-                del type_hints["team"]
-            # log_info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            excluded_params = ["return", "agent", "team"]
-            if self.requires_user_input and self.user_input_fields:
-                if len(self.user_input_fields) == 0:
-                    excluded_params.extend(list(type_hints.keys()))
-                else:
-                    excluded_params.extend(self.user_input_fields)
-
-            # Get filtered list of parameter types
-            param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            param_descriptions_clean = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
+        # Filter out return type and only process parameters
+        excluded_params = ["return", "agent", "team"]
+        if self.requires_user_input and self.user_input_fields:
+            excluded_params.extend(self.user_input_fields)
 
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-                        param_descriptions_clean[param_name] = param.description
+        cache_key = get_schema_cache_key(self.entrypoint, "entrypoint", strict, tuple(excluded_params))
+        schema = processed_schema_cache.get(cache_key) if cache_key is not None else None
+        if schema is None:
+            try:
+                schema = self._read_schema(strict=strict, excluded_params=excluded_params)
+                if cache_key is not None:
+                    processed_schema_cache.set(cache_key, schema)
+            except Exception as e:
+                log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
 
+        if schema is not None:
             # If the function requires user input, we should set the user_input_schema to all parameters. The arguments provided by the model are filled in later.
             if self.requires_user_input:
                 self.user_input_schema = [
-                    UserInputField(
-                        name=name,
-                        description=param_descriptions_clean.get(name),
-                        field_type=type_hints.get(name, str),
-                    )
-                    for name in sig.parameters
-                ]
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name not in excluded_params
+                    UserInputField(name=name, description=description, field_type=field_type)
+                    for name, description, field_type in schema.user_input_fields
                 ]
 
             if params_set_by_user:
@@ -299,17 +325,11 @@ class Function(BaseModel):
                     ]
                 else:
                     # Mark a field as required if it has no default value
-                    self.parameters["required"] = [
-                        name
-                        for name, param in sig.parameters.items()
-                        if param.default == param.empty and name != "self" and name not in excluded_params
-                    ]
-
-            self.description = self.description or get_entrypoint_docstring(self.entrypoint)
+                    self.parameters["required"] = list(schema.parameters["required"])
+            else:
+                parameters = deepcopy(schema.parameters)
 
-            # log_debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            log_warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
+            self.description = self.description or schema.description
 
         if not params_set_by_user:
             self.parameters = parameters
@@ -319,10 +339,68 @@ class Function(BaseModel):
         except Exception as e:
             log_warning(f"Failed to add validate decorator to entrypoint: {e}")
 
+    def _read_schema(self, strict: bool, excluded_params: List[str]) -> ProcessedSchema:
+        """Read the parameters schema and description of the entrypoint"""
+        from inspect import getdoc, signature
+
+        from agno.utils.json_schema import get_json_schema
+
+        sig = signature(self.entrypoint)  # type: ignore
+        type_hints = get_type_hints(self.entrypoint)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        if "team" in sig.parameters:
+            del type_hints["team"]
+
+        # Get filtered list of parameter types
+        param_type_hints = {name: type_hints.get(name) for name in sig.parameters if name not in excluded_params}
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        param_descriptions_clean = {}
+        if docstring := getdoc(self.entrypoint):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+                    param_descriptions_clean[param_name] = param.description
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name not in excluded_params]
+        else:
+            # Mark a field as required if it has no default value
+            parameters["required"] = [
+                name
+                for name, param in sig.parameters.items()
+                if param.default == param.empty and name != "self" and name not in excluded_params
+            ]
+
+        return ProcessedSchema(
+            parameters=parameters,
+            description=get_entrypoint_docstring(self.entrypoint),  # type: ignore
+            user_input_fields=[
+                (name, param_descriptions_clean.get(name), type_hints.get(name, str)) for name in sig.parameters
+            ],
+        )
+
     @staticmethod
     def _wrap_callable(func: Callable) -> Callable:
         """Wrap a callable with Pydantic's validate_call decorator, if relevant"""
-        from inspect import isasyncgenfunction
+        from inspect import isasyncgenfunction, isfunction
 
         # Don't wrap async generator with validate_call
         if isasyncgenfunction(func):
@@ -330,6 +408,16 @@ class Function(BaseModel):
         # Don't wrap ValidateCallWrapper with validate_call
         elif isinstance(func, ValidateCallWrapper):
             return func
+        # Don't wrap a callable already wrapped with validate_call
+        elif isfunction(func) and callable(getattr(func, "raw_function", None)):
+            return func
+        # Wrap plain functions once, bound methods and closures are wrapped for each instance
+        elif isfunction(func) and func.__closure__ is None:
+            wrapped = wrapped_callable_cache.get(func)
+            if wrapped is None:
+                wrapped = validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
+                wrapped_callable_cache.set(func, wrapped)
+            return wrapped
         # Wrap the callable with validate_call
         else:
             return validate_call(func, config=dict(arbitrary_types_allowed=True))  # type: ignore
@@ -354,53 +442,15 @@ class Function(BaseModel):
         key_str = f"{self.name}:{args_str}:{kwargs_str}"
         return md5(key_str.encode()).hexdigest()
 
-    def _get_cache_file_path(self, cache_key: str) -> str:
-        """Get the full path for the cache file."""
-        from pathlib import Path
-        from tempfile import gettempdir
-
-        base_cache_dir = self.cache_dir or Path(gettempdir()) / "agno_cache"
-        func_cache_dir = Path(base_cache_dir) / "functions" / self.name
-        func_cache_dir.mkdir(parents=True, exist_ok=True)
-        return str(func_cache_dir / f"{cache_key}.json")
-
-    def _get_cached_result(self, cache_file: str) -> Optional[Any]:
-        """Retrieve cached result if valid."""
-        import json
-        from pathlib import Path
-        from time import time
-
-        cache_path = Path(cache_file)
-        if not cache_path.exists():
-            return None
-
-        try:
-            with cache_path.open("r") as f:
-                cache_data = json.load(f)
-
-            timestamp = cache_data.get("timestamp", 0)
-            result = cache_data.get("result")
-
-            if time() - timestamp <= self.cache_ttl:
-                return result
-
-            # Remove expired entry
-            cache_path.unlink()
-        except Exception as e:
-            log_error(f"Error reading cache: {e}")
-
-        return None
-
-    def _save_to_cache(self, cache_file: str, result: Any):
-        """Save result to cache."""
-        import json
-        from time import time
-
-        try:
-            with open(cache_file, "w") as f:
-                json.dump({"timestamp": time(), "result": result}, f)
-        except Exception as e:
-            log_error(f"Error writing cache: {e}")
+    def _get_cache_backend(self) -> ToolResultCache:
+        """Get the store for the results of this function."""
+        if self.cache_backend is not None:
+            return self.cache_backend
+        if self.cache_dir is not None:
+            if self.cache_dir not in _file_tool_result_caches:
+                _file_tool_result_caches[self.cache_dir] = FileToolResultCache(cache_dir=self.cache_dir)
+            return _file_tool_result_caches[self.cache_dir]
+        return default_tool_result_cache
 
 
 class FunctionExecutionResult(BaseModel):
@@ -562,6 +612,40 @@ class FunctionCall(BaseModel):
         chain = reduce(create_hook_wrapper, hooks, execute_entrypoint)
         return chain
 
+    def _read_cache(self, cache_key: str) -> Tuple[Optional[Any], bool]:
+        """Get the cached result for this call, waiting for an identical call that is already running.
+
+        Returns:
+            The cached result or None, and whether this call must run the function and then release the cache key.
+        """
+        cache = self.function._get_cache_backend()
+        cached_result = cache.get(cache_key)
+        if cached_result is None:
+            running_call = cache.begin_call(cache_key)
+            if running_call is None:
+                cache.record(self.function.name, hit=False)
+                return None, True
+            running_call.wait(timeout=SINGLE_FLIGHT_TIMEOUT)
+            cached_result = cache.get(cache_key)
+        cache.record(self.function.name, hit=cached_result is not None)
+        return cached_result, False
+
+    async def _aread_cache(self, cache_key: str) -> Tuple[Optional[Any], bool]:
+        """Async version of `_read_cache`, waiting without blocking the event loop."""
+        import asyncio
+
+        cache = self.function._get_cache_backend()
+        cached_result = cache.get(cache_key)
+        if cached_result is None:
+            running_call = cache.begin_call(cache_key)
+            if running_call is None:
+                cache.record(self.function.name, hit=False)
+                return None, True
+            await asyncio.to_thread(running_call.wait, SINGLE_FLIGHT_TIMEOUT)
+            cached_result = cache.get(cache_key)
+        cache.record(self.function.name, hit=cached_result is not None)
+        return cached_result, False
+
     def execute(self) -> FunctionExecutionResult:
         """Runs the function call."""
         from inspect import isgenerator
@@ -577,11 +661,11 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache_key: Optional[str] = None
+        owns_cache_key = False
         if self.function.cache_results and not isgenerator(self.function.entrypoint):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
-
+            cached_result, owns_cache_key = self._read_cache(cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -605,10 +689,8 @@ class FunctionCall(BaseModel):
             else:
                 self.result = result
                 # Only cache non-generator results
-                if self.function.cache_results:
-                    cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                    cache_file = self.function._get_cache_file_path(cache_key)
-                    self.function._save_to_cache(cache_file, self.result)
+                if cache_key is not None:
+                    self.function._get_cache_backend().set(cache_key, self.result, ttl=self.function.cache_ttl)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -619,6 +701,9 @@ class FunctionCall(BaseModel):
             log_exception(e)
             self.error = str(e)
             return FunctionExecutionResult(status="failure", error=str(e))
+        finally:
+            if owns_cache_key:
+                self.function._get_cache_backend().end_call(cache_key)  # type: ignore
 
         # Execute post-hook if it exists
         self._handle_post_hook()
@@ -758,12 +843,13 @@ class FunctionCall(BaseModel):
         entrypoint_args = self._build_entrypoint_args()
 
         # Check cache if enabled and not a generator function
+        cache_key: Optional[str] = None
+        owns_cache_key = False
         if self.function.cache_results and not (
             isasyncgen(self.function.entrypoint) or isgenerator(self.function.entrypoint)
         ):
             cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-            cache_file = self.function._get_cache_file_path(cache_key)
-            cached_result = self.function._get_cached_result(cache_file)
+            cached_result, owns_cache_key = await self._aread_cache(cache_key)
             if cached_result is not None:
                 log_debug(f"Cache hit for: {self.get_call_str()}")
                 self.result = cached_result
@@ -787,10 +873,8 @@ class FunctionCall(BaseModel):
                     self.result = await result
 
             # Only cache if not a generator
-            if self.function.cache_results and not (isgenerator(self.result) or isasyncgen(self.result)):
-                cache_key = self.function._get_cache_key(entrypoint_args, self.arguments)
-                cache_file = self.function._get_cache_file_path(cache_key)
-                self.function._save_to_cache(cache_file, self.result)
+            if cache_key is not None and not (isgenerator(self.result) or isasyncgen(self.result)):
+                self.function._get_cache_backend().set(cache_key, self.result, ttl=self.function.cache_ttl)
 
         except AgentRunException as e:
             log_debug(f"{e.__class__.__name__}: {e}")
@@ -801,6 +885,9 @@ class FunctionCall(BaseModel):
             log_exception(e)
             self.error = str(e)
             return FunctionExecutionResult(status="failure", error=str(e))
+        finally:
+            if owns_cache_key:
+                self.function._get_cache_backend().end_call(cache_key)  # type: ignore
 
         # Execute post-hook if it exists
         if iscoroutinefunction(self.function.post_hook):
@@ -1,4 +1,6 @@
+from itertools import chain
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 try:
     import psycopg2
@@ -9,6 +11,7 @@ except ImportError:
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, log_info
+from agno.utils.query_result import QueryResultPager, iter_batches
 
 
 class PostgresTools(Toolkit):
@@ -27,6 +30,7 @@ class PostgresTools(Toolkit):
         summarize_tables: bool = True,
         export_tables: bool = False,
         table_schema: str = "public",
+        result_pager: Optional[QueryResultPager] = None,
         **kwargs,
     ):
         self._connection: Optional[psycopg2.extensions.connection] = connection
@@ -36,6 +40,8 @@ class PostgresTools(Toolkit):
         self.host: Optional[str] = host
         self.port: Optional[int] = port
         self.table_schema: str = table_schema
+        # Bounds the size of query results and keeps truncated results open for paging
+        self.result_pager: QueryResultPager = result_pager or QueryResultPager()
 
         tools: List[Any] = []
         tools.append(self.show_tables)
@@ -44,6 +50,7 @@ class PostgresTools(Toolkit):
             tools.append(self.inspect_query)
         if run_queries:
             tools.append(self.run_query)
+            tools.append(self.get_next_result_page)
         if summarize_tables:
             tools.append(self.summarize_table)
         if export_tables:
@@ -181,6 +188,14 @@ class PostgresTools(Toolkit):
         log_debug(f"Explain plan: {explain_plan}")
         return explain_plan
 
+    def get_next_result_page(self, handle: str) -> str:
+        """Function to get the next rows of a query result that was too large to return at once.
+
+        :param handle: Handle of the truncated result
+        :return: Next rows of the result
+        """
+        return self.result_pager.next_page(handle)
+
     def export_table_to_path(self, table: str, path: Optional[str] = None) -> str:
         """Save a table in CSV format.
         If the path is provided, the table will be saved under that path.
@@ -220,25 +235,25 @@ class PostgresTools(Toolkit):
         try:
             log_info(f"Running: {formatted_sql}")
 
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            query_result = cursor.fetchall()
+            first_word = formatted_sql.split(None, 1)[0].lower() if formatted_sql.strip() else ""
+            if first_word in ("select", "with", "values", "table"):
+                # A server side cursor streams the rows instead of loading the whole result on execute
+                cursor = self.connection.cursor(name=f"agno_{uuid4().hex}", withhold=self.connection.autocommit)
+            else:
+                cursor = self.connection.cursor()
+            cursor.execute(formatted_sql)
+            # Server side cursors only describe their columns after the first fetch
+            first_rows = cursor.fetchmany(1000) if cursor.name else []
 
             result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            if cursor.description is None:
+                cursor.close()
+            else:
+                result_output = self.result_pager.render(
+                    [column[0] for column in cursor.description],
+                    chain(first_rows, iter_batches(lambda: cursor.fetchmany(1000))),
+                    close=cursor.close,
+                )
 
             log_debug(f"Query result: {result_output}")
 
@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 
 from agno.tools import Toolkit
 from agno.utils.log import log_debug, logger
+from agno.utils.query_result import QueryResultPager, iter_batches
 
 try:
     from sqlalchemy import Engine, create_engine
@@ -28,6 +29,7 @@ class SQLTools(Toolkit):
         list_tables: bool = True,
         describe_table: bool = True,
         run_sql_query: bool = True,
+        result_pager: Optional[QueryResultPager] = None,
         **kwargs,
     ):
         # Get the database engine
@@ -52,6 +54,9 @@ class SQLTools(Toolkit):
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
 
+        # Bounds the size of query results and keeps truncated results open for paging
+        self.result_pager: QueryResultPager = result_pager or QueryResultPager(output_format="json")
+
         tools: List[Any] = []
         if list_tables:
             tools.append(self.list_tables)
@@ -59,6 +64,7 @@ class SQLTools(Toolkit):
             tools.append(self.describe_table)
         if run_sql_query:
             tools.append(self.run_sql_query)
+            tools.append(self.get_next_result_page)
 
         super().__init__(name="sql_tools", tools=tools, **kwargs)
 
@@ -113,19 +119,58 @@ class SQLTools(Toolkit):
 
         Args:
             query (str): The query to run.
-            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show all results.
+            limit (int, optional): The number of rows to return. Defaults to 10. Use `None` to show as many rows as fit in one page.
         Returns:
             str: Result of the SQL query.
         Notes:
             - The result may be empty if the query does not return any data.
+            - If the result is truncated, use `get_next_result_page` with the returned handle to see more rows.
         """
 
         try:
-            return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            log_debug(f"Running sql |\n{query}")
+            sess = self.Session()
+            try:
+                sess.begin()
+                # Stream the rows with a server side cursor where the dialect supports one
+                result = sess.connection().execute(text(query).execution_options(stream_results=True))
+                if not result.returns_rows:
+                    sess.commit()
+                    sess.close()
+                    return "[]"
+
+                def close() -> None:
+                    sess.commit()
+                    sess.close()
+
+                batch_size = min(limit, 1000) if limit else 1000
+                # A few more pages of a truncated result are read right away, so the session does not hold a pooled
+                # connection until the result is paged through or evicted
+                return self.result_pager.render(
+                    list(result.keys()),
+                    iter_batches(lambda: result.fetchmany(batch_size)),
+                    close=close,
+                    max_rows=limit,
+                    keep_open=False,
+                )
+            except Exception:
+                sess.close()
+                raise
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error running query: {e}"
 
+    def get_next_result_page(self, handle: str) -> str:
+        """Use this function to get the next rows of a query result that was too large to return at once.
+
+        Args:
+            handle (str): The handle of the truncated result.
+
+        Returns:
+            str: The next rows of the result.
+        """
+        return self.result_pager.next_page(handle)
+
     def run_sql(self, sql: str, limit: Optional[int] = None) -> List[dict]:
         """Internal function to run a sql query.
 
@@ -1,6 +1,7 @@
 from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional
 
+from agno.tools.cache import ToolResultCache
 from agno.tools.function import Function
 from agno.utils.log import log_debug, log_warning, logger
 
@@ -18,9 +19,11 @@ class Toolkit:
         external_execution_required_tools: Optional[list[str]] = None,
         stop_after_tool_call_tools: Optional[List[str]] = None,
         show_result_tools: Optional[List[str]] = None,
+        parallel_safe_tools: Optional[List[str]] = None,
         cache_results: bool = False,
         cache_ttl: int = 3600,
         cache_dir: Optional[str] = None,
+        cache_backend: Optional[ToolResultCache] = None,
         auto_register: bool = True,
     ):
         """Initialize a new Toolkit.
@@ -37,9 +40,12 @@ class Toolkit:
             cache_results (bool): Enable in-memory caching of function results.
             cache_ttl (int): Time-to-live for cached results in seconds.
             cache_dir (Optional[str]): Directory to store cache files. Defaults to system temp dir.
+            cache_backend (Optional[ToolResultCache]): Store for cached results, e.g. a SqliteToolResultCache or
+                RedisToolResultCache shared by many workers. Defaults to an in-memory cache, or to files in cache_dir.
             auto_register (bool): Whether to automatically register all methods in the class.
             stop_after_tool_call_tools (Optional[List[str]]): List of function names that should stop the agent after execution.
             show_result_tools (Optional[List[str]]): List of function names whose results should be shown.
+            parallel_safe_tools (Optional[List[str]]): List of function names that can run in parallel with other calls.
         """
         self.name: str = name
         self.tools: List[Callable] = tools
@@ -52,6 +58,7 @@ class Toolkit:
 
         self.stop_after_tool_call_tools: list[str] = stop_after_tool_call_tools or []
         self.show_result_tools: list[str] = show_result_tools or []
+        self.parallel_safe_tools: list[str] = parallel_safe_tools or []
 
         self._check_tools_filters(
             available_tools=[tool.__name__ for tool in tools], include_tools=include_tools, exclude_tools=exclude_tools
@@ -63,6 +70,7 @@ class Toolkit:
         self.cache_results: bool = cache_results
         self.cache_ttl: int = cache_ttl
         self.cache_dir: Optional[str] = cache_dir
+        self.cache_backend: Optional[ToolResultCache] = cache_backend
 
         # Automatically register all methods if auto_register is True
         if auto_register and self.tools:
@@ -128,10 +136,12 @@ class Toolkit:
                 cache_results=self.cache_results,
                 cache_dir=self.cache_dir,
                 cache_ttl=self.cache_ttl,
+                cache_backend=self.cache_backend,
                 requires_confirmation=tool_name in self.requires_confirmation_tools,
                 external_execution=tool_name in self.external_execution_required_tools,
                 stop_after_tool_call=tool_name in self.stop_after_tool_call_tools,
                 show_result=tool_name in self.show_result_tools,
+                parallel_safe=tool_name in self.parallel_safe_tools,
             )
             self.functions[f.name] = f
             log_debug(f"Function: {f.name} registered with {self.name}")
@@ -139,8 +149,29 @@ class Toolkit:
             logger.warning(f"Failed to create Function for: {function.__name__}")
             raise e
 
+    def copy_for_run(self) -> "Toolkit":
+        """Copy the toolkit for an agent or team run, see Agent.copy_for_run.
+
+        The functions are copied, as the agent or team running them is set on them. The toolkit itself, e.g. its
+        clients, stays shared with the copy.
+        """
+        from copy import copy
+
+        new_toolkit = copy(self)
+        new_toolkit.functions = OrderedDict((name, f.model_copy()) for name, f in self.functions.items())
+        return new_toolkit
+
     def __repr__(self):
         return f"<{self.__class__.__name__} name={self.name} functions={list(self.functions.keys())}>"
 
     def __str__(self):
         return self.__repr__()
+
+
+def copy_tool_for_run(tool: Any) -> Any:
+    """Copy a tool of an agent or team for a run, see Agent.copy_for_run"""
+    if isinstance(tool, Toolkit):
+        return tool.copy_for_run()
+    if isinstance(tool, Function):
+        return tool.model_copy()
+    return tool
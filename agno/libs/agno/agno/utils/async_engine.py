@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from typing import Any, Dict, Optional
+
+from agno.utils.log import log_debug, log_warning
+from agno.utils.shared import SharedOnCopy
+
+try:
+    from sqlalchemy.engine import URL, make_url
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+except ImportError:
+    # sqlalchemy[asyncio] is optional, without it the async methods run the sync methods in a thread
+    AsyncEngine = AsyncSession = async_sessionmaker = create_async_engine = None  # type: ignore
+
+
+def asyncpg_url(url: "URL") -> Optional[str]:
+    """Get the asyncpg url for the database of a sync postgresql url, or None if there is none.
+
+    The query parameters of the url are passed to asyncpg as connect arguments, so `sslmode` is translated to
+    `ssl` and a url with other libpq parameters, e.g. `connect_timeout`, gets no asyncpg url.
+    """
+    if url.get_backend_name() != "postgresql":
+        return None
+    query: Dict[str, Any] = dict(url.query)
+    sslmode = query.pop("sslmode", None)
+    if query:
+        log_debug(f"No asyncpg url for the parameters {sorted(query)}, set async_db_url to use asyncpg")
+        return None
+    if sslmode is not None:
+        url = url.difference_update_query(["sslmode"]).update_query_dict({"ssl": sslmode})
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+def dispose_async_engine(engine: "AsyncEngine", loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Release the connection pool of an async engine created on another event loop"""
+    if loop is not None and loop.is_running():
+        # Close the connections on the event loop they belong to
+        asyncio.run_coroutine_threadsafe(engine.dispose(), loop)
+    else:
+        # Connections can not be closed without their event loop, so only drop the pool
+        engine.sync_engine.dispose(close=False)
+
+
+class LoopAsyncEngine(SharedOnCopy):
+    """The async engine of a storage or vector db, for the running event loop.
+
+    Connections of async drivers like asyncpg and aiosqlite can't be shared between event loops, so an engine created
+    from the url is recreated when the running event loop changes, and the pool of the previous engine is released.
+    An engine passed in is used as is. Copies of the owner share the engine.
+
+    Args:
+        url: The async database url to create the engine from.
+        engine: The async engine to use instead of creating one from the url.
+    """
+
+    def __init__(self, url: Optional[str] = None, engine: Optional["AsyncEngine"] = None):
+        self.url: Optional[str] = None if engine is not None else url
+        self.engine: Optional[AsyncEngine] = engine
+        self.session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def get_session_factory(self) -> Optional["async_sessionmaker[AsyncSession]"]:
+        """Get the async session factory, or None if the async methods should run the sync methods in a thread"""
+        if create_async_engine is None:
+            return None
+        with self._lock:
+            if self.url is not None:
+                loop = asyncio.get_running_loop()
+                if self.engine is None or self._loop is not loop:
+                    previous_engine, previous_loop = self.engine, self._loop
+                    try:
+                        self.engine = create_async_engine(make_url(self.url))
+                    except ImportError as e:
+                        log_debug(f"{e}, the async methods will run the sync methods in a thread")
+                        self.url = None
+                        return None
+                    self._loop = loop
+                    self.session_factory = None
+                    if previous_engine is not None:
+                        dispose_async_engine(previous_engine, previous_loop)
+            if self.engine is None:
+                return None
+            if self.session_factory is None:
+                self.session_factory = async_sessionmaker(bind=self.engine)
+            return self.session_factory
+
+    async def open_session(self) -> Optional["AsyncSession"]:
+        """Open an async session with a connection, or return None if the async methods should run the sync
+        methods in a thread, e.g. because the async driver can't connect with the parameters of the url.
+        """
+        session_factory = self.get_session_factory()
+        if session_factory is None:
+            return None
+        sess = session_factory()
+        try:
+            await sess.connection()
+        except Exception as e:
+            await sess.close()
+            log_warning(f"Could not connect with the async engine, running the sync methods in a thread: {e}")
+            return None
+        return sess
@@ -0,0 +1,204 @@
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, List, Literal, Optional, Sequence
+from uuid import uuid4
+
+from agno.utils.log import log_debug
+
+# Rough number of characters per token, used to turn a token budget into a size budget
+CHARS_PER_TOKEN = 4
+# Number of rows buffered for a result that is not kept open, when it has no row budget
+MAX_BUFFERED_ROWS = 2_000
+
+
+def iter_batches(fetch_batch: Callable[[], Optional[Sequence[Any]]]) -> Iterator[Any]:
+    """Yields rows from a `fetchmany` style callable until it returns no rows"""
+    while True:
+        batch = fetch_batch()
+        if not batch:
+            return
+        yield from batch
+
+
+@dataclass
+class OpenQueryResult:
+    """A truncated query result that can be paged through"""
+
+    columns: List[str]
+    rows: Iterator[Sequence[Any]]
+    close: Optional[Callable[[], None]]
+    # Maximum number of rows in a page of this result
+    max_rows: Optional[int] = None
+    # Number of rows already returned
+    offset: int = 0
+    # True if the rows after the buffered ones were dropped
+    cut_off: bool = False
+
+
+class QueryResultPager:
+    """Renders query results within row and size budgets, streaming rows instead of fetching them all.
+
+    When a result does not fit, the rendered rows are followed by a note with a handle, and the rest of the result
+    is kept open so the next page can be read with `next_page`. The oldest open results are closed first.
+
+    Args:
+        max_rows: Maximum number of rows in a page.
+        max_chars: Maximum number of characters in a page.
+        max_tokens: Maximum number of tokens in a page, estimated from the number of characters.
+        max_open_results: Maximum number of truncated results kept open for paging.
+        max_buffered_pages: Maximum number of pages buffered for a truncated result that is not kept open. The rows
+            after them are dropped and the last page says so.
+        output_format: "csv" renders a header line and comma separated rows, "json" renders a list of objects.
+    """
+
+    def __init__(
+        self,
+        max_rows: Optional[int] = 500,
+        max_chars: Optional[int] = 20_000,
+        max_tokens: Optional[int] = None,
+        max_open_results: int = 4,
+        max_buffered_pages: int = 4,
+        output_format: Literal["csv", "json"] = "csv",
+    ):
+        self.max_rows: Optional[int] = max_rows
+        self.max_chars: Optional[int] = max_chars
+        self.max_tokens: Optional[int] = max_tokens
+        self.max_open_results: int = max_open_results
+        self.max_buffered_pages: int = max_buffered_pages
+        self.output_format: Literal["csv", "json"] = output_format
+        self._open_results: "OrderedDict[str, OpenQueryResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def char_budget(self) -> Optional[int]:
+        budgets = [self.max_chars, self.max_tokens * CHARS_PER_TOKEN if self.max_tokens is not None else None]
+        limits = [budget for budget in budgets if budget is not None]
+        return min(limits) if limits else None
+
+    def render(
+        self,
+        columns: List[str],
+        rows: Iterable[Sequence[Any]],
+        close: Optional[Callable[[], None]] = None,
+        max_rows: Optional[int] = None,
+        keep_open: bool = True,
+    ) -> str:
+        """Render the first page of a query result.
+
+        Args:
+            columns: The column names.
+            rows: The rows, read lazily. Only the rows of the first page and one more are consumed.
+            close: Called once the result is fully read or evicted, e.g. to close a cursor.
+            max_rows: Maximum number of rows for this result, capped by the pager's max_rows.
+            keep_open: If False, up to `max_buffered_pages` more pages of a truncated result are read into memory and
+                the result is closed right away, e.g. to return a pooled connection instead of holding it until the
+                result is evicted.
+
+        Returns:
+            str: The rendered rows, followed by a paging note if the result was truncated.
+        """
+        result = OpenQueryResult(columns=list(columns), rows=iter(rows), close=close, max_rows=max_rows)
+        output = self._render_page(result)
+        if not keep_open and result.close is not None:
+            # Still open, so the result was truncated
+            row_budget = self._row_budget(result)
+            max_buffered_rows = row_budget * self.max_buffered_pages if row_budget is not None else MAX_BUFFERED_ROWS
+            buffered = list(islice(result.rows, max_buffered_rows + 1))
+            result.cut_off = len(buffered) > max_buffered_rows
+            result.rows = iter(buffered[:max_buffered_rows])
+            self._close(result)
+        return output
+
+    def next_page(self, handle: str) -> str:
+        """Render the next page of a truncated result"""
+        with self._lock:
+            result = self._open_results.pop(handle, None)
+        if result is None:
+            return f"No open result with handle {handle}, please run the query again."
+        return self._render_page(result)
+
+    def close(self) -> None:
+        """Close all open results"""
+        with self._lock:
+            results = list(self._open_results.values())
+            self._open_results.clear()
+        for result in results:
+            self._close(result)
+
+    def _row_budget(self, result: OpenQueryResult) -> Optional[int]:
+        row_limits = [limit for limit in (result.max_rows, self.max_rows) if limit is not None]
+        return min(row_limits) if row_limits else None
+
+    def _render_page(self, result: OpenQueryResult) -> str:
+        row_budget = self._row_budget(result)
+        char_budget = self.char_budget
+
+        rendered: List[str] = []
+        size = sum(len(column) + 1 for column in result.columns)
+        truncated = False
+        for row in result.rows:
+            line = self._render_row(result.columns, row)
+            if (row_budget is not None and len(rendered) >= row_budget) or (
+                char_budget is not None and rendered and size + len(line) + 1 > char_budget
+            ):
+                # Put the row back for the next page
+                result.rows = chain([row], result.rows)
+                truncated = True
+                break
+            if char_budget is not None and len(line) > char_budget:
+                line = line[:char_budget] + "..."
+            rendered.append(line)
+            size += len(line) + 1
+
+        first_row = result.offset + 1
+        result.offset += len(rendered)
+        output = self._join(result.columns, rendered)
+        if not truncated:
+            self._close(result)
+            if result.cut_off:
+                return (
+                    f"{output}\n... Showing rows {first_row}-{result.offset}. The rest of the result was not kept, "
+                    "refine the query to see more rows."
+                )
+            return output
+
+        handle = uuid4().hex[:8]
+        self._keep_open(handle, result)
+        log_debug(f"Query result truncated after row {result.offset}, handle {handle}")
+        return (
+            f"{output}\n... Showing rows {first_row}-{result.offset}. More rows are available, "
+            f"call get_next_result_page with handle {handle} to see them."
+        )
+
+    def _render_row(self, columns: List[str], row: Sequence[Any]) -> str:
+        if self.output_format == "json":
+            return json.dumps(dict(zip(columns, row)), default=str)
+        if len(row) == 1:
+            return str(row[0])
+        return ",".join(str(x) for x in row)
+
+    def _join(self, columns: List[str], rendered: List[str]) -> str:
+        if self.output_format == "json":
+            return "[" + ", ".join(rendered) + "]"
+        return ",".join(columns) + "\n" + "\n".join(rendered)
+
+    def _keep_open(self, handle: str, result: OpenQueryResult) -> None:
+        evicted: List[OpenQueryResult] = []
+        with self._lock:
+            self._open_results[handle] = result
+            while len(self._open_results) > self.max_open_results:
+                evicted.append(self._open_results.popitem(last=False)[1])
+        for old_result in evicted:
+            self._close(old_result)
+
+    @staticmethod
+    def _close(result: OpenQueryResult) -> None:
+        if result.close is not None:
+            try:
+                result.close()
+            except Exception as e:
+                log_debug(f"Could not close query result: {e}")
+            result.close = None
@@ -0,0 +1,87 @@
+import json
+import re
+from dataclasses import asdict, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, json is used when it is not installed
+    orjson = None  # type: ignore
+
+
+_NON_ASCII_PATTERN = re.compile(r"[^\x00-\x7f]")
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    # Same escapes as json.dumps with ensure_ascii, characters outside the BMP become surrogate pairs
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u{0:04x}\\u{1:04x}".format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u{0:04x}".format(code)
+
+
+def _to_plain(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, list):
+        return [_to_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_to_plain(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _to_plain(v) for k, v in value.items()}
+    return value
+
+
+def dataclass_to_dict(obj: Any, exclude: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+    """Get the fields of a dataclass that are not None, without the deep copies made by `dataclasses.asdict`.
+
+    Nested dataclasses are converted to dicts and lists and dicts are copied, like asdict does. Other values, e.g.
+    pydantic models, are not copied.
+
+    Args:
+        obj: The dataclass instance.
+        exclude: Names of the fields to leave out, e.g. because the caller serializes them itself.
+
+    Returns:
+        Dict[str, Any]: The fields that are not None and not excluded.
+    """
+    _dict = {}
+    for name in _field_names(obj.__class__):
+        if name in exclude:
+            continue
+        value = getattr(obj, name)
+        if value is not None:
+            _dict[name] = _to_plain(value)
+    return _dict
+
+
+def json_dumps(data: Any, indent: Optional[int] = None) -> str:
+    """Serialize data to JSON, with orjson when it is installed.
+
+    Args:
+        data: The data to serialize.
+        indent: None for compact JSON, or the number of spaces to indent with.
+
+    Returns:
+        str: The JSON string.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        try:
+            dumped = orjson.dumps(data, option=option).decode("utf-8")
+            # orjson writes non-ASCII characters as is, escape them so the output matches json.dumps
+            return dumped if dumped.isascii() else _NON_ASCII_PATTERN.sub(_escape_non_ascii, dumped)
+        except TypeError:
+            # e.g. integers over 64 bits, json handles these
+            pass
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=indent)
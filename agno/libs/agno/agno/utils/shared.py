@@ -0,0 +1,7 @@
+class SharedOnCopy:
+    """Mixin for objects that are shared by the copies of their owner, e.g. caches and stores holding locks,
+    connections or memory maps that can't be copied. A deep copy returns the object itself.
+    """
+
+    def __deepcopy__(self, memo):
+        return self
@@ -1,5 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from agno.document import Document
 
@@ -34,6 +35,15 @@ class VectorDb(ABC):
     def id_exists(self, id: str) -> bool:
         raise NotImplementedError
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the subset of the given content hashes (see `Document.content_hash`) already stored in the vector db.
+        Vector dbs that can look up many hashes in a single query should override this.
+        """
+        raise NotImplementedError
+
+    async def async_existing_hashes(self, hashes: List[str]) -> Set[str]:
+        return await asyncio.to_thread(self.existing_hashes, hashes)
+
     @abstractmethod
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         raise NotImplementedError
@@ -63,6 +73,21 @@ class VectorDb(ABC):
     ) -> List[Document]:
         raise NotImplementedError
 
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search for several queries at once, returning the results for each query in the order given.
+        Vector dbs that can embed the queries in one batch or search for them in a single query should override this.
+        """
+        return [self.search(query=query, limit=limit, filters=filters) for query in queries]
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        return list(
+            await asyncio.gather(*[self.async_search(query=query, limit=limit, filters=filters) for query in queries])
+        )
+
     def vector_search(self, query: str, limit: int = 5) -> List[Document]:
         raise NotImplementedError
 
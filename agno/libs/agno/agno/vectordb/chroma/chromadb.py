@@ -1,6 +1,6 @@
 import asyncio
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -18,6 +18,7 @@ from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.search import SearchProjection
 
 
 class ChromaDb(VectorDb):
@@ -29,6 +30,7 @@ class ChromaDb(VectorDb):
         path: str = "tmp/chromadb",
         persistent_client: bool = False,
         reranker: Optional[Reranker] = None,
+        search_projection: Optional[SearchProjection] = None,
         **kwargs,
     ):
         # Collection attributes
@@ -57,6 +59,9 @@ class ChromaDb(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Embeddings are only returned with search results when requested
+        self.search_projection: SearchProjection = search_projection or SearchProjection()
+
         # Chroma client kwargs
         self.kwargs = kwargs
 
@@ -117,6 +122,25 @@ class ChromaDb(VectorDb):
         """Check if a document exists asynchronously."""
         return await asyncio.to_thread(self.doc_exists, document)
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection, using a single lookup by id.
+        Args:
+            hashes (List[str]): Content hashes to check.
+        Returns:
+            Set[str]: The subset of hashes that exist in the collection.
+        """
+        if not hashes or not self.client:
+            return set()
+
+        try:
+            collection: Collection = self.client.get_collection(name=self.collection_name)
+            # Documents are stored with their content hash as id
+            result: GetResult = collection.get(ids=list(hashes), include=[])
+            return set(result.get("ids", []))
+        except Exception as e:
+            logger.error(f"Error checking for existing content hashes: {e}")
+            return set()
+
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
         Args:
@@ -153,8 +177,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
 
@@ -200,8 +225,9 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection_name)
 
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -251,7 +277,7 @@ class ChromaDb(VectorDb):
             query_embeddings=query_embedding,
             n_results=limit,
             where=where_filter,  # Add where filter
-            include=["metadatas", "documents", "embeddings", "distances", "uris"],
+            include=self._search_include(),
         )
 
         # Build search results
@@ -260,8 +286,9 @@ class ChromaDb(VectorDb):
         ids = result.get("ids", [[]])[0]
         metadata = result.get("metadatas", [{}])[0]
         documents = result.get("documents", [[]])[0]
-        embeddings = result.get("embeddings")[0]
-        embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in embeddings]
+        embeddings: List[Any] = [None] * len(ids)
+        if self.search_projection.embedding:
+            embeddings = [e.tolist() if hasattr(e, "tolist") else e for e in result.get("embeddings")[0]]
         distances = result.get("distances", [[]])[0]
 
         for idx, distance in enumerate(distances):
@@ -286,6 +313,13 @@ class ChromaDb(VectorDb):
         log_info(f"Found {len(search_results)} documents")
         return search_results
 
+    def _search_include(self) -> List[Any]:
+        """Fields returned by search queries, embeddings are only included when requested."""
+        include: List[Any] = ["metadatas", "documents", "distances", "uris"]
+        if self.search_projection.embedding:
+            include.append("embeddings")
+        return include
+
     def _convert_filters(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Convert simple filters to ChromaDB's filter format.
 
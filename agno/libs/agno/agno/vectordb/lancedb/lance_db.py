@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     import lancedb
@@ -204,6 +204,35 @@ class LanceDb(VectorDb):
             self.table = self.connection.open_table(name=self.table_name)
         return self.doc_exists(document)
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        if not hashes or self.table is None:
+            return set()
+        # A missing table means none of the docs exist; any other failure is a real error
+        if not self.exists():
+            return set()
+        # Content hashes are hex digests, so they can be safely inlined in the filter
+        hash_list = ", ".join(f"'{content_hash}'" for content_hash in hashes if content_hash.isalnum())
+        if not hash_list:
+            return set()
+        try:
+            result = (
+                self.table.search()
+                .where(f"{self._id} IN ({hash_list})")
+                .select([self._id])
+                .limit(len(hashes))
+                .to_arrow()
+            )
+        except Exception as e:
+            logger.error(f"Error checking existing content hashes in table {self.table_name}: {e}")
+            raise
+        return set(result.column(self._id).to_pylist())
+
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
         Insert documents into the database.
@@ -219,17 +248,17 @@ class LanceDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         data = []
 
+        existing = self.existing_hashes([document.content_hash for document in documents])
+        documents = [document for document in documents if document.content_hash not in existing]
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
-            if self.doc_exists(document):
-                continue
-
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -278,17 +307,20 @@ class LanceDb(VectorDb):
         data = []
 
         # Prepare documents for insertion
+        if self.connection and self.exists():
+            # Reopen the table to see the rows added through the async connection
+            self.table = self.connection.open_table(name=self.table_name)
+        existing = await self.async_existing_hashes([document.content_hash for document in documents])
+        documents = [document for document in documents if document.content_hash not in existing]
+        if await Document.async_embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
-            if await self.async_doc_exists(document):
-                continue
-
             # Add filters to document metadata if provided
             if filters:
                 meta_data = document.meta_data.copy() if document.meta_data else {}
                 meta_data.update(filters)
                 document.meta_data = meta_data
 
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
             payload = {
@@ -448,7 +480,7 @@ class LanceDb(VectorDb):
             search_results = filtered_results
 
         if self.reranker and search_results:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
+            search_results = await self.reranker.arerank(query=query, documents=search_results)
 
         log_info(f"Found {len(search_results)} documents")
         return search_results
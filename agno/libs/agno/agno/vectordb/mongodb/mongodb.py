@@ -9,7 +9,7 @@ from agno.embedder import Embedder
 from agno.utils.log import log_debug, log_info, log_warning, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import SearchProjection, SearchType
 
 try:
     from hashlib import md5
@@ -49,6 +49,7 @@ class MongoDb(VectorDb):
         hybrid_vector_weight: float = 0.5,
         hybrid_keyword_weight: float = 0.5,
         hybrid_rank_constant: int = 60,
+        search_projection: Optional[SearchProjection] = None,
         **kwargs,
     ):
         """
@@ -72,6 +73,7 @@ class MongoDb(VectorDb):
             hybrid_vector_weight (float): Default weight for vector search results in hybrid search.
             hybrid_keyword_weight (float): Default weight for keyword search results in hybrid search.
             hybrid_rank_constant (int): Default rank constant (k) for Reciprocal Rank Fusion in hybrid search. This constant is added to the rank before taking the reciprocal, helping to smooth scores. A common value is 60.
+            search_projection (Optional[SearchProjection]): Optional fields returned with vector search results. Embeddings and usage are not returned by default.
             **kwargs: Additional arguments for MongoClient.
         """
         if not collection_name:
@@ -86,6 +88,7 @@ class MongoDb(VectorDb):
         self.hybrid_vector_weight = hybrid_vector_weight
         self.hybrid_keyword_weight = hybrid_keyword_weight
         self.hybrid_rank_constant = hybrid_rank_constant
+        self.search_projection = search_projection or SearchProjection()
 
         if embedder is None:
             from agno.embedder.openai import OpenAIEmbedder
@@ -490,6 +493,8 @@ class MongoDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents")
         collection = self._get_collection()
 
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         prepared_docs = []
         for document in documents:
             try:
@@ -514,6 +519,8 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents")
         collection = self._get_collection()
 
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -530,6 +537,15 @@ class MongoDb(VectorDb):
         """Indicate that upsert functionality is available."""
         return True
 
+    def _search_projection_fields(self) -> Dict[str, Any]:
+        """Fields returned by vector searches, including the embedding and usage only when requested."""
+        fields: Dict[str, Any] = {"_id": 1, "name": 1, "content": 1, "meta_data": 1, "score": 1}
+        if self.search_projection.embedding:
+            fields["embedding"] = 1
+        if self.search_projection.usage:
+            fields["usage"] = 1
+        return fields
+
     def search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, min_score: float = 0.0
     ) -> List[Document]:
@@ -559,11 +575,8 @@ class MongoDb(VectorDb):
                     search_stage,
                     {
                         "$project": {
+                            **self._search_projection_fields(),
                             "similarityScore": {"$meta": "searchScore"},
-                            "_id": 1,
-                            "name": 1,
-                            "content": 1,
-                            "meta_data": 1,
                         }
                     },
                 ]
@@ -575,6 +588,8 @@ class MongoDb(VectorDb):
                         name=doc.get("name"),
                         content=doc["content"],
                         meta_data={**doc.get("meta_data", {}), "score": doc.get("similarityScore", 0.0)},
+                        embedding=doc.get("embedding"),
+                        usage=doc.get("usage"),
                     )
                     for doc in results
                 ]
@@ -622,7 +637,7 @@ class MongoDb(VectorDb):
                 if match_filters:
                     pipeline.append({"$match": match_filters})  # type: ignore
 
-                pipeline.append({"$project": {"embedding": 0}})
+                pipeline.append({"$project": self._search_projection_fields()})
 
                 results = list(collection.aggregate(pipeline))  # type: ignore
 
@@ -635,6 +650,8 @@ class MongoDb(VectorDb):
                         name=clean_doc.get("name"),
                         content=clean_doc["content"],
                         meta_data={**clean_doc.get("meta_data", {}), "score": clean_doc.get("score", 0.0)},
+                        embedding=clean_doc.get("embedding"),
+                        usage=clean_doc.get("usage"),
                     )
                     docs.append(document)
 
@@ -915,8 +932,11 @@ class MongoDb(VectorDb):
         return True
 
     def prepare_doc(self, document: Document, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        """Prepare a document for insertion or upsertion into MongoDB.
+        Documents that were already embedded, e.g. as part of a batch, are not embedded again.
+        """
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
@@ -967,6 +987,8 @@ class MongoDb(VectorDb):
         log_debug(f"Inserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        if await Document.async_embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         prepared_docs = []
         for document in documents:
             try:
@@ -991,6 +1013,8 @@ class MongoDb(VectorDb):
         log_info(f"Upserting {len(documents)} documents asynchronously")
         collection = await self._get_async_collection()
 
+        if await Document.async_embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -1040,7 +1064,7 @@ class MongoDb(VectorDb):
 
                 pipeline.append({"$match": mongo_filters})
 
-            pipeline.append({"$project": {"embedding": 0}})
+            pipeline.append({"$project": self._search_projection_fields()})
 
             # With AsyncMongoClient, aggregate() returns a coroutine that resolves to a cursor
             # We need to await it first to get the cursor
@@ -1059,6 +1083,8 @@ class MongoDb(VectorDb):
                     name=doc.get("name"),
                     content=doc["content"],
                     meta_data={**doc.get("meta_data", {}), "score": doc.get("score", 0.0)},
+                    embedding=doc.get("embedding"),
+                    usage=doc.get("usage"),
                 )
                 for doc in results
             ]
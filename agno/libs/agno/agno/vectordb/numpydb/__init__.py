@@ -0,0 +1,9 @@
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.index import HNSW
+from agno.vectordb.numpydb.numpydb import NumpyDb
+
+__all__ = [
+    "Distance",
+    "HNSW",
+    "NumpyDb",
+]
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+
+class HNSW(BaseModel):
+    """Approximate nearest neighbour index for NumpyDb, built with `hnswlib`.
+
+    The index is only used once the collection holds at least `min_rows` documents.
+    Smaller collections and filtered searches are scanned exactly.
+    """
+
+    m: int = 16
+    ef_construction: int = 200
+    ef_search: int = 64
+    min_rows: int = 10_000
@@ -0,0 +1,578 @@
+import asyncio
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    raise ImportError("`numpy` not installed. Please install using `pip install numpy`")
+
+from agno.document import Document
+from agno.embedder import Embedder
+from agno.reranker.base import Reranker
+from agno.utils.log import log_debug, log_info, logger
+from agno.utils.shared import SharedOnCopy
+from agno.vectordb.base import VectorDb
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb.index import HNSW
+from agno.vectordb.search import SearchProjection
+
+
+class NumpyDb(SharedOnCopy, VectorDb):
+    """
+    In-process vector db backed by a contiguous float32 matrix of embeddings.
+
+    Searches compute the distance to every stored embedding with a single matrix-vector product and select
+    the top-k with `argpartition`. When a `path` is set, the matrix is memory-mapped from a `.npy` file and the
+    documents are appended to a `.jsonl` file next to it on every write, so a collection can be reopened without
+    re-embedding.
+    Metadata filters are resolved through an inverted index before scanning, and an optional HNSW index
+    (requires `hnswlib`) can be used for larger collections.
+    """
+
+    def __init__(
+        self,
+        collection: str = "documents",
+        path: Optional[Union[str, Path]] = None,
+        embedder: Optional[Embedder] = None,
+        distance: Distance = Distance.cosine,
+        index: Optional[HNSW] = None,
+        reranker: Optional[Reranker] = None,
+        initial_capacity: int = 1024,
+        search_projection: Optional[SearchProjection] = None,
+    ):
+        """
+        Initialize the NumpyDb instance.
+
+        Args:
+            collection (str): Name of the collection, used for the names of the files on disk.
+            path (Optional[Union[str, Path]]): Directory to persist the collection to. Keeps it in memory if None.
+            embedder (Optional[Embedder]): Embedder instance for creating embeddings.
+            distance (Distance): Distance metric used for search.
+            index (Optional[HNSW]): Optional approximate nearest neighbour index.
+            reranker (Optional[Reranker]): Reranker instance for reranking search results.
+            initial_capacity (int): Number of rows allocated when the collection is created.
+            search_projection (Optional[SearchProjection]): Optional fields returned with search results.
+        """
+        if not collection:
+            raise ValueError("Collection name must be provided.")
+
+        # Embedder for embedding the document contents
+        if embedder is None:
+            from agno.embedder.openai import OpenAIEmbedder
+
+            embedder = OpenAIEmbedder()
+            log_info("Embedder not provided, using OpenAIEmbedder as default.")
+        self.embedder: Embedder = embedder
+        if self.embedder.dimensions is None:
+            raise ValueError("Embedder.dimensions must be set.")
+        self.dimensions: int = self.embedder.dimensions
+
+        self.collection: str = collection
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.distance: Distance = distance
+        self.index: Optional[HNSW] = index
+        self.reranker: Optional[Reranker] = reranker
+        self.initial_capacity: int = max(initial_capacity, 1)
+        self.search_projection: SearchProjection = search_projection or SearchProjection()
+
+        if self.index is not None:
+            try:
+                import hnswlib  # noqa: F401
+            except ImportError:
+                raise ImportError("`hnswlib` not installed. Please install using `pip install hnswlib`")
+
+        self._lock = threading.RLock()
+        self._reset()
+        if self.path is not None and self._embeddings_file.exists():
+            self._load()
+
+        log_debug(f"Initialized NumpyDb with collection: '{self.collection}'")
+
+    @property
+    def _embeddings_file(self) -> Path:
+        return self.path / f"{self.collection}.npy"  # type: ignore
+
+    @property
+    def _documents_file(self) -> Path:
+        # One {"row": ..., "document": ...} line per write of a row, later lines replace earlier ones
+        return self.path / f"{self.collection}.jsonl"  # type: ignore
+
+    def _reset(self) -> None:
+        self._created: bool = False
+        self._count: int = 0
+        self._embeddings: Optional[np.ndarray] = None
+        self._norms: np.ndarray = np.zeros(0, dtype=np.float32)
+        # Row index -> stored document
+        self._records: List[Dict[str, Any]] = []
+        self._rows_by_hash: Dict[str, int] = {}
+        self._rows_by_id: Dict[str, int] = {}
+        self._rows_by_name: Dict[str, Set[int]] = {}
+        # Metadata key -> value -> rows, used to resolve filters
+        self._inverted_index: Dict[str, Dict[Hashable, Set[int]]] = {}
+        self._hnsw: Any = None
+
+    def _load(self) -> None:
+        with self._lock:
+            embeddings = np.load(self._embeddings_file, mmap_mode="r+")
+            if embeddings.shape[1] != self.dimensions:
+                raise ValueError(
+                    f"Collection '{self.collection}' has {embeddings.shape[1]} dimensions, "
+                    f"but the embedder has {self.dimensions}"
+                )
+            records_by_row: Dict[int, Dict[str, Any]] = {}
+            num_lines = 0
+            if self._documents_file.exists():
+                with open(self._documents_file, encoding="utf-8") as documents_file:
+                    for line in documents_file:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            # An interrupted write leaves a partial last line
+                            logger.warning(f"Ignoring a partially written document in {self._documents_file}")
+                            num_lines += 1
+                            break
+                        records_by_row[entry["row"]] = entry["document"]
+                        num_lines += 1
+            # New rows are appended in order, so the rows of an interrupted write are always a prefix
+            records: List[Dict[str, Any]] = []
+            while len(records) in records_by_row:
+                records.append(records_by_row[len(records)])
+
+            self._embeddings = embeddings
+            self._count = len(records)
+            self._norms = np.zeros(embeddings.shape[0], dtype=np.float32)
+            self._norms[: self._count] = np.linalg.norm(embeddings[: self._count], axis=1)
+            for row, record in enumerate(records):
+                self._records.append(record)
+                self._index_record(row, record)
+            self._created = True
+            if num_lines > self._count:
+                # Drop replaced and partially written lines
+                self._persist()
+            log_debug(f"Loaded {self._count} documents from {self._embeddings_file}")
+
+    def _document_lines(self, rows: Iterable[int]) -> str:
+        return "".join(json.dumps({"row": row, "document": self._records[row]}) + "\n" for row in rows)
+
+    def _persist(self) -> None:
+        """Rewrite the documents file with the current documents"""
+        if self.path is None or self._embeddings is None:
+            return
+        if isinstance(self._embeddings, np.memmap):
+            self._embeddings.flush()
+        # Write to a temporary file first so an interrupted write does not corrupt the collection
+        tmp_file = self._documents_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_text(self._document_lines(range(self._count)), "utf-8")
+        tmp_file.replace(self._documents_file)
+
+    def _persist_rows(self, rows: Iterable[int]) -> None:
+        """Append the documents of the written rows to the documents file, so a write costs O(rows written)"""
+        if self.path is None or self._embeddings is None:
+            return
+        if isinstance(self._embeddings, np.memmap):
+            # Embeddings reach the disk before the documents that refer to them
+            self._embeddings.flush()
+        with open(self._documents_file, "a", encoding="utf-8") as documents_file:
+            documents_file.write(self._document_lines(rows))
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.dimensions), dtype=np.float32)
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self._embeddings_file.with_suffix(".npy.tmp")
+        embeddings = np.lib.format.open_memmap(tmp_file, mode="w+", dtype=np.float32, shape=(capacity, self.dimensions))
+        if self._embeddings is not None and self._count > 0:
+            embeddings[: self._count] = self._embeddings[: self._count]
+        embeddings.flush()
+        del embeddings
+        # Release the current mapping before replacing the file it maps
+        self._embeddings = None
+        os.replace(tmp_file, self._embeddings_file)
+        return np.load(self._embeddings_file, mmap_mode="r+")
+
+    def _ensure_capacity(self, rows: int) -> None:
+        capacity = 0 if self._embeddings is None else self._embeddings.shape[0]
+        if rows <= capacity:
+            return
+
+        new_capacity = max(rows, capacity * 2, self.initial_capacity)
+        log_debug(f"Growing collection '{self.collection}' to {new_capacity} rows")
+        previous = self._embeddings
+        embeddings = self._allocate(new_capacity)
+        if self.path is None and previous is not None:
+            embeddings[: self._count] = previous[: self._count]
+        self._embeddings = embeddings
+
+        norms = np.zeros(new_capacity, dtype=np.float32)
+        norms[: self._count] = self._norms[: self._count]
+        self._norms = norms
+
+        if self._hnsw is not None:
+            self._hnsw.resize_index(new_capacity)
+
+    @staticmethod
+    def _filter_values(value: Any) -> Iterable[Hashable]:
+        # Lists are indexed by element, so a filter matches documents whose list contains the value
+        values = value if isinstance(value, list) else [value]
+        for item in values:
+            yield json.dumps(item, sort_keys=True, default=str)
+
+    def _index_record(self, row: int, record: Dict[str, Any]) -> None:
+        self._rows_by_hash[record["content_hash"]] = row
+        if record.get("id"):
+            self._rows_by_id[record["id"]] = row
+        if record.get("name"):
+            self._rows_by_name.setdefault(record["name"], set()).add(row)
+        for key, value in (record.get("meta_data") or {}).items():
+            key_index = self._inverted_index.setdefault(key, {})
+            for filter_value in self._filter_values(value):
+                key_index.setdefault(filter_value, set()).add(row)
+
+    def _unindex_record(self, row: int, record: Dict[str, Any]) -> None:
+        if record.get("id") and self._rows_by_id.get(record["id"]) == row:
+            del self._rows_by_id[record["id"]]
+        if record.get("name"):
+            self._rows_by_name.get(record["name"], set()).discard(row)
+        for key, value in (record.get("meta_data") or {}).items():
+            for filter_value in self._filter_values(value):
+                self._inverted_index.get(key, {}).get(filter_value, set()).discard(row)
+
+    def create(self) -> None:
+        """Create the collection if it does not exist."""
+        with self._lock:
+            if self._created:
+                return
+            log_debug(f"Creating collection: {self.collection}")
+            self._ensure_capacity(self.initial_capacity)
+            self._created = True
+            self._persist()
+
+    async def async_create(self) -> None:
+        """Create the collection asynchronously by running in a thread."""
+        await asyncio.to_thread(self.create)
+
+    def doc_exists(self, document: Document) -> bool:
+        """
+        Check if a document with the same content hash exists in the collection.
+
+        Args:
+            document (Document): The document to check.
+
+        Returns:
+            bool: True if the document exists, False otherwise.
+        """
+        return document.content_hash in self._rows_by_hash
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        return {content_hash for content_hash in hashes if content_hash in self._rows_by_hash}
+
+    async def async_existing_hashes(self, hashes: List[str]) -> Set[str]:
+        return self.existing_hashes(hashes)
+
+    def name_exists(self, name: str) -> bool:
+        """
+        Check if a document with the given name exists in the collection.
+
+        Args:
+            name (str): The name to check.
+
+        Returns:
+            bool: True if a document with the name exists, False otherwise.
+        """
+        return bool(self._rows_by_name.get(name))
+
+    async def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def id_exists(self, id: str) -> bool:
+        return id in self._rows_by_id
+
+    def _write(self, documents: List[Document], filters: Optional[Dict[str, Any]], upsert: bool) -> None:
+        if not documents:
+            return
+        if not self._created:
+            self.create()
+
+        if Document.embed_documents(documents, embedder=self.embedder):
+            documents = [doc for doc in documents if doc.embedding]
+        with self._lock:
+            # Resolve the row of every document first, so the matrix grows at most once per batch
+            rows: List[Tuple[int, Document]] = []
+            next_row = self._count
+            pending: Dict[str, int] = {}
+            for document in documents:
+                if document.embedding is None or len(document.embedding) != self.dimensions:
+                    logger.error(f"Skipping document without a valid embedding: {document.name}")
+                    continue
+                content_hash = document.content_hash
+                row = self._rows_by_hash.get(content_hash, pending.get(content_hash))
+                if row is not None:
+                    if not upsert:
+                        continue
+                else:
+                    row = next_row
+                    pending[content_hash] = row
+                    next_row += 1
+                rows.append((row, document))
+
+            if not rows:
+                return
+            self._ensure_capacity(next_row)
+
+            row_indices = np.array([row for row, _ in rows], dtype=np.int64)
+            vectors = np.asarray([document.embedding for _, document in rows], dtype=np.float32)
+            self._embeddings[row_indices] = vectors  # type: ignore
+            self._norms[row_indices] = np.linalg.norm(vectors, axis=1)
+
+            for row, document in rows:
+                meta_data = dict(document.meta_data or {})
+                if filters:
+                    meta_data.update(filters)
+                record = {
+                    "id": document.id,
+                    "name": document.name,
+                    "content": document.content,
+                    "meta_data": meta_data,
+                    "usage": document.usage,
+                    "content_hash": document.content_hash,
+                }
+                if row < len(self._records):
+                    self._unindex_record(row, self._records[row])
+                    self._records[row] = record
+                else:
+                    self._records.append(record)
+                self._index_record(row, record)
+            self._count = next_row
+
+            if self._hnsw is not None:
+                self._hnsw.add_items(vectors, row_indices)
+            self._persist_rows(row for row, _ in rows)
+            log_debug(f"Wrote {len(rows)} documents to collection '{self.collection}'")
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the collection. Documents that already exist are skipped.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Metadata to add to each document.
+        """
+        self._write(documents, filters, upsert=False)
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.insert, documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert or update documents, replacing documents with the same content hash.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Metadata to add to each document.
+        """
+        self._write(documents, filters, upsert=True)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """Upsert documents asynchronously by running in a thread."""
+        await asyncio.to_thread(self.upsert, documents, filters)
+
+    def _candidate_rows(self, filters: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """Rows matching every filter, or None if no filters are set"""
+        if not filters:
+            return None
+
+        candidates: Optional[Set[int]] = None
+        for key, value in filters.items():
+            key_index = self._inverted_index.get(key, {})
+            for filter_value in self._filter_values(value):
+                rows = key_index.get(filter_value, set())
+                candidates = set(rows) if candidates is None else candidates & rows
+                if not candidates:
+                    return np.zeros(0, dtype=np.int64)
+        return np.fromiter(sorted(candidates or ()), dtype=np.int64)
+
+    def _scores(self, query: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Similarity of the query to the given rows (all rows if None), higher is closer"""
+        embeddings = self._embeddings[: self._count] if rows is None else self._embeddings[rows]  # type: ignore
+        dot = embeddings @ query
+        if self.distance == Distance.max_inner_product:
+            return dot
+        norms = self._norms[: self._count] if rows is None else self._norms[rows]
+        if self.distance == Distance.cosine:
+            return dot / np.maximum(norms * np.linalg.norm(query), 1e-12)
+        # Negative squared l2 distance
+        return 2 * dot - norms**2 - float(query @ query)
+
+    def _exact_search(self, query: np.ndarray, limit: int, rows: Optional[np.ndarray]) -> List[int]:
+        scores = self._scores(query, rows)
+        if len(scores) > limit:
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return (top if rows is None else rows[top]).tolist()
+
+    def _use_index(self) -> bool:
+        return self.index is not None and self._count >= self.index.min_rows
+
+    def _build_index(self) -> None:
+        import hnswlib
+
+        space = {Distance.cosine: "cosine", Distance.l2: "l2", Distance.max_inner_product: "ip"}[self.distance]
+        log_debug(f"Building HNSW index for {self._count} documents")
+        hnsw = hnswlib.Index(space=space, dim=self.dimensions)
+        hnsw.init_index(
+            max_elements=self._embeddings.shape[0],  # type: ignore
+            ef_construction=self.index.ef_construction,  # type: ignore
+            M=self.index.m,  # type: ignore
+        )
+        hnsw.add_items(self._embeddings[: self._count], np.arange(self._count))  # type: ignore
+        hnsw.set_ef(self.index.ef_search)  # type: ignore
+        self._hnsw = hnsw
+
+    def _index_search(self, query: np.ndarray, limit: int) -> List[int]:
+        if self._hnsw is None:
+            self._build_index()
+        labels, _ = self._hnsw.knn_query(query, k=min(limit, self._count))
+        return labels[0].tolist()
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        """
+        Search for documents closest to the query.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Metadata the documents must match.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        search_results = self._search_embedding(query, query_embedding, limit, filters)
+        log_info(f"Found {len(search_results)} documents")
+        return search_results
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries at once, embedding all queries in one batch.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Metadata the documents must match.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in the order of the queries.
+        """
+        if not queries:
+            return []
+        query_embeddings = self.embedder.get_embeddings_batch(queries)
+        search_results: List[List[Document]] = []
+        for query, query_embedding in zip(queries, query_embeddings):
+            if not query_embedding:
+                logger.error(f"Error getting embedding for Query: {query}")
+                search_results.append([])
+                continue
+            search_results.append(self._search_embedding(query, query_embedding, limit, filters))
+        log_info(f"Found {sum(len(documents) for documents in search_results)} documents for {len(queries)} queries")
+        return search_results
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """Search for several queries asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.search_many, queries, limit, filters)
+
+    def _search_embedding(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        with self._lock:
+            if self._count == 0 or limit <= 0:
+                return []
+            candidate_rows = self._candidate_rows(filters)
+            if candidate_rows is not None and len(candidate_rows) == 0:
+                return []
+
+            # Filtered searches scan the (smaller) set of matching rows exactly
+            if candidate_rows is None and self._use_index():
+                rows = self._index_search(query_vector, limit)
+            else:
+                rows = self._exact_search(query_vector, limit, candidate_rows)
+
+            search_results = [
+                Document(
+                    id=self._records[row]["id"],
+                    name=self._records[row]["name"],
+                    meta_data=dict(self._records[row]["meta_data"]),
+                    content=self._records[row]["content"],
+                    embedder=self.embedder,
+                    embedding=self._embeddings[row].tolist() if self.search_projection.embedding else None,  # type: ignore
+                    usage=self._records[row]["usage"] if self.search_projection.usage else None,
+                )
+                for row in rows
+            ]
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """Search asynchronously by running in a thread."""
+        return await asyncio.to_thread(self.search, query, limit, filters)
+
+    def drop(self) -> None:
+        """Drop the collection, removing its files from disk."""
+        with self._lock:
+            log_debug(f"Dropping collection: {self.collection}")
+            self._reset()
+            if self.path is not None:
+                for file in (self._embeddings_file, self._documents_file):
+                    if file.exists():
+                        file.unlink()
+
+    async def async_drop(self) -> None:
+        await asyncio.to_thread(self.drop)
+
+    def exists(self) -> bool:
+        return self._created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def get_count(self) -> int:
+        return self._count
+
+    def optimize(self) -> None:
+        """Build the HNSW index ahead of the first search."""
+        with self._lock:
+            if self.index is not None and self._count > 0 and self._hnsw is None:
+                self._build_index()
+
+    def delete(self) -> bool:
+        """Delete all documents from the collection, keeping the collection."""
+        with self._lock:
+            self.drop()
+            self.create()
+        return True
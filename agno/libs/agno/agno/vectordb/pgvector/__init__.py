@@ -1,12 +1,13 @@
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
 from agno.vectordb.pgvector.pgvector import PgVector
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import SearchProjection, SearchType
 
 __all__ = [
     "Distance",
     "HNSW",
     "Ivfflat",
     "PgVector",
+    "SearchProjection",
     "SearchType",
 ]
@@ -1,19 +1,38 @@
 import asyncio
+import io
+import json
 from hashlib import md5
 from math import sqrt
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union, cast
 
 try:
+    from sqlalchemy import cast as sa_cast
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import Engine, create_engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, scoped_session, sessionmaker
     from sqlalchemy.schema import Column, Index, MetaData, Table
-    from sqlalchemy.sql.expression import bindparam, desc, func, select, text
-    from sqlalchemy.types import DateTime, String
+    from sqlalchemy.sql.expression import (
+        Select,
+        TextClause,
+        any_,
+        bindparam,
+        column,
+        desc,
+        func,
+        select,
+        table,
+        text,
+        true,
+        values,
+    )
+    from sqlalchemy.types import DateTime, Integer, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
 try:
     from pgvector.sqlalchemy import Vector
 except ImportError:
@@ -22,11 +41,16 @@ except ImportError:
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
+from agno.utils.async_engine import LoopAsyncEngine, asyncpg_url
 from agno.utils.log import log_debug, log_info, logger
+from agno.utils.lru_cache import LRUCache
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.pgvector.index import HNSW, Ivfflat
-from agno.vectordb.search import SearchType
+from agno.vectordb.search import SearchProjection, SearchType
+
+# Columns written for each document, in the order used by COPY
+RECORD_COLUMNS = ("id", "name", "meta_data", "filters", "content", "embedding", "usage", "content_hash")
 
 
 class PgVector(VectorDb):
@@ -53,6 +77,10 @@ class PgVector(VectorDb):
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
         reranker: Optional[Reranker] = None,
+        query_embedding_cache_size: int = 128,
+        search_projection: Optional[SearchProjection] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional["AsyncEngine"] = None,
     ):
         """
         Initialize the PgVector instance.
@@ -71,6 +99,15 @@ class PgVector(VectorDb):
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
+            reranker (Optional[Reranker]): Reranker to apply to vector search results.
+            query_embedding_cache_size (int): Number of query embeddings to keep in memory. Set to 0 to disable.
+            search_projection (Optional[SearchProjection]): Optional fields to fetch with search results.
+                Embeddings and usage are not fetched by default.
+            async_db_url (Optional[str]): The asyncpg database URL used by the async methods. Defaults to the
+                database of the sync engine, if `asyncpg` is installed and the url has no libpq parameters other than
+                `sslmode`.
+            async_db_engine (Optional[AsyncEngine]): SQLAlchemy async database engine used by the async methods.
+                Pass an engine to configure the connection pool, e.g. `pool_size` for many concurrent searches.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
@@ -127,12 +164,26 @@ class PgVector(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Optional fields fetched with search results
+        self.search_projection: SearchProjection = search_projection or SearchProjection()
+
+        # In-memory cache of query embeddings, so repeated searches skip the embedder
+        self.query_embedding_cache: LRUCache[List[float]] = LRUCache(max_size=query_embedding_cache_size)
+
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async engine for the async methods, created for the running event loop on first use
+        self.async_engine: LoopAsyncEngine = LoopAsyncEngine(
+            url=async_db_url or asyncpg_url(self.db_engine.url), engine=async_db_engine
+        )
         # Database table
         self.table: Table = self.get_table()
         log_debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+    def _get_async_session(self) -> Optional["async_sessionmaker[AsyncSession]"]:
+        """Get the async session factory, or None if the async methods should run the sync methods in a thread"""
+        return self.async_engine.get_session_factory()
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -229,6 +280,29 @@ class PgVector(VectorDb):
             logger.error(f"Error checking if record exists: {e}")
             return False
 
+    async def _async_record_exists(self, column, value) -> bool:
+        """
+        Check if a record with the given column value exists in the table, on the async engine.
+
+        Args:
+            column: The column to check.
+            value: The value to search for.
+
+        Returns:
+            bool: True if the record exists, False otherwise.
+        """
+        async_session = self._get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self._record_exists, column, value)
+        try:
+            async with async_session() as sess, sess.begin():
+                stmt = select(1).where(column == value).limit(1)
+                result = (await sess.execute(stmt)).first()
+                return result is not None
+        except Exception as e:
+            logger.error(f"Error checking if record exists: {e}")
+            return False
+
     def doc_exists(self, document: Document) -> bool:
         """
         Check if a document with the same content hash exists in the table.
@@ -244,8 +318,57 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.content_hash, content_hash)
 
     async def async_doc_exists(self, document: Document) -> bool:
-        """Check if document exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.doc_exists, document)
+        """Check if a document with the same content hash exists in the table, asynchronously."""
+        if self._get_async_session() is None:
+            return await asyncio.to_thread(self.doc_exists, document)
+        content_hash = md5(self._clean_content(document.content).encode()).hexdigest()
+        return await self._async_record_exists(self.table.c.content_hash, content_hash)
+
+    def _existing_hashes_stmt(self, hashes: List[str]) -> Select:
+        # Bind the hashes as one array parameter, which avoids the limit on bound parameters
+        hashes_param = bindparam("hashes", value=list(hashes), type_=postgresql.ARRAY(String))
+        return select(self.table.c.content_hash).where(self.table.c.content_hash == any_(hashes_param))
+
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query.
+
+        Args:
+            hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of hashes that exist in the table.
+        """
+        if not hashes:
+            return set()
+        try:
+            with self.Session() as sess, sess.begin():
+                return {row[0] for row in sess.execute(self._existing_hashes_stmt(hashes))}
+        except Exception as e:
+            logger.error(f"Error checking for existing content hashes: {e}")
+            return set()
+
+    async def async_existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query on the async engine.
+
+        Args:
+            hashes (List[str]): The content hashes to check.
+
+        Returns:
+            Set[str]: The subset of hashes that exist in the table.
+        """
+        if not hashes:
+            return set()
+        async_session = self._get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self.existing_hashes, hashes)
+        try:
+            async with async_session() as sess, sess.begin():
+                return {row[0] for row in await sess.execute(self._existing_hashes_stmt(hashes))}
+        except Exception as e:
+            logger.error(f"Error checking for existing content hashes: {e}")
+            return set()
 
     def name_exists(self, name: str) -> bool:
         """
@@ -260,8 +383,10 @@ class PgVector(VectorDb):
         return self._record_exists(self.table.c.name, name)
 
     async def async_name_exists(self, name: str) -> bool:
-        """Check if name exists asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.name_exists, name)
+        """Check if a document with the given name exists in the table, asynchronously."""
+        if self._get_async_session() is None:
+            return await asyncio.to_thread(self.name_exists, name)
+        return await self._async_record_exists(self.table.c.name, name)
 
     def id_exists(self, id: str) -> bool:
         """
@@ -287,6 +412,159 @@ class PgVector(VectorDb):
         """
         return content.replace("\x00", "\ufffd")
 
+    def _get_records(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, upsert: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Prepare embedded documents as table records.
+
+        Args:
+            documents (List[Document]): The embedded documents.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            upsert (bool): Use the content hash as the id, so upserting the same content does not add duplicates.
+
+        Returns:
+            List[Dict[str, Any]]: The records of the documents with an embedding, with one key per column in
+                RECORD_COLUMNS.
+        """
+        records = []
+        for doc in documents:
+            if not doc.embedding:
+                # Documents that could not be embedded are reported by embed_documents and not written
+                continue
+            try:
+                cleaned_content = self._clean_content(doc.content)
+                content_hash = md5(cleaned_content.encode()).hexdigest()
+
+                meta_data = doc.meta_data or {}
+                if filters:
+                    meta_data.update(filters)
+
+                records.append(
+                    {
+                        "id": content_hash if upsert else doc.id or content_hash,
+                        "name": doc.name,
+                        "meta_data": doc.meta_data,
+                        "filters": filters,
+                        "content": cleaned_content,
+                        "embedding": doc.embedding,
+                        "usage": doc.usage,
+                        "content_hash": content_hash,
+                    }
+                )
+            except Exception as e:
+                logger.error(f"Error processing document '{doc.name}': {e}")
+        return records
+
+    def _on_conflict_update(self, insert_stmt: postgresql.Insert) -> postgresql.Insert:
+        """Update every record column except the id when the id already exists"""
+        return insert_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={name: insert_stmt.excluded[name] for name in RECORD_COLUMNS if name != "id"},
+        )
+
+    def _records_to_csv(self, records: List[Dict[str, Any]]) -> bytes:
+        """
+        Encode records as CSV for COPY, with the columns in the order of RECORD_COLUMNS.
+        Every value is quoted, so only the unquoted empty fields of None values are read as NULL.
+        """
+        lines = []
+        for record in records:
+            embedding = record["embedding"]
+            row = [
+                record["id"],
+                record["name"],
+                None if record["meta_data"] is None else json.dumps(record["meta_data"]),
+                None if record["filters"] is None else json.dumps(record["filters"]),
+                record["content"],
+                None if embedding is None else "[" + ",".join(str(float(x)) for x in embedding) + "]",
+                None if record["usage"] is None else json.dumps(record["usage"]),
+                record["content_hash"],
+            ]
+            lines.append(",".join("" if v is None else '"' + str(v).replace('"', '""') + '"' for v in row))
+        return "\n".join(lines).encode("utf-8")
+
+    async def _async_copy_records(self, records: List[Dict[str, Any]], upsert: bool = False) -> None:
+        """
+        Write records with COPY, in one transaction.
+
+        Inserted records are copied straight into the table. Upserted records are copied into a temporary
+        table first and merged into the table with INSERT ... ON CONFLICT, as COPY can not update rows.
+
+        Args:
+            records (List[Dict[str, Any]]): The records to write.
+            upsert (bool): Update the records whose id already exists.
+        """
+        async_session = self._get_async_session()
+        if async_session is None:
+            raise RuntimeError("The async engine is not available")
+        if upsert:
+            # Keep the last record for each id, as a row can only be updated once per statement
+            records = list({record["id"]: record for record in records}.values())
+        source = self._records_to_csv(records)
+        async with async_session() as sess, sess.begin():
+            conn = await sess.connection()
+            # COPY is not exposed by SQLAlchemy, so use the asyncpg connection of the transaction
+            asyncpg_conn = (await conn.get_raw_connection()).driver_connection
+            if asyncpg_conn is None:
+                raise RuntimeError("The asyncpg connection of the transaction is not available")
+            if not upsert:
+                await asyncpg_conn.copy_to_table(
+                    self.table_name,
+                    schema_name=self.schema,
+                    source=io.BytesIO(source),
+                    columns=list(RECORD_COLUMNS),
+                    format="csv",
+                )
+                return
+
+            staging_name = f"{self.table_name}_staging"
+            await conn.execute(
+                text(
+                    f'CREATE TEMP TABLE "{staging_name}" (LIKE {self.table.fullname} INCLUDING DEFAULTS) ON COMMIT DROP'
+                )
+            )
+            await asyncpg_conn.copy_to_table(
+                staging_name, source=io.BytesIO(source), columns=list(RECORD_COLUMNS), format="csv"
+            )
+            staging = table(staging_name, *[column(name) for name in RECORD_COLUMNS])
+            insert_stmt = postgresql.insert(self.table).from_select(list(RECORD_COLUMNS), select(*staging.c))
+            await conn.execute(self._on_conflict_update(insert_stmt))
+
+    async def _async_write_documents(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]], batch_size: int, upsert: bool
+    ) -> None:
+        """
+        Embed and write documents in batches, embedding the next batch while the current batch is copied.
+
+        Args:
+            documents (List[Document]): The documents to write.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to write in each batch.
+            upsert (bool): Update the documents that already exist.
+        """
+        batches = [documents[i : i + batch_size] for i in range(0, len(documents), batch_size)]
+        if not batches:
+            return
+        embed_task = asyncio.create_task(Document.async_embed_documents(batches[0], embedder=self.embedder))
+        try:
+            for i, batch_docs in enumerate(batches):
+                log_debug(f"Processing batch starting at index {i * batch_size}, size: {len(batch_docs)}")
+                await embed_task
+                if i + 1 < len(batches):
+                    embed_task = asyncio.create_task(
+                        Document.async_embed_documents(batches[i + 1], embedder=self.embedder)
+                    )
+                batch_records = self._get_records(batch_docs, filters=filters, upsert=upsert)
+                try:
+                    await self._async_copy_records(batch_records, upsert=upsert)
+                except Exception as e:
+                    logger.error(f"Error with batch starting at index {i * batch_size}: {e}")
+                    raise
+                log_info(f"{'Upserted' if upsert else 'Inserted'} batch of {len(batch_records)} documents.")
+        finally:
+            embed_task.cancel()
+
     def insert(
         self,
         documents: List[Document],
@@ -307,32 +585,11 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few embedder requests as possible
+                        Document.embed_documents(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for insertion
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-                                _id = doc.id or content_hash
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": _id,
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_records(batch_docs, filters=filters)
 
                         # Insert the batch of records
                         insert_stmt = postgresql.insert(self.table)
@@ -347,9 +604,29 @@ class PgVector(VectorDb):
             logger.error(f"Error inserting documents: {e}")
             raise
 
-    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Insert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.insert, documents, filters)
+    async def async_insert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Insert documents into the database on the async engine.
+        Each batch is written with COPY while the next batch is embedded.
+
+        Args:
+            documents (List[Document]): List of documents to insert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to insert in each batch.
+        """
+        if self._get_async_session() is None:
+            await asyncio.to_thread(self.insert, documents, filters, batch_size)
+            return
+        try:
+            await self._async_write_documents(documents, filters=filters, batch_size=batch_size, upsert=False)
+        except Exception as e:
+            logger.error(f"Error inserting documents: {e}")
+            raise
 
     def upsert_available(self) -> bool:
         """
@@ -380,47 +657,15 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     log_debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch in as few embedder requests as possible
+                        Document.embed_documents(batch_docs, embedder=self.embedder)
+
                         # Prepare documents for upserting
-                        batch_records = []
-                        for doc in batch_docs:
-                            try:
-                                doc.embed(embedder=self.embedder)
-                                cleaned_content = self._clean_content(doc.content)
-                                content_hash = md5(cleaned_content.encode()).hexdigest()
-
-                                meta_data = doc.meta_data or {}
-                                if filters:
-                                    meta_data.update(filters)
-
-                                record = {
-                                    "id": content_hash,  # use content_hash as a reproducible id to avoid duplicates while upsert
-                                    "name": doc.name,
-                                    "meta_data": doc.meta_data,
-                                    "filters": filters,
-                                    "content": cleaned_content,
-                                    "embedding": doc.embedding,
-                                    "usage": doc.usage,
-                                    "content_hash": content_hash,
-                                }
-                                batch_records.append(record)
-                            except Exception as e:
-                                logger.error(f"Error processing document '{doc.name}': {e}")
+                        batch_records = self._get_records(batch_docs, filters=filters, upsert=True)
 
                         # Upsert the batch of records
                         insert_stmt = postgresql.insert(self.table).values(batch_records)
-                        upsert_stmt = insert_stmt.on_conflict_do_update(
-                            index_elements=["id"],
-                            set_={
-                                "name": insert_stmt.excluded.name,
-                                "meta_data": insert_stmt.excluded.meta_data,
-                                "filters": insert_stmt.excluded.filters,
-                                "content": insert_stmt.excluded.content,
-                                "embedding": insert_stmt.excluded.embedding,
-                                "usage": insert_stmt.excluded.usage,
-                                "content_hash": insert_stmt.excluded.content_hash,
-                            },
-                        )
-                        sess.execute(upsert_stmt)
+                        sess.execute(self._on_conflict_update(insert_stmt))
                         sess.commit()  # Commit batch independently
                         log_info(f"Upserted batch of {len(batch_records)} documents.")
                     except Exception as e:
@@ -431,9 +676,29 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
-    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
-        """Upsert documents asynchronously by running in a thread."""
-        await asyncio.to_thread(self.upsert, documents, filters)
+    async def async_upsert(
+        self,
+        documents: List[Document],
+        filters: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100,
+    ) -> None:
+        """
+        Upsert (insert or update) documents in the database on the async engine.
+        Each batch is written with COPY while the next batch is embedded.
+
+        Args:
+            documents (List[Document]): List of documents to upsert.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the documents.
+            batch_size (int): Number of documents to upsert in each batch.
+        """
+        if self._get_async_session() is None:
+            await asyncio.to_thread(self.upsert, documents, filters, batch_size)
+            return
+        try:
+            await self._async_write_documents(documents, filters=filters, batch_size=batch_size, upsert=True)
+        except Exception as e:
+            logger.error(f"Error upserting documents: {e}")
+            raise
 
     def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -460,8 +725,402 @@ class PgVector(VectorDb):
     async def async_search(
         self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
     ) -> List[Document]:
-        """Search asynchronously by running in a thread."""
-        return await asyncio.to_thread(self.search, query, limit, filters)
+        """
+        Perform a search based on the configured search type, on the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        if self._get_async_session() is None:
+            return await asyncio.to_thread(self.search, query, limit, filters)
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.keyword:
+            return await self.async_keyword_search(query=query, limit=limit, filters=filters)
+        elif self.search_type == SearchType.hybrid:
+            return await self.async_hybrid_search(query=query, limit=limit, filters=filters)
+        else:
+            logger.error(f"Invalid search type '{self.search_type}'.")
+            return []
+
+    def _get_query_embedding(self, query: str) -> Optional[List[float]]:
+        """
+        Get the embedding for a search query, using the in-memory query embedding cache.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            Optional[List[float]]: The query embedding.
+        """
+        query_embedding = self.query_embedding_cache.get(query)
+        if query_embedding is None:
+            query_embedding = self.embedder.get_embedding(query)
+            if query_embedding:
+                self.query_embedding_cache.set(query, query_embedding)
+        return query_embedding
+
+    async def _async_get_query_embedding(self, query: str) -> Optional[List[float]]:
+        """Get the embedding for a search query asynchronously, using the in-memory query embedding cache."""
+        query_embedding = self.query_embedding_cache.get(query)
+        if query_embedding is None:
+            query_embedding = (await self.embedder.async_get_embeddings_batch([query]))[0]
+            if query_embedding:
+                self.query_embedding_cache.set(query, query_embedding)
+        return query_embedding
+
+    def _get_query_embeddings(self, queries: List[str]) -> List[Optional[List[float]]]:
+        """
+        Get the embeddings for several search queries, embedding the queries missing from the cache in one batch.
+
+        Args:
+            queries (List[str]): The search queries.
+
+        Returns:
+            List[Optional[List[float]]]: The query embeddings, in the order of the queries.
+        """
+        query_embeddings: Dict[str, Optional[List[float]]] = {
+            query: self.query_embedding_cache.get(query) for query in queries
+        }
+        missing = [query for query, query_embedding in query_embeddings.items() if query_embedding is None]
+        if missing:
+            for query, query_embedding in zip(missing, self.embedder.get_embeddings_batch(missing)):
+                query_embeddings[query] = query_embedding
+                if query_embedding:
+                    self.query_embedding_cache.set(query, query_embedding)
+        return [query_embeddings[query] for query in queries]
+
+    async def _async_get_query_embeddings(self, queries: List[str]) -> List[Optional[List[float]]]:
+        """Get the embeddings for several search queries asynchronously, embedding the missing ones in one batch."""
+        query_embeddings: Dict[str, Optional[List[float]]] = {
+            query: self.query_embedding_cache.get(query) for query in queries
+        }
+        missing = [query for query, query_embedding in query_embeddings.items() if query_embedding is None]
+        if missing:
+            for query, query_embedding in zip(missing, await self.embedder.async_get_embeddings_batch(missing)):
+                query_embeddings[query] = query_embedding
+                if query_embedding:
+                    self.query_embedding_cache.set(query, query_embedding)
+        return [query_embeddings[query] for query in queries]
+
+    def search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries at once.
+
+        Query embeddings are computed in one batch. Vector searches for all queries run as a single
+        lateral join, while keyword and hybrid searches run one query each.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in the order of the queries.
+        """
+        if not queries:
+            return []
+        if self.search_type == SearchType.vector:
+            return self.vector_search_many(queries=queries, limit=limit, filters=filters)
+        if self.search_type == SearchType.hybrid:
+            # Warm the query embedding cache in one batch, so the hybrid searches below do not embed one by one
+            try:
+                self._get_query_embeddings(queries)
+            except Exception as e:
+                logger.warning(f"Error embedding queries in a batch: {e}")
+        return [self.search(query=query, limit=limit, filters=filters) for query in queries]
+
+    async def async_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Search for several queries at once, on the async engine.
+        Keyword and hybrid searches run concurrently, one query each.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in the order of the queries.
+        """
+        if not queries:
+            return []
+        if self._get_async_session() is None:
+            return await asyncio.to_thread(self.search_many, queries, limit, filters)
+        if self.search_type == SearchType.vector:
+            return await self.async_vector_search_many(queries=queries, limit=limit, filters=filters)
+        if self.search_type == SearchType.hybrid:
+            # Warm the query embedding cache in one batch, so the hybrid searches below do not embed one by one
+            try:
+                await self._async_get_query_embeddings(queries)
+            except Exception as e:
+                logger.warning(f"Error embedding queries in a batch: {e}")
+        return list(
+            await asyncio.gather(*[self.async_search(query=query, limit=limit, filters=filters) for query in queries])
+        )
+
+    def _index_search_settings(self) -> Optional[TextClause]:
+        """Get the statement setting the search parameters of the vector index for the current transaction"""
+        if isinstance(self.vector_index, Ivfflat):
+            return text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}")
+        elif isinstance(self.vector_index, HNSW):
+            return text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}")
+        return None
+
+    def _execute_search(self, stmt: Select, use_index: bool = True) -> List[Any]:
+        """Run a search statement, with the vector index search parameters set if use_index is True"""
+        with self.Session() as sess, sess.begin():
+            index_search_settings = self._index_search_settings() if use_index else None
+            if index_search_settings is not None:
+                sess.execute(index_search_settings)
+            return list(sess.execute(stmt).fetchall())
+
+    async def _async_execute_search(self, stmt: Select, use_index: bool = True) -> List[Any]:
+        """Run a search statement on the async engine, with the vector index search parameters set if use_index is True"""
+        async_session = self._get_async_session()
+        if async_session is None:
+            return await asyncio.to_thread(self._execute_search, stmt, use_index)
+        async with async_session() as sess, sess.begin():
+            index_search_settings = self._index_search_settings() if use_index else None
+            if index_search_settings is not None:
+                await sess.execute(index_search_settings)
+            return list((await sess.execute(stmt)).fetchall())
+
+    def _vector_search_many_stmt(
+        self, rows: List[Any], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the statement selecting the nearest documents for several query embeddings.
+
+        Args:
+            rows (List[Any]): (query index, query embedding) pairs.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The statement, or None if the distance metric is unknown.
+        """
+        query_values = values(
+            column("query_index", Integer), column("query_embedding", Vector(self.dimensions)), name="queries"
+        ).data(rows)
+        # Parameters in a VALUES list are not typed by postgres, so cast the embeddings explicitly
+        query_embedding = sa_cast(query_values.c.query_embedding, Vector(self.dimensions))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            distance = self.table.c.embedding.l2_distance(query_embedding)
+        elif self.distance == Distance.cosine:
+            distance = self.table.c.embedding.cosine_distance(query_embedding)
+        elif self.distance == Distance.max_inner_product:
+            distance = self.table.c.embedding.max_inner_product(query_embedding)
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Select the nearest documents for each query
+        matches = select(*self._search_columns(), distance.label("distance"))
+        if filters is not None:
+            matches = matches.where(self.table.c.meta_data.contains(filters))
+        lateral_matches = matches.order_by(distance).limit(limit).lateral("matches")
+
+        return (
+            select(query_values.c.query_index, *lateral_matches.c)
+            .select_from(query_values.join(lateral_matches, true()))
+            .order_by(query_values.c.query_index, lateral_matches.c.distance)
+        )
+
+    def _group_search_many_results(
+        self, queries: List[str], results: List[Any], search_results: List[List[Document]]
+    ) -> List[List[Document]]:
+        """Group the result rows of a vector search for several queries by query, and rerank them"""
+        for result in results:
+            search_results[result.query_index].append(self._result_to_document(result))
+
+        if self.reranker:
+            search_results = [
+                self.reranker.rerank(query=query, documents=documents) if documents else documents
+                for query, documents in zip(queries, search_results)
+            ]
+
+        log_info(f"Found {sum(len(documents) for documents in search_results)} documents for {len(queries)} queries")
+        return search_results
+
+    def vector_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Perform a vector similarity search for several queries in a single statement.
+
+        The query embeddings are sent as a VALUES list, and the nearest documents for each query are
+        selected with a LATERAL subquery, so the vector index is used for every query.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in the order of the queries.
+        """
+        search_results: List[List[Document]] = [[] for _ in queries]
+        try:
+            query_embeddings = self._get_query_embeddings(queries)
+            rows = [(i, embedding) for i, embedding in enumerate(query_embeddings) if embedding]
+            if len(rows) < len(queries):
+                logger.error("Error getting embeddings for some queries")
+            if not rows:
+                return search_results
+
+            stmt = self._vector_search_many_stmt(rows, limit=limit, filters=filters)
+            if stmt is None:
+                return search_results
+
+            # Log the query for debugging
+            log_debug(f"Vector search many query: {stmt}")
+
+            # Execute the query
+            try:
+                results = self._execute_search(stmt)
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                self.create()
+                return search_results
+
+            return self._group_search_many_results(queries, results, search_results)
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return search_results
+
+    async def async_vector_search_many(
+        self, queries: List[str], limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[List[Document]]:
+        """
+        Perform a vector similarity search for several queries in a single statement, on the async engine.
+
+        Args:
+            queries (List[str]): The search queries.
+            limit (int): Maximum number of results to return per query.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[List[Document]]: The matching documents for each query, in the order of the queries.
+        """
+        search_results: List[List[Document]] = [[] for _ in queries]
+        try:
+            query_embeddings = await self._async_get_query_embeddings(queries)
+            rows = [(i, embedding) for i, embedding in enumerate(query_embeddings) if embedding]
+            if len(rows) < len(queries):
+                logger.error("Error getting embeddings for some queries")
+            if not rows:
+                return search_results
+
+            stmt = self._vector_search_many_stmt(rows, limit=limit, filters=filters)
+            if stmt is None:
+                return search_results
+
+            # Log the query for debugging
+            log_debug(f"Vector search many query: {stmt}")
+
+            # Execute the query
+            try:
+                results = await self._async_execute_search(stmt)
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                await self.async_create()
+                return search_results
+
+            return self._group_search_many_results(queries, results, search_results)
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return search_results
+
+    def _search_columns(self) -> List[Any]:
+        """
+        Get the columns to select for search results, following the search projection.
+
+        Returns:
+            List[Any]: The columns to select.
+        """
+        columns = [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+        ]
+        if self.search_projection.embedding:
+            columns.append(self.table.c.embedding)
+        if self.search_projection.usage:
+            columns.append(self.table.c.usage)
+        return columns
+
+    def _result_to_document(self, result: Any) -> Document:
+        """
+        Convert a search result row to a Document.
+
+        Args:
+            result (Any): A row selected with the columns from _search_columns.
+
+        Returns:
+            Document: The document, with embedding and usage set only if they were selected.
+        """
+        return Document(
+            id=result.id,
+            name=result.name,
+            meta_data=result.meta_data,
+            content=result.content,
+            embedder=self.embedder,
+            embedding=result.embedding if self.search_projection.embedding else None,
+            usage=result.usage if self.search_projection.usage else None,
+        )
+
+    def _vector_search_stmt(
+        self, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the vector similarity search statement.
+
+        Args:
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The statement, or None if the distance metric is unknown.
+        """
+        # Define the columns to select
+        columns = self._search_columns()
+
+        # Build the base statement
+        stmt = select(*columns)
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results based on the distance metric
+        if self.distance == Distance.l2:
+            stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
+        elif self.distance == Distance.cosine:
+            stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        elif self.distance == Distance.max_inner_product:
+            stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Limit the number of results
+        return stmt.limit(limit)
 
     def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
@@ -477,74 +1136,78 @@ class PgVector(VectorDb):
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self._get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            stmt = self._vector_search_stmt(query_embedding, limit=limit, filters=filters)
+            if stmt is None:
+                return []
 
-            # Build the base statement
-            stmt = select(*columns)
+            # Log the query for debugging
+            log_debug(f"Vector search query: {stmt}")
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+            # Execute the query
+            try:
+                results = self._execute_search(stmt)
+            except Exception as e:
+                logger.error(f"Error performing semantic search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                self.create()
+                return []
 
-            # Order the results based on the distance metric
-            if self.distance == Distance.l2:
-                stmt = stmt.order_by(self.table.c.embedding.l2_distance(query_embedding))
-            elif self.distance == Distance.cosine:
-                stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
-            elif self.distance == Distance.max_inner_product:
-                stmt = stmt.order_by(self.table.c.embedding.max_inner_product(query_embedding))
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            # Process the results and convert to Document objects
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
+
+            if self.reranker:
+                search_results = self.reranker.rerank(query=query, documents=search_results)
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during vector search: {e}")
+            return []
+
+    async def async_vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a vector similarity search on the async engine.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        try:
+            # Get the embedding for the query string
+            query_embedding = await self._async_get_query_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._vector_search_stmt(query_embedding, limit=limit, filters=filters)
+            if stmt is None:
+                return []
 
             # Log the query for debugging
             log_debug(f"Vector search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                results = await self._async_execute_search(stmt)
             except Exception as e:
                 logger.error(f"Error performing semantic search: {e}")
                 logger.error("Table might not exist, creating for future use")
-                self.create()
+                await self.async_create()
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
 
             if self.reranker:
                 search_results = self.reranker.rerank(query=query, documents=search_results)
@@ -570,6 +1233,47 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
+    def _text_rank(self, query: str) -> Any:
+        """Get the full-text search rank of the 'content' column for a query"""
+        # Build the text search vector
+        ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+        # Create the ts_query using websearch_to_tsquery with parameter binding
+        processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+        ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+        # Compute the text rank
+        return func.ts_rank_cd(ts_vector, ts_query)
+
+    def _keyword_search_stmt(self, query: str, limit: int, filters: Optional[Dict[str, Any]] = None) -> Select:
+        """
+        Build the keyword search statement.
+
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Select: The statement.
+        """
+        # Define the columns to select
+        columns = self._search_columns()
+
+        # Build the base statement
+        stmt = select(*columns)
+
+        text_rank = self._text_rank(query)
+
+        # Apply filters if provided
+        if filters is not None:
+            # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order by the relevance rank
+        stmt = stmt.order_by(text_rank.desc())
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
@@ -583,65 +1287,60 @@ class PgVector(VectorDb):
             List[Document]: List of matching documents.
         """
         try:
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            stmt = self._keyword_search_stmt(query, limit=limit, filters=filters)
 
-            # Build the base statement
-            stmt = select(*columns)
+            # Log the query for debugging
+            log_debug(f"Keyword search query: {stmt}")
 
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            # Execute the query
+            try:
+                results = self._execute_search(stmt, use_index=False)
+            except Exception as e:
+                logger.error(f"Error performing keyword search: {e}")
+                logger.error("Table might not exist, creating for future use")
+                self.create()
+                return []
+
+            # Process the results and convert to Document objects
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
+
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during keyword search: {e}")
+            return []
 
-            # Apply filters if provided
-            if filters is not None:
-                # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+    async def async_keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Perform a keyword search on the 'content' column, on the async engine.
 
-            # Order by the relevance rank
-            stmt = stmt.order_by(text_rank.desc())
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        try:
+            stmt = self._keyword_search_stmt(query, limit=limit, filters=filters)
 
             # Log the query for debugging
             log_debug(f"Keyword search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    results = sess.execute(stmt).fetchall()
+                results = await self._async_execute_search(stmt, use_index=False)
             except Exception as e:
                 logger.error(f"Error performing keyword search: {e}")
                 logger.error("Table might not exist, creating for future use")
-                self.create()
+                await self.async_create()
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -649,6 +1348,71 @@ class PgVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
+    def _hybrid_search_stmt(
+        self, query: str, query_embedding: List[float], limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> Optional[Select]:
+        """
+        Build the hybrid search statement, combining vector similarity and full-text search.
+
+        Args:
+            query (str): The search query.
+            query_embedding (List[float]): The embedding of the search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+
+        Returns:
+            Optional[Select]: The statement, or None if the distance metric is unknown.
+        """
+        # Define the columns to select
+        columns = self._search_columns()
+
+        text_rank = self._text_rank(query)
+
+        # Compute the vector similarity score
+        if self.distance == Distance.l2:
+            # For L2 distance, smaller distances are better
+            vector_distance = self.table.c.embedding.l2_distance(query_embedding)
+            # Invert and normalize the distance to get a similarity score between 0 and 1
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.cosine:
+            # For cosine distance, smaller distances are better
+            vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
+            vector_score = 1 / (1 + vector_distance)
+        elif self.distance == Distance.max_inner_product:
+            # For inner product, higher values are better
+            # Assume embeddings are normalized, so inner product ranges from -1 to 1
+            raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
+            # Normalize to range [0, 1]
+            vector_score = (raw_vector_score + 1) / 2
+        else:
+            logger.error(f"Unknown distance metric: {self.distance}")
+            return None
+
+        # Apply weights to control the influence of each score
+        # Validate the vector_weight parameter
+        if not 0 <= self.vector_score_weight <= 1:
+            raise ValueError("vector_score_weight must be between 0 and 1")
+        text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+
+        # Combine the scores into a hybrid score
+        hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+
+        # Build the base statement, including the hybrid score
+        stmt = select(*columns, hybrid_score.label("hybrid_score"))
+
+        # Add the full-text search condition
+        # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
+        # Apply filters if provided
+        if filters is not None:
+            stmt = stmt.where(self.table.c.meta_data.contains(filters))
+
+        # Order the results by the hybrid score in descending order
+        stmt = stmt.order_by(desc("hybrid_score"))
+
+        # Limit the number of results
+        return stmt.limit(limit)
+
     def hybrid_search(
         self,
         query: str,
@@ -668,104 +1432,74 @@ class PgVector(VectorDb):
         """
         try:
             # Get the embedding for the query string
-            query_embedding = self.embedder.get_embedding(query)
+            query_embedding = self._get_query_embedding(query)
             if query_embedding is None:
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
-
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
-
-            # Compute the vector similarity score
-            if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
-                vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
-                vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
-            elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
-            else:
-                logger.error(f"Unknown distance metric: {self.distance}")
+            stmt = self._hybrid_search_stmt(query, query_embedding, limit=limit, filters=filters)
+            if stmt is None:
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
+            # Log the query for debugging
+            log_debug(f"Hybrid search query: {stmt}")
 
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
+            # Execute the query
+            try:
+                results = self._execute_search(stmt)
+            except Exception as e:
+                logger.error(f"Error performing hybrid search: {e}")
+                return []
 
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
+            # Process the results and convert to Document objects
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
 
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
+            log_info(f"Found {len(search_results)} documents")
+            return search_results
+        except Exception as e:
+            logger.error(f"Error during hybrid search: {e}")
+            return []
+
+    async def async_hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        Perform a hybrid search combining vector similarity and full-text search, on the async engine.
 
-            # Apply filters if provided
-            if filters is not None:
-                stmt = stmt.where(self.table.c.meta_data.contains(filters))
+        Args:
+            query (str): The search query.
+            limit (int): Maximum number of results to return.
+            filters (Optional[Dict[str, Any]]): Filters to apply to the search.
 
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+        Returns:
+            List[Document]: List of matching documents.
+        """
+        try:
+            # Get the embedding for the query string
+            query_embedding = await self._async_get_query_embedding(query)
+            if query_embedding is None:
+                logger.error(f"Error getting embedding for Query: {query}")
+                return []
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            stmt = self._hybrid_search_stmt(query, query_embedding, limit=limit, filters=filters)
+            if stmt is None:
+                return []
 
             # Log the query for debugging
             log_debug(f"Hybrid search query: {stmt}")
 
             # Execute the query
             try:
-                with self.Session() as sess, sess.begin():
-                    if self.vector_index is not None:
-                        if isinstance(self.vector_index, Ivfflat):
-                            sess.execute(text(f"SET LOCAL ivfflat.probes = {self.vector_index.probes}"))
-                        elif isinstance(self.vector_index, HNSW):
-                            sess.execute(text(f"SET LOCAL hnsw.ef_search = {self.vector_index.ef_search}"))
-                    results = sess.execute(stmt).fetchall()
+                results = await self._async_execute_search(stmt)
             except Exception as e:
                 logger.error(f"Error performing hybrid search: {e}")
                 return []
 
             # Process the results and convert to Document objects
-            search_results: List[Document] = []
-            for result in results:
-                search_results.append(
-                    Document(
-                        id=result.id,
-                        name=result.name,
-                        meta_data=result.meta_data,
-                        content=result.content,
-                        embedder=self.embedder,
-                        embedding=result.embedding,
-                        usage=result.usage,
-                    )
-                )
+            search_results: List[Document] = [self._result_to_document(result) for result in results]
 
             log_info(f"Found {len(search_results)} documents")
             return search_results
@@ -1060,7 +1794,7 @@ class PgVector(VectorDb):
         for k, v in self.__dict__.items():
             if k in {"metadata", "table"}:
                 continue
-            # Reuse db_engine and Session without copying
+            # Reuse the engines and sessions without copying
             elif k in {"db_engine", "Session", "embedder"}:
                 setattr(copied_obj, k, v)
             else:
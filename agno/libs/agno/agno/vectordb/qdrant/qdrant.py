@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
@@ -12,7 +12,7 @@ except ImportError:
 from agno.document import Document
 from agno.embedder import Embedder
 from agno.reranker.base import Reranker
-from agno.utils.log import log_debug, log_info
+from agno.utils.log import log_debug, log_error, log_info
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
 from agno.vectordb.search import SearchType
@@ -260,6 +260,47 @@ class Qdrant(VectorDb):
         )
         return len(collection_points) > 0
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the collection, using a single retrieve call
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        if not hashes or not self.client:
+            return set()
+        try:
+            points = self.client.retrieve(
+                collection_name=self.collection,
+                ids=list(hashes),
+                with_payload=False,
+                with_vectors=False,
+            )
+        except Exception as e:
+            log_error(f"Error checking for existing content hashes: {e}")
+            return set()
+        return self._point_hashes(points)
+
+    async def async_existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """Return the content hashes that already exist in the collection asynchronously."""
+        if not hashes:
+            return set()
+        try:
+            points = await self.async_client.retrieve(
+                collection_name=self.collection,
+                ids=list(hashes),
+                with_payload=False,
+                with_vectors=False,
+            )
+        except Exception as e:
+            log_error(f"Error checking for existing content hashes: {e}")
+            return set()
+        return self._point_hashes(points)
+
+    def _point_hashes(self, points: List[Any]) -> Set[str]:
+        # Qdrant returns the md5 ids formatted as UUIDs
+        return {str(point.id).replace("-", "") for point in points}
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -312,6 +353,9 @@ class Qdrant(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            if Document.embed_documents(documents, embedder=self.embedder):
+                documents = [doc for doc in documents if doc.embedding]
         points = []
         for document in documents:
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -325,13 +369,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding  # type: ignore
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
@@ -373,6 +415,9 @@ class Qdrant(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
         """
         log_debug(f"Inserting {len(documents)} documents asynchronously")
+        if self.search_type in [SearchType.vector, SearchType.hybrid]:
+            if await Document.async_embed_documents(documents, embedder=self.embedder):
+                documents = [doc for doc in documents if doc.embedding]
 
         async def process_document(document):
             cleaned_content = document.content.replace("\x00", "\ufffd")
@@ -380,13 +425,11 @@ class Qdrant(VectorDb):
 
             if self.search_type == SearchType.vector:
                 # For vector search, maintain backward compatibility with unnamed vectors
-                document.embed(embedder=self.embedder)
                 vector = document.embedding
             else:
                 # For other search types, use named vectors
                 vector = {}
                 if self.search_type in [SearchType.hybrid]:
-                    document.embed(embedder=self.embedder)
                     vector[self.dense_vector_name] = document.embedding
 
                 if self.search_type in [SearchType.keyword, SearchType.hybrid]:
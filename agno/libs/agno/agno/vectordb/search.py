@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -5,3 +6,17 @@ class SearchType(str, Enum):
     vector = "vector"
     keyword = "keyword"
     hybrid = "hybrid"
+
+
+@dataclass
+class SearchProjection:
+    """Optional fields fetched for each search result.
+
+    Embeddings and usage are not needed to answer a query and are the largest part of each row,
+    so they are left out of search results unless requested.
+    """
+
+    # Return the stored embedding of each result
+    embedding: bool = False
+    # Return the embedding usage recorded for each result
+    usage: bool = False
@@ -1,6 +1,6 @@
 import json
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 try:
     from sqlalchemy.dialects import mysql
@@ -21,6 +21,7 @@ from agno.reranker.base import Reranker
 from agno.utils.log import log_debug, log_info, logger
 from agno.vectordb.base import VectorDb
 from agno.vectordb.distance import Distance
+from agno.vectordb.search import SearchProjection
 
 
 class SingleStore(VectorDb):
@@ -34,6 +35,7 @@ class SingleStore(VectorDb):
         distance: Distance = Distance.cosine,
         reranker: Optional[Reranker] = None,
         # index: Optional[Union[Ivfflat, HNSW]] = HNSW(),
+        search_projection: Optional[SearchProjection] = None,
     ):
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -60,6 +62,8 @@ class SingleStore(VectorDb):
         # self.index: Optional[Union[Ivfflat, HNSW]] = index
         self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
         self.reranker: Optional[Reranker] = reranker
+        # Embeddings and usage are only fetched with search results when requested
+        self.search_projection: SearchProjection = search_projection or SearchProjection()
         self.table: Table = self.get_table()
 
     def get_table(self) -> Table:
@@ -137,6 +141,19 @@ class SingleStore(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def existing_hashes(self, hashes: List[str]) -> Set[str]:
+        """
+        Return the content hashes that already exist in the table, using a single query
+
+        Args:
+            hashes (List[str]): Content hashes to check
+        """
+        if not hashes:
+            return set()
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(hashes))
+            return {row[0] for row in sess.execute(stmt)}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -172,8 +189,9 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            if Document.embed_documents(documents, embedder=self.embedder):
+                documents = [doc for doc in documents if doc.embedding]
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -215,8 +233,9 @@ class SingleStore(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            if Document.embed_documents(documents, embedder=self.embedder):
+                documents = [doc for doc in documents if doc.embedding]
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -274,9 +293,11 @@ class SingleStore(VectorDb):
             self.table.c.name,
             self.table.c.meta_data,
             self.table.c.content,
-            self.table.c.embedding,
-            self.table.c.usage,
         ]
+        if self.search_projection.embedding:
+            columns.append(self.table.c.embedding)
+        if self.search_projection.usage:
+            columns.append(self.table.c.usage)
 
         stmt = select(*columns)
 
@@ -318,16 +339,21 @@ class SingleStore(VectorDb):
         search_results: List[Document] = []
         for neighbor in neighbors:
             meta_data_dict = json.loads(neighbor.meta_data) if neighbor.meta_data else {}
-            usage_dict = json.loads(neighbor.usage) if neighbor.usage else {}
+
+            usage_dict = None
+            if self.search_projection.usage:
+                usage_dict = json.loads(neighbor.usage) if neighbor.usage else {}
 
             # Convert SingleStore VECTOR type to list
-            embedding_list = []
-            if neighbor.embedding:
-                try:
-                    embedding_list = json.loads(neighbor.embedding)
-                except Exception as e:
-                    logger.error(f"Error extracting vector: {e}")
-                    embedding_list = []
+            embedding_list = None
+            if self.search_projection.embedding:
+                embedding_list = []
+                if neighbor.embedding:
+                    try:
+                        embedding_list = json.loads(neighbor.embedding)
+                    except Exception as e:
+                        logger.error(f"Error extracting vector: {e}")
+                        embedding_list = []
 
             search_results.append(
                 Document(
@@ -248,8 +248,8 @@ class Weaviate(VectorDb):
         log_debug(f"Inserting {len(documents)} documents into Weaviate.")
         collection = self.get_client().collections.get(self.collection)
 
+        Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             if document.embedding is None:
                 logger.error(f"Document embedding is None: {document.name}")
                 continue
@@ -293,11 +293,12 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            # Embed all documents in batched requests
+            await Document.async_embed_documents(documents, embedder=self.embedder)
+
             # Process documents first
             for document in documents:
                 try:
-                    # Embed document
-                    document.embed(embedder=self.embedder)
                     if document.embedding is None:
                         logger.error(f"Document embedding is None: {document.name}")
                         continue
@@ -357,8 +358,8 @@ class Weaviate(VectorDb):
         try:
             collection = client.collections.get(self.collection)
 
+            await Document.async_embed_documents(documents, embedder=self.embedder)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 if document.embedding is None:
                     logger.error(f"Document embedding is None: {document.name}")
                     continue
@@ -495,7 +496,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -565,7 +566,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -649,7 +650,7 @@ class Weaviate(VectorDb):
             search_results = self.get_search_results(response)
 
             if self.reranker:
-                search_results = self.reranker.rerank(query=query, documents=search_results)
+                search_results = await self.reranker.arerank(query=query, documents=search_results)
 
             log_info(f"Found {len(search_results)} documents")
 
@@ -288,7 +288,7 @@ class Workflow:
         self.run_response = RunResponse(run_id=self.run_id, session_id=self.session_id, workflow_id=self.workflow_id)
 
         # Read existing session from storage
-        self.read_from_storage()
+        await self.aread_from_storage()
 
         # Update the session_id for all Agent instances
         self.update_agent_session_ids()
@@ -337,7 +337,7 @@ class Workflow:
                 elif isinstance(self.memory, Memory):
                     self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
                 # Write this run to the database
-                self.write_to_storage()
+                await self.awrite_to_storage()
                 log_debug(f"Workflow Run End: {self.run_id}", center=True)
 
             return result_generator()
@@ -358,7 +358,7 @@ class Workflow:
             elif isinstance(self.memory, Memory):
                 self.memory.add_run(session_id=self.session_id, run=self.run_response)  # type: ignore
             # Write this run to the database
-            self.write_to_storage()
+            await self.awrite_to_storage()
             log_debug(f"Workflow Run End: {self.run_id}", center=True)
             return result
         else:
@@ -650,6 +650,30 @@ class Workflow:
             self.workflow_session = cast(WorkflowSession, self.storage.upsert(session=self.get_workflow_session()))
         return self.workflow_session
 
+    async def aread_from_storage(self) -> Optional[WorkflowSession]:
+        """Load the WorkflowSession from storage, without blocking the event loop.
+
+        Returns:
+            Optional[WorkflowSession]: The loaded WorkflowSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            self.workflow_session = cast(WorkflowSession, await self.storage.aread(session_id=self.session_id))
+            if self.workflow_session is not None:
+                self.load_workflow_session(session=self.workflow_session)
+        return self.workflow_session
+
+    async def awrite_to_storage(self) -> Optional[WorkflowSession]:
+        """Save the WorkflowSession to storage, without blocking the event loop
+
+        Returns:
+            Optional[WorkflowSession]: The saved WorkflowSession or None if not saved.
+        """
+        if self.storage is not None:
+            self.workflow_session = cast(
+                WorkflowSession, await self.storage.aupsert(session=self.get_workflow_session())
+            )
+        return self.workflow_session
+
     def load_session(self, force: bool = False) -> Optional[str]:
         """Load an existing session from the database and return the session_id.
         If a session does not exist, create a new session.
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agno.api.exporter import ApiExporter
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.received.append((self.path, json.loads(body), self.client_address))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.received = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def exporter(stub_server):
+    exporter = ApiExporter(
+        max_queue_size=100,
+        batch_size=10,
+        flush_interval=60,
+        base_url=f"http://127.0.0.1:{stub_server.server_address[1]}",
+        headers={},
+    )
+    yield exporter
+    exporter.shutdown(timeout=5)
+
+
+def test_flush_sends_events_in_order(exporter, stub_server):
+    for i in range(25):
+        assert exporter.enqueue("/v1/telemetry/agent/run/create", {"run": {"run_id": str(i)}})
+
+    assert exporter.flush(timeout=5)
+    assert [payload["run"]["run_id"] for _, payload, _ in stub_server.received] == [str(i) for i in range(25)]
+    assert {path for path, _, _ in stub_server.received} == {"/v1/telemetry/agent/run/create"}
+
+
+def test_events_reuse_one_connection(exporter, stub_server):
+    for i in range(5):
+        exporter.enqueue("/v1/agents/create", {"agent_id": str(i)})
+
+    assert exporter.flush(timeout=5)
+    assert len({client_address for _, _, client_address in stub_server.received}) == 1
+
+
+def test_full_queue_drops_events():
+    exporter = ApiExporter(
+        max_queue_size=3, batch_size=10, flush_interval=60, base_url="http://127.0.0.1:1", headers={}
+    )
+    # A worker that never drains the queue
+    exporter._worker = threading.Thread(target=lambda: None)
+    exporter._pid = os.getpid()
+
+    results = [exporter.enqueue("/v1/agents/create", {"agent_id": str(i)}) for i in range(5)]
+
+    assert results == [True, True, True, False, False]
+    assert exporter.dropped_events == 2
+
+
+def test_failed_requests_do_not_block_flush():
+    exporter = ApiExporter(batch_size=2, flush_interval=60, base_url="http://127.0.0.1:1", headers={})
+    exporter.enqueue("/v1/agents/create", {"agent_id": "1"})
+
+    assert exporter.flush(timeout=5)
+    exporter.shutdown(timeout=1)
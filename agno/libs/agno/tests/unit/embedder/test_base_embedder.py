@@ -0,0 +1,158 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+
+
+@dataclass
+class SingleTextEmbedder(Embedder):
+    """Embedder without a native batch API"""
+
+    dimensions: int = 2
+    calls: List[str] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.calls.append(text)
+        return [float(len(text)), 1.0], {"total_tokens": 1}
+
+
+@dataclass
+class BatchEmbedder(SingleTextEmbedder):
+    """Embedder with a native batch API that records the size of every request"""
+
+    requests: List[List[str]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        with self.lock:
+            self.requests.append(list(texts))
+        usages: List[Optional[Dict]] = [None] * len(texts)
+        usages[0] = {"total_tokens": len(texts)}
+        return [[float(len(text)), 1.0] for text in texts], usages
+
+
+@dataclass
+class FailingBatchEmbedder(SingleTextEmbedder):
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        raise RuntimeError("batch endpoint unavailable")
+
+
+TEXTS = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff", "ggggggg"]
+
+
+def test_default_batch_falls_back_to_single_requests():
+    embedder = SingleTextEmbedder()
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(TEXTS)
+
+    assert embeddings == [[float(len(text)), 1.0] for text in TEXTS]
+    assert usages == [{"total_tokens": 1}] * len(TEXTS)
+    assert embedder.calls == TEXTS
+
+
+def test_batches_respect_batch_size_and_preserve_order():
+    embedder = BatchEmbedder(batch_size=3, max_concurrency=3)
+    embeddings = embedder.get_embeddings_batch(TEXTS)
+
+    assert embeddings == [[float(len(text)), 1.0] for text in TEXTS]
+    assert sorted(len(request) for request in embedder.requests) == [1, 3, 3]
+    assert embedder.calls == []
+
+
+def test_batch_usage_is_reported_once_per_request():
+    embedder = BatchEmbedder(batch_size=3)
+    _, usages = embedder.get_embeddings_batch_and_usage(TEXTS)
+
+    assert sum(usage["total_tokens"] for usage in usages if usage) == len(TEXTS)
+
+
+def test_empty_batch():
+    embedder = BatchEmbedder()
+    assert embedder.get_embeddings_batch_and_usage([]) == ([], [])
+    assert embedder.requests == []
+
+
+@pytest.mark.asyncio
+async def test_async_batches_preserve_order():
+    embedder = BatchEmbedder(batch_size=2, max_concurrency=2)
+    embeddings, usages = await embedder.async_get_embeddings_batch_and_usage(TEXTS)
+
+    assert embeddings == [[float(len(text)), 1.0] for text in TEXTS]
+    assert len(usages) == len(TEXTS)
+    assert len(embedder.requests) == 4
+
+
+def test_embed_documents():
+    embedder = BatchEmbedder(batch_size=4)
+    documents = [Document(content=text) for text in TEXTS]
+    Document.embed_documents(documents, embedder=embedder)
+
+    assert [doc.embedding for doc in documents] == [[float(len(text)), 1.0] for text in TEXTS]
+    assert len(embedder.requests) == 2
+
+
+def test_embed_documents_falls_back_when_batch_fails():
+    embedder = FailingBatchEmbedder()
+    documents = [Document(content=text) for text in TEXTS]
+    Document.embed_documents(documents, embedder=embedder)
+
+    assert [doc.embedding for doc in documents] == [[float(len(text)), 1.0] for text in TEXTS]
+    assert embedder.calls == TEXTS
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents():
+    embedder = BatchEmbedder(batch_size=4)
+    documents = [Document(content=text) for text in TEXTS]
+    await Document.async_embed_documents(documents, embedder=embedder)
+
+    assert [doc.embedding for doc in documents] == [[float(len(text)), 1.0] for text in TEXTS]
+    assert len(embedder.requests) == 2
+
+
+@dataclass
+class FailingTextEmbedder(SingleTextEmbedder):
+    """Embedder without batch requests that can't embed the text "ccc" and records the threads it embeds in"""
+
+    threads: List[str] = field(default_factory=list)
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.threads.append(threading.current_thread().name)
+        if text == "ccc":
+            raise RuntimeError("text rejected")
+        return super().get_embedding_and_usage(text)
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        if len(texts) > 1:
+            raise RuntimeError("batch endpoint unavailable")
+        return super()._embed_batch_and_usage(texts)
+
+
+def test_embed_documents_returns_the_documents_that_could_not_be_embedded():
+    documents = [Document(content=text) for text in TEXTS]
+
+    failed = Document.embed_documents(documents, embedder=FailingTextEmbedder())
+
+    assert failed == [documents[2]]
+    assert documents[2].embedding is None
+    assert all(doc.embedding for doc in documents if doc is not documents[2])
+
+
+@pytest.mark.asyncio
+async def test_async_embed_documents_falls_back_without_blocking_the_event_loop():
+    embedder = FailingTextEmbedder()
+    documents = [Document(content=text) for text in TEXTS]
+
+    failed = await Document.async_embed_documents(documents, embedder=embedder)
+
+    assert failed == [documents[2]]
+    assert [doc.embedding for doc in documents if doc is not documents[2]] == [
+        [float(len(text)), 1.0] for text in TEXTS if text != "ccc"
+    ]
+    assert threading.main_thread().name not in embedder.threads
@@ -0,0 +1,127 @@
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.embedder.base import Embedder
+from agno.embedder.cached import CachedEmbedder, InMemoryEmbeddingCacheStore, SqliteEmbeddingCacheStore
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    id: str = "counting"
+    dimensions: int = 3
+    requests: List[List[str]] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests.append([text])
+        return [float(len(text)), 0.5, 0.25], {"total_tokens": 1}
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.requests.append(list(texts))
+        return [[float(len(text)), 0.5, 0.25] for text in texts], [{"total_tokens": 1}] * len(texts)
+
+
+def test_cached_embedder_mirrors_wrapped_embedder():
+    embedder = CachedEmbedder(embedder=CountingEmbedder(batch_size=7))
+    assert embedder.dimensions == 3
+    assert embedder.batch_size == 7
+
+
+def test_single_embedding_is_cached():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+
+    first, usage = embedder.get_embedding_and_usage("hello")
+    second, cached_usage = embedder.get_embedding_and_usage("hello")
+
+    assert first == second
+    assert usage == {"total_tokens": 1}
+    assert cached_usage is None
+    assert inner.requests == [["hello"]]
+
+
+def test_batch_only_embeds_misses_once():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    embedder.get_embedding("a")
+
+    embeddings, usages = embedder.get_embeddings_batch_and_usage(["a", "bb", "bb", "ccc"])
+
+    assert embeddings == [[1.0, 0.5, 0.25], [2.0, 0.5, 0.25], [2.0, 0.5, 0.25], [3.0, 0.5, 0.25]]
+    assert usages == [None, {"total_tokens": 1}, None, {"total_tokens": 1}]
+    assert inner.requests == [["a"], ["bb", "ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_uses_cache():
+    inner = CountingEmbedder()
+    embedder = CachedEmbedder(embedder=inner)
+    await embedder.async_get_embeddings_batch_and_usage(["a", "bb"])
+    embeddings = await embedder.async_get_embeddings_batch(["a", "bb"])
+
+    assert embeddings == [[1.0, 0.5, 0.25], [2.0, 0.5, 0.25]]
+    assert inner.requests == [["a", "bb"]]
+
+
+def test_cache_is_keyed_on_embedder_and_dimensions():
+    store = InMemoryEmbeddingCacheStore()
+    small = CountingEmbedder(dimensions=3)
+    large = CountingEmbedder(dimensions=6)
+    CachedEmbedder(embedder=small, cache=store).get_embedding("hello")
+    CachedEmbedder(embedder=large, cache=store).get_embedding("hello")
+
+    assert small.requests == [["hello"]]
+    assert large.requests == [["hello"]]
+
+
+def test_sqlite_store_persists_across_instances(tmp_path):
+    db_file = str(tmp_path / "embeddings.db")
+    first = CountingEmbedder()
+    CachedEmbedder(embedder=first, cache=SqliteEmbeddingCacheStore(db_file=db_file)).get_embeddings_batch(["a", "bb"])
+
+    second = CountingEmbedder()
+    embeddings = CachedEmbedder(embedder=second, cache=SqliteEmbeddingCacheStore(db_file=db_file)).get_embeddings_batch(
+        ["a", "bb"]
+    )
+
+    assert embeddings == [[1.0, 0.5, 0.25], [2.0, 0.5, 0.25]]
+    assert second.requests == []
+
+
+def test_sqlite_store_evicts_least_recently_used(tmp_path):
+    store = SqliteEmbeddingCacheStore(db_file=str(tmp_path / "embeddings.db"), max_entries=2)
+    store.set_many({"a": [1.0]})
+    store.set_many({"b": [2.0]})
+    store.get_many(["a"])
+    store.set_many({"c": [3.0]})
+
+    assert set(store.get_many(["a", "b", "c"])) == {"a", "c"}
+
+
+def test_sqlite_store_tracks_the_number_of_entries(tmp_path):
+    store = SqliteEmbeddingCacheStore(db_file=str(tmp_path / "embeddings.db"), max_entries=3)
+    statements = []
+    store._connection.set_trace_callback(statements.append)
+
+    store.set_many({"a": [1.0], "b": [2.0]})
+    # Replacing a stored key does not add an entry
+    store.set_many({"a": [1.5], "c": [3.0]})
+    store.set_many({"d": [4.0]})
+
+    assert set(store.get_many(["a", "b", "c", "d"])) == {"a", "c", "d"}
+    # The table is only counted once
+    assert sum("SELECT COUNT(*) FROM embedding_cache" == statement.strip() for statement in statements) == 1
+
+
+def test_deepcopy_shares_cache():
+    embedder = CachedEmbedder(embedder=CountingEmbedder())
+    embedder.get_embedding("hello")
+    copied = deepcopy(embedder)
+    copied.get_embedding("hello")
+
+    assert copied.embedder.requests == [["hello"]]
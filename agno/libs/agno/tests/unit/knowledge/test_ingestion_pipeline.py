@@ -0,0 +1,231 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+
+from agno.document import Document
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.reader.text_reader import TextReader
+from agno.embedder.base import Embedder
+from agno.knowledge.pipeline import IngestionError, IngestionPipeline
+from agno.knowledge.text import TextKnowledgeBase
+from agno.vectordb.base import VectorDb
+
+
+@dataclass
+class CountingEmbedder(Embedder):
+    dimensions: Optional[int] = 3
+    batch_size: int = 4
+    calls: List[int] = field(default_factory=list)
+
+    def get_embedding(self, text: str) -> List[float]:
+        return [float(len(text)), 0.0, 1.0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+    def _embed_batch_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], List[Optional[Dict]]]:
+        self.calls.append(len(texts))
+        return [self.get_embedding(text) for text in texts], [None] * len(texts)
+
+
+class InMemoryVectorDb(VectorDb):
+    def __init__(self, embedder: Embedder):
+        self.embedder = embedder
+        self.documents: Dict[str, Document] = {}
+        self.created = False
+
+    def create(self) -> None:
+        self.created = True
+
+    async def async_create(self) -> None:
+        self.create()
+
+    def doc_exists(self, document: Document) -> bool:
+        return document.content in self.documents
+
+    async def async_doc_exists(self, document: Document) -> bool:
+        return self.doc_exists(document)
+
+    def name_exists(self, name: str) -> bool:
+        return any(doc.name == name for doc in self.documents.values())
+
+    def async_name_exists(self, name: str) -> bool:
+        return self.name_exists(name)
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        # Documents must reach the vector db already embedded
+        Document.embed_documents(documents, embedder=self.embedder)
+        for document in documents:
+            self.documents[document.content] = document
+
+    async def async_insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def upsert_available(self) -> bool:
+        return True
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    async def async_upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        self.insert(documents, filters)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        return list(self.documents.values())[:limit]
+
+    async def async_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        return self.search(query, limit, filters)
+
+    def drop(self) -> None:
+        self.documents.clear()
+        self.created = False
+
+    async def async_drop(self) -> None:
+        self.drop()
+
+    def exists(self) -> bool:
+        return self.created
+
+    async def async_exists(self) -> bool:
+        return self.exists()
+
+    def delete(self) -> bool:
+        self.documents.clear()
+        return True
+
+
+@pytest.fixture
+def text_dir(tmp_path: Path) -> Path:
+    for i in range(5):
+        # Each file is chunked into 3 chunks of 100 characters
+        content = "".join(f"file{i}line{j:03d}".ljust(20, "x") for j in range(15))
+        (tmp_path / f"file_{i}.txt").write_text(content)
+    return tmp_path
+
+
+@pytest.fixture
+def knowledge(text_dir: Path) -> TextKnowledgeBase:
+    embedder = CountingEmbedder()
+    return TextKnowledgeBase(
+        path=text_dir,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=InMemoryVectorDb(embedder=embedder),
+    )
+
+
+def test_pipeline_loads_all_chunks(knowledge):
+    pipeline = IngestionPipeline(chunk_workers=2, embed_workers=2, write_workers=2, queue_size=1, batch_size=4)
+    metrics = pipeline.run(knowledge)
+
+    vector_db = knowledge.vector_db
+    assert len(vector_db.documents) == 15
+    assert all(doc.embedding is not None for doc in vector_db.documents.values())
+    # Chunks are embedded in batches of at most batch_size, and only once
+    assert sum(vector_db.embedder.calls) == 15
+    assert max(vector_db.embedder.calls) <= 4
+
+    assert metrics["read"].documents == 5
+    assert metrics["chunk"].documents == 15
+    assert metrics["embed"].documents == 15
+    assert metrics["write"].documents == 15
+    assert all(stage.errors == 0 for stage in metrics.values())
+    # The reader of the knowledge base is not changed by the pipeline
+    assert knowledge.reader.chunk is True
+
+
+async def test_pipeline_runs_from_sync_code_inside_an_event_loop(knowledge, monkeypatch):
+    reads = []
+    original_async_read = TextReader.async_read
+
+    async def recording_async_read(reader, *args, **kwargs):
+        reads.append((reader is knowledge.reader, reader.chunk, knowledge.reader.chunk))
+        return await original_async_read(reader, *args, **kwargs)
+
+    monkeypatch.setattr(TextReader, "async_read", recording_async_read)
+    metrics = IngestionPipeline().run(knowledge)
+
+    assert metrics["write"].documents == 15
+    # Files are read without chunking by a copy of the reader, while the shared reader keeps chunking
+    assert reads == [(False, False, True)] * 5
+
+
+def test_pipeline_matches_sequential_load(knowledge, text_dir):
+    knowledge.ingestion_pipeline = IngestionPipeline(batch_size=2)
+    knowledge.load()
+
+    sequential = TextKnowledgeBase(
+        path=text_dir,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=InMemoryVectorDb(embedder=CountingEmbedder()),
+    )
+    sequential.load()
+
+    assert set(knowledge.vector_db.documents) == set(sequential.vector_db.documents)
+
+
+async def test_pipeline_skips_existing_documents(knowledge):
+    pipeline = IngestionPipeline()
+    await pipeline.arun(knowledge)
+    embedded = sum(knowledge.vector_db.embedder.calls)
+
+    metrics = await pipeline.arun(knowledge)
+
+    assert metrics["write"].documents == 0
+    assert sum(knowledge.vector_db.embedder.calls) == embedded
+
+
+async def test_pipeline_recreate_and_upsert(knowledge):
+    pipeline = IngestionPipeline()
+    await pipeline.arun(knowledge)
+
+    metrics = await pipeline.arun(knowledge, recreate=True, upsert=True)
+
+    assert metrics["write"].documents == 15
+    assert len(knowledge.vector_db.documents) == 15
+
+
+async def test_pipeline_raises_failed_batches(knowledge):
+    calls = {"count": 0}
+    original_insert = knowledge.vector_db.async_insert
+
+    async def flaky_insert(documents, filters=None):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("write failed")
+        await original_insert(documents, filters)
+
+    knowledge.vector_db.async_insert = flaky_insert
+    with pytest.raises(IngestionError) as exc_info:
+        await IngestionPipeline(write_workers=1, batch_size=100).arun(knowledge)
+
+    assert exc_info.value.metrics["write"].errors == 1
+    [failed_batch] = exc_info.value.failed_batches
+    assert failed_batch.stage == "write"
+    assert str(failed_batch.error) == "write failed"
+    assert len(knowledge.vector_db.documents) == 15 - len(failed_batch.documents)
+
+
+async def test_pipeline_reports_documents_that_could_not_be_embedded(knowledge):
+    embedder = knowledge.vector_db.embedder
+    original_embed_batch = embedder._embed_batch_and_usage
+
+    def embed_batch(texts):
+        # The batch and the single request for the first chunk of file 0 fail
+        if any(text.startswith("file0line000") for text in texts):
+            raise RuntimeError("text rejected")
+        return original_embed_batch(texts)
+
+    embedder._embed_batch_and_usage = embed_batch
+    with pytest.raises(IngestionError) as exc_info:
+        await IngestionPipeline(batch_size=100).arun(knowledge)
+
+    [failed_batch] = exc_info.value.failed_batches
+    assert failed_batch.stage == "embed"
+    assert [doc.content[:12] for doc in failed_batch.documents] == ["file0line000"]
+    assert exc_info.value.metrics["embed"].errors == 1
+    assert len(knowledge.vector_db.documents) == 14
+    assert all(doc.embedding for doc in knowledge.vector_db.documents.values())
@@ -0,0 +1,199 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.reader.text_reader import TextReader
+from agno.knowledge.manifest import SourceManifest
+from agno.knowledge.pipeline import IngestionPipeline
+from agno.knowledge.text import TextKnowledgeBase
+from tests.unit.knowledge.test_ingestion_pipeline import CountingEmbedder, InMemoryVectorDb
+
+
+@pytest.fixture
+def text_dir(tmp_path: Path) -> Path:
+    source_dir = tmp_path / "sources"
+    source_dir.mkdir()
+    for i in range(3):
+        (source_dir / f"file_{i}.txt").write_text(f"contents of file {i}")
+    return source_dir
+
+
+@pytest.fixture
+def knowledge(text_dir: Path, tmp_path: Path) -> TextKnowledgeBase:
+    return TextKnowledgeBase(
+        path=text_dir,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=InMemoryVectorDb(embedder=CountingEmbedder()),
+        manifest=SourceManifest(path=tmp_path / "manifest.json"),
+    )
+
+
+def count_read_files(knowledge: TextKnowledgeBase, monkeypatch) -> list:
+    read_files = []
+    original_read = knowledge.reader.read
+
+    def read(file):
+        read_files.append(file.name)
+        return original_read(file=file)
+
+    monkeypatch.setattr(knowledge.reader, "read", read)
+    return read_files
+
+
+def test_reload_skips_unchanged_files(knowledge, text_dir, tmp_path, monkeypatch):
+    knowledge.load()
+    assert len(knowledge.vector_db.documents) == 3
+    assert (tmp_path / "manifest.json").exists()
+
+    read_files = count_read_files(knowledge, monkeypatch)
+    knowledge.load()
+    assert read_files == []
+
+    # Only the modified file is read again
+    (text_dir / "file_1.txt").write_text("new contents of file 1")
+    knowledge.load()
+    assert read_files == ["file_1.txt"]
+    assert len(knowledge.vector_db.documents) == 4
+
+
+def test_touched_file_with_same_content_is_skipped(knowledge, text_dir, monkeypatch):
+    knowledge.load()
+    read_files = count_read_files(knowledge, monkeypatch)
+
+    file_path = text_dir / "file_0.txt"
+    stat = file_path.stat()
+    os.utime(file_path, (stat.st_atime, stat.st_mtime + 10))
+    knowledge.load()
+
+    assert read_files == []
+
+
+def test_manifest_is_persisted(knowledge, tmp_path, monkeypatch):
+    knowledge.load()
+
+    knowledge.manifest = SourceManifest(path=tmp_path / "manifest.json")
+    read_files = count_read_files(knowledge, monkeypatch)
+    knowledge.load()
+
+    assert read_files == []
+    assert len(knowledge.manifest.entries) == 3
+
+
+def test_recreate_reloads_all_files(knowledge, monkeypatch):
+    knowledge.load()
+    read_files = count_read_files(knowledge, monkeypatch)
+
+    knowledge.load(recreate=True)
+
+    assert sorted(read_files) == ["file_0.txt", "file_1.txt", "file_2.txt"]
+    assert len(knowledge.vector_db.documents) == 3
+
+
+def test_manifest_entries_are_kept_per_vector_db(knowledge, text_dir, monkeypatch):
+    knowledge.vector_db.collection = "first"
+    other_vector_db = InMemoryVectorDb(embedder=CountingEmbedder())
+    other_vector_db.collection = "second"
+    other = TextKnowledgeBase(
+        path=text_dir,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=other_vector_db,
+        manifest=knowledge.manifest,
+    )
+
+    knowledge.load()
+    # The files were loaded into another collection, so they are loaded into this one too
+    other.load()
+    assert len(other_vector_db.documents) == 3
+
+    # Recreating one collection keeps the entries of the other
+    other.load(recreate=True)
+    read_files = count_read_files(knowledge, monkeypatch)
+    knowledge.load()
+    assert read_files == []
+
+
+def test_failed_load_does_not_update_manifest(knowledge, monkeypatch):
+    def failing_insert(documents, filters=None):
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(knowledge.vector_db, "insert", failing_insert)
+    with pytest.raises(RuntimeError):
+        knowledge.load()
+
+    assert knowledge.manifest.entries == {}
+
+
+async def test_concurrent_loads_keep_their_own_pending_entries(knowledge, text_dir):
+    import asyncio
+
+    knowledge.vector_db.collection = "failing"
+    other_vector_db = InMemoryVectorDb(embedder=CountingEmbedder())
+    other_vector_db.collection = "working"
+    # The first load fails while the second one is writing
+    other_writing, first_failed = asyncio.Event(), asyncio.Event()
+    other_insert = other_vector_db.async_insert
+
+    async def failing_insert(documents, filters=None):
+        await other_writing.wait()
+        first_failed.set()
+        raise RuntimeError("insert failed")
+
+    async def waiting_insert(documents, filters=None):
+        other_writing.set()
+        await first_failed.wait()
+        await other_insert(documents, filters=filters)
+
+    knowledge.vector_db.async_insert = failing_insert
+    other_vector_db.async_insert = waiting_insert
+    other = TextKnowledgeBase(
+        path=text_dir,
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=other_vector_db,
+        manifest=knowledge.manifest,
+    )
+
+    results = await asyncio.gather(knowledge.aload(), other.aload(), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError) and results[1] is None
+    # Only the files of the load that succeeded are recorded
+    targets = {entry["target"] for entry in knowledge.manifest.entries.values()}
+    assert targets == {SourceManifest.target_of(other_vector_db)}
+    assert len(knowledge.manifest.entries) == 3
+
+
+def test_all_files_visible_outside_of_load(knowledge):
+    knowledge.load()
+    assert len(list(knowledge.document_lists)) == 3
+
+
+async def test_pipeline_uses_manifest(knowledge, text_dir):
+    pipeline = IngestionPipeline()
+    await pipeline.arun(knowledge)
+
+    (text_dir / "file_2.txt").write_text("new contents of file 2")
+    metrics = await pipeline.arun(knowledge)
+
+    assert metrics["read"].documents == 1
+    assert metrics["write"].documents == 1
+
+
+def test_filter_existing_documents_uses_bulk_lookup(knowledge):
+    from agno.document import Document
+
+    knowledge.load()
+    calls = []
+
+    def existing_hashes(hashes):
+        calls.append(hashes)
+        return {doc.content_hash for doc in knowledge.vector_db.documents.values()} & set(hashes)
+
+    knowledge.vector_db.existing_hashes = existing_hashes
+    documents = [Document(content="contents of file 0"), Document(content="new"), Document(content="new")]
+
+    filtered = knowledge.filter_existing_documents(documents)
+
+    assert [doc.content for doc in filtered] == ["new"]
+    # Duplicates are removed before the single lookup
+    assert len(calls) == 1 and len(calls[0]) == 2
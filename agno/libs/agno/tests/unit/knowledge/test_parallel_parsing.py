@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from agno.document.chunking.fixed import FixedSizeChunking
+from agno.document.reader.text_reader import TextReader
+from agno.knowledge.text import TextKnowledgeBase
+from tests.unit.knowledge.test_ingestion_pipeline import CountingEmbedder, InMemoryVectorDb
+
+
+@pytest.fixture
+def text_files(tmp_path: Path) -> list:
+    files = []
+    for i in range(6):
+        path = tmp_path / f"file_{i}.txt"
+        path.write_text(f"contents of file {i}")
+        files.append(path)
+    return files
+
+
+def make_knowledge(text_files: list, num_parse_workers=None) -> TextKnowledgeBase:
+    return TextKnowledgeBase(
+        path=[{"path": str(path), "metadata": {"index": i}} for i, path in enumerate(text_files)],
+        reader=TextReader(chunking_strategy=FixedSizeChunking(chunk_size=100, overlap=0)),
+        vector_db=InMemoryVectorDb(embedder=CountingEmbedder()),
+        num_parse_workers=num_parse_workers,
+    )
+
+
+def contents(document_lists) -> list:
+    return [[(doc.content, doc.meta_data) for doc in documents] for documents in document_lists]
+
+
+def test_process_pool_keeps_file_order(text_files):
+    expected = contents(make_knowledge(text_files).document_lists)
+
+    assert contents(make_knowledge(text_files, num_parse_workers=2).document_lists) == expected
+    assert [documents[0][1]["index"] for documents in expected] == list(range(6))
+
+
+async def test_async_process_pool_keeps_file_order(text_files):
+    expected = contents(make_knowledge(text_files).document_lists)
+
+    knowledge = make_knowledge(text_files, num_parse_workers=2)
+    document_lists = [documents async for documents in knowledge.async_document_lists]
+
+    assert contents(document_lists) == expected
+
+
+def test_load_with_process_pool(text_files):
+    knowledge = make_knowledge(text_files, num_parse_workers=2)
+
+    knowledge.load()
+
+    assert len(knowledge.vector_db.documents) == 6
+
+
+def test_reader_that_can_not_be_pickled_reads_in_process(text_files, monkeypatch):
+    knowledge = make_knowledge(text_files, num_parse_workers=2)
+    # A local function can not be sent to a worker process
+    original_read = knowledge.reader.read
+    monkeypatch.setattr(knowledge.reader, "read", lambda file: original_read(file=file))
+
+    assert len(list(knowledge.document_lists)) == 6
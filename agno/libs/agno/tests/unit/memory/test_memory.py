@@ -1,3 +1,4 @@
+from copy import deepcopy
 from datetime import datetime
 from unittest.mock import MagicMock, Mock, patch
 
@@ -598,6 +599,100 @@ def test_get_messages_from_last_n_runs(memory_with_model):
 
 
 # Team Context Tests
+def test_add_run_replaces_run_with_same_id(memory_with_model):
+    """Test that adding a run with a known run_id replaces it, also after the runs list was replaced."""
+    session_id = "test_session"
+    for i in range(5):
+        memory_with_model.add_run(session_id, RunResponse(run_id=f"run_{i}", content=f"Response {i}"))
+
+    memory_with_model.add_run(session_id, RunResponse(run_id="run_2", content="Updated"))
+    assert len(memory_with_model.runs[session_id]) == 5
+    assert memory_with_model.runs[session_id][2].content == "Updated"
+
+    # Runs loaded from storage replace the list
+    memory_with_model.runs[session_id] = list(reversed(memory_with_model.runs[session_id]))
+    memory_with_model.add_run(session_id, RunResponse(run_id="run_0", content="Updated again"))
+    assert len(memory_with_model.runs[session_id]) == 5
+    assert memory_with_model.runs[session_id][4].content == "Updated again"
+
+    memory_with_model.add_run(session_id, RunResponse(run_id="run_5", content="Response 5"))
+    assert len(memory_with_model.runs[session_id]) == 6
+
+
+def test_get_messages_from_last_n_runs_skips_filtered_runs(memory_with_model):
+    """Test that the last N runs are counted after filtering by agent and status."""
+    from agno.run.base import RunStatus
+
+    session_id = "test_session"
+    for i in range(6):
+        memory_with_model.add_run(
+            session_id,
+            RunResponse(
+                run_id=f"run_{i}",
+                agent_id="agent_1" if i % 2 == 0 else "agent_2",
+                status=RunStatus.error if i == 4 else RunStatus.running,
+                messages=[Message(role="user", content=f"Question {i}")],
+            ),
+        )
+
+    messages = memory_with_model.get_messages_from_last_n_runs(session_id, agent_id="agent_1", last_n=2)
+
+    assert [message.content for message in messages] == ["Question 0", "Question 2"]
+
+
+def test_get_session_metrics(memory_with_model):
+    """Test that session metrics add up the assistant messages of all runs, including changes to the last run."""
+    from agno.models.message import MessageMetrics
+
+    session_id = "test_session"
+
+    def make_run(run_id: str, input_tokens: int) -> RunResponse:
+        return RunResponse(
+            run_id=run_id,
+            messages=[
+                Message(role="user", content="Hello"),
+                Message(role="assistant", content="Hi", metrics=MessageMetrics(input_tokens=input_tokens)),
+            ],
+        )
+
+    memory_with_model.add_run(session_id, make_run("run_1", 10))
+    memory_with_model.add_run(session_id, make_run("run_2", 20))
+    assert memory_with_model.get_session_metrics(session_id).input_tokens == 30
+
+    # The last run can still change
+    memory_with_model.runs[session_id][-1].messages.append(
+        Message(role="assistant", content="More", metrics=MessageMetrics(input_tokens=5))
+    )
+    assert memory_with_model.get_session_metrics(session_id).input_tokens == 35
+
+    memory_with_model.add_run(session_id, make_run("run_3", 1))
+    assert memory_with_model.get_session_metrics(session_id).input_tokens == 36
+
+    # Replacing a run reads the metrics again
+    memory_with_model.add_run(session_id, make_run("run_1", 100))
+    assert memory_with_model.get_session_metrics(session_id).input_tokens == 126
+
+
+def test_agent_memory_session_metrics_and_runs():
+    """Test the run index and running session metrics of the legacy AgentMemory."""
+    from agno.memory.agent import AgentMemory, AgentRun
+    from agno.models.message import MessageMetrics
+
+    memory = AgentMemory()
+    memory.add_messages([Message(role="assistant", content="Hi", metrics=MessageMetrics(output_tokens=3))])
+    assert memory.get_session_metrics().output_tokens == 3
+    memory.add_messages([Message(role="assistant", content="Hi", metrics=MessageMetrics(output_tokens=4))])
+    assert memory.get_session_metrics().output_tokens == 7
+    memory.add_system_message(Message(role="system", content="System"))
+    assert memory.get_session_metrics().output_tokens == 7
+
+    for i in range(3):
+        memory.add_run(AgentRun(response=RunResponse(run_id=f"run_{i}", content=f"Response {i}")))
+    memory.add_run(AgentRun(response=RunResponse(run_id="run_1", content="Updated")))
+    assert len(memory.runs) == 3
+    assert memory.runs[1].response.content == "Updated"
+
+
 def test_add_interaction_to_team_context(memory_with_model):
     """Test adding an interaction to team context."""
     # Add a run with messages
@@ -759,3 +854,64 @@ def test_clear(memory_with_model, sample_user_memory):
     # Verify data is cleared
     assert memory_with_model.memories == {}
     assert memory_with_model.summaries == {}
+
+
+def test_user_memory_cache_reads_only_changed_memories(tmp_path):
+    from agno.memory.v2.db.sqlite import SqliteMemoryDb
+
+    db = SqliteMemoryDb(db_file=str(tmp_path / "memory.db"))
+    db.create()
+    memory = Memory(db=db)
+    first_id = memory.add_user_memory(UserMemory(memory="first"), user_id="test_user")
+    memory.add_user_memory(UserMemory(memory="second"), user_id="test_user")
+
+    with (
+        patch.object(
+            SqliteMemoryDb, "read_memories", autospec=True, side_effect=SqliteMemoryDb.read_memories
+        ) as read_memories,
+        patch.object(
+            SqliteMemoryDb,
+            "read_memories_updated_since",
+            autospec=True,
+            side_effect=SqliteMemoryDb.read_memories_updated_since,
+        ) as read_updated,
+    ):
+        assert sorted(m.memory for m in memory.get_user_memories(user_id="test_user")) == ["first", "second"]
+        # A memory written by another process is fetched incrementally
+        db.upsert_memory(MemoryRow(id="other", user_id="test_user", memory=UserMemory(memory="third").to_dict()))
+        assert len(memory.get_user_memories(user_id="test_user")) == 3
+        read_memories.assert_not_called()
+        assert read_updated.call_count == 2
+
+        # A memory deleted by another process leaves the count off, so memories are read in full
+        db.delete_memory(first_id)
+        assert sorted(m.memory for m in memory.get_user_memories(user_id="test_user")) == ["second", "third"]
+        read_memories.assert_called_once_with(db, user_id="test_user")
+
+    # Copies of the memory share the cache
+    assert deepcopy(memory).user_memory_cache is memory.user_memory_cache
+
+
+def test_user_memory_cache_ttl_and_lru():
+    from agno.memory.v2.cache import UserMemoryCache
+
+    db = Mock()
+    db.get_memories_version.return_value = (1, "2025-01-01 00:00:00")
+    db.read_memories.return_value = [MemoryRow(id="1", user_id="a", memory=UserMemory(memory="m").to_dict())]
+    cache = UserMemoryCache(max_users=1, ttl=60)
+
+    with patch("agno.memory.v2.cache.time.monotonic", return_value=0):
+        cache.get_user_memories(db, "a")
+        cache.get_user_memories(db, "a")
+    assert db.read_memories.call_count == 1
+
+    # Entries older than the ttl are read again
+    with patch("agno.memory.v2.cache.time.monotonic", return_value=61):
+        cache.get_user_memories(db, "a")
+    assert db.read_memories.call_count == 2
+
+    # Only max_users users are kept
+    cache.get_user_memories(db, "b")
+    assert len(cache) == 1
+    cache.get_user_memories(db, "a")
+    assert db.read_memories.call_count == 4
@@ -242,3 +242,38 @@ def test_error_handling(memory_db, mock_redis_client):
     result = memory_db.clear()
     # The method should return False when there's an error
     assert result is False
+
+
+def test_memories_version_and_incremental_read(memory_db, mock_redis_client):
+    """Test the per-user memory index used to read only changed memories."""
+    index: Dict[str, Dict[str, str]] = {}
+
+    def mock_hincrby(key, field, amount):
+        value = int(index.setdefault(key, {}).get(field, 0)) + amount
+        index[key][field] = str(value)
+        return value
+
+    def mock_hset(key, field=None, value=None, mapping=None):
+        index.setdefault(key, {}).update({k: str(v) for k, v in (mapping or {field: value}).items()})
+
+    mock_redis_client.hincrby.side_effect = mock_hincrby
+    mock_redis_client.hset.side_effect = mock_hset
+    mock_redis_client.hsetnx.side_effect = lambda key, field, value: index.setdefault(key, {}).setdefault(field, value)
+    mock_redis_client.hget.side_effect = lambda key, field: index.get(key, {}).get(field)
+    mock_redis_client.hlen.side_effect = lambda key: len(index.get(key, {}))
+    mock_redis_client.hgetall.side_effect = lambda key: dict(index.get(key, {}))
+    mock_redis_client.hdel.side_effect = lambda key, field: index.get(key, {}).pop(field, None)
+    mock_redis_client.mget.side_effect = lambda keys: [mock_redis_client.get(key) for key in keys]
+
+    # Memories written before the index existed are indexed on first use
+    mock_redis_client.set("test_memory:old", '{"id": "old", "user_id": "user1", "memory": {"memory": "old"}}')
+    assert memory_db.get_memories_version(user_id="user1") is None
+    assert memory_db.get_memories_version(user_id="user1") == (1, 0)
+
+    memory_db.upsert_memory(MemoryRow(id="1", user_id="user1", memory={"memory": "first"}))
+    memory_db.upsert_memory(MemoryRow(id="2", user_id="user1", memory={"memory": "second"}))
+    assert memory_db.get_memories_version(user_id="user1") == (3, 2)
+    assert [m.id for m in memory_db.read_memories_updated_since(user_id="user1", since=2)] == ["2"]
+
+    memory_db.delete_memory("1")
+    assert memory_db.get_memories_version(user_id="user1") == (2, 3)
@@ -0,0 +1,142 @@
+import asyncio
+import copy
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from agno.agent import Agent
+from agno.models.openai import OpenAIChat
+
+
+def test_openai_chat_reuses_clients():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+
+    assert model.get_client() is model.get_client()
+    assert model.get_async_client() is model.get_async_client()
+
+
+def test_http_client_limits():
+    limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+    model = OpenAIChat(id="gpt-4o", api_key="test-key", http_client_limits=limits)
+
+    pool = model.get_async_client()._client._transport._pool
+    assert pool._max_connections == 5
+    assert pool._max_keepalive_connections == 2
+
+
+def test_close_creates_new_client_on_next_request():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+    client = model.get_client()
+
+    model.close()
+
+    assert client.is_closed()
+    assert model.client is None
+    assert model.get_client() is not client
+
+
+async def test_aclose_closes_sync_and_async_clients():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+    client = model.get_client()
+    async_client = model.get_async_client()
+
+    await model.aclose()
+
+    assert client.is_closed()
+    assert async_client.is_closed()
+    assert model.client is None and model.async_client is None
+
+
+def test_close_leaves_http_client_open():
+    http_client = httpx.Client()
+    model = OpenAIChat(id="gpt-4o", api_key="test-key", http_client=http_client)
+    model.get_client()
+
+    model.close()
+
+    assert not http_client.is_closed
+    assert model.client is None
+    http_client.close()
+
+
+def test_deep_copy_shares_clients():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+    client = model.get_client()
+
+    model_copy = copy.deepcopy(model)
+
+    assert model_copy is not model
+    assert model_copy.client is client
+
+
+class ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Answers every chat completion request with the same assistant message"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": "hello"}, "finish_reason": "stop"}
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_async_client_is_recreated_for_each_event_loop():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ChatCompletionHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        model = OpenAIChat(id="gpt-4o", api_key="test-key", base_url=f"http://127.0.0.1:{server.server_port}/v1")
+        agent = Agent(model=model, telemetry=False)
+
+        first = asyncio.run(agent.arun("hi"))
+        first_client = model.async_client
+        second = asyncio.run(agent.arun("hi again"))
+
+        assert first.content == second.content == "hello"
+        assert model.async_client is not first_client
+        # The client of the closed event loop is not kept
+        assert model._previous_async_clients == []
+    finally:
+        server.shutdown()
+
+
+async def test_aclose_closes_async_clients_of_other_event_loops():
+    model = OpenAIChat(id="gpt-4o", api_key="test-key")
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def get_async_client():
+        return model.get_async_client()
+
+    try:
+        other_client = asyncio.run_coroutine_threadsafe(get_async_client(), other_loop).result()
+        client = model.get_async_client()
+        assert client is not other_client
+        # The client is used again on the event loop it was created on
+        assert asyncio.run_coroutine_threadsafe(get_async_client(), other_loop).result() is other_client
+
+        await model.aclose()
+
+        assert client.is_closed() and other_client.is_closed()
+        assert model.async_client is None and model._previous_async_clients == []
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
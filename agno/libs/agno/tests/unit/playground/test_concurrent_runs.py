@@ -0,0 +1,166 @@
+"""
+Load test for concurrent streamed runs against one agent or team served by the playground and FastAPI apps.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import httpx
+
+from agno.agent import Agent
+from agno.app.fastapi import FastAPIApp
+from agno.memory.v2.db.sqlite import SqliteMemoryDb
+from agno.memory.v2.memory import Memory
+from agno.memory.v2.schema import UserMemory
+from agno.models.base import Model
+from agno.models.message import Message
+from agno.models.response import ModelResponse
+from agno.playground import Playground
+from agno.team import Team
+from agno.tools.toolkit import Toolkit
+
+NUM_CONCURRENT_RUNS = 200
+
+
+@dataclass
+class EchoModel(Model):
+    """Streams the last user message back, one word at a time, yielding to other runs between words"""
+
+    id: str = "echo"
+    name: str = "Echo"
+    provider: str = "Echo"
+
+    def _words(self, messages: List[Message]) -> List[str]:
+        user_message = next(m for m in reversed(messages) if m.role == "user")
+        return [f"{word} " for word in f"echo {user_message.content}".split()]
+
+    def invoke(self, messages: List[Message], **kwargs) -> str:
+        return "".join(self._words(messages))
+
+    async def ainvoke(self, messages: List[Message], **kwargs) -> str:
+        await asyncio.sleep(0)
+        return "".join(self._words(messages))
+
+    def invoke_stream(self, messages: List[Message], **kwargs) -> Iterator[str]:
+        yield from self._words(messages)
+
+    async def ainvoke_stream(self, messages: List[Message], **kwargs) -> AsyncIterator[str]:
+        for word in self._words(messages):
+            await asyncio.sleep(0)
+            yield word
+
+    def parse_provider_response(self, response: Any, **kwargs) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+    def parse_provider_response_delta(self, response: Any) -> ModelResponse:
+        return ModelResponse(role="assistant", content=response)
+
+
+def parse_stream(body: str) -> List[Dict[str, Any]]:
+    decoder = json.JSONDecoder()
+    events, position = [], 0
+    while position < len(body):
+        event, position = decoder.raw_decode(body, position)
+        events.append(event)
+    return events
+
+
+async def run_concurrently(app, path: str, num_runs: int = NUM_CONCURRENT_RUNS) -> List[Dict[str, Any]]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+
+        async def run(i: int) -> Dict[str, Any]:
+            response = await client.post(
+                path, data={"message": f"message {i}", "stream": "true", "session_id": f"session-{i}"}
+            )
+            assert response.status_code == 200
+            events = parse_stream(response.text)
+            content = "".join(e.get("content") or "" for e in events if e["event"].endswith("RunResponseContent"))
+            return {"i": i, "events": events, "content": content}
+
+        return await asyncio.gather(*(run(i) for i in range(num_runs)))
+
+
+def assert_isolated(results: List[Dict[str, Any]], id_field: str) -> None:
+    for result in results:
+        i = result["i"]
+        assert result["content"].strip() == f"echo message {i}"
+        top_level = [e for e in result["events"] if id_field in e]
+        assert top_level
+        assert {e["session_id"] for e in top_level} == {f"session-{i}"}
+        assert not [e for e in result["events"] if e["event"].endswith("RunError")]
+
+
+def make_agent(**kwargs) -> Agent:
+    return Agent(name="Echo Agent", agent_id="echo-agent", model=EchoModel(), telemetry=False, **kwargs)
+
+
+async def test_playground_serves_concurrent_streamed_agent_runs():
+    def lookup(query: str) -> str:
+        """Look up a query"""
+        return query
+
+    agent = make_agent(tools=[Toolkit(name="lookup", tools=[lookup])], session_state={"count": 0})
+    app = Playground(agents=[agent]).get_app(use_async=True)
+
+    results = await run_concurrently(app, "/v1/playground/agents/echo-agent/runs")
+
+    assert_isolated(results, "agent_id")
+    # The shared agent is never run itself
+    assert agent.run_response is None
+    assert agent.session_state == {"count": 0}
+    assert agent.tools[0].functions["lookup"]._agent is None
+
+
+async def test_fastapi_app_serves_concurrent_streamed_team_runs():
+    team = Team(
+        name="Echo Team",
+        team_id="echo-team",
+        mode="coordinate",
+        model=EchoModel(),
+        members=[make_agent()],
+        telemetry=False,
+    )
+    app = FastAPIApp(teams=[team]).get_app(use_async=True)
+
+    results = await run_concurrently(app, "/runs?team_id=echo-team", num_runs=50)
+
+    assert_isolated(results, "team_id")
+    assert team.run_response is None
+
+
+def test_copy_for_run_shares_configuration():
+    agent = make_agent(session_state={"count": 0}, tools=[Toolkit(name="empty", tools=[])])
+
+    copy_a, copy_b = agent.copy_for_run(), agent.copy_for_run()
+
+    assert copy_a.agent_id == copy_b.agent_id == agent.agent_id
+    assert copy_a.memory is copy_b.memory is agent.memory
+    assert copy_a.model is not copy_b.model
+    assert copy_a.tools[0] is not agent.tools[0]
+    copy_a.session_state["count"] = 1
+    assert copy_b.session_state == {"count": 0}
+
+
+def test_concurrent_runs_for_two_users_see_their_own_memories(tmp_path):
+    memory = Memory(db=SqliteMemoryDb(db_file=str(tmp_path / "memory.db")))
+    memory.add_user_memory(UserMemory(memory="alice likes tea"), user_id="alice")
+    memory.add_user_memory(UserMemory(memory="bob likes coffee"), user_id="bob")
+    agent = make_agent(memory=memory, add_memory_references=True)
+
+    def run(i: int) -> str:
+        user_id = ["alice", "bob"][i % 2]
+        response = agent.copy_for_run().run(f"message {i}", user_id=user_id, session_id=f"session-{i}")
+        return f"{user_id}: {response.messages[0].content}"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        system_messages = list(executor.map(run, range(100)))
+
+    for system_message in system_messages:
+        user_id, content = system_message.split(": ", 1)
+        assert ("alice likes tea" in content) == (user_id == "alice")
+        assert ("bob likes coffee" in content) == (user_id == "bob")
+    assert set(memory.memories) == {"alice", "bob"}
@@ -0,0 +1,104 @@
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+
+# Mock the sentence_transformers module
+with patch.dict("sys.modules", {"sentence_transformers": Mock()}):
+    from agno.reranker import sentence_transformer
+    from agno.reranker.sentence_transformer import (
+        SentenceTransformerReranker,
+        _CrossEncoderBatcher,
+        get_cross_encoder,
+    )
+
+
+class StubCrossEncoder:
+    """Stand-in for a CrossEncoder, scoring a pair by the length of the document"""
+
+    loads: List[str] = []
+    predict_calls: List[List[List[str]]] = []
+    fail_next_predict = threading.Event()
+
+    def __init__(self, model_name_or_path: str, model_kwargs: Optional[Dict[str, Any]] = None):
+        StubCrossEncoder.loads.append(model_name_or_path)
+
+    def predict(self, pairs: List[List[str]], batch_size: int = 32) -> np.ndarray:
+        StubCrossEncoder.predict_calls.append(pairs)
+        if StubCrossEncoder.fail_next_predict.is_set():
+            StubCrossEncoder.fail_next_predict.clear()
+            raise RuntimeError("predict failed")
+        return np.array([float(len(document)) for _, document in pairs])
+
+
+@pytest.fixture(autouse=True)
+def stub_cross_encoder(monkeypatch):
+    StubCrossEncoder.loads = []
+    StubCrossEncoder.predict_calls = []
+    StubCrossEncoder.fail_next_predict.clear()
+    monkeypatch.setattr(sentence_transformer, "CrossEncoder", StubCrossEncoder)
+    monkeypatch.setattr(sentence_transformer, "_cross_encoders", {})
+    monkeypatch.setattr(sentence_transformer, "_batchers", {})
+
+
+@pytest.fixture
+def documents() -> List[Document]:
+    return [Document(content=content) for content in ["medium text", "short", "the longest text of all"]]
+
+
+def test_model_is_loaded_once_per_name():
+    first = get_cross_encoder("model-a")
+    threads = [threading.Thread(target=get_cross_encoder, args=("model-a",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert get_cross_encoder("model-a") is first
+    assert get_cross_encoder("model-b") is not first
+    assert get_cross_encoder("model-a", model_kwargs={"torch_dtype": "float16"}) is not first
+    assert StubCrossEncoder.loads == ["model-a", "model-b", "model-a"]
+
+
+def test_concurrent_submits_are_scored_in_one_predict():
+    batcher = _CrossEncoderBatcher("model-a", None, batch_size=6, max_wait=5.0)
+    requests = [[["query", "a" * i], ["query", "b" * (i + 1)]] for i in range(3)]
+
+    futures = [batcher.submit(pairs) for pairs in requests]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert len(StubCrossEncoder.predict_calls) == 1
+    assert StubCrossEncoder.predict_calls[0] == [pair for pairs in requests for pair in pairs]
+    assert results == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
+
+
+def test_batcher_thread_survives_predict_errors():
+    batcher = _CrossEncoderBatcher("model-a", None, batch_size=1, max_wait=0.0)
+    StubCrossEncoder.fail_next_predict.set()
+
+    with pytest.raises(RuntimeError, match="predict failed"):
+        batcher.submit([["query", "text"]]).result(timeout=5)
+
+    assert batcher.submit([["query", "text"]]).result(timeout=5) == [4.0]
+    assert batcher._worker.is_alive()
+
+
+def test_rerank_returns_original_documents_on_error(documents):
+    StubCrossEncoder.fail_next_predict.set()
+
+    assert SentenceTransformerReranker(model="model-a").rerank("query", documents) == documents
+
+
+async def test_arerank_matches_rerank(documents):
+    reranker = SentenceTransformerReranker(model="model-a", top_n=2)
+
+    reranked = reranker.rerank("query", list(documents))
+    areranked = await reranker.arerank("query", list(documents))
+
+    assert [doc.content for doc in reranked] == ["the longest text of all", "medium text"]
+    assert [doc.content for doc in areranked] == [doc.content for doc in reranked]
+    assert [doc.reranking_score for doc in areranked] == [23.0, 11.0]
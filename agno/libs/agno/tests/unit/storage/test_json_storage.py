@@ -1,4 +1,5 @@
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator
 
@@ -174,3 +175,49 @@ def test_workflow_storage_filtering(workflow_storage: JsonStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_list_session_summaries(agent_storage: JsonStorage, temp_dir: Path):
+    for i in range(3):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="user-1" if i < 2 else "user-2",
+                memory={"runs": [{"run_id": f"run-{i}", "content": f"answer {i}"}]},
+            )
+        )
+
+    index_path = temp_dir / ".session_index"
+    assert index_path.exists()
+    summaries = agent_storage.list_session_summaries(user_id="user-1")
+    assert sorted(summary.session_id for summary in summaries) == ["session-0", "session-1"]
+    assert summaries[0].first_run["content"].startswith("answer")
+    assert len(agent_storage.list_session_summaries(limit=2)) == 2
+    assert len(agent_storage.list_session_summaries(offset=2)) == 1
+
+    # A missing index is rebuilt from the session files
+    index_path.unlink()
+    assert len(agent_storage.list_session_summaries()) == 3
+
+    agent_storage.delete_session("session-0")
+    assert [summary.session_id for summary in agent_storage.list_session_summaries(user_id="user-1")] == ["session-1"]
+
+    agent_storage.drop()
+    assert not index_path.exists()
+    assert agent_storage.list_session_summaries() == []
+
+
+def test_concurrent_upserts_keep_every_index_entry(agent_storage: JsonStorage, temp_dir: Path):
+    # Two storages of the same directory, like two agents sharing it
+    other_storage = JsonStorage(dir_path=temp_dir)
+
+    def upsert(i: int) -> None:
+        storage = agent_storage if i % 2 else other_storage
+        storage.upsert(AgentSession(session_id=f"session-{i}", agent_id="test-agent", user_id="user-1"))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(upsert, range(50)))
+
+    assert len(agent_storage.list_session_summaries()) == 50
+    assert not list(temp_dir.glob("*.tmp"))
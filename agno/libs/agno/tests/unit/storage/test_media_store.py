@@ -0,0 +1,160 @@
+import hashlib
+import io
+import json
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+from agno.agent import Agent
+from agno.media import AudioArtifact, Image, ImageArtifact
+from agno.models.base import _aload_media_content, _load_media_content
+from agno.models.message import Message
+from agno.models.openai import OpenAIChat
+from agno.storage.json import JsonStorage
+from agno.storage.media import LocalMediaStore, read_media_uri, use_media_store
+from agno.storage.media.s3 import S3MediaStore
+
+IMAGE_BYTES = b"\x89PNG" + bytes(range(256)) * 64
+
+
+class FakeS3Client:
+    """Stand-in for a boto3 S3 client, keeping objects in memory"""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def head_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {}
+
+    def upload_fileobj(self, Fileobj, Bucket, Key):
+        self.uploads += 1
+        self.objects[(Bucket, Key)] = Fileobj.read()
+
+    def get_object(self, Bucket, Key):
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+
+@pytest.fixture
+def media_store(tmp_path: Path) -> LocalMediaStore:
+    return LocalMediaStore(base_dir=tmp_path / "media")
+
+
+def test_local_media_store_round_trip(media_store: LocalMediaStore):
+    content_hash, content_uri = media_store.put(IMAGE_BYTES)
+
+    assert content_hash == hashlib.sha256(IMAGE_BYTES).hexdigest()
+    assert content_uri == f"{media_store.base_uri}/{content_hash[:2]}/{content_hash}"
+    assert media_store.exists(content_hash)
+    assert media_store.get(content_hash) == IMAGE_BYTES
+    assert read_media_uri(content_uri) == IMAGE_BYTES
+    # Same content is stored once, with no temporary files left behind
+    assert media_store.put(IMAGE_BYTES) == (content_hash, content_uri)
+    assert [p.name for p in (media_store.base_dir / content_hash[:2]).iterdir()] == [content_hash]
+
+    media_store.delete(content_hash)
+    assert not media_store.exists(content_hash)
+
+
+def test_media_is_serialized_inline_without_media_store():
+    image_dict = Image(content=IMAGE_BYTES).to_dict()
+
+    assert "content" in image_dict
+    assert "content_uri" not in image_dict
+    assert Image.model_validate(image_dict).content == IMAGE_BYTES
+
+
+def test_media_store_keeps_only_references(media_store: LocalMediaStore):
+    message = Message(role="user", content="Describe this image", images=[Image(content=IMAGE_BYTES)])
+    with use_media_store(media_store):
+        message_dict = message.to_dict()
+
+    image_dict = message_dict["images"][0]
+    assert "content" not in image_dict
+    assert image_dict["content_hash"] == hashlib.sha256(IMAGE_BYTES).hexdigest()
+    assert len(json.dumps(message_dict)) < 1000
+
+    # The reference is kept, so a save without a store does not inline the content again
+    restored = Message.model_validate(json.loads(json.dumps(message_dict)))
+    assert restored.images[0].content is None
+    assert restored.images[0].to_dict() == image_dict
+
+    _load_media_content([restored])
+    assert restored.images[0].content == IMAGE_BYTES
+
+
+async def test_offloaded_media_is_loaded_before_async_model_calls(media_store: LocalMediaStore):
+    with use_media_store(media_store):
+        message_dict = Message(role="user", images=[Image(content=IMAGE_BYTES)]).to_dict()
+    restored = Message.model_validate(message_dict)
+
+    await _aload_media_content([restored])
+
+    assert restored.images[0].content == IMAGE_BYTES
+
+
+def test_artifacts_are_offloaded(media_store: LocalMediaStore):
+    image = ImageArtifact(id="img", content=b"aGVsbG8=")
+    audio = AudioArtifact(id="aud", base64_audio="d29ybGQ=")
+    with use_media_store(media_store):
+        image_dict = image.to_dict()
+        audio_dict = audio.to_dict()
+
+    assert "content" not in image_dict and "content" not in audio_dict
+    restored_image = ImageArtifact.model_validate(image_dict)
+    restored_audio = AudioArtifact.model_validate(audio_dict)
+    assert restored_image.load_content() == b"aGVsbG8="
+    assert restored_audio.load_content() == "d29ybGQ="
+
+
+def test_agent_session_keeps_media_references(tmp_path: Path, media_store: LocalMediaStore):
+    storage = JsonStorage(dir_path=tmp_path / "sessions")
+    agent = Agent(model=OpenAIChat(api_key="test"), storage=storage, media_store=media_store)
+    agent.images = [ImageArtifact(id="img", content=IMAGE_BYTES)]
+
+    agent.write_to_storage(session_id="session-1")
+
+    session_json = (tmp_path / "sessions" / "session-1.json").read_text()
+    assert len(session_json) < len(IMAGE_BYTES)
+    image_dict = json.loads(session_json)["session_data"]["images"][0]
+    assert ImageArtifact.model_validate(image_dict).load_content() == IMAGE_BYTES
+
+
+def test_s3_media_store_with_stand_in_client():
+    client = FakeS3Client()
+    media_store = S3MediaStore(bucket_name="media", prefix="agno/media", client=client)
+
+    content_hash, content_uri = media_store.put(IMAGE_BYTES)
+    media_store.put(IMAGE_BYTES)
+
+    assert content_uri == f"s3://media/agno/media/{content_hash[:2]}/{content_hash}"
+    assert client.uploads == 1
+    assert read_media_uri(content_uri) == IMAGE_BYTES
+
+    with use_media_store(media_store):
+        image_dict = Image(content=IMAGE_BYTES).to_dict()
+    assert image_dict["content_uri"] == content_uri
+    assert client.uploads == 1
+
+
+def test_only_uris_of_registered_media_stores_are_read(tmp_path: Path, media_store: LocalMediaStore):
+    secret = tmp_path / "secret.txt"
+    secret.write_bytes(b"secret")
+    content_hash = hashlib.sha256(b"secret").hexdigest()
+    (tmp_path / "media" / "other").mkdir()
+
+    for content_uri in [
+        secret.as_uri(),
+        f"{media_store.base_uri}/../secret.txt",
+        f"{media_store.base_uri}/other/{content_hash}",
+    ]:
+        with pytest.raises(ValueError):
+            read_media_uri(content_uri)
+    with pytest.raises(ValueError):
+        Image(content_uri=secret.as_uri()).load_content()
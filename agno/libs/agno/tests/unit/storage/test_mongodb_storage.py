@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -316,3 +316,74 @@ def test_deepcopy(agent_storage):
     assert copied_storage._client is storage._client
     assert copied_storage.db is storage.db
     assert copied_storage.collection is storage.collection
+
+
+def test_list_session_summaries(agent_storage):
+    """Test session summaries project only the summary fields and the first run."""
+    storage, mock_collection = agent_storage
+    mock_cursor = MagicMock()
+    mock_cursor.sort.return_value = mock_cursor
+    mock_cursor.skip.return_value = mock_cursor
+    mock_cursor.limit.return_value = mock_cursor
+    mock_cursor.__iter__.return_value = iter(
+        [
+            {
+                "session_id": "test-session",
+                "agent_id": "test-agent",
+                "user_id": "test-user",
+                "session_data": {"session_name": "named"},
+                "memory": {"runs": [{"run_id": "run-1", "content": "hello"}]},
+                "created_at": 2,
+            }
+        ]
+    )
+    mock_collection.find.return_value = mock_cursor
+
+    summaries = storage.list_session_summaries(user_id="test-user", limit=10, offset=5)
+
+    query, projection = mock_collection.find.call_args[0]
+    assert query == {"user_id": "test-user"}
+    assert projection["memory.runs"] == {"$slice": 1}
+    assert "agent_data" not in projection
+    mock_cursor.skip.assert_called_once_with(5)
+    mock_cursor.limit.assert_called_once_with(10)
+    assert len(summaries) == 1
+    assert summaries[0].entity_id == "test-agent"
+    assert summaries[0].session_name == "named"
+    assert summaries[0].first_run == {"run_id": "run-1", "content": "hello"}
+
+
+async def test_async_methods_use_async_client(mock_mongo_client):
+    """Test aread, aupsert and aget_recent_sessions go through the async client."""
+    _, mock_collection = mock_mongo_client
+    with patch("agno.storage.mongodb.AsyncMongoClient") as mock_async_client:
+        async_collection = MagicMock()
+        mock_async_client.return_value.__getitem__.return_value.__getitem__.return_value = async_collection
+        storage = MongoDbStorage(collection_name="agent_sessions", db_url="mongodb://localhost:27017")
+
+        doc = {"_id": "id", "session_id": "test-session", "agent_id": "test-agent", "user_id": "test-user"}
+        async_collection.find_one = AsyncMock(side_effect=[None, dict(doc)])
+        async_collection.update_one = AsyncMock(return_value=MagicMock(acknowledged=True))
+
+        saved_session = await storage.aupsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+
+        assert saved_session is not None and saved_session.agent_id == "test-agent"
+        query, update = async_collection.update_one.call_args[0]
+        assert query == {"session_id": "test-session"}
+        assert update["$set"]["created_at"] == update["$set"]["updated_at"]
+
+        cursor = MagicMock()
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.__aiter__.return_value = [dict(doc)]
+        async_collection.find.return_value = cursor
+
+        sessions = await storage.aget_recent_sessions(user_id="test-user", entity_id="test-agent", limit=1)
+
+        assert [session.session_id for session in sessions] == ["test-session"]
+        async_collection.find.assert_called_once_with({"user_id": "test-user", "agent_id": "test-agent"})
+        cursor.limit.assert_called_once_with(1)
+        mock_async_client.assert_called_once_with("mongodb://localhost:27017")
+    # The sync client is not used
+    mock_collection.find_one.assert_not_called()
+    mock_collection.update_one.assert_not_called()
@@ -1,6 +1,7 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from agno.storage.postgres import PostgresStorage
 from agno.storage.session.agent import AgentSession
@@ -272,3 +273,73 @@ def test_mode_switching():
                     storage.mode = "workflow"
                     assert storage.mode == "workflow"
                     mock_get_table.assert_called_once()
+
+
+def test_runs_table_upsert(mock_engine, mock_session):
+    """Test that runs are appended to the runs table and only changed runs are written."""
+    with patch("agno.storage.postgres.scoped_session", return_value=mock_session[0]):
+        with patch("agno.storage.postgres.inspect", return_value=MagicMock()):
+            storage = PostgresStorage(
+                table_name="agent_sessions", schema="ai", db_engine=mock_engine, runs_table_name="agent_session_runs"
+            )
+    sess = mock_session[1]
+    sess.execute.return_value = MagicMock(__iter__=lambda _: iter([]), scalar=MagicMock(return_value=-1))
+
+    runs = [{"run_id": "run-1", "content": "Answer 1"}, {"run_id": "run-2", "content": "Answer 2"}]
+    storage._write_runs(sess, "test-session", runs)
+
+    stmt = sess.execute.call_args_list[-1][0][0]
+    compiled = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "INSERT INTO ai.agent_session_runs" in compiled
+    assert "ON CONFLICT (session_id, run_id) DO UPDATE" in compiled
+
+    # Unchanged runs are not written again
+    sess.execute.reset_mock()
+    storage._write_runs(sess, "test-session", runs)
+    sess.execute.assert_not_called()
+
+    # The session memory is stored without the runs
+    sess.execute.reset_mock()
+    with patch.object(storage, "read"):
+        storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs}))
+    session_stmt = sess.execute.call_args_list[0][0][0]
+    assert session_stmt.compile(dialect=postgresql.dialect()).params["memory"] == {}
+
+
+def async_session_factory(connect_error=None):
+    """Create an async session factory whose sessions run the sync callables on a mock session."""
+    sess = MagicMock()
+    sess.__aenter__ = AsyncMock(return_value=sess)
+    sess.__aexit__ = AsyncMock(return_value=False)
+    sess.connection = AsyncMock(side_effect=connect_error)
+    sess.close = AsyncMock()
+    sess.commit = AsyncMock()
+    sess.run_sync = AsyncMock(return_value=None)
+    return MagicMock(return_value=sess), sess
+
+
+async def test_agent_storage_aupsert_uses_the_async_engine(mock_engine, mock_session):
+    with patch("agno.storage.postgres.scoped_session", return_value=mock_session[0]):
+        with patch("agno.storage.postgres.inspect", return_value=MagicMock()):
+            storage = PostgresStorage(table_name="agent_sessions", db_engine=mock_engine, async_db_engine=MagicMock())
+    session_factory, sess = async_session_factory()
+    storage.async_engine.session_factory = session_factory
+
+    await storage.aupsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+
+    assert sess.run_sync.await_args_list[0].args[0] == storage._upsert
+    sess.commit.assert_awaited_once()
+
+
+async def test_agent_storage_async_methods_fall_back_to_a_thread_when_the_async_engine_cannot_connect(
+    mock_engine, mock_session
+):
+    with patch("agno.storage.postgres.scoped_session", return_value=mock_session[0]):
+        with patch("agno.storage.postgres.inspect", return_value=MagicMock()):
+            storage = PostgresStorage(table_name="agent_sessions", db_engine=mock_engine, async_db_engine=MagicMock())
+    storage.async_engine.session_factory = async_session_factory(connect_error=OSError("connection refused"))[0]
+    session = AgentSession(session_id="test-session", agent_id="test-agent")
+
+    with patch.object(storage, "read", return_value=session), patch.object(storage, "upsert", return_value=session):
+        assert await storage.aread("test-session") is session
+        assert await storage.aupsert(session) is session
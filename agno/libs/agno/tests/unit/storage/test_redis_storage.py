@@ -1,5 +1,5 @@
 from typing import Dict
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -429,3 +429,101 @@ def test_error_handling_with_uuid(agent_storage, mock_redis_client):
     mock_redis_client.get.return_value = "invalid json"
     result = agent_storage.read(str(uuid4()))
     assert result is None
+
+
+def test_list_session_summaries(agent_storage, mock_redis_client):
+    """Test session summaries are served from the session index."""
+    index: Dict[str, str] = {}
+    mock_redis_client.hset.side_effect = lambda key, field=None, value=None, mapping=None: index.update(
+        mapping or {field: value}
+    )
+    mock_redis_client.hexists.side_effect = lambda key, field: field in index
+    mock_redis_client.hgetall.side_effect = lambda key: dict(index)
+    mock_redis_client.hdel.side_effect = lambda key, *fields: [index.pop(field, None) for field in fields]
+
+    # Sessions written before the index existed are picked up by a rebuild
+    mock_redis_client.set(
+        "test_agent:old-session",
+        agent_storage.serialize({"session_id": "old-session", "agent_id": "test-agent", "created_at": 1}),
+    )
+    for i in range(2):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="test-user",
+                memory={"runs": [{"run_id": f"run-{i}"}]},
+            )
+        )
+    assert "old-session" not in index
+
+    summaries = agent_storage.list_session_summaries()
+    assert {summary.session_id for summary in summaries} == {"old-session", "session-0", "session-1"}
+    assert RedisStorage._INDEX_COMPLETE in index
+
+    summaries = agent_storage.list_session_summaries(user_id="test-user", limit=1)
+    assert len(summaries) == 1
+    assert summaries[0].first_run["run_id"].startswith("run-")
+
+    agent_storage.delete_session("session-0")
+    assert "session-0" not in index
+
+
+def test_list_session_summaries_skips_expired(mock_redis_client):
+    """Test expired sessions are dropped from the session index."""
+    index: Dict[str, str] = {}
+    mock_redis_client.set.side_effect = lambda key, value, ex=None: None
+    mock_redis_client.hset.side_effect = lambda key, field=None, value=None, mapping=None: index.update(
+        mapping or {field: value}
+    )
+    mock_redis_client.hexists.side_effect = lambda key, field: True
+    mock_redis_client.hgetall.side_effect = lambda key: dict(index)
+    mock_redis_client.hdel.side_effect = lambda key, *fields: [index.pop(field, None) for field in fields]
+    storage = RedisStorage(prefix="test_agent", mode="agent", expire=10)
+
+    with patch("time.time", return_value=1000):
+        storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+    with patch("time.time", return_value=1005):
+        assert len(storage.list_session_summaries()) == 1
+    with patch("time.time", return_value=1011):
+        assert storage.list_session_summaries() == []
+    assert "test-session" not in index
+
+
+async def test_async_methods_use_async_client(mock_redis_client):
+    """Test aread, aupsert and aget_recent_sessions go through the async client."""
+    data: Dict[str, str] = {}
+    index: Dict[str, str] = {}
+    with patch("agno.storage.redis.AsyncRedis") as mock_async_redis:
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=lambda key: data.get(key))
+
+        async def scan_iter(match):
+            for key in list(data):
+                if key.startswith(match.replace("*", "")):
+                    yield key
+
+        client.scan_iter.side_effect = scan_iter
+        pipe = MagicMock()
+        pipe.set.side_effect = lambda key, value, ex=None: data.update({key: value})
+        pipe.hset.side_effect = lambda key, field, value: index.update({field: value})
+        pipe.execute = AsyncMock()
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        mock_async_redis.return_value = client
+        storage = RedisStorage(prefix="test_agent", mode="agent", expire=60)
+
+        for i in range(3):
+            session = AgentSession(
+                session_id=f"session-{i}", agent_id="test-agent", user_id="test-user", created_at=1000 + i
+            )
+            assert await storage.aupsert(session) is session
+
+        assert pipe.set.call_args.kwargs == {"ex": 60}
+        assert set(index) == {"session-0", "session-1", "session-2"}
+        assert (await storage.aread("session-1")).session_id == "session-1"
+        assert await storage.aread("session-1", user_id="other-user") is None
+        sessions = await storage.aget_recent_sessions(user_id="test-user", entity_id="test-agent", limit=2)
+        assert [session.session_id for session in sessions] == ["session-2", "session-1"]
+    # The sync client is not used
+    mock_redis_client.set.assert_not_called()
+    mock_redis_client.get.assert_not_called()
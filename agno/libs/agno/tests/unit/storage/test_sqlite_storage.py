@@ -2,9 +2,12 @@ import os
 import tempfile
 from pathlib import Path
 from typing import Generator
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import event
 
+from agno.storage.runs import hash_run
 from agno.storage.session.agent import AgentSession
 from agno.storage.session.workflow import WorkflowSession
 from agno.storage.sqlite import SqliteStorage
@@ -193,3 +196,172 @@ def test_workflow_storage_filtering(workflow_storage: SqliteStorage):
 
     empty_sessions = workflow_storage.get_all_sessions(entity_id="non-existent")
     assert len(empty_sessions) == 0
+
+
+def test_agent_storage_runs_table(temp_db_path: Path):
+    storage = SqliteStorage(
+        table_name="agent_sessions",
+        db_file=str(temp_db_path),
+        runs_table_name="agent_session_runs",
+        num_history_runs=2,
+    )
+    storage.create()
+
+    runs = [{"run_id": f"run-{i}", "session_id": "test-session", "content": f"Answer {i}"} for i in range(3)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs, "memories": None})
+    saved_session = storage.upsert(session)
+
+    # Only the last N runs are loaded with the session
+    assert saved_session is not None
+    assert saved_session.memory == {"runs": runs[-2:], "memories": None}
+    assert storage.read_runs("test-session") == runs
+
+    # The memory column no longer holds the runs
+    with storage.SqlSession() as sess:
+        stored_memory = sess.execute(storage.table.select()).fetchone().memory
+    assert stored_memory == {"memories": None}
+
+    # Only new and changed runs are written
+    runs[2]["content"] = "Updated answer"
+    runs.append({"run_id": "run-3", "session_id": "test-session", "content": "Answer 3"})
+    session.memory = {"runs": runs[-3:], "memories": None}
+    inserted_params = []
+
+    def capture_inserts(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO agent_session_runs"):
+            inserted_params.extend(parameters)
+
+    event.listen(storage.db_engine, "before_cursor_execute", capture_inserts)
+    storage.upsert(session)
+    event.remove(storage.db_engine, "before_cursor_execute", capture_inserts)
+    assert "run-2" in inserted_params and "run-3" in inserted_params
+    assert "run-1" not in inserted_params
+    assert storage.read_runs("test-session") == runs
+    assert storage.read_runs("test-session", limit=1) == runs[-1:]
+    assert [s.memory["runs"] for s in storage.get_all_sessions()] == [runs]
+
+    # Deleting the session deletes its runs
+    storage.delete_session("test-session")
+    assert storage.read_runs("test-session") == []
+
+
+def test_agent_storage_runs_table_reads_legacy_sessions(agent_storage: SqliteStorage, temp_db_path: Path):
+    runs = [{"run_id": f"run-{i}", "session_id": "test-session", "content": f"Answer {i}"} for i in range(3)]
+    agent_storage.create()
+    agent_storage.upsert(AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs}))
+
+    storage = SqliteStorage(
+        table_name="agent_sessions",
+        db_file=str(temp_db_path),
+        runs_table_name="agent_session_runs",
+        num_history_runs=1,
+    )
+    storage.create()
+
+    # Runs stored with the session memory are still read
+    read_session = storage.read("test-session")
+    assert read_session.memory == {"runs": runs[-1:]}
+
+    # and moved to the runs table on the next upsert
+    read_session.memory = {"runs": runs}
+    storage.upsert(read_session)
+    assert storage.read_runs("test-session") == runs
+
+
+def test_list_session_summaries(agent_storage: SqliteStorage):
+    agent_storage.create()
+    for i in range(3):
+        agent_storage.upsert(
+            AgentSession(
+                session_id=f"session-{i}",
+                agent_id="test-agent",
+                user_id="user-1" if i < 2 else "user-2",
+                memory={
+                    "runs": [
+                        {
+                            "run_id": f"run-{i}",
+                            "content": "x" * 500,
+                            "messages": [
+                                {"role": "system", "content": "system prompt"},
+                                {"role": "user", "content": f"question {i}"},
+                            ],
+                        }
+                    ]
+                },
+                session_data={"session_name": "named"} if i == 0 else None,
+            )
+        )
+
+    summaries = agent_storage.list_session_summaries()
+    assert [summary.session_id for summary in summaries] == ["session-0", "session-1", "session-2"]
+    assert summaries[0].session_name == "named"
+    assert summaries[0].entity_id == "test-agent"
+    assert summaries[0].first_run["run_id"] == "run-0"
+    assert len(summaries[0].first_run["content"]) == 200
+    assert summaries[0].first_run["messages"] == [{"role": "user", "content": "question 0"}]
+
+    page = agent_storage.list_session_summaries(user_id="user-1", limit=1, offset=1)
+    assert [summary.session_id for summary in page] == ["session-1"]
+    assert agent_storage.list_session_summaries(entity_id="other-agent") == []
+
+
+async def test_agent_storage_async(temp_db_path: Path):
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("greenlet")
+    storage = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), runs_table_name="agent_session_runs"
+    )
+    assert storage.async_engine.url == f"sqlite+aiosqlite:///{temp_db_path.resolve()}"
+
+    runs = [{"run_id": f"run-{i}", "session_id": "session-0", "content": f"Answer {i}"} for i in range(2)]
+    for i in range(3):
+        session = AgentSession(session_id=f"session-{i}", agent_id="test-agent", user_id="test-user")
+        if i == 0:
+            session.memory = {"runs": runs}
+        # The table is created on the first upsert
+        saved_session = await storage.aupsert(session)
+        assert saved_session is not None
+
+    assert storage.async_engine.engine is not None
+    assert (await storage.aread("session-0")).memory == {"runs": runs}
+    assert storage.read("session-0").memory == {"runs": runs}
+    assert await storage.aread("session-0", user_id="other-user") is None
+    assert len(await storage.aget_recent_sessions(user_id="test-user", limit=2)) == 2
+    assert len(await storage.aget_recent_sessions(user_id="test-user", limit=None)) == 3
+
+
+async def test_in_memory_storage_async():
+    storage = SqliteStorage(table_name="agent_sessions")
+    assert storage.async_engine.url is None
+
+    await storage.aupsert(AgentSession(session_id="test-session", agent_id="test-agent"))
+
+    assert (await storage.aread("test-session")).agent_id == "test-agent"
+    assert storage.read("test-session") is not None
+
+
+def test_agent_storage_runs_table_only_hashes_runs_that_can_change(temp_db_path: Path):
+    storage = SqliteStorage(
+        table_name="agent_sessions", db_file=str(temp_db_path), runs_table_name="agent_session_runs"
+    )
+    storage.create()
+    runs = [{"run_id": f"run-{i}", "status": "RUNNING", "content": f"Answer {i}"} for i in range(5)]
+    session = AgentSession(session_id="test-session", agent_id="test-agent", memory={"runs": runs})
+
+    with patch("agno.storage.runs.hash_run", wraps=hash_run) as mock_hash_run:
+        storage.upsert(session)
+        assert mock_hash_run.call_count == 5
+
+        # Runs followed by a stored run are settled, only the last stored run and the new run are hashed
+        mock_hash_run.reset_mock()
+        runs.append({"run_id": "run-5", "status": "RUNNING", "content": "Answer 5"})
+        storage.upsert(session)
+        assert [c.args[0]["run_id"] for c in mock_hash_run.call_args_list] == ["run-4", "run-5"]
+
+        # A run that is paused or changes status is hashed again
+        mock_hash_run.reset_mock()
+        runs[1]["status"] = "PAUSED"
+        storage.upsert(session)
+        assert [c.args[0]["run_id"] for c in mock_hash_run.call_args_list] == ["run-1", "run-5"]
+
+    assert storage.read_runs("test-session") == runs
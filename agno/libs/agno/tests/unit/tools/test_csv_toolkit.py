@@ -0,0 +1,85 @@
+import json
+import os
+
+import pytest
+
+from agno.tools.csv_toolkit import CsvTools
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "movies.csv"
+    path.write_text("title,year,rating\nAlien,1979,8.5\nHeat,1995,\n")
+    return path
+
+
+def test_query_csv_file_can_run_repeatedly(csv_file):
+    tools = CsvTools(csvs=[csv_file])
+
+    first = tools.query_csv_file("movies", "SELECT title FROM movies ORDER BY year")
+    second = tools.query_csv_file("movies", "SELECT COUNT(*) FROM movies")
+
+    assert first == "title\nAlien\nHeat"
+    assert second == "count_star()\n2"
+
+
+def test_csv_is_loaded_once(csv_file, mocker):
+    tools = CsvTools(csvs=[csv_file])
+    log_info = mocker.patch("agno.tools.csv_toolkit.log_info")
+
+    tools.query_csv_file("movies", "SELECT * FROM movies")
+    tools.query_csv_file("movies", "SELECT * FROM movies")
+    tools.get_columns("movies")
+    tools.read_csv_file("movies")
+    tools.read_csv_file("movies")
+
+    loads = [call.args[0] for call in log_info.call_args_list if call.args[0].startswith("Loading csv file")]
+    assert loads == ["Loading csv file: movies", "Loading csv file: movies as text"]
+
+
+def test_changed_csv_is_reloaded(csv_file):
+    tools = CsvTools(csvs=[csv_file])
+    assert tools.query_csv_file("movies", "SELECT COUNT(*) FROM movies") == "count_star()\n2"
+
+    csv_file.write_text("title,year,rating\nAlien,1979,8.5\nHeat,1995,\nUp,2009,8.3\n")
+    stat = csv_file.stat()
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert tools.query_csv_file("movies", "SELECT COUNT(*) FROM movies") == "count_star()\n3"
+
+
+def test_read_csv_file_and_get_columns_match_csv_module(csv_file):
+    cached = CsvTools(csvs=[csv_file])
+    uncached = CsvTools(csvs=[csv_file], cache_tables=False)
+
+    assert json.loads(cached.get_columns("movies")) == json.loads(uncached.get_columns("movies"))
+    assert json.loads(cached.read_csv_file("movies")) == json.loads(uncached.read_csv_file("movies"))
+    assert json.loads(cached.read_csv_file("movies", row_limit=1)) == [
+        {"title": "Alien", "year": "1979", "rating": "8.5"}
+    ]
+
+
+def test_read_csv_file_keeps_values_as_written(tmp_path):
+    path = tmp_path / "prices.csv"
+    path.write_text("item,price,date\nTea,1.50,2024-1-5\nCake,,2024-01-06\n")
+    cached = CsvTools(csvs=[path])
+    uncached = CsvTools(csvs=[path], cache_tables=False)
+
+    assert json.loads(cached.read_csv_file("prices")) == [
+        {"item": "Tea", "price": "1.50", "date": "2024-1-5"},
+        {"item": "Cake", "price": "", "date": "2024-01-06"},
+    ]
+    assert json.loads(cached.read_csv_file("prices")) == json.loads(uncached.read_csv_file("prices"))
+    assert cached.query_csv_file("prices", "SELECT SUM(price) FROM prices") == "sum(price)\n1.5"
+
+
+def test_tables_persist_in_database_file(csv_file, tmp_path):
+    database = str(tmp_path / "csvs.duckdb")
+    tools = CsvTools(csvs=[csv_file], duckdb_kwargs={"database": database})
+    tools.query_csv_file("movies", "SELECT * FROM movies")
+    tools.duckdb_connection.close()
+
+    import duckdb
+
+    con = duckdb.connect(database)
+    assert con.execute("SELECT COUNT(*) FROM movies").fetchone() == (2,)
@@ -2,6 +2,7 @@ from typing import Any, Callable, Dict
 
 import pytest
 
+from agno.tools.cache import FileToolResultCache
 from agno.tools.decorator import tool
 from agno.tools.function import Function, FunctionCall
 
@@ -183,6 +184,85 @@ def test_function_process_entrypoint_with_user_input():
     assert func.user_input_schema[1].field_type is int
 
 
+def test_function_process_entrypoint_reuses_schema():
+    """Test that Functions built on the same callable share its processed schema."""
+    from agno.tools.function import get_schema_cache_key, processed_schema_cache
+
+    def test_func(param1: str, param2: int = 42) -> str:
+        """Test function with parameters."""
+        return f"{param1}-{param2}"
+
+    first = Function(name="test_func", entrypoint=test_func)
+    first.process_entrypoint()
+    assert get_schema_cache_key(test_func, "entrypoint", False, ("return", "agent", "team")) in processed_schema_cache
+
+    second = Function(name="test_func", entrypoint=test_func)
+    second.process_entrypoint()
+    assert second.parameters == first.parameters
+    assert second.parameters is not first.parameters
+    assert second.description == "Test function with parameters."
+    # The validate_call wrapper is shared too
+    assert second.entrypoint is first.entrypoint
+
+    # Processing again does not wrap the entrypoint again
+    second.process_entrypoint()
+    assert second.entrypoint is first.entrypoint
+    assert second.entrypoint.raw_function is test_func
+
+    # The strict flag is part of the key
+    strict = Function(name="test_func", entrypoint=test_func)
+    strict.process_entrypoint(strict=True)
+    assert "param2" in strict.parameters["required"]
+    assert "param2" not in second.parameters["required"]
+
+
+def test_function_schema_cache_does_not_keep_closures_alive():
+    """Test that closures, e.g. the tools an agent builds for each run, are not kept alive by the caches."""
+    import gc
+    import weakref
+
+    from agno.tools.function import get_schema_cache_key
+
+    class Owner:
+        pass
+
+    def make_tool(owner: Owner) -> Callable:
+        def tool(query: str) -> str:
+            """Search for the query."""
+            return f"{owner}-{query}"
+
+        return tool
+
+    owners = [Owner() for _ in range(50)]
+    owner_refs = [weakref.ref(owner) for owner in owners]
+    for owner in owners:
+        function = Function(name="tool", entrypoint=make_tool(owner))
+        function.process_entrypoint()
+        assert function.parameters["required"] == ["query"]
+    assert get_schema_cache_key(make_tool(Owner()), "entrypoint", False) is None
+
+    del owners, owner, function
+    gc.collect()
+    assert all(owner_ref() is None for owner_ref in owner_refs)
+
+
+def test_function_schema_shared_by_bound_methods():
+    """Test that bound methods of different instances share the schema of their function."""
+    from agno.tools.function import get_schema_cache_key
+
+    class Tools:
+        def search(self, query: str) -> str:
+            """Search for a query."""
+            return query
+
+    first, second = Tools(), Tools()
+    assert get_schema_cache_key(first.search, False) == get_schema_cache_key(second.search, False)
+
+    func = Function.from_callable(second.search)
+    assert func.parameters["required"] == ["query"]
+    assert func.entrypoint(query="test") == "test"
+
+
 def test_function_process_entrypoint_skip_processing():
     """Test that entrypoint processing is skipped when skip_entrypoint_processing is True."""
 
@@ -228,47 +308,44 @@ def test_function_cache_key_generation():
     assert cache_key == "12cfb4e42ec8561012d976e2dca0e0c1"
 
 
-def test_function_cache_file_path():
-    """Test generation of cache file paths."""
-    func = Function(name="test_func", cache_results=True, cache_dir="/tmp")
+def test_function_cache_file_path(tmp_path):
+    """Test the location of cache files."""
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
 
-    cache_key = "test_key"
-    cache_file = func._get_cache_file_path(cache_key)
-    assert cache_file.startswith("/tmp/")
-    assert "test_func" in cache_file
-    assert "test_key" in cache_file
+    cache = func._get_cache_backend()
+    assert isinstance(cache, FileToolResultCache)
+    cache_key = func._get_cache_key({"param1": "value1"})
+    cache.set(cache_key, "result", ttl=func.cache_ttl)
+    assert (tmp_path / "functions" / f"{cache_key}.json").exists()
 
 
 def test_function_cache_operations(tmp_path):
     """Test caching operations (save and retrieve)."""
     import json
-    import os
 
     func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    cache = func._get_cache_backend()
 
     # Test saving to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    cache_key = func._get_cache_key({"param1": "value1"})
+    cache.set(cache_key, test_result, ttl=func.cache_ttl)
 
     # Verify cache file exists and contains correct data
-    assert os.path.exists(cache_file)
+    cache_file = tmp_path / "functions" / f"{cache_key}.json"
     with open(cache_file, "r") as f:
         cached_data = json.load(f)
     assert cached_data["result"] == {"result": "test_data"}
 
     # Test retrieving from cache
-    retrieved_result = func._get_cached_result(cache_file)
-    assert retrieved_result == test_result
+    assert cache.get(cache_key) == test_result
 
     # Test retrieving non-existent cache
-    non_existent_file = os.path.join(str(tmp_path), "non_existent.json")
-    assert func._get_cached_result(non_existent_file) is None
+    assert cache.get("non_existent") is None
 
 
 def test_function_cache_ttl(tmp_path):
     """Test cache TTL functionality."""
-    import os
     import time
 
     func = Function(
@@ -277,20 +354,39 @@ def test_function_cache_ttl(tmp_path):
         cache_dir=str(tmp_path),
         cache_ttl=1,  # 1 second TTL
     )
+    cache = func._get_cache_backend()
 
     # Save test data to cache
     test_result = {"result": "test_data"}
-    cache_file = os.path.join(str(tmp_path), "test_cache.json")
-    func._save_to_cache(cache_file, test_result)
+    cache_key = func._get_cache_key({"param1": "value1"})
+    cache.set(cache_key, test_result, ttl=func.cache_ttl)
 
     # Verify cache is valid immediately
-    assert func._get_cached_result(cache_file) == test_result
+    assert cache.get(cache_key) == test_result
 
     # Wait for cache to expire
     time.sleep(1.1)
 
     # Verify cache is no longer valid
-    assert func._get_cached_result(cache_file) is None
+    assert cache.get(cache_key) is None
+    assert not (tmp_path / "functions" / f"{cache_key}.json").exists()
+
+
+def test_function_cache_ignores_previous_layout(tmp_path):
+    """Test that results cached in the previous per-function layout are not read, and are removed by clear."""
+    import json
+
+    func = Function(name="test_func", cache_results=True, cache_dir=str(tmp_path))
+    cache_key = func._get_cache_key({"param1": "value1"})
+    legacy_file = tmp_path / "functions" / "test_func" / f"{cache_key}.json"
+    legacy_file.parent.mkdir(parents=True)
+    legacy_file.write_text(json.dumps({"timestamp": 0, "result": "old"}))
+
+    cache = FileToolResultCache(cache_dir=tmp_path)
+    assert cache.get(cache_key) is None
+
+    cache.clear()
+    assert not legacy_file.exists()
 
 
 def test_function_call_initialization():
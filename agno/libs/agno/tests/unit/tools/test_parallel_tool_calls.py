@@ -0,0 +1,111 @@
+import threading
+import time
+
+from agno.models.openai import OpenAIChat
+from agno.models.response import ModelResponseEvent
+from agno.tools.decorator import tool
+from agno.tools.function import Function, FunctionCall
+from agno.tools.toolkit import Toolkit
+
+
+def make_calls(function: Function, n: int):
+    return [FunctionCall(function=function, arguments={"i": i}, call_id=f"call_{i}") for i in range(n)]
+
+
+def run(model, function_calls, **kwargs):
+    results = []
+    events = list(model.run_function_calls(function_calls=function_calls, function_call_results=results, **kwargs))
+    return events, results
+
+
+def slow_function(max_seen: list, active: list, lock: threading.Lock):
+    def lookup(i: int) -> str:
+        """Look up a value."""
+        with lock:
+            active.append(i)
+            max_seen[0] = max(max_seen[0], len(active))
+        # Later calls finish first
+        time.sleep(0.05 * (4 - i))
+        with lock:
+            active.remove(i)
+        return f"value {i}"
+
+    return lookup
+
+
+def test_parallel_safe_calls_run_concurrently_in_order():
+    max_seen, active, lock = [0], [], threading.Lock()
+    function = Function.from_callable(slow_function(max_seen, active, lock))
+    function.parallel_safe = True
+
+    events, results = run(OpenAIChat(id="gpt-4o"), make_calls(function, 4), max_parallel_tool_calls=2)
+
+    assert max_seen[0] == 2
+    assert [result.content for result in results] == [f"value {i}" for i in range(4)]
+    completed = [e for e in events if getattr(e, "event", None) == ModelResponseEvent.tool_call_completed.value]
+    assert [e.tool_executions[0].tool_call_id for e in completed] == [f"call_{i}" for i in range(4)]
+
+
+def test_calls_run_sequentially_without_opt_in():
+    max_seen, active, lock = [0], [], threading.Lock()
+    safe = Function.from_callable(slow_function(max_seen, active, lock))
+    safe.parallel_safe = True
+    unsafe = Function.from_callable(slow_function(max_seen, active, lock))
+
+    run(OpenAIChat(id="gpt-4o"), make_calls(safe, 3))
+    run(OpenAIChat(id="gpt-4o"), make_calls(unsafe, 3), max_parallel_tool_calls=4)
+
+    assert max_seen[0] == 1
+
+
+def test_tool_call_limit_and_pauses_with_parallel_calls():
+    max_seen, active, lock = [0], [], threading.Lock()
+    safe = Function.from_callable(slow_function(max_seen, active, lock))
+    safe.parallel_safe = True
+    confirm = Function.from_callable(slow_function(max_seen, active, lock))
+    confirm.parallel_safe = True
+    confirm.requires_confirmation = True
+
+    calls = make_calls(safe, 2) + [FunctionCall(function=confirm, arguments={"i": 2}, call_id="confirm")]
+    calls += make_calls(safe, 4)[3:]
+    events, results = run(
+        OpenAIChat(id="gpt-4o"), calls, max_parallel_tool_calls=4, function_call_limit=3, current_function_call_count=0
+    )
+
+    assert [result.tool_call_id for result in results] == ["call_0", "call_1", "call_3"]
+    assert results[2].tool_call_error
+    paused = [e for e in events if getattr(e, "event", None) == ModelResponseEvent.tool_call_paused.value]
+    assert [e.tool_executions[0].tool_call_id for e in paused] == ["confirm"]
+
+
+def test_tool_hooks_run_for_parallel_calls():
+    hook_calls = []
+
+    def hook(function_name, function_call, arguments):
+        hook_calls.append(function_name)
+        return function_call(**arguments)
+
+    @tool(parallel_safe=True, tool_hooks=[hook])
+    def echo(i: int) -> str:
+        """Echo a value."""
+        return str(i)
+
+    assert echo.parallel_safe
+
+    _, results = run(OpenAIChat(id="gpt-4o"), make_calls(echo, 3), max_parallel_tool_calls=3)
+
+    assert [result.content for result in results] == ["0", "1", "2"]
+    assert hook_calls == ["echo", "echo", "echo"]
+
+
+def test_toolkit_parallel_safe_tools():
+    def first() -> str:
+        return "first"
+
+    def second() -> str:
+        return "second"
+
+    toolkit = Toolkit(tools=[first, second], parallel_safe_tools=["first"])
+
+    assert toolkit.functions["first"].parallel_safe
+    assert not toolkit.functions["second"].parallel_safe
@@ -0,0 +1,93 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import CursorResult
+
+from agno.tools.duckdb import DuckDbTools
+from agno.tools.sql import SQLTools
+from agno.utils.query_result import QueryResultPager
+
+
+@pytest.fixture
+def sql_tools():
+    engine = create_engine("sqlite://")
+    tools = SQLTools(db_engine=engine, result_pager=QueryResultPager(max_rows=3, output_format="json"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT)"))
+        conn.execute(text("INSERT INTO items VALUES " + ", ".join(f"({i}, 'item-{i}')" for i in range(5))))
+    return tools
+
+
+def test_sql_tools_small_result_is_json(sql_tools):
+    output = sql_tools.run_sql_query("SELECT id FROM items WHERE id < 2 ORDER BY id")
+
+    assert json.loads(output) == [{"id": 0}, {"id": 1}]
+
+
+def test_sql_tools_pages_through_large_result(sql_tools):
+    first = sql_tools.run_sql_query("SELECT id FROM items ORDER BY id", limit=None)
+    assert "Showing rows 1-3." in first
+    handle = first.split("handle ")[1].split(" ")[0]
+
+    assert json.loads(sql_tools.get_next_result_page(handle)) == [{"id": 3}, {"id": 4}]
+
+
+def test_sql_tools_truncated_result_releases_connection(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'items.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER)"))
+        conn.execute(text("INSERT INTO items VALUES " + ", ".join(f"({i})" for i in range(5))))
+    tools = SQLTools(db_engine=engine, result_pager=QueryResultPager(max_rows=3, output_format="json"))
+
+    first = tools.run_sql_query("SELECT id FROM items ORDER BY id", limit=None)
+    handle = first.split("handle ")[1].split(" ")[0]
+
+    # The connection is back in the pool while the rest of the result waits to be paged through
+    assert engine.pool.checkedout() == 0
+    assert json.loads(tools.get_next_result_page(handle)) == [{"id": 3}, {"id": 4}]
+
+
+def test_sql_tools_truncated_result_fetches_a_bounded_number_of_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'items.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER)"))
+        conn.execute(text("INSERT INTO items VALUES " + ", ".join(f"({i})" for i in range(5000))))
+    tools = SQLTools(db_engine=engine, result_pager=QueryResultPager(max_buffered_pages=2))
+    fetched = []
+    fetchmany = CursorResult.fetchmany
+
+    def counting_fetchmany(self, size=None):
+        rows = fetchmany(self, size)
+        fetched.extend(rows)
+        return rows
+
+    with patch.object(CursorResult, "fetchmany", counting_fetchmany):
+        first = tools.run_sql_query("SELECT id FROM items ORDER BY id", limit=10)
+
+    assert "Showing rows 1-10." in first
+    assert len(fetched) <= 40
+    assert engine.pool.checkedout() == 0
+
+
+def test_sql_tools_statement_without_rows(sql_tools):
+    assert sql_tools.run_sql_query("UPDATE items SET name = 'x' WHERE id = 0") == "[]"
+
+
+def test_duckdb_tools_pages_through_large_result():
+    tools = DuckDbTools(result_pager=QueryResultPager(max_rows=2))
+
+    first = tools.run_query("SELECT range AS i FROM range(100000000)")
+    assert first.startswith("i\n0\n1\n... Showing rows 1-2.")
+
+    # Other queries on the connection do not invalidate the open result
+    assert tools.run_query("SELECT 42 AS answer") == "answer\n42"
+    handle = first.split("handle ")[1].split(" ")[0]
+    assert tools.get_next_result_page(handle).startswith("i\n2\n3\n")
+
+
+def test_duckdb_tools_statement_without_rows():
+    tools = DuckDbTools()
+
+    assert tools.run_query("CREATE TABLE t (a INTEGER)") == "No output"
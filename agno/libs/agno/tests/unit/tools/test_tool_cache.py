@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agno.tools.cache import FileToolResultCache, InMemoryToolResultCache, SqliteToolResultCache
+from agno.tools.function import Function, FunctionCall
+
+
+def counting_function(calls: list, delay: float = 0.0):
+    def lookup(query: str) -> str:
+        """Look up a query."""
+        calls.append(query)
+        time.sleep(delay)
+        return f"result for {query}"
+
+    return lookup
+
+
+def test_in_memory_cache_ttl_and_size():
+    cache = InMemoryToolResultCache(max_size=2)
+    cache.set("a", 1, ttl=0.05)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.set("d", 4, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("d") is None
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    db_file = tmp_path / "tools.db"
+    SqliteToolResultCache(db_file=db_file).set("key", {"value": [1, 2]}, ttl=60)
+
+    other = SqliteToolResultCache(db_file=db_file)
+    assert other.get("key") == {"value": [1, 2]}
+
+    other.set("expired", "x", ttl=-1)
+    assert other.get("expired") is None
+
+
+def test_sqlite_cache_purges_beyond_max_entries(tmp_path):
+    cache = SqliteToolResultCache(db_file=tmp_path / "tools.db", max_entries=3, purge_interval=5)
+    for i in range(5):
+        cache.set(f"key-{i}", i)
+
+    assert [cache.get(f"key-{i}") for i in range(5)] == [None, None, 2, 3, 4]
+
+
+def test_redis_cache_sets_expiry():
+    from agno.tools.cache.redis import RedisToolResultCache
+
+    client = MagicMock()
+    cache = RedisToolResultCache(redis_client=client)
+    cache.set("key", {"a": 1}, ttl=1.5)
+    client.get.return_value = '{"a": 1}'
+
+    client.set.assert_called_once_with("agno:tool_cache:key", '{"a": 1}', px=1500)
+    assert cache.get("key") == {"a": 1}
+
+
+def test_function_uses_cache_backend_and_records_stats():
+    calls = []
+    cache = InMemoryToolResultCache()
+    function = Function.from_callable(counting_function(calls))
+    function.cache_results = True
+    function.cache_backend = cache
+
+    for _ in range(3):
+        call = FunctionCall(function=function, arguments={"query": "agno"})
+        assert call.execute().result == "result for agno"
+
+    assert calls == ["agno"]
+    stats = cache.get_stats("lookup")["lookup"]
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_function_with_cache_dir_uses_file_cache(tmp_path):
+    function = Function(name="lookup", cache_results=True, cache_dir=str(tmp_path))
+
+    assert isinstance(function._get_cache_backend(), FileToolResultCache)
+    assert function._get_cache_backend() is Function(name="other", cache_dir=str(tmp_path))._get_cache_backend()
+
+
+def test_concurrent_identical_calls_run_once():
+    calls = []
+    function = Function.from_callable(counting_function(calls, delay=0.2))
+    function.cache_results = True
+    function.cache_backend = InMemoryToolResultCache()
+
+    results = []
+
+    def run():
+        results.append(FunctionCall(function=function, arguments={"query": "agno"}).execute().result)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["agno"]
+    assert results == ["result for agno"] * 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_async_calls_run_once():
+    calls = []
+
+    async def lookup(query: str) -> str:
+        """Look up a query."""
+        calls.append(query)
+        await asyncio.sleep(0.1)
+        return f"result for {query}"
+
+    function = Function.from_callable(lookup)
+    function.cache_results = True
+    function.cache_backend = InMemoryToolResultCache()
+
+    results = await asyncio.gather(
+        *(FunctionCall(function=function, arguments={"query": "agno"}).aexecute() for _ in range(3))
+    )
+
+    assert calls == ["agno"]
+    assert [r.result for r in results] == ["result for agno"] * 3
+
+
+def test_failed_call_releases_waiting_calls():
+    attempts = []
+
+    def flaky(query: str) -> str:
+        """Fails the first time."""
+        attempts.append(query)
+        if len(attempts) == 1:
+            time.sleep(0.1)
+            raise ValueError("boom")
+        return "ok"
+
+    function = Function.from_callable(flaky)
+    function.cache_results = True
+    function.cache_backend = InMemoryToolResultCache()
+    results = []
+
+    def run():
+        results.append(FunctionCall(function=function, arguments={"query": "q"}).execute().status)
+
+    first = threading.Thread(target=run)
+    first.start()
+    time.sleep(0.02)
+    second = threading.Thread(target=run)
+    second.start()
+    first.join()
+    second.join()
+
+    assert sorted(results) == ["failure", "success"]
+    assert len(attempts) == 2
@@ -0,0 +1,48 @@
+import asyncio
+from copy import deepcopy
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.engine import make_url
+
+from agno.utils.async_engine import LoopAsyncEngine, asyncpg_url
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("postgresql+psycopg://ai:ai@localhost:5532/ai", "postgresql+asyncpg://ai:ai@localhost:5532/ai"),
+        ("postgresql://ai:ai@localhost/ai?sslmode=require", "postgresql+asyncpg://ai:ai@localhost/ai?ssl=require"),
+        ("postgresql://ai:ai@localhost/ai?sslmode=require&connect_timeout=10", None),
+        ("sqlite:///agno.db", None),
+    ],
+)
+def test_asyncpg_url(url, expected):
+    assert asyncpg_url(make_url(url)) == expected
+
+
+def test_engine_is_recreated_for_each_event_loop_and_shared_by_copies():
+    async_engine = LoopAsyncEngine(url="postgresql+asyncpg://ai:ai@localhost/ai")
+
+    async def get_engine():
+        async_engine.get_session_factory()
+        return async_engine.engine
+
+    with patch("agno.utils.async_engine.create_async_engine", side_effect=lambda url: MagicMock()):
+        first_engine = asyncio.run(get_engine())
+        second_engine = asyncio.run(get_engine())
+
+    assert second_engine is not first_engine
+    first_engine.sync_engine.dispose.assert_called_once_with(close=False)
+    assert deepcopy(async_engine) is async_engine
+
+
+async def test_open_session_returns_none_when_the_engine_cannot_connect():
+    async_engine = LoopAsyncEngine(engine=MagicMock())
+    sess = MagicMock()
+    sess.connection = AsyncMock(side_effect=TypeError("connect() got an unexpected keyword argument 'sslmode'"))
+    sess.close = AsyncMock()
+    async_engine.session_factory = MagicMock(return_value=sess)
+
+    assert await async_engine.open_session() is None
+    sess.close.assert_awaited_once()
@@ -0,0 +1,40 @@
+import time
+from copy import deepcopy
+
+from agno.utils.lru_cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[int] = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_lru_cache_ttl_expires_entries():
+    cache: LRUCache[int] = LRUCache(max_size=2, ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_lru_cache_disabled_with_zero_size():
+    cache: LRUCache[int] = LRUCache(max_size=0)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_lru_cache_is_shared_by_deep_copies():
+    cache: LRUCache[int] = LRUCache(max_size=2)
+    owner = {"cache": cache}
+
+    assert deepcopy(owner)["cache"] is cache
@@ -0,0 +1,97 @@
+import json
+
+from agno.utils.query_result import QueryResultPager
+
+
+def counting_rows(n, consumed):
+    for i in range(n):
+        consumed.append(i)
+        yield (i, f"name-{i}")
+
+
+def test_small_result_renders_like_before():
+    pager = QueryResultPager()
+
+    assert pager.render(["id", "name"], [(1, "a"), (2, "b")]) == "id,name\n1,a\n2,b"
+    assert pager.render(["id"], [(1,), (2,)]) == "id\n1\n2"
+
+
+def test_row_budget_truncates_and_pages():
+    pager = QueryResultPager(max_rows=2)
+    consumed = []
+    closed = []
+
+    first = pager.render(["id", "name"], counting_rows(5, consumed), close=lambda: closed.append(True))
+
+    assert first.startswith("id,name\n0,name-0\n1,name-1\n... Showing rows 1-2.")
+    # Only one row more than the page is read
+    assert consumed == [0, 1, 2]
+    handle = first.split("handle ")[1].split(" ")[0]
+
+    second = pager.next_page(handle)
+    assert second.startswith("id,name\n2,name-2\n3,name-3\n... Showing rows 3-4.")
+    handle = second.split("handle ")[1].split(" ")[0]
+
+    assert pager.next_page(handle) == "id,name\n4,name-4"
+    assert closed == [True]
+    assert pager.next_page(handle).startswith("No open result")
+
+
+def test_char_and_token_budgets():
+    rows = [(i, "x" * 50) for i in range(100)]
+
+    by_chars = QueryResultPager(max_rows=None, max_chars=200).render(["id", "text"], iter(rows))
+    by_tokens = QueryResultPager(max_rows=None, max_chars=None, max_tokens=50).render(["id", "text"], iter(rows))
+
+    assert "Showing rows 1-3." in by_chars
+    assert "Showing rows 1-3." in by_tokens
+
+
+def test_oldest_open_result_is_closed():
+    pager = QueryResultPager(max_rows=1, max_open_results=1)
+    closed = []
+
+    first = pager.render(["id"], iter([(1,), (2,)]), close=lambda: closed.append("first"))
+    pager.render(["id"], iter([(1,), (2,)]), close=lambda: closed.append("second"))
+
+    assert closed == ["first"]
+    assert pager.next_page(first.split("handle ")[1].split(" ")[0]).startswith("No open result")
+
+
+def test_result_that_is_not_kept_open_is_closed_after_the_first_page():
+    pager = QueryResultPager(max_rows=1)
+    closed = []
+
+    first = pager.render(["id"], iter([(1,), (2,)]), close=lambda: closed.append(True), keep_open=False)
+
+    assert closed == [True]
+    assert pager.next_page(first.split("handle ")[1].split(" ")[0]) == "id\n2"
+
+
+def test_result_that_is_not_kept_open_buffers_a_few_pages():
+    pager = QueryResultPager(max_rows=2, max_buffered_pages=2)
+    consumed = []
+
+    def rows():
+        for i in range(100):
+            consumed.append(i)
+            yield (i,)
+
+    first = pager.render(["id"], rows(), close=lambda: None, keep_open=False)
+    handle = first.split("handle ")[1].split(" ")[0]
+
+    # The first page, two buffered pages and one row to tell that more rows exist
+    assert len(consumed) == 7
+    second = pager.next_page(handle)
+    assert "More rows are available" in second
+    last = pager.next_page(second.split("handle ")[1].split(" ")[0])
+    assert last.startswith("id\n4\n5")
+    assert "Showing rows 5-6. The rest of the result was not kept" in last
+
+
+def test_json_output_format():
+    pager = QueryResultPager(output_format="json")
+
+    output = pager.render(["id", "name"], [(1, "a"), (2, "b")])
+
+    assert json.loads(output) == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
@@ -0,0 +1,91 @@
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from agno.models.message import Message
+from agno.run.response import RunResponse, RunResponseContentEvent
+from agno.run.team import TeamRunResponse
+from agno.utils import serialize
+from agno.utils.serialize import dataclass_to_dict, json_dumps
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Shape:
+    name: str
+    points: List[Point] = field(default_factory=list)
+    tags: Dict[str, Any] = field(default_factory=dict)
+    note: Optional[str] = None
+
+
+def test_dataclass_to_dict_matches_asdict():
+    shape = Shape(name="triangle", points=[Point(0, 0), Point(1, 0)], tags={"origin": Point(0, 0)})
+
+    expected = {k: v for k, v in asdict(shape).items() if v is not None}
+    assert dataclass_to_dict(shape) == expected
+    assert dataclass_to_dict(shape, exclude=frozenset(["points"])) == {
+        "name": "triangle",
+        "tags": {"origin": {"x": 0, "y": 0}},
+    }
+
+
+def test_dataclass_to_dict_copies_containers():
+    shape = Shape(name="square", tags={"sides": [1, 2]})
+
+    shape_dict = dataclass_to_dict(shape)
+    shape_dict["tags"]["sides"].append(3)
+
+    assert shape.tags == {"sides": [1, 2]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_dumps(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(serialize, "orjson", None)
+    data = {"text": "héllo 日本 😀", "items": [1, 2.5, None, True]}
+
+    compact = json_dumps(data)
+    # Non-ASCII characters are escaped like json.dumps does, so both paths write the same bytes
+    assert compact == json.dumps(data, separators=(",", ":"))
+    assert json.loads(compact) == data
+    assert json_dumps(data, indent=2) == json.dumps(data, indent=2)
+
+
+def test_event_to_json_is_compact():
+    event = RunResponseContentEvent(content="chunk", agent_id="agent", run_id="run", session_id="session")
+
+    event_json = event.to_json()
+
+    assert "\n" not in event_json
+    assert json.loads(event_json) == event.to_dict()
+    assert event.to_dict()["content"] == "chunk"
+
+
+def test_run_response_to_dict():
+    run_response = RunResponse(
+        content={"answer": [1, 2]}, messages=[Message(role="user", content="question")], metrics={"time": [0.5]}
+    )
+
+    run_dict = run_response.to_dict()
+    run_dict["content"]["answer"].append(3)
+
+    assert run_response.content == {"answer": [1, 2]}
+    assert run_dict["messages"][0]["content"] == "question"
+    assert run_dict["status"] == "RUNNING"
+    assert json.loads(run_response.to_json()) == json.loads(json.dumps(run_response.to_dict()))
+
+
+def test_team_run_response_to_dict_keeps_member_responses():
+    team_response = TeamRunResponse(content="team", member_responses=[RunResponse(content="member")])
+
+    team_dict = team_response.to_dict()
+
+    assert team_dict["member_responses"][0]["content"] == "member"
+    assert TeamRunResponse(content="team").to_dict()["member_responses"] == []
@@ -22,4 +22,14 @@ def mock_embedder():
     mock_usage: Dict[str, Any] = {"prompt_tokens": 10, "total_tokens": 10}
     mock.get_embedding_and_usage.return_value = (mock_embedding, mock_usage)
 
+    # Mock the batch methods to return one embedding per text
+    def _batch(texts):
+        return [mock_embedding] * len(texts), [mock_usage] * len(texts)
+
+    async def _async_batch(texts):
+        return _batch(texts)
+
+    mock.get_embeddings_batch_and_usage.side_effect = _batch
+    mock.async_get_embeddings_batch_and_usage.side_effect = _async_batch
+
     return mock
@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import List
+from unittest.mock import patch
 
 import pytest
 
@@ -125,6 +126,24 @@ def test_doc_exists(lance_db, sample_documents):
     assert lance_db.doc_exists(sample_documents[0]) is True
 
 
+def test_existing_hashes(lance_db, sample_documents):
+    """Test bulk content hash existence check"""
+    lance_db.insert(sample_documents[:2])
+    hashes = [doc.content_hash for doc in sample_documents]
+    assert lance_db.existing_hashes(hashes) == set(hashes[:2])
+    assert lance_db.existing_hashes([]) == set()
+
+
+async def test_async_insert_skips_existing_documents(lance_db, sample_documents):
+    """Test async insert checks the existing documents with a single lookup"""
+    await lance_db.async_insert(sample_documents[:2])
+
+    with patch.object(lance_db, "async_doc_exists", side_effect=AssertionError("checked one document at a time")):
+        await lance_db.async_insert(sample_documents)
+
+    assert await lance_db.async_get_count() == 3
+
+
 def test_name_exists(lance_db, sample_documents):
     """Test name existence check"""
     lance_db.insert([sample_documents[0]])
@@ -161,3 +180,16 @@ def test_bad_vectors_handling(mock_embedder):
         db.drop()
         if os.path.exists(TEST_PATH):
             shutil.rmtree(TEST_PATH)
+
+
+def test_existing_hashes_missing_table(lance_db, sample_documents):
+    """A dropped table means no hashes exist, other search errors are raised"""
+    lance_db.insert(sample_documents[:2])
+    hashes = [doc.content_hash for doc in sample_documents]
+
+    with patch.object(lance_db.table, "search", side_effect=RuntimeError("boom")):
+        with pytest.raises(RuntimeError):
+            lance_db.existing_hashes(hashes)
+
+    lance_db.connection.drop_table(lance_db.table_name)
+    assert lance_db.existing_hashes(hashes) == set()
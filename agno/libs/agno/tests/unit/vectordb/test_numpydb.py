@@ -0,0 +1,235 @@
+from dataclasses import dataclass
+from hashlib import md5
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from agno.document import Document
+from agno.embedder.base import Embedder
+from agno.vectordb.distance import Distance
+from agno.vectordb.numpydb import HNSW, NumpyDb
+from agno.vectordb.search import SearchProjection
+
+
+@dataclass
+class BagOfWordsEmbedder(Embedder):
+    """Deterministic embedder hashing each word into one of `dimensions` buckets"""
+
+    dimensions: Optional[int] = 64
+
+    def get_embedding(self, text: str) -> List[float]:
+        embedding = [0.0] * self.dimensions  # type: ignore
+        for word in text.lower().split():
+            embedding[int(md5(word.encode()).hexdigest(), 16) % self.dimensions] += 1.0  # type: ignore
+        return embedding
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        return self.get_embedding(text), None
+
+
+@pytest.fixture
+def sample_documents() -> List[Document]:
+    return [
+        Document(
+            content="Tom Kha Gai is a Thai coconut soup with chicken",
+            meta_data={"cuisine": "Thai", "type": "soup", "tags": ["spicy", "coconut"]},
+            name="tom_kha",
+        ),
+        Document(
+            content="Pad Thai is a stir-fried rice noodle dish",
+            meta_data={"cuisine": "Thai", "type": "noodles"},
+            name="pad_thai",
+        ),
+        Document(
+            content="Minestrone is an Italian vegetable soup",
+            meta_data={"cuisine": "Italian", "type": "soup"},
+            name="minestrone",
+        ),
+    ]
+
+
+@pytest.fixture
+def numpy_db():
+    db = NumpyDb(collection="recipes", embedder=BagOfWordsEmbedder(), initial_capacity=2)
+    db.create()
+    return db
+
+
+def test_insert_and_search(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.get_count() == 3
+    results = numpy_db.search("coconut soup with chicken", limit=2)
+    assert [doc.name for doc in results] == ["tom_kha", "minestrone"]
+    assert results[0].meta_data["cuisine"] == "Thai"
+    # Embeddings are not returned unless requested
+    assert results[0].embedding is None
+
+
+def test_search_many(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    queries = ["coconut soup with chicken", "rice noodle dish", "Italian vegetable soup"]
+
+    with patch.object(numpy_db.embedder, "get_embeddings_batch", wraps=numpy_db.embedder.get_embeddings_batch) as batch:
+        results = numpy_db.search_many(queries, limit=2)
+        # All queries are embedded in a single batch
+        batch.assert_called_once_with(queries)
+
+    assert results == [numpy_db.search(query, limit=2) for query in queries]
+    assert [documents[0].name for documents in results] == ["tom_kha", "pad_thai", "minestrone"]
+
+
+async def test_async_search_many(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    results = await numpy_db.async_search_many(
+        ["rice noodle dish", "vegetable soup"], limit=1, filters={"type": "soup"}
+    )
+    assert [[doc.name for doc in documents] for documents in results] == [["tom_kha"], ["minestrone"]]
+
+
+def test_search_projection(sample_documents):
+    db = NumpyDb(
+        collection="recipes",
+        embedder=BagOfWordsEmbedder(),
+        search_projection=SearchProjection(embedding=True, usage=True),
+    )
+    db.insert(sample_documents)
+
+    results = db.search("coconut soup with chicken", limit=1)
+    assert len(results[0].embedding) == 64
+
+
+def test_insert_skips_existing_documents(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.get_count() == 3
+    assert numpy_db.doc_exists(sample_documents[0])
+    assert numpy_db.name_exists("pad_thai")
+    assert not numpy_db.name_exists("green_curry")
+    hashes = [doc.content_hash for doc in sample_documents]
+    assert numpy_db.existing_hashes(hashes + ["missing"]) == set(hashes)
+
+
+def test_upsert_replaces_metadata(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+    updated = Document(content=sample_documents[2].content, name="minestrone", meta_data={"cuisine": "Ligurian"})
+    numpy_db.upsert([updated])
+
+    assert numpy_db.get_count() == 3
+    assert numpy_db.search("vegetable soup", limit=1, filters={"cuisine": "Italian"}) == []
+    results = numpy_db.search("vegetable soup", limit=1, filters={"cuisine": "Ligurian"})
+    assert [doc.name for doc in results] == ["minestrone"]
+
+
+def test_search_with_filters(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    results = numpy_db.search("soup", limit=5, filters={"cuisine": "Thai", "type": "soup"})
+    assert [doc.name for doc in results] == ["tom_kha"]
+
+    # List metadata matches documents whose list contains the value
+    results = numpy_db.search("soup", limit=5, filters={"tags": "spicy"})
+    assert [doc.name for doc in results] == ["tom_kha"]
+
+    assert numpy_db.search("soup", limit=5, filters={"cuisine": "French"}) == []
+
+
+def test_insert_filters_are_added_to_metadata(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents[:1], filters={"source": "cookbook"})
+
+    results = numpy_db.search("soup", limit=5, filters={"source": "cookbook"})
+    assert [doc.name for doc in results] == ["tom_kha"]
+
+
+@pytest.mark.parametrize("distance", [Distance.cosine, Distance.l2, Distance.max_inner_product])
+def test_distances_match_brute_force(distance):
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 8)).astype(np.float32)
+    query = rng.normal(size=8).astype(np.float32)
+
+    embedder = BagOfWordsEmbedder(dimensions=8)
+    db = NumpyDb(collection="vectors", embedder=embedder, distance=distance)
+    documents = [
+        Document(content=f"doc {i}", name=str(i), embedder=embedder, embedding=v.tolist())
+        for i, v in enumerate(vectors)
+    ]
+    db.insert(documents)
+    embedder.get_embedding = lambda text: query.tolist()  # type: ignore
+
+    if distance == Distance.cosine:
+        scores = vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+    elif distance == Distance.l2:
+        scores = -np.linalg.norm(vectors - query, axis=1)
+    else:
+        scores = vectors @ query
+    expected = [str(i) for i in np.argsort(-scores)[:5]]
+
+    assert [doc.name for doc in db.search("query", limit=5)] == expected
+
+
+def test_persistence(tmp_path, sample_documents):
+    db = NumpyDb(collection="recipes", path=tmp_path, embedder=BagOfWordsEmbedder(), initial_capacity=1)
+    db.create()
+    db.insert(sample_documents)
+
+    reopened = NumpyDb(collection="recipes", path=tmp_path, embedder=BagOfWordsEmbedder())
+    assert reopened.exists()
+    assert reopened.get_count() == 3
+    assert isinstance(reopened._embeddings, np.memmap)
+    assert [doc.name for doc in reopened.search("italian vegetable soup", limit=1)] == ["minestrone"]
+
+    reopened.drop()
+    assert not (tmp_path / "recipes.npy").exists()
+    assert not NumpyDb(collection="recipes", path=tmp_path, embedder=BagOfWordsEmbedder()).exists()
+
+
+def test_writes_append_documents(tmp_path, sample_documents):
+    db = NumpyDb(collection="recipes", path=tmp_path, embedder=BagOfWordsEmbedder())
+    documents_file = tmp_path / "recipes.jsonl"
+    db.insert(sample_documents[:2])
+    db.insert(sample_documents[2:])
+    assert len(documents_file.read_text().splitlines()) == 3
+
+    db.upsert(sample_documents[:1], filters={"cuisine": "fusion"})
+    # The upsert is appended, replacing the first document when the collection is reopened
+    assert len(documents_file.read_text().splitlines()) == 4
+    with open(documents_file, "a") as f:
+        f.write('{"row": 3, "document": {"name"')
+
+    reopened = NumpyDb(collection="recipes", path=tmp_path, embedder=BagOfWordsEmbedder())
+    assert reopened.get_count() == 3
+    assert reopened._records[0]["meta_data"]["cuisine"] == "fusion"
+    # Replaced and partially written lines are dropped on reopen
+    assert len(documents_file.read_text().splitlines()) == 3
+
+
+def test_hnsw_index(sample_documents):
+    pytest.importorskip("hnswlib")
+    db = NumpyDb(collection="recipes", embedder=BagOfWordsEmbedder(), index=HNSW(min_rows=1))
+    db.insert(sample_documents)
+
+    results = db.search("coconut soup with chicken", limit=1)
+
+    assert db._hnsw is not None
+    assert [doc.name for doc in results] == ["tom_kha"]
+
+
+def test_delete(numpy_db, sample_documents):
+    numpy_db.insert(sample_documents)
+
+    assert numpy_db.delete() is True
+    assert numpy_db.exists()
+    assert numpy_db.get_count() == 0
+    assert numpy_db.search("soup") == []
+
+
+async def test_async_methods(numpy_db, sample_documents):
+    await numpy_db.async_insert(sample_documents)
+
+    assert await numpy_db.async_doc_exists(sample_documents[0])
+    results = await numpy_db.async_search("rice noodle dish", limit=1)
+    assert [doc.name for doc in results] == ["pad_thai"]
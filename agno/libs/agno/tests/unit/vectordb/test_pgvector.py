@@ -1,13 +1,15 @@
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pgvector.sqlalchemy import Vector
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import URL, Engine
 from sqlalchemy.orm import Session
 
 from agno.document import Document
-from agno.vectordb.pgvector import PgVector
-from agno.vectordb.search import SearchType
+from agno.vectordb.pgvector import HNSW, Ivfflat, PgVector
+from agno.vectordb.search import SearchProjection, SearchType
 
 # Configuration for tests
 TEST_TABLE = f"test_vectors_{uuid.uuid4().hex[:8]}"
@@ -72,6 +74,9 @@ def mock_pgvector(mock_engine, mock_embedder):
                 # Mock the Session attribute
                 db.Session = mock_session_factory
 
+                # No async engine, so the async methods run the sync methods in a thread
+                db.async_engine.url = None
+
                 yield db
 
 
@@ -161,6 +166,22 @@ def test_doc_exists(mock_pgvector):
         assert mock_pgvector.doc_exists(doc) is False
 
 
+def test_existing_hashes(mock_pgvector):
+    """Test existing_hashes runs a single query for all hashes."""
+    docs = create_test_documents(3)
+    hashes = [doc.content_hash for doc in docs]
+
+    mock_session = MagicMock()
+    mock_session.execute.return_value = [(hashes[0],), (hashes[2],)]
+    mock_pgvector.Session = MagicMock()
+    mock_pgvector.Session.return_value.__enter__.return_value = mock_session
+
+    with patch("agno.vectordb.pgvector.pgvector.select"), patch("agno.vectordb.pgvector.pgvector.any_"):
+        assert mock_pgvector.existing_hashes(hashes) == {hashes[0], hashes[2]}
+    mock_session.execute.assert_called_once()
+    assert mock_pgvector.existing_hashes([]) == set()
+
+
 def test_name_exists(mock_pgvector):
     """Test name_exists method."""
     with patch.object(mock_pgvector, "_record_exists") as mock_record_exists:
@@ -241,6 +262,69 @@ def test_vector_search(mock_pgvector, mock_embedder):
         assert results[0].content == "Test content"
 
 
+def test_search_projection(mock_pgvector):
+    """Test that embeddings and usage are only selected when requested."""
+    columns = mock_pgvector._search_columns()
+    assert mock_pgvector.table.c.embedding not in columns
+    assert mock_pgvector.table.c.usage not in columns
+
+    row = MagicMock(id="doc_1", meta_data={}, content="Test content")
+    row.name = "test_doc_1"
+    document = mock_pgvector._result_to_document(row)
+    assert document.embedding is None
+    assert document.usage is None
+
+    mock_pgvector.search_projection = SearchProjection(embedding=True, usage=True)
+    columns = mock_pgvector._search_columns()
+    assert mock_pgvector.table.c.embedding in columns
+    assert mock_pgvector.table.c.usage in columns
+
+
+def test_search_many(mock_pgvector, mock_embedder):
+    """Test that search_many embeds the queries in one batch and runs a single lateral join."""
+    mock_embedder.reset_mock()
+    mock_embedder.get_embeddings_batch.return_value = [[0.1] * 1024, [0.2] * 1024]
+
+    rows = []
+    for query_index, doc_id in [(0, "doc_1"), (0, "doc_2"), (1, "doc_3")]:
+        row = MagicMock(query_index=query_index, id=doc_id, meta_data={}, content=f"Content of {doc_id}")
+        row.name = doc_id
+        rows.append(row)
+
+    session = mock_pgvector.Session.return_value.__enter__.return_value
+    session.execute.return_value.fetchall.return_value = rows
+
+    # Use a real table so the statement can be compiled
+    with patch("agno.vectordb.pgvector.pgvector.Vector", Vector):
+        mock_pgvector.table = mock_pgvector.get_table()
+        results = mock_pgvector.search_many(["first query", "second query"], limit=2)
+
+    mock_embedder.get_embeddings_batch.assert_called_once_with(["first query", "second query"])
+    assert [[doc.id for doc in documents] for documents in results] == [["doc_1", "doc_2"], ["doc_3"]]
+
+    stmt = session.execute.call_args_list[-1][0][0]
+    assert "LATERAL" in str(stmt.compile(dialect=postgresql.dialect()))
+
+    # Query embeddings are cached for the next search
+    assert mock_pgvector._get_query_embeddings(["second query"]) == [[0.2] * 1024]
+    mock_embedder.get_embeddings_batch.assert_called_once()
+
+
+def test_create_vector_index(mock_pgvector):
+    """Test that index creation keeps the typed vector index."""
+    session = MagicMock()
+    mock_pgvector._create_hnsw_index(session, mock_pgvector.table.fullname, "vector_cosine_ops")
+
+    assert isinstance(mock_pgvector.vector_index, HNSW)
+    assert "USING hnsw" in str(session.execute.call_args.args[0])
+
+    mock_pgvector.vector_index = Ivfflat(dynamic_lists=False)
+    mock_pgvector._create_ivfflat_index(session, mock_pgvector.table.fullname, "vector_cosine_ops")
+
+    assert isinstance(mock_pgvector.vector_index, Ivfflat)
+    assert "USING ivfflat" in str(session.execute.call_args.args[0])
+
+
 def test_drop(mock_pgvector):
     """Test drop method."""
     with patch.object(mock_pgvector, "table_exists", return_value=True):
@@ -327,7 +411,7 @@ async def test_async_insert(mock_pgvector):
         await mock_pgvector.async_insert(docs)
 
         # Check that insert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.insert, docs, None, 100)
 
 
 @pytest.mark.asyncio
@@ -341,7 +425,7 @@ async def test_async_upsert(mock_pgvector):
         await mock_pgvector.async_upsert(docs)
 
         # Check that upsert was called via to_thread
-        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None)
+        mock_to_thread.assert_called_once_with(mock_pgvector.upsert, docs, None, 100)
 
 
 @pytest.mark.asyncio
@@ -385,3 +469,102 @@ async def test_async_exists(mock_pgvector):
         # Check result and that exists was called via to_thread
         assert result is True
         mock_to_thread.assert_called_once_with(mock_pgvector.exists)
+
+
+@pytest.fixture
+def async_pgvector(mock_embedder):
+    """Create a PgVector instance with a mocked async session, returning the async session and connection."""
+    db = PgVector(
+        table_name=TEST_TABLE,
+        schema=TEST_SCHEMA,
+        db_url="postgresql+psycopg://ai:ai@localhost:5532/ai",
+        embedder=mock_embedder,
+        async_db_engine=MagicMock(),
+    )
+
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=MagicMock())
+    connection = MagicMock()
+    connection.execute = AsyncMock()
+    connection.get_raw_connection = AsyncMock()
+    connection.get_raw_connection.return_value.driver_connection.copy_to_table = AsyncMock()
+    session.connection = AsyncMock(return_value=connection)
+    session_factory = MagicMock()
+    session_factory.return_value.__aenter__.return_value = session
+    db.async_engine.session_factory = session_factory
+    return db, session, connection
+
+
+def test_async_db_url(mock_embedder):
+    db = PgVector(table_name=TEST_TABLE, db_url="postgresql+psycopg://ai:ai@localhost:5532/ai", embedder=mock_embedder)
+    assert db.async_engine.url == "postgresql+asyncpg://ai:ai@localhost:5532/ai"
+
+
+async def test_async_search_uses_async_session(async_pgvector):
+    db, session, _ = async_pgvector
+    db.query_embedding_cache.set("test query", [0.1] * 1024)
+    row = MagicMock(id="doc_0", meta_data={"type": "test"}, content="This is test document 0")
+    row.name = "test_doc_0"
+    session.execute.return_value.fetchall.return_value = [row]
+
+    with patch.object(db, "search") as mock_search:
+        results = await db.async_search("test query", limit=3)
+
+    mock_search.assert_not_called()
+    assert [doc.id for doc in results] == ["doc_0"]
+    # The index search parameters are set in the same transaction as the search
+    settings_stmt, search_stmt = [c.args[0] for c in session.execute.call_args_list]
+    assert str(settings_stmt) == "SET LOCAL hnsw.ef_search = 5"
+    assert "LIMIT" in str(search_stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_async_insert_copies_records(async_pgvector):
+    db, _, connection = async_pgvector
+    docs = create_test_documents(5)
+
+    await db.async_insert(docs, batch_size=2)
+
+    copy_to_table = connection.get_raw_connection.return_value.driver_connection.copy_to_table
+    assert copy_to_table.await_count == 3
+    table_name = copy_to_table.call_args_list[0].args[0]
+    kwargs = copy_to_table.call_args_list[0].kwargs
+    assert (table_name, kwargs["schema_name"], kwargs["format"]) == (TEST_TABLE, TEST_SCHEMA, "csv")
+    assert kwargs["columns"][0] == "id"
+    first_row = kwargs["source"].read().decode().splitlines()[0]
+    assert first_row.startswith('"doc_0","test_doc_0","{""type"": ""test"", ""index"": 0}",,')
+    assert ',,"This is test document 0","[0.1,0.1,' in first_row
+    connection.execute.assert_not_called()
+
+
+async def test_async_upsert_merges_copied_records(async_pgvector):
+    db, _, connection = async_pgvector
+    docs = create_test_documents(2)
+
+    await db.async_upsert(docs)
+
+    copy_to_table = connection.get_raw_connection.return_value.driver_connection.copy_to_table
+    assert copy_to_table.call_args.args[0] == f"{TEST_TABLE}_staging"
+    create_stmt, upsert_stmt = [c.args[0] for c in connection.execute.call_args_list]
+    assert str(create_stmt).startswith(f'CREATE TEMP TABLE "{TEST_TABLE}_staging"')
+    upsert_sql = str(upsert_stmt.compile(dialect=postgresql.dialect()))
+    assert f"SELECT {TEST_TABLE}_staging.id" in upsert_sql
+    assert "ON CONFLICT (id) DO UPDATE" in upsert_sql
+
+
+def test_async_engine_is_recreated_and_disposed_when_the_event_loop_changes(mock_embedder):
+    import asyncio
+
+    db = PgVector(table_name=TEST_TABLE, db_url="postgresql+psycopg://ai:ai@localhost:5532/ai", embedder=mock_embedder)
+
+    async def get_engine():
+        db._get_async_session()
+        return db.async_engine.engine
+
+    with patch("agno.utils.async_engine.create_async_engine", side_effect=lambda url: MagicMock()):
+        first_engine = asyncio.run(get_engine())
+        second_engine = asyncio.run(get_engine())
+
+    assert second_engine is not first_engine
+    # The first event loop is closed, so the pool of its engine is dropped without closing the connections
+    first_engine.sync_engine.dispose.assert_called_once_with(close=False)
+    second_engine.sync_engine.dispose.assert_not_called()
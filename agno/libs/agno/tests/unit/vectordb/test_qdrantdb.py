@@ -1,3 +1,4 @@
+import uuid
 from typing import List
 from unittest.mock import Mock, patch
 
@@ -144,6 +145,23 @@ def test_doc_exists(qdrant_db, sample_documents, mock_qdrant_client):
     assert qdrant_db.doc_exists(sample_documents[0]) is False
 
 
+def test_existing_hashes(qdrant_db, sample_documents, mock_qdrant_client):
+    """Test bulk content hash existence check"""
+    hashes = [doc.content_hash for doc in sample_documents]
+    # Qdrant returns ids formatted as UUIDs
+    existing_id = str(uuid.UUID(hashes[0]))
+    mock_qdrant_client.retrieve.return_value = [Mock(id=existing_id)]
+
+    assert qdrant_db.existing_hashes(hashes) == {hashes[0]}
+    mock_qdrant_client.retrieve.assert_called_once_with(
+        collection_name=qdrant_db.collection, ids=hashes, with_payload=False, with_vectors=False
+    )
+
+    # A failed lookup is logged and treated as no existing hashes
+    mock_qdrant_client.retrieve.side_effect = Exception("Connection refused")
+    assert qdrant_db.existing_hashes(hashes) == set()
+
+
 def test_name_exists(qdrant_db, mock_qdrant_client):
     """Test name existence check"""
     # Test when name exists